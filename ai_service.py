@@ -1,27 +1,98 @@
-import os
-from openai import OpenAI
+import asyncio
+import json
+
+import httpx
+from telegram.request import CircuitBreaker
+
 from config import Config
+from conversation_store import with_user_name
 
 class AIService:
-    def __init__(self):
+    def __init__(self, on_breaker_state_change=None):
         self.config = Config()
-        self.client = OpenAI(
-            api_key=self.config.ai_api_key,
-            base_url=self.config.ai_base_url
+        # 复用连接池的异步 HTTP 客户端，直接调用 OpenAI 兼容接口，不阻塞事件循环
+        self.client = httpx.AsyncClient(
+            base_url=self.config.ai_base_url,
+            headers={'Authorization': f'Bearer {self.config.ai_api_key}'},
+            limits=httpx.Limits(
+                max_connections=self.config.ai_max_connections,
+                max_keepalive_connections=self.config.ai_max_connections,
+            ),
+            timeout=httpx.Timeout(self.config.ai_timeout, connect=10.0),
+        )
+        # 限制同时进行中的 AI 请求数量
+        self._semaphore = asyncio.Semaphore(self.config.ai_concurrency)
+        # 熔断器：AI 接口持续失败时直接失败，而不是让每个请求都等到超时
+        self.breaker = CircuitBreaker(
+            failure_threshold=self.config.breaker_failure_threshold,
+            error_rate_threshold=self.config.breaker_error_rate or None,
+            recovery_timeout=self.config.breaker_recovery_timeout,
+            name="ai",
+            on_state_change=on_breaker_state_change,
         )
         self.current_model = "qwen-plus"
-        
-    async def chat_completion(self, messages, user_name=None):
+
+    @staticmethod
+    def _is_upstream_failure(exc):
+        """网络错误、超时、限流和 5xx 说明 AI 接口出了问题；其他错误（如 4xx）不计入熔断"""
+        if isinstance(exc, httpx.TransportError):
+            return True
+        if isinstance(exc, httpx.HTTPStatusError):
+            status = exc.response.status_code
+            return status == 429 or status >= 500
+        return False
+
+    @staticmethod
+    def _add_user_name(messages, user_name):
         if user_name:
             system_msg = next((msg for msg in messages if msg['role'] == 'system'), None)
             if system_msg:
-                system_msg['content'] += f"\n当前用户: {user_name}"
-        
-        completion = self.client.chat.completions.create(
-            model=self.current_model,
-            messages=messages
-        )
-        return completion.choices[0].message.content
-        
+                system_msg['content'] = with_user_name(system_msg['content'], user_name)
+
+    async def chat_completion(self, messages, user_name=None, timeout=None):
+        self._add_user_name(messages, user_name)
+
+        request_timeout = httpx.USE_CLIENT_DEFAULT if timeout is None else timeout
+        # 熔断时在排队等待信号量之前就失败
+        with self.breaker.guard(is_failure=self._is_upstream_failure):
+            async with self._semaphore:
+                response = await self.client.post(
+                    'chat/completions',
+                    json={'model': self.current_model, 'messages': messages},
+                    timeout=request_timeout,
+                )
+            response.raise_for_status()
+        return response.json()['choices'][0]['message']['content']
+
+    async def stream_chat_completion(self, messages, user_name=None, timeout=None):
+        """流式调用，逐个产出模型返回的文本片段（解析 SSE 事件流）"""
+        self._add_user_name(messages, user_name)
+
+        request_timeout = httpx.USE_CLIENT_DEFAULT if timeout is None else timeout
+        with self.breaker.guard(is_failure=self._is_upstream_failure):
+            async with self._semaphore:
+                async with self.client.stream(
+                    'POST',
+                    'chat/completions',
+                    json={'model': self.current_model, 'messages': messages, 'stream': True},
+                    timeout=request_timeout,
+                ) as response:
+                    response.raise_for_status()
+                    async for line in response.aiter_lines():
+                        if not line.startswith('data:'):
+                            continue
+                        data = line[len('data:'):].strip()
+                        if data == '[DONE]':
+                            break
+                        choices = json.loads(data).get('choices') or []
+                        if not choices:
+                            continue
+                        content = (choices[0].get('delta') or {}).get('content')
+                        if content:
+                            yield content
+
     def set_model(self, model):
-        self.current_model = model
\ No newline at end of file
+        self.current_model = model
+
+    async def aclose(self):
+        await self.client.aclose()
@@ -0,0 +1,76 @@
+"""Measure the peak memory of ``File.download_to_drive`` and ``File.download_to_memory``.
+
+The file is served by an ``httpx.MockTransport`` in 64 KiB chunks, so no network is involved.
+The peak is measured with ``tracemalloc`` and should not grow with the file size.
+
+Usage (from the repository root): python benchmarks/download_memory_bench.py
+"""
+
+import asyncio
+import sys
+import tempfile
+import tracemalloc
+from pathlib import Path
+
+import httpx
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from telegram import Bot, File
+from telegram.request import HTTPXRequest
+
+CHUNK = b"\0" * 64 * 1024
+
+
+def serve(size: int):
+    async def content():
+        for _ in range(size // len(CHUNK)):
+            yield CHUNK
+
+    def handler(_request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, content=content())
+
+    return handler
+
+
+class NullWriter:
+    def write(self, data: bytes) -> int:
+        return len(data)
+
+    def seekable(self) -> bool:
+        return False
+
+
+async def measure(size: int, directory: Path) -> tuple[float, float]:
+    request = HTTPXRequest()
+    await request.initialize()
+    await request._client.aclose()
+    request._client = httpx.AsyncClient(transport=httpx.MockTransport(serve(size)))
+    bot = Bot("123:abc", request=request)
+    file = File("file_id", "file_unique_id", file_path="https://example.com/file.bin")
+    file.set_bot(bot)
+
+    peaks = []
+    for download in (
+        lambda: file.download_to_drive(directory / "file.bin"),
+        lambda: file.download_to_memory(NullWriter()),
+    ):
+        tracemalloc.start()
+        await download()
+        peaks.append(tracemalloc.get_traced_memory()[1] / 2**20)
+        tracemalloc.stop()
+
+    await request.shutdown()
+    return peaks[0], peaks[1]
+
+
+async def main() -> None:
+    print(f"{'file MiB':>9} {'drive peak MiB':>15} {'memory peak MiB':>16}")
+    with tempfile.TemporaryDirectory() as directory:
+        for size_mib in (1, 16, 64, 256):
+            drive, memory = await measure(size_mib * 2**20, Path(directory))
+            print(f"{size_mib:>9} {drive:>15.2f} {memory:>16.2f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,74 @@
+"""Compare the backends of ``JSONCodec`` on a ``getUpdates`` response with 100 updates.
+
+Measures how many batches per second ``HTTPXRequest`` decodes and how long
+``TelegramObject.to_json`` takes for the decoded updates.
+
+Usage (from the repository root): python benchmarks/json_codec_bench.py
+"""
+
+import json
+import sys
+import timeit
+from functools import partial
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from telegram import Bot, Update
+from telegram.request import HTTPXRequest, JSONCodec, _jsoncodec
+
+
+def make_update(update_id: int) -> dict:
+    return {
+        "update_id": update_id,
+        "message": {
+            "message_id": update_id,
+            "date": 1700000000 + update_id,
+            "chat": {"id": -1001234567890, "type": "supergroup", "title": "测试群组"},
+            "from": {
+                "id": 123456789 + update_id,
+                "is_bot": False,
+                "first_name": "User",
+                "username": f"user{update_id}",
+                "language_code": "zh-hans",
+            },
+            "text": "Lorem ipsum dolor sit amet, /command 你好 " * 4,
+            "entities": [
+                {"type": "bot_command", "offset": 27, "length": 8},
+                {"type": "bold", "offset": 0, "length": 5},
+            ],
+        },
+    }
+
+
+def to_json(updates: list[Update]) -> list[str]:
+    return [update.to_json() for update in updates]
+
+
+def main() -> None:
+    payload = json.dumps(
+        {"ok": True, "result": [make_update(i) for i in range(100)]}, ensure_ascii=False
+    ).encode()
+    updates = [Update.de_json(update, None) for update in json.loads(payload)["result"]]
+
+    backends = ["json"]
+    if _jsoncodec.ORJSON_AVAILABLE:
+        backends.append("orjson")
+    if _jsoncodec.MSGSPEC_AVAILABLE:
+        backends.append("msgspec")
+
+    print(f"payload: {len(payload)} bytes, 100 updates")
+    print(f"{'backend':>8} {'decode batches/s':>17} {'to_json us/update':>18}")
+    for backend in backends:
+        request = HTTPXRequest(json_codec=JSONCodec(backend))
+        bot = Bot("123:abc", request=request)
+        for update in updates:
+            update.set_bot(bot)
+        number = 500
+        decode = timeit.timeit(partial(request._parse_json_payload, payload), number=number)
+        encode = timeit.timeit(partial(to_json, updates), number=50)
+        print(f"{backend:>8} {number / decode:>17.0f} {encode / 50 / 100 * 1e6:>18.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""关键词匹配微基准: 逐个子串查找 vs. Aho-Corasick 自动机
+
+用法 (在仓库根目录): python benchmarks/keyword_matcher_bench.py
+"""
+
+import random
+import string
+import sys
+import timeit
+from functools import partial
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from keyword_matcher import KeywordMatcher
+
+MESSAGE_LENGTH = 200
+
+
+def random_word(rng, min_len=3, max_len=10):
+    return "".join(rng.choice(string.ascii_letters) for _ in range(rng.randint(min_len, max_len)))
+
+
+def naive_match(keywords, text):
+    # 原先 handle_message 中的实现
+    return [k for k in keywords if k.lower() in text.lower()]
+
+
+def main():
+    rng = random.Random(0)
+    message = " ".join(random_word(rng) for _ in range(MESSAGE_LENGTH // 6))[:MESSAGE_LENGTH]
+    print(f"消息长度: {len(message)} 字符")
+    print(
+        f"{'关键词数':>8} {'子串查找 (us/条)':>18} {'Aho-Corasick (us/条)':>22} {'构建 (ms)':>10}"
+    )
+    for count in (10, 1_000, 10_000):
+        keywords = [random_word(rng) for _ in range(count)]
+        build = timeit.timeit(partial(KeywordMatcher, keywords), number=1)
+        matcher = KeywordMatcher(keywords)
+        assert matcher.find_all(message) == naive_match(keywords, message)
+
+        number = max(10, 20_000 // count)
+        naive = timeit.timeit(partial(naive_match, keywords, message), number=number) / number
+        compiled = timeit.timeit(partial(matcher.find_all, message), number=number) / number
+        print(f"{count:>8} {naive * 1e6:>18.1f} {compiled * 1e6:>22.1f} {build * 1e3:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
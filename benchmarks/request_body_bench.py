@@ -0,0 +1,83 @@
+"""Compare form-encoded and JSON request bodies of ``HTTPXRequest`` for ``sendMessage``.
+
+Measures the encoded body size (bytes on the wire, excluding headers) and the CPU time needed to
+turn the parameters of a ``send_message`` call into an ``httpx.Request``.
+
+Usage (from the repository root): python benchmarks/request_body_bench.py
+"""
+
+import sys
+import timeit
+from functools import partial
+from pathlib import Path
+
+import httpx
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from telegram import InlineKeyboardButton, InlineKeyboardMarkup, MessageEntity
+from telegram.request import RequestData
+from telegram.request._requestparameter import RequestParameter
+
+URL = "https://api.telegram.org/bot123:abc/sendMessage"
+
+
+def send_message_params(buttons: int, entities: int) -> dict:
+    text = "Lorem ipsum dolor sit amet, consectetur adipiscing elit. " * 20
+    return {
+        "chat_id": 123456789,
+        "text": text,
+        "entities": [MessageEntity(MessageEntity.BOLD, i * 5, 4) for i in range(entities)],
+        "reply_markup": InlineKeyboardMarkup(
+            [
+                [InlineKeyboardButton(f"Button {row}", callback_data=f"cb:{row}")]
+                for row in range(buttons)
+            ]
+        ),
+        "disable_notification": True,
+    }
+
+
+def build_form(params: dict) -> httpx.Request:
+    request_data = RequestData(
+        [RequestParameter.from_input(key, value) for key, value in params.items()]
+    )
+    request = httpx.Request("POST", URL, data=request_data.json_parameters)
+    request.read()
+    return request
+
+
+def build_json(params: dict) -> httpx.Request:
+    request_data = RequestData(
+        [RequestParameter.from_input(key, value) for key, value in params.items()]
+    )
+    request = httpx.Request(
+        "POST",
+        URL,
+        content=request_data.json_payload,
+        headers={"Content-Type": "application/json"},
+    )
+    request.read()
+    return request
+
+
+def main() -> None:
+    print(
+        f"{'buttons/entities':>17} {'form bytes':>11} {'json bytes':>11} "
+        f"{'form us':>9} {'json us':>9}"
+    )
+    for size in (0, 10, 100, 500):
+        params = send_message_params(buttons=size, entities=size)
+        form_bytes = len(build_form(params).content)
+        json_bytes = len(build_json(params).content)
+        number = 2000 if size < 100 else 200
+        form_time = timeit.timeit(partial(build_form, params), number=number) / number
+        json_time = timeit.timeit(partial(build_json, params), number=number) / number
+        print(
+            f"{size:>17} {form_bytes:>11} {json_bytes:>11} "
+            f"{form_time * 1e6:>9.1f} {json_time * 1e6:>9.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""Measure the peak memory of ``Bot.send_media_group`` with three large documents.
+
+Compares passing the files as open file handles (read into memory when the ``InputMedia`` is
+created) with passing them as ``InputFile(pathlib.Path)`` (read chunk by chunk while the request
+is sent) and as ``InputFile(pathlib.Path, memory_map=True)`` (sent as slices of a shared memory
+mapping). Pages of a memory mapping belong to the page cache and are not traced, so the last
+column shows the memory allocated by Python for sending the same files five times in a row.
+The request body is consumed by a transport that discards it, so no network is involved.
+
+Usage (from the repository root): python benchmarks/upload_memory_bench.py
+"""
+
+import asyncio
+import sys
+import tempfile
+import tracemalloc
+from contextlib import ExitStack
+from pathlib import Path
+
+import httpx
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from telegram import Bot, InputFile, InputMediaDocument
+from telegram.request import HTTPXRequest
+
+
+class DrainTransport(httpx.AsyncBaseTransport):
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        async for _ in request.stream:
+            pass
+        return httpx.Response(200, content=b'{"ok": true, "result": []}')
+
+
+async def measure(paths: list[Path], mode: str) -> float:
+    request = HTTPXRequest()
+    await request.initialize()
+    await request._client.aclose()
+    request._client = httpx.AsyncClient(transport=DrainTransport())
+    bot = Bot("123:abc", request=request)
+
+    with ExitStack() as stack:
+        tracemalloc.start()
+        if mode == "handles":
+            media = [InputMediaDocument(stack.enter_context(path.open("rb"))) for path in paths]
+            await bot.send_media_group(chat_id=1, media=media)
+        elif mode == "streamed":
+            media = [InputMediaDocument(InputFile(path, attach=True)) for path in paths]
+            await bot.send_media_group(chat_id=1, media=media)
+        else:
+            for _ in range(5):
+                media = [
+                    InputMediaDocument(InputFile(path, attach=True, memory_map=True))
+                    for path in paths
+                ]
+                await bot.send_media_group(chat_id=1, media=media)
+        peak = tracemalloc.get_traced_memory()[1] / 2**20
+        tracemalloc.stop()
+
+    await request.shutdown()
+    return peak
+
+
+async def main() -> None:
+    print(
+        f"{'3 files of MiB':>15} {'handles peak MiB':>17} {'streamed peak MiB':>18}"
+        f" {'mapped 5x peak MiB':>19}"
+    )
+    with tempfile.TemporaryDirectory() as directory:
+        for size_mib in (1, 8, 32):
+            paths = []
+            for index in range(3):
+                path = Path(directory) / f"document{index}.bin"
+                path.write_bytes(b"\0" * size_mib * 2**20)
+                paths.append(path)
+            eager = await measure(paths, "handles")
+            streamed = await measure(paths, "streamed")
+            mapped = await measure(paths, "mapped")
+            print(f"{size_mib:>15} {eager:>17.2f} {streamed:>18.2f} {mapped:>19.2f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
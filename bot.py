@@ -5,10 +5,15 @@ import asyncio
 from typing import List, Any
 
 from telegram import Update
+from telegram.constants import MessageLimit
+from telegram.error import BadRequest
+from telegram.request import CircuitBreaker
 from telegram.ext import (
     Application,
     CommandHandler,
     MessageHandler,
+    PersistenceInput,
+    PicklePersistence,
     filters,
     ContextTypes,
 )
@@ -17,6 +22,11 @@ from telegram.ext import (
 from config import Config
 from data_manager import DataManager
 from ai_service import AIService
+from conversation_store import ConversationStore
+from response_cache import ResponseCache
+from request_coordinator import RequestCoordinator
+from deletion_scheduler import DeletionScheduler
+from fair_update_processor import FairUpdateProcessor, PRIORITY_HIGH, PRIORITY_NORMAL
 
 
 # 确保日志目录存在并初始化日志
@@ -35,8 +45,18 @@ logger = logging.getLogger(__name__)
 class TelegramBot:
     def __init__(self):
         self.config = Config()
-        self.data_manager = DataManager()
-        self.ai_service = AIService()
+        self.data_manager = DataManager(flush_interval=self.config.flush_interval)
+        # 熔断器状态变化次数，按熔断器名称与新状态统计
+        self.breaker_transitions = {}
+        self.ai_service = AIService(on_breaker_state_change=self._on_breaker_state_change)
+        # Telegram 接口的熔断器，发送消息与拉取更新共用
+        self.telegram_breaker = CircuitBreaker(
+            failure_threshold=self.config.breaker_failure_threshold,
+            error_rate_threshold=self.config.breaker_error_rate or None,
+            recovery_timeout=self.config.breaker_recovery_timeout,
+            name="telegram",
+            on_state_change=self._on_breaker_state_change,
+        )
 
         # 本地保存一份当前模型 / 提示词状态
         self.current_model = getattr(self.ai_service, 'current_model', 'qwen-plus')
@@ -45,8 +65,61 @@ class TelegramBot:
         # 默认不删除消息
         self.boom_time = 0
 
+        # 可选的 AI 回复缓存
+        self.response_cache = None
+        if self.config.ai_cache_enabled:
+            self.response_cache = ResponseCache(
+                max_entries=self.config.ai_cache_max_entries,
+                ttl=self.config.ai_cache_ttl,
+                path=self.config.ai_cache_file or None,
+            )
+            self.response_cache.load()
+
+        # 按会话合并连续消息、取消被取代的 AI 请求
+        self.coordinator = RequestCoordinator(window=self.config.coalesce_window)
+
+        # 定期刷新机器人身份的后台任务
+        self._identity_task = None
+
+        # 带优先级与准入控制的更新处理器：管理员与私聊优先，积压过多时直接回复繁忙
+        self.update_processor = FairUpdateProcessor(
+            max_concurrent_updates=self.config.concurrent_updates,
+            max_backlog=self.config.max_backlog,
+            classify=self._classify_update,
+            on_shed=self._on_update_shed,
+        )
+
         # Telegram 应用
-        self.app = Application.builder().token(self.config.telegram_token).build()
+        builder = (
+            Application.builder()
+            .token(self.config.telegram_token)
+            .concurrent_updates(self.update_processor)
+            .circuit_breaker(self.telegram_breaker)
+            .get_updates_circuit_breaker(self.telegram_breaker)
+            .post_init(self._post_init)
+            .post_shutdown(self._post_shutdown)
+        )
+        if self.config.persistence_file:
+            # chat_data（对话历史）与 bot_data（待删除消息）通过 PicklePersistence 持久化
+            builder = builder.persistence(
+                PicklePersistence(
+                    filepath=self.config.persistence_file,
+                    store_data=PersistenceInput(
+                        bot_data=True, chat_data=True, user_data=False, callback_data=False
+                    ),
+                )
+            )
+        self.app = builder.build()
+
+        # 对话历史（保存在 chat_data 中）
+        self.conversations = ConversationStore(
+            self.app,
+            max_conversations=self.config.max_conversations,
+            max_tokens=self.config.history_max_tokens,
+        )
+
+        # 消息自毁调度（待删除消息保存在 bot_data 中）
+        self.deletions = DeletionScheduler(self.app)
 
         # 注册命令与消息处理
         self._register_handlers()
@@ -75,6 +148,46 @@ class TelegramBot:
             logger.exception("保存 %s 失败: %s", file_attr, e)
             return False
 
+    def _on_breaker_state_change(self, breaker: CircuitBreaker, old_state: str, new_state: str):
+        """熔断器状态变化时记录日志与计数（具体原因由熔断器自己的日志给出）"""
+        key = (breaker.name, new_state)
+        self.breaker_transitions[key] = self.breaker_transitions.get(key, 0) + 1
+        if new_state == CircuitBreaker.OPEN:
+            logger.warning("%s 接口熔断 (%s -> %s)", breaker.name, old_state, new_state)
+        else:
+            logger.info("%s 接口熔断器状态: %s -> %s", breaker.name, old_state, new_state)
+
+    async def _post_init(self, application: Application):
+        # 持久化数据已在 initialize 中加载，这里重建对话历史的 LRU 顺序
+        self.conversations.load()
+        await self.deletions.start()
+        if self.config.identity_refresh_interval > 0:
+            self._identity_task = asyncio.create_task(self._refresh_identity_loop())
+
+    async def _refresh_identity_loop(self):
+        """定期调用 get_me 刷新缓存的机器人身份（例如用户名被修改后）"""
+        while True:
+            await asyncio.sleep(self.config.identity_refresh_interval)
+            try:
+                await self.app.bot.get_me()
+            except Exception as e:
+                logger.warning("刷新机器人身份失败: %s", e)
+
+    async def _post_shutdown(self, application: Application):
+        if self._identity_task is not None:
+            self._identity_task.cancel()
+            try:
+                await self._identity_task
+            except asyncio.CancelledError:
+                pass
+            self._identity_task = None
+        await self.deletions.stop()
+        # 停止后台写回线程，并把尚未落盘的修改写入磁盘
+        self.data_manager.close()
+        if self.response_cache is not None:
+            self.response_cache.save()
+        await self.ai_service.aclose()
+
     # ---- 注册 handlers ----
     def _register_handlers(self):
         self.app.add_handler(CommandHandler("rbq", self.add_admin))
@@ -92,6 +205,8 @@ class TelegramBot:
         self.app.add_handler(CommandHandler("unke", self.remove_keyword))
         self.app.add_handler(CommandHandler("mll", self.manage_model))
         self.app.add_handler(CommandHandler("boom", self.set_boom_time))  # 新增命令
+        self.app.add_handler(CommandHandler("cache", self.manage_cache))
+        self.app.add_handler(CommandHandler("queue", self.show_queue))
      
         self.app.add_handler(MessageHandler(filters.TEXT & (~filters.COMMAND), self.handle_message))
 
@@ -103,9 +218,7 @@ class TelegramBot:
             return True
             
         # 普通管理员
-        admins = self._safe_load('admin_file', [])
-        admins = [int(a) for a in admins]
-        return user_id in admins
+        return self.data_manager.is_admin(user_id)
 
     def _get_user_id(self, update: Update) -> int | None:
         """安全获取用户ID，如果无法获取返回None"""
@@ -115,33 +228,185 @@ class TelegramBot:
 
     # ---- 工具方法 ----
     async def _reply(self, update: Update, text: str):
+        sent_msg = None
         try:
-            sent_msg = None
             if update and update.message:
                 sent_msg = await update.message.reply_text(text)
             elif update and update.effective_chat:
                 sent_msg = await self.app.bot.send_message(chat_id=update.effective_chat.id, text=text)
 
-            # 如果设置了 boom_time，在后台异步删除消息，不阻塞主流程
+            # 如果设置了 boom_time，交给自毁调度器到期后批量删除，不阻塞主流程
             if sent_msg and self.boom_time > 0:
-                # 创建一个后台任务来处理删除操作
-                asyncio.create_task(self._delayed_delete(sent_msg, self.boom_time))
+                self.deletions.schedule(sent_msg.chat_id, sent_msg.message_id, self.boom_time)
 
         except Exception as e:
             logger.exception("发送消息失败: %s", e)
-            
-    async def _delayed_delete(self, message, delay_seconds: int):
-        """在后台异步删除消息，不阻塞主流程"""
+        return sent_msg
+
+    async def _edit_text(self, message, text: str) -> bool:
+        """编辑已发送的消息，内容未变化时忽略 Telegram 的报错"""
         try:
-            await asyncio.sleep(delay_seconds)
-            await message.delete()
+            await self.app.bot.edit_message_text(
+                chat_id=message.chat_id,
+                message_id=message.message_id,
+                text=text[:MessageLimit.MAX_TEXT_LENGTH],
+            )
+            return True
+        except BadRequest as e:
+            if "not modified" not in str(e).lower():
+                logger.warning("编辑消息失败: %s", e)
         except Exception as e:
-            logger.warning("删除消息失败: %s", e)
+            logger.warning("编辑消息失败: %s", e)
+        return False
+
+    async def _stream_reply(self, update: Update, chunks) -> str | None:
+        """先发送占位消息，再按设定的节奏把流式内容编辑进去，成功时返回完整文本"""
+        placeholder = await self._reply(update, "…")
+        loop = asyncio.get_running_loop()
+        interval = self.config.stream_edit_interval
+        edit_tokens = self.config.stream_edit_tokens
+
+        text = ""
+        shown = ""
+        failed = False
+        pending_tokens = 0
+        # 第一个片段到达时立即编辑，让用户尽快看到输出
+        last_edit = loop.time() - interval
+        try:
+            async for chunk in chunks:
+                text += chunk
+                pending_tokens += 1
+                if placeholder is None:
+                    continue
+                # 合并编辑：达到时间间隔或累计片段数才编辑一次，避免触发 Telegram 限流
+                now = loop.time()
+                if now - last_edit >= interval or (edit_tokens > 0 and pending_tokens >= edit_tokens):
+                    if text.strip() and await self._edit_text(placeholder, text):
+                        shown = text
+                    pending_tokens = 0
+                    last_edit = now
+        except asyncio.CancelledError:
+            # 请求已被同一会话的新消息取代，撤回占位消息
+            await chunks.aclose()
+            if placeholder is not None:
+                try:
+                    await placeholder.delete()
+                except Exception as e:
+                    logger.warning("删除占位消息失败: %s", e)
+            raise
+        except Exception:
+            logger.exception("ai_service.stream_chat_completion 调用失败")
+            failed = True
+            if not text:
+                text = "抱歉，AI 服务暂时不可用。"
+        if not text.strip():
+            failed = True
+            text = "AI 服务返回了空响应"
+
+        if placeholder is None:
+            # 占位消息发送失败时退回到一次性发送
+            await self._reply(update, text)
+        elif text != shown:
+            await self._edit_text(placeholder, text)
+        return None if failed else text
+            
+    # ---- 准入控制 ----
+    def _classify_update(self, update: object):
+        """返回 (优先级, 会话键)：管理员和私聊为高优先级"""
+        if not isinstance(update, Update):
+            return PRIORITY_NORMAL, None
+        chat = update.effective_chat
+        chat_id = chat.id if chat else None
+        user_id = self._get_user_id(update)
+        if (chat and chat.type == "private") or (
+            user_id is not None and self._check_admin_permission(user_id)
+        ):
+            return PRIORITY_HIGH, chat_id
+        return PRIORITY_NORMAL, chat_id
+
+    async def _on_update_shed(self, update: object):
+        """积压过多时被丢弃的更新：只对本应触发 AI 回复的消息回复繁忙"""
+        if not isinstance(update, Update) or not update.message or not update.effective_user:
+            return
+        if update.effective_user.is_bot:
+            return
+        message_text = (update.message.text or "").strip()
+        if not message_text or message_text.startswith("/"):
+            return
+        if self._is_supergroup_or_group(update) and not self.data_manager.is_group_authorized(
+            update.effective_chat.id
+        ):
+            return
+        if any(self._check_triggers(update, message_text)):
+            await self._reply(update, "⏳ 当前请求较多，请稍后再试")
 
     def _is_supergroup_or_group(self, update: Update) -> bool:
         t = getattr(update.effective_chat, 'type', '')
         return t in ("group", "supergroup")
     # ---- 命令实现 ----
+    # ---- /cache 命令实现 ----
+    async def manage_cache(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
+        """查看或清空 AI 回复缓存"""
+        try:
+            # 权限检查
+            user_id = self._get_user_id(update)
+            if user_id is None or not self._check_admin_permission(user_id):
+                await self._reply(update, "❌ 只有管理员可以使用此命令")
+                return
+
+            if self.response_cache is None:
+                await self._reply(update, "AI 回复缓存未启用（config.ini 中设置 ai_cache_enabled = true）")
+                return
+
+            if context.args and context.args[0].lower() == "clear":
+                self.response_cache.clear()
+                self.response_cache.save()
+                await self._reply(update, "✅ 已清空 AI 回复缓存")
+                return
+
+            stats = self.response_cache.stats()
+            await self._reply(
+                update,
+                "AI 回复缓存:\n"
+                f"条目: {stats['entries']}/{stats['max_entries']}\n"
+                f"命中: {stats['hits']}  未命中: {stats['misses']}\n"
+                f"命中率: {stats['hit_rate']:.1%}\n"
+                "用法: /cache clear 清空缓存",
+            )
+        except Exception as e:
+            logger.exception("manage_cache 出现异常: %s", e)
+            await self._reply(update, "❌ 内部错误，查看日志了解详情")
+
+    # ---- /queue 命令实现 ----
+    async def show_queue(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
+        """查看更新处理队列的深度与等待时间"""
+        try:
+            # 权限检查
+            user_id = self._get_user_id(update)
+            if user_id is None or not self._check_admin_permission(user_id):
+                await self._reply(update, "❌ 只有管理员可以使用此命令")
+                return
+
+            stats = self.update_processor.stats()
+            breakers = "\n".join(
+                f"{breaker.name}: {breaker.state}，快速失败 {breaker.rejected_calls} 次，"
+                f"熔断 {self.breaker_transitions.get((breaker.name, CircuitBreaker.OPEN), 0)} 次"
+                for breaker in (self.telegram_breaker, self.ai_service.breaker)
+            )
+            await self._reply(
+                update,
+                "处理队列:\n"
+                f"处理中: {stats['running']}/{stats['workers']}\n"
+                f"排队: 高优先级 {stats['queued_high']}，"
+                f"普通 {stats['queued_normal']}/{stats['max_backlog']}\n"
+                f"已处理: {stats['processed']}  已丢弃: {stats['shed']}\n"
+                f"等待时间: 平均 {stats['avg_wait']:.2f}s，最长 {stats['max_wait']:.2f}s\n"
+                f"熔断器:\n{breakers}",
+            )
+        except Exception as e:
+            logger.exception("show_queue 出现异常: %s", e)
+            await self._reply(update, "❌ 内部错误，查看日志了解详情")
+
 # ---- /boom 命令实现 ----
     async def set_boom_time(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """设置消息自毁时间"""
@@ -545,6 +810,26 @@ class TelegramBot:
             logger.exception("add_keyword 出现异常: %s", e)
             await self._reply(update, "❌ 内部错误，查看日志了解详情")
 
+    def _check_triggers(self, update: Update, message_text: str):
+        """返回 (是否 at bot, 是否回复 bot, 命中的关键词列表)"""
+        # 机器人身份在 initialize() 时已经获取并缓存在 Bot 上，无需每条消息调用 get_me
+        bot_username = self.app.bot.username
+        is_at_bot = bot_username and (f"@{bot_username.lower()}" in message_text.lower())
+        
+        # 精确判断是否是回复给当前机器人的消息
+        is_reply_to_bot = False
+        if (update.message.reply_to_message 
+            and update.message.reply_to_message.from_user
+            and update.message.reply_to_message.from_user.is_bot
+            and hasattr(update.message.reply_to_message.from_user, 'id')):
+            # 确保回复的是当前机器人，而不是其他机器人
+            reply_bot_id = update.message.reply_to_message.from_user.id
+            is_reply_to_bot = (reply_bot_id == self.app.bot.id)
+
+        # ---- 检查关键词触发 ----
+        matched_keywords = self.data_manager.match_keywords(message_text)
+        return is_at_bot, is_reply_to_bot, matched_keywords
+
     async def handle_message(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         try:
             # 防止没有消息对象或是机器人发送的消息
@@ -557,39 +842,8 @@ class TelegramBot:
             if not message_text:
                 return
 
-            # ---- 检查是否 at bot 或 回复 bot ----
-            bot_username = (await self.app.bot.get_me()).username
-            is_at_bot = bot_username and (f"@{bot_username.lower()}" in message_text.lower())
-            
-            # 精确判断是否是回复给当前机器人的消息
-            is_reply_to_bot = False
-            if (update.message.reply_to_message 
-                and update.message.reply_to_message.from_user
-                and update.message.reply_to_message.from_user.is_bot
-                and hasattr(update.message.reply_to_message.from_user, 'id')):
-                # 确保回复的是当前机器人，而不是其他机器人
-                reply_bot_id = update.message.reply_to_message.from_user.id
-                current_bot_id = (await self.app.bot.get_me()).id
-                is_reply_to_bot = (reply_bot_id == current_bot_id)
-
-            # ---- 检查关键词触发 ----
-            keywords = []
-            if hasattr(self.data_manager, 'get_keywords'):
-                try:
-                    keywords = self.data_manager.get_keywords()
-                except Exception:
-                    logger.exception("data_manager.get_keywords 调用失败，尝试从文件加载")
-                    keywords = self._safe_load('keyword_file', [])
-            else:
-                keywords = self._safe_load('keyword_file', [])
-
-            matched_keywords = []
-            for item in keywords:
-                k = item.get('keyword') if isinstance(item, dict) else item
-                if not k:
-                    continue
-                if k.lower() in message_text.lower():
-                    matched_keywords.append(k)
+            # ---- 检查是否 at bot、回复 bot 或命中关键词 ----
+            is_at_bot, is_reply_to_bot, matched_keywords = self._check_triggers(update, message_text)
 
             # 如果没有关键词匹配，且不是 at bot 或回复 bot，就直接返回
             if not (matched_keywords or is_at_bot or is_reply_to_bot):
@@ -601,8 +855,7 @@ class TelegramBot:
 
             # 群组授权检查
             if self._is_supergroup_or_group(update):
-                groups = [int(g) for g in self._safe_load('group_file', [])]
-                if update.effective_chat.id not in groups:
+                if not self.data_manager.is_group_authorized(update.effective_chat.id):
                     # 未授权群组不处理消息
                     return
                     
@@ -610,29 +863,76 @@ class TelegramBot:
             if not (matched_keywords or is_at_bot or is_reply_to_bot):
                 return
                 
-            # 调用 AI 服务
-            user_name = update.effective_user.full_name if update.effective_user else 'user'
-            try:
-                response_text = await self.ai_service.chat_completion(
-                    messages=[
-                        {'role': 'system', 'content': self.current_prompt},
-                        {'role': 'user', 'content': message_text}
-                    ],
-                    user_name=user_name,
-                )
-                # 确保 response_text 是字符串，不是 None
-                if response_text is None:
-                    response_text = "AI 服务返回了空响应"
-            except Exception:
-                logger.exception("ai_service.chat_completion 调用失败")
-                response_text = "抱歉，AI 服务暂时不可用。"
-
-            # 用统一的 _reply 发送（支持 /boom 自毁）
-            await self._reply(update, response_text)
+            # 合并同一会话中连续发送的消息，并取消被取代的进行中请求
+            await self.coordinator.submit(
+                (update.effective_chat.id, update.effective_user.id),
+                update,
+                message_text,
+                self._answer,
+            )
 
         except Exception as e:
             logger.exception("handle_message 出现异常: %s", e)
 
+    async def _answer(self, update: Update, message_text: str):
+        """调用 AI 服务回答一条（可能由多条消息合并而成的）消息"""
+        user_name = update.effective_user.full_name if update.effective_user else 'user'
+        chat_id = update.effective_chat.id
+        user_id = update.effective_user.id
+        cache_key = None
+        with_history = True
+        if self.response_cache is not None:
+            # 只缓存不依赖历史的请求：会话的第一轮，或仅由关键词触发（未 at bot、未回复 bot）的消息，
+            # 后者不带历史回答
+            is_at_bot, is_reply_to_bot, matched_keywords = self._check_triggers(update, message_text)
+            with_history = bool(is_at_bot or is_reply_to_bot or not matched_keywords)
+            if not with_history or not self.conversations.get_history(chat_id, user_id):
+                cache_key = self.response_cache.make_key(
+                    self.ai_service.current_model, self.current_prompt, message_text
+                )
+                cached = self.response_cache.get(cache_key)
+                if cached is not None:
+                    self.conversations.append_turn(chat_id, user_id, message_text, cached)
+                    await self._reply(update, cached)
+                    return
+
+        # 带上该会话的历史记录；用户名在查询缓存之后才拼进提示词，并计入 token 预算
+        messages = self.conversations.build_messages(
+            chat_id,
+            user_id,
+            self.current_prompt,
+            message_text,
+            user_name=user_name,
+            with_history=with_history,
+        )
+
+        if self.config.ai_stream:
+            response_text = await self._stream_reply(
+                update,
+                self.ai_service.stream_chat_completion(messages=messages),
+            )
+            if response_text is not None:
+                self.conversations.append_turn(chat_id, user_id, message_text, response_text)
+                if cache_key is not None:
+                    self.response_cache.set(cache_key, response_text)
+            return
+
+        try:
+            response_text = await self.ai_service.chat_completion(messages=messages)
+            # 确保 response_text 是字符串，不是 None
+            if response_text is None:
+                response_text = "AI 服务返回了空响应"
+            else:
+                self.conversations.append_turn(chat_id, user_id, message_text, response_text)
+                if cache_key is not None:
+                    self.response_cache.set(cache_key, response_text)
+        except Exception:
+            logger.exception("ai_service.chat_completion 调用失败")
+            response_text = "抱歉，AI 服务暂时不可用。"
+
+        # 用统一的 _reply 发送（支持 /boom 自毁）
+        await self._reply(update, response_text)
+
     def run(self):
         logger.info("Bot starting...")
         self.app.run_polling()
@@ -38,4 +38,109 @@ class Config:
         
     @property
     def ai_base_url(self):
-        return self.config['DEFAULT']['ai_base_url']
\ No newline at end of file
+        return self.config['DEFAULT']['ai_base_url']
+
+    @property
+    def flush_interval(self):
+        # 数据写回磁盘的批量间隔（秒），0 表示每次修改后立即写回
+        return self.config['DEFAULT'].getfloat('flush_interval', fallback=1.0)
+
+    @property
+    def ai_timeout(self):
+        # 单次 AI 请求的超时时间（秒）
+        return self.config['DEFAULT'].getfloat('ai_timeout', fallback=60.0)
+
+    @property
+    def ai_max_connections(self):
+        # AI 接口 HTTP 连接池大小
+        return self.config['DEFAULT'].getint('ai_max_connections', fallback=20)
+
+    @property
+    def ai_concurrency(self):
+        # 同时进行中的 AI 请求上限
+        return self.config['DEFAULT'].getint('ai_concurrency', fallback=8)
+
+    @property
+    def concurrent_updates(self):
+        # 同时处理的 Telegram 更新数量，1 表示按顺序处理
+        return self.config['DEFAULT'].getint('concurrent_updates', fallback=32)
+
+    @property
+    def ai_stream(self):
+        # 是否以流式方式输出 AI 回复（先发占位消息，再逐步编辑）
+        return self.config['DEFAULT'].getboolean('ai_stream', fallback=True)
+
+    @property
+    def stream_edit_interval(self):
+        # 流式输出时两次编辑消息之间的最小间隔（秒）
+        return self.config['DEFAULT'].getfloat('stream_edit_interval', fallback=1.0)
+
+    @property
+    def stream_edit_tokens(self):
+        # 流式输出时累计多少个片段后提前编辑一次，0 表示只按时间间隔编辑
+        return self.config['DEFAULT'].getint('stream_edit_tokens', fallback=0)
+
+    @property
+    def persistence_file(self):
+        # 对话历史等运行时数据的持久化文件，留空表示不持久化
+        return self.config['DEFAULT'].get('persistence_file', fallback='data/bot_state.pickle')
+
+    @property
+    def max_conversations(self):
+        # 最多保留多少个会话的对话历史（超出后淘汰最久未使用的会话）
+        return self.config['DEFAULT'].getint('max_conversations', fallback=1000)
+
+    @property
+    def history_max_tokens(self):
+        # 每次请求发送给模型的提示词（含历史）的 token 上限
+        return self.config['DEFAULT'].getint('history_max_tokens', fallback=3000)
+
+    @property
+    def identity_refresh_interval(self):
+        # 定期刷新机器人身份（用户名等）的间隔（秒），0 表示只在启动时获取一次
+        return self.config['DEFAULT'].getfloat('identity_refresh_interval', fallback=0.0)
+
+    @property
+    def ai_cache_enabled(self):
+        # 是否缓存 AI 回复（相同模型、提示词和问题直接返回缓存结果）
+        return self.config['DEFAULT'].getboolean('ai_cache_enabled', fallback=False)
+
+    @property
+    def ai_cache_ttl(self):
+        # AI 回复缓存的有效期（秒）
+        return self.config['DEFAULT'].getfloat('ai_cache_ttl', fallback=3600.0)
+
+    @property
+    def ai_cache_max_entries(self):
+        # AI 回复缓存最多保留的条目数（超出后淘汰最久未使用的条目）
+        return self.config['DEFAULT'].getint('ai_cache_max_entries', fallback=1000)
+
+    @property
+    def ai_cache_file(self):
+        # AI 回复缓存的磁盘文件，重启后仍可命中；留空表示只缓存在内存中
+        return self.config['DEFAULT'].get('ai_cache_file', fallback='data/ai_cache.json')
+
+    @property
+    def coalesce_window(self):
+        # 同一用户连续发送的消息在该时间窗口（秒）内会合并为一次 AI 请求，0 表示不等待
+        return self.config['DEFAULT'].getfloat('coalesce_window', fallback=1.0)
+
+    @property
+    def max_backlog(self):
+        # 普通优先级更新的最大排队数，超出后直接回复繁忙
+        return self.config['DEFAULT'].getint('max_backlog', fallback=100)
+
+    @property
+    def breaker_failure_threshold(self):
+        # 熔断器：连续失败多少次后熔断（Telegram 与 AI 接口各自独立计数）
+        return self.config['DEFAULT'].getint('breaker_failure_threshold', fallback=5)
+
+    @property
+    def breaker_error_rate(self):
+        # 熔断器：最近一分钟内失败比例达到该值（且请求数不少于 20）时熔断，0 表示不按比例熔断
+        return self.config['DEFAULT'].getfloat('breaker_error_rate', fallback=0.5)
+
+    @property
+    def breaker_recovery_timeout(self):
+        # 熔断器：熔断后等待多少秒再放行探测请求
+        return self.config['DEFAULT'].getfloat('breaker_recovery_timeout', fallback=30.0)
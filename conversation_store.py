@@ -0,0 +1,146 @@
+import time
+from collections import OrderedDict
+
+# chat_data 中保存对话历史使用的键
+CONVERSATIONS_KEY = 'conversations'
+# 用户消息超出 token 预算被截断时追加的标记
+TRUNCATION_MARK = '…（消息过长，已截断）'
+
+
+def estimate_tokens(text):
+    """粗略估算文本的 token 数：中日韩字符按 1 个计，其余字符约 4 个计 1 个"""
+    cjk = sum(1 for ch in text if ord(ch) >= 0x2E80)
+    # 每条消息额外加上角色等格式开销
+    return cjk + (len(text) - cjk + 3) // 4 + 4
+
+
+def with_user_name(system_prompt, user_name):
+    """在系统提示词末尾注明当前用户"""
+    if not user_name:
+        return system_prompt
+    return f"{system_prompt}\n当前用户: {user_name}"
+
+
+def truncate_tokens(text, budget):
+    """截断文本，使其估算的 token 数不超过预算"""
+    if estimate_tokens(text) <= budget:
+        return text
+    if estimate_tokens(TRUNCATION_MARK) > budget:
+        # 预算连截断标记都放不下
+        return ''
+    # 二分查找满足预算的最长前缀（估算值随长度单调不减）
+    low, high = 0, len(text)
+    while low < high:
+        mid = (low + high + 1) // 2
+        if estimate_tokens(text[:mid] + TRUNCATION_MARK) <= budget:
+            low = mid
+        else:
+            high = mid - 1
+    return text[:low] + TRUNCATION_MARK
+
+
+class ConversationStore:
+    """按 (会话, 用户) 保存的对话历史
+
+    历史记录存放在 Application.chat_data 中，因此配置了 BasePersistence 时会随之持久化。
+    会话数量使用 LRU 限制，每个会话的历史按 token 预算截断，内存和提示词大小都不会无限增长。
+    """
+
+    def __init__(self, application, max_conversations=1000, max_tokens=3000):
+        self.app = application
+        self.max_conversations = max_conversations
+        self.max_tokens = max_tokens
+        # (chat_id, user_id) -> None，按最近使用顺序排列
+        self._lru = OrderedDict()
+
+    def load(self):
+        """从（已由持久化恢复的）chat_data 中重建 LRU 顺序"""
+        entries = []
+        for chat_id, chat_data in self.app.chat_data.items():
+            for user_id, conv in chat_data.get(CONVERSATIONS_KEY, {}).items():
+                entries.append((conv.get('last_used', 0), chat_id, user_id))
+        self._lru.clear()
+        for _, chat_id, user_id in sorted(entries):
+            self._lru[(chat_id, user_id)] = None
+        self._evict()
+
+    def _conversations(self, chat_id):
+        return self.app.chat_data[chat_id].setdefault(CONVERSATIONS_KEY, {})
+
+    def _touch(self, chat_id, user_id):
+        key = (chat_id, user_id)
+        self._lru[key] = None
+        self._lru.move_to_end(key)
+        self._evict()
+
+    def _evict(self):
+        while len(self._lru) > self.max_conversations:
+            (chat_id, user_id), _ = self._lru.popitem(last=False)
+            self.clear(chat_id, user_id)
+
+    def _trim(self, messages, budget):
+        # 从最早的一轮开始丢弃，直到历史总 token 数不超过预算
+        total = sum(estimate_tokens(m['content']) for m in messages)
+        start = 0
+        while start < len(messages) and total > budget:
+            total -= estimate_tokens(messages[start]['content'])
+            start += 1
+        # 保证历史从用户消息开始
+        while start < len(messages) and messages[start]['role'] != 'user':
+            total -= estimate_tokens(messages[start]['content'])
+            start += 1
+        return messages[start:]
+
+    def get_history(self, chat_id, user_id):
+        conv = self.app.chat_data.get(chat_id, {}).get(CONVERSATIONS_KEY, {}).get(user_id)
+        return list(conv['messages']) if conv else []
+
+    def build_messages(
+        self, chat_id, user_id, system_prompt, user_text, user_name=None, with_history=True
+    ):
+        """组装发送给模型的消息列表，总 token 数不超过预算
+
+        user_name 会先拼进系统提示词再计算预算。超长的用户消息（例如合并后的连续消息）
+        会被截断到系统提示词之外剩余的预算内。with_history 为 False 时不带对话历史。
+        """
+        system_prompt = with_user_name(system_prompt, user_name)
+        budget = self.max_tokens - estimate_tokens(system_prompt)
+        user_text = truncate_tokens(user_text, max(budget, 0))
+        budget -= estimate_tokens(user_text)
+        history = self.get_history(chat_id, user_id) if with_history else []
+        history = self._trim(history, max(budget, 0))
+        return (
+            [{'role': 'system', 'content': system_prompt}]
+            + [dict(m) for m in history]
+            + [{'role': 'user', 'content': user_text}]
+        )
+
+    def append_turn(self, chat_id, user_id, user_text, assistant_text):
+        conversations = self._conversations(chat_id)
+        conv = conversations.setdefault(user_id, {'messages': []})
+        messages = conv['messages'] + [
+            {'role': 'user', 'content': user_text},
+            {'role': 'assistant', 'content': assistant_text},
+        ]
+        conv['messages'] = self._trim(messages, self.max_tokens)
+        conv['last_used'] = time.time()
+        self._touch(chat_id, user_id)
+
+    def clear(self, chat_id, user_id=None):
+        chat_data = self.app.chat_data.get(chat_id)
+        if chat_data is None:
+            return
+        conversations = chat_data.get(CONVERSATIONS_KEY, {})
+        if user_id is None:
+            for uid in list(conversations):
+                self._lru.pop((chat_id, uid), None)
+            conversations.clear()
+        else:
+            conversations.pop(user_id, None)
+            self._lru.pop((chat_id, user_id), None)
+        if not conversations:
+            chat_data.pop(CONVERSATIONS_KEY, None)
+        if not chat_data:
+            self.app.drop_chat_data(chat_id)
+        else:
+            self.app.mark_data_for_update_persistence(chat_ids=chat_id)
@@ -1,91 +1,256 @@
 import json
 import os
+import copy
+import logging
+import tempfile
+import threading
 from pathlib import Path
 
+from keyword_matcher import KeywordMatcher
+
+logger = logging.getLogger(__name__)
+
+
+def atomic_write_json(file, data):
+    """先写临时文件再 rename，保证磁盘上的文件要么是旧内容要么是新内容"""
+    file = Path(file)
+    fd, tmp_path = tempfile.mkstemp(dir=file.parent, prefix=f".{file.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'w') as f:
+            json.dump(data, f, indent=4)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, file)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
 class DataManager:
-    def __init__(self):
+    def __init__(self, flush_interval=1.0):
         self.data_dir = Path("data")
         self.data_dir.mkdir(exist_ok=True)
-        
+
         self.admin_file = self.data_dir / "admins.json"
         self.group_file = self.data_dir / "groups.json"
         self.prompt_file = self.data_dir / "prompts.json"
         self.keyword_file = self.data_dir / "keywords.json"
         self.model_file = self.data_dir / "models.json"
-        
+
+        # 内存中的数据，启动时从磁盘读取一次，之后所有读操作都走内存
+        self._data = {}
+        self._admin_ids = set()
+        self._group_ids = set()
+        self._keyword_matcher = KeywordMatcher()
+
+        # 写回（write-behind）：修改只标记为脏，由后台线程按间隔批量落盘
+        self.flush_interval = flush_interval
+        self._lock = threading.RLock()
+        self._flush_lock = threading.Lock()
+        self._dirty = set()
+        self._wakeup = threading.Event()
+        self._closed = False
+
         self._init_files()
-        
+        self._load_all()
+
+        self._writer = threading.Thread(
+            target=self._writer_loop, name="DataManager-writer", daemon=True
+        )
+        self._writer.start()
+
     def _init_files(self):
-        for file in [self.admin_file, self.group_file, 
-                    self.prompt_file, self.keyword_file, self.model_file]:
+        for file in self._files():
             if not file.exists():
                 with open(file, 'w') as f:
                     json.dump([], f)
-    
+
+    def _files(self):
+        return [self.admin_file, self.group_file,
+                self.prompt_file, self.keyword_file, self.model_file]
+
+    def _load_all(self):
+        for file in self._files():
+            try:
+                with open(file, 'r') as f:
+                    data = json.load(f)
+            except (OSError, ValueError):
+                logger.exception("读取 %s 失败，使用空列表", file)
+                data = []
+            self._data[file] = data if isinstance(data, list) else []
+        self._rebuild_index(self.admin_file)
+        self._rebuild_index(self.group_file)
+        self._rebuild_index(self.keyword_file)
+
+    @staticmethod
+    def _to_id_set(items):
+        ids = set()
+        for item in items:
+            try:
+                ids.add(int(item))
+            except (TypeError, ValueError):
+                logger.warning("忽略无效的ID: %r", item)
+        return ids
+
+    def _rebuild_index(self, file):
+        if file == self.admin_file:
+            self._admin_ids = self._to_id_set(self._data[file])
+        elif file == self.group_file:
+            self._group_ids = self._to_id_set(self._data[file])
+        elif file == self.keyword_file:
+            # 关键词变化时重新编译匹配自动机
+            self._keyword_matcher = KeywordMatcher(
+                item.get('keyword') if isinstance(item, dict) else item
+                for item in self._data[file]
+            )
+
+    def _mark_dirty(self, file):
+        self._rebuild_index(file)
+        self._dirty.add(file)
+        if self.flush_interval <= 0:
+            # 间隔为 0 时不做批量合并，立即唤醒后台线程落盘
+            self._wakeup.set()
+
     def load_data(self, file):
-        with open(file, 'r') as f:
-            return json.load(f)
-            
+        # 返回副本，调用方可以随意修改后再通过 save_data 写回
+        with self._lock:
+            return copy.deepcopy(self._data[Path(file)])
+
     def save_data(self, file, data):
-        with open(file, 'w') as f:
-            json.dump(data, f, indent=4)
-            
+        with self._lock:
+            self._data[Path(file)] = copy.deepcopy(list(data))
+            self._mark_dirty(Path(file))
+
+    # ---- 后台写回 ----
+    def flush(self):
+        """把所有脏数据立即写入磁盘"""
+        # 串行化落盘，避免较旧的快照覆盖较新的快照
+        with self._flush_lock:
+            with self._lock:
+                pending = {file: copy.deepcopy(self._data[file]) for file in self._dirty}
+                self._dirty.clear()
+            for file, data in pending.items():
+                try:
+                    atomic_write_json(file, data)
+                except Exception:
+                    logger.exception("写入 %s 失败，稍后重试", file)
+                    with self._lock:
+                        self._dirty.add(file)
+
+    def _writer_loop(self):
+        while not self._closed:
+            self._wakeup.wait(self.flush_interval if self.flush_interval > 0 else None)
+            self._wakeup.clear()
+            self.flush()
+
+    def close(self):
+        """停止后台写回线程并把剩余数据落盘"""
+        if self._closed:
+            return
+        self._closed = True
+        self._wakeup.set()
+        self._writer.join()
+        self.flush()
+
     # 管理员管理方法
+    def is_admin(self, user_id):
+        return user_id in self._admin_ids
+
+    def get_admins(self):
+        return self.load_data(self.admin_file)
+
     def add_admin(self, user_id):
-        admins = self.load_data(self.admin_file)
-        if user_id not in admins:
-            admins.append(user_id)
-            self.save_data(self.admin_file, admins)
+        with self._lock:
+            if user_id in self._admin_ids:
+                return False
+            self._data[self.admin_file].append(user_id)
+            self._mark_dirty(self.admin_file)
             return True
-        return False
-        
+
     def remove_admin(self, index):
-        admins = self.load_data(self.admin_file)
-        if 0 <= index < len(admins):
-            admins.pop(index)
-            self.save_data(self.admin_file, admins)
-            return True
-        return False
-        
+        with self._lock:
+            admins = self._data[self.admin_file]
+            if 0 <= index < len(admins):
+                admins.pop(index)
+                self._mark_dirty(self.admin_file)
+                return True
+            return False
+
     # 群组管理方法
+    def is_group_authorized(self, group_id):
+        return group_id in self._group_ids
+
+    def authorize_group(self, group_id):
+        with self._lock:
+            if group_id in self._group_ids:
+                return False
+            self._data[self.group_file].append(group_id)
+            self._mark_dirty(self.group_file)
+            return True
+
     def deauthorize_group(self, group_id):
-        groups = self.load_data(self.group_file)
-        if group_id in groups:
-            groups.remove(group_id)
-            self.save_data(self.group_file, groups)
+        with self._lock:
+            if group_id not in self._group_ids:
+                return False
+            groups = self._data[self.group_file]
+            groups[:] = [g for g in groups if g != group_id and str(g) != str(group_id)]
+            self._mark_dirty(self.group_file)
             return True
-        return False
-        
+
     # 提示词管理方法
     def get_prompts(self):
         return self.load_data(self.prompt_file)
-        
+
+    def add_prompt(self, prompt):
+        with self._lock:
+            self._data[self.prompt_file].append(prompt)
+            self._mark_dirty(self.prompt_file)
+            return len(self._data[self.prompt_file])
+
     def remove_prompt(self, index):
-        prompts = self.load_data(self.prompt_file)
-        if 0 <= index < len(prompts):
-            prompts.pop(index)
-            self.save_data(self.prompt_file, prompts)
-            return True
-        return False
-        
+        with self._lock:
+            prompts = self._data[self.prompt_file]
+            if 0 <= index < len(prompts):
+                prompts.pop(index)
+                self._mark_dirty(self.prompt_file)
+                return True
+            return False
+
     # 关键词管理方法
     def add_keyword(self, keyword, response):
-        keywords = self.load_data(self.keyword_file)
-        keywords.append({"keyword": keyword, "response": response})
-        self.save_data(self.keyword_file, keywords)
-        return True
-        
+        with self._lock:
+            self._data[self.keyword_file].append({"keyword": keyword, "response": response})
+            self._mark_dirty(self.keyword_file)
+            return True
+
+    def remove_keyword(self, index):
+        with self._lock:
+            keywords = self._data[self.keyword_file]
+            if 0 <= index < len(keywords):
+                keywords.pop(index)
+                self._mark_dirty(self.keyword_file)
+                return True
+            return False
+
     def get_keywords(self):
         return self.load_data(self.keyword_file)
-        
+
+    def match_keywords(self, text):
+        """一次扫描返回 text 中命中的所有关键词"""
+        return self._keyword_matcher.find_all(text)
+
     # 模型管理方法
     def add_model(self, model_name):
-        models = self.load_data(self.model_file)
-        if model_name not in models:
-            models.append(model_name)
-            self.save_data(self.model_file, models)
-            return True
-        return False
-        
+        with self._lock:
+            models = self._data[self.model_file]
+            if model_name not in models:
+                models.append(model_name)
+                self._mark_dirty(self.model_file)
+                return True
+            return False
+
     def get_models(self):
-        return self.load_data(self.model_file)
\ No newline at end of file
+        return self.load_data(self.model_file)
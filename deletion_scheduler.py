@@ -0,0 +1,80 @@
+import asyncio
+import heapq
+import logging
+import time
+from collections import defaultdict
+
+from telegram.constants import BulkRequestLimit
+
+logger = logging.getLogger(__name__)
+
+# bot_data 中保存待删除消息的键
+PENDING_DELETIONS_KEY = 'pending_deletions'
+
+
+class DeletionScheduler:
+    """消息自毁调度器
+
+    所有待删除的消息保存在一个按到期时间排序的小顶堆中，由单个后台任务等待最早到期的条目，
+    同时到期的消息按会话合并，每次最多 100 条调用 Bot.delete_messages 删除。
+    堆直接存放在 Application.bot_data 中，配置了持久化时重启后仍会按时删除。
+    """
+
+    def __init__(self, application):
+        self.app = application
+        self._heap = []
+        self._wakeup = asyncio.Event()
+        self._task = None
+
+    def __len__(self):
+        return len(self._heap)
+
+    async def start(self):
+        # bot_data 已在 initialize() 中由持久化恢复
+        self._heap = self.app.bot_data.setdefault(PENDING_DELETIONS_KEY, [])
+        heapq.heapify(self._heap)
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    def schedule(self, chat_id, message_id, delay):
+        due = time.time() + delay
+        earliest = self._heap[0][0] if self._heap else None
+        heapq.heappush(self._heap, (due, chat_id, message_id))
+        if earliest is None or due < earliest:
+            self._wakeup.set()
+
+    def _pop_due(self):
+        now = time.time()
+        due = defaultdict(list)
+        while self._heap and self._heap[0][0] <= now:
+            _, chat_id, message_id = heapq.heappop(self._heap)
+            due[chat_id].append(message_id)
+        return due
+
+    async def _run(self):
+        while True:
+            timeout = None
+            if self._heap:
+                timeout = max(self._heap[0][0] - time.time(), 0)
+            self._wakeup.clear()
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+
+            for chat_id, message_ids in self._pop_due().items():
+                for i in range(0, len(message_ids), BulkRequestLimit.MAX_LIMIT):
+                    batch = message_ids[i:i + BulkRequestLimit.MAX_LIMIT]
+                    try:
+                        await self.app.bot.delete_messages(chat_id, batch)
+                    except Exception as e:
+                        logger.warning("删除会话 %s 中的 %d 条消息失败: %s", chat_id, len(batch), e)
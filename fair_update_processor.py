@@ -0,0 +1,148 @@
+import asyncio
+import inspect
+import logging
+from collections import OrderedDict, deque
+
+from telegram.ext import BaseUpdateProcessor
+
+logger = logging.getLogger(__name__)
+
+# 优先级：数值越小越优先
+PRIORITY_HIGH = 0
+PRIORITY_NORMAL = 1
+
+
+class FairUpdateProcessor(BaseUpdateProcessor):
+    """带准入控制的更新处理器，通过 ApplicationBuilder.concurrent_updates 接入
+
+    - 同时处理的更新数不超过 max_concurrent_updates，其余进入等待队列；
+    - 等待队列分为高/普通两个优先级，高优先级（管理员、私聊）总是先被处理；
+    - 同一优先级内按会话轮转（round-robin），单个刷屏的群不会饿死其他会话；
+    - 普通优先级的排队数超过 max_backlog 时直接丢弃新更新（调用 on_shed），不再无限排队。
+
+    classify(update) 返回 (优先级, 会话键)；on_shed(update) 是可选的协程函数，
+    用于给被丢弃的更新回复“繁忙”。
+    """
+
+    __slots__ = (
+        '_classify', '_on_shed', '_workers', '_max_backlog', '_running', '_lanes', '_queued',
+        'processed', 'shed', 'total_wait', 'max_wait',
+    )
+
+    def __init__(self, max_concurrent_updates, max_backlog, classify, on_shed=None):
+        # 基类的信号量只作为硬上限：高优先级更新不会被丢弃，为它们预留同样大小的余量
+        super().__init__(max_concurrent_updates + 2 * max_backlog)
+        self._classify = classify
+        self._on_shed = on_shed
+        self._workers = max_concurrent_updates
+        self._max_backlog = max_backlog
+        self._running = 0
+        # 每个优先级一条队列：会话键 -> 等待中的 (future, 入队时间)
+        self._lanes = (OrderedDict(), OrderedDict())
+        self._queued = [0, 0]
+        self.processed = 0
+        self.shed = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    @property
+    def queue_depth(self):
+        return self._queued[PRIORITY_HIGH] + self._queued[PRIORITY_NORMAL]
+
+    def stats(self):
+        return {
+            'running': self._running,
+            'workers': self._workers,
+            'queued_high': self._queued[PRIORITY_HIGH],
+            'queued_normal': self._queued[PRIORITY_NORMAL],
+            'max_backlog': self._max_backlog,
+            'processed': self.processed,
+            'shed': self.shed,
+            'avg_wait': self.total_wait / self.processed if self.processed else 0.0,
+            'max_wait': self.max_wait,
+        }
+
+    async def initialize(self):
+        pass
+
+    async def shutdown(self):
+        pass
+
+    def _dispatch(self):
+        # 有空闲名额时，按优先级、在同一优先级内按会话轮转唤醒等待者
+        while self._running < self._workers:
+            for priority, lane in enumerate(self._lanes):
+                if lane:
+                    break
+            else:
+                return
+            key, waiters = next(iter(lane.items()))
+            future, _ = waiters.popleft()
+            self._queued[priority] -= 1
+            if waiters:
+                lane.move_to_end(key)
+            else:
+                del lane[key]
+            if not future.done():
+                future.set_result(None)
+                self._running += 1
+
+    def _release(self):
+        self._running -= 1
+        self._dispatch()
+
+    def _remove_waiter(self, priority, key, entry):
+        waiters = self._lanes[priority].get(key)
+        if waiters is None:
+            return
+        try:
+            waiters.remove(entry)
+        except ValueError:
+            return
+        self._queued[priority] -= 1
+        if not waiters:
+            del self._lanes[priority][key]
+
+    async def do_process_update(self, update, coroutine):
+        loop = asyncio.get_running_loop()
+        priority, key = self._classify(update)
+        enqueued_at = loop.time()
+
+        if self._running < self._workers and not self.queue_depth:
+            self._running += 1
+        else:
+            if priority != PRIORITY_HIGH and self._queued[PRIORITY_NORMAL] >= self._max_backlog:
+                # 普通优先级积压过多，丢弃更新；排队的高优先级更新不计入
+                self.shed += 1
+                if inspect.iscoroutine(coroutine):
+                    coroutine.close()
+                if self._on_shed is not None:
+                    try:
+                        await self._on_shed(update)
+                    except Exception:
+                        logger.exception("处理被丢弃的更新时出错")
+                return
+
+            entry = (loop.create_future(), enqueued_at)
+            self._lanes[priority].setdefault(key, deque()).append(entry)
+            self._queued[priority] += 1
+            try:
+                await entry[0]
+            except asyncio.CancelledError:
+                if entry[0].done() and not entry[0].cancelled():
+                    # 已经分配到名额但在运行前被取消，归还名额
+                    self._release()
+                else:
+                    self._remove_waiter(priority, key, entry)
+                if inspect.iscoroutine(coroutine):
+                    coroutine.close()
+                raise
+
+        wait = loop.time() - enqueued_at
+        self.processed += 1
+        self.total_wait += wait
+        self.max_wait = max(self.max_wait, wait)
+        try:
+            await coroutine
+        finally:
+            self._release()
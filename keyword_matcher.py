@@ -0,0 +1,69 @@
+from collections import deque
+
+
+class KeywordMatcher:
+    """Aho–Corasick 多关键词匹配器
+
+    构建一次自动机后，对消息只需扫描一遍即可找出所有命中的关键词，
+    耗时与关键词数量无关（只与消息长度和命中数量有关）。匹配不区分大小写。
+    """
+
+    def __init__(self, keywords=()):
+        # 每个状态：转移表、失败指针、以该状态结尾的关键词序号
+        self._goto = [{}]
+        self._fail = [0]
+        self._output = [()]
+        self._keywords = []
+        for keyword in keywords:
+            self._add(keyword)
+        self._build()
+
+    def __len__(self):
+        return len(self._keywords)
+
+    def _add(self, keyword):
+        if not keyword:
+            return
+        index = len(self._keywords)
+        self._keywords.append(keyword)
+        state = 0
+        for ch in keyword.lower():
+            nxt = self._goto[state].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[state][ch] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append(())
+            state = nxt
+        self._output[state] += (index,)
+
+    def _build(self):
+        # 广度优先计算失败指针，并把失败状态的输出合并进来
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in self._goto[state].items():
+                queue.append(nxt)
+                fail = self._fail[state]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[nxt] = self._goto[fail].get(ch, 0)
+                if self._fail[nxt] == nxt:
+                    self._fail[nxt] = 0
+                self._output[nxt] += self._output[self._fail[nxt]]
+
+    def find_all(self, text):
+        """返回在 text 中出现过的关键词（按添加顺序，不重复）"""
+        goto = self._goto
+        fail = self._fail
+        output = self._output
+        hits = set()
+        state = 0
+        for ch in text.lower():
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if output[state]:
+                hits.update(output[state])
+        return [self._keywords[i] for i in sorted(hits)]
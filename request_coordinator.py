@@ -0,0 +1,69 @@
+import asyncio
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class _PendingState:
+    __slots__ = ('texts', 'inflight_texts', 'update', 'generation', 'task')
+
+    def __init__(self):
+        # 等待合并的消息、正在处理中的消息、最近一条消息对应的 update
+        self.texts = []
+        self.inflight_texts = []
+        self.update = None
+        self.generation = 0
+        self.task = None
+
+
+class RequestCoordinator:
+    """合并同一会话中短时间内连续发送的消息，并取消被新消息取代的 AI 请求
+
+    每条消息到达后等待 window 秒，期间同一会话的新消息会被合并进同一个请求；
+    如果上一次请求还在进行中，则取消它，并把它的消息一起合并到新请求里。
+    """
+
+    def __init__(self, window=1.0):
+        self.window = window
+        self._states = {}
+        self.cancelled = 0
+        self.merged = 0
+
+    async def submit(self, key, update, text, handler):
+        """提交一条消息；handler(update, merged_text) 只会对每批消息中的最后一条调用一次"""
+        state = self._states.get(key)
+        if state is None:
+            state = self._states[key] = _PendingState()
+
+        if state.task is not None and not state.task.done():
+            # 正在进行的请求已经被新消息取代
+            state.task.cancel()
+            state.texts = state.inflight_texts + state.texts
+            state.task = None
+            self.cancelled += 1
+        if state.texts:
+            self.merged += 1
+        state.texts.append(text)
+        state.update = update
+        state.generation += 1
+        generation = state.generation
+
+        await asyncio.sleep(self.window)
+        if state.generation != generation:
+            # 窗口期内有更新的消息，由它负责处理
+            return
+
+        texts, state.texts = state.texts, []
+        state.inflight_texts = texts
+        task = asyncio.create_task(handler(state.update, "\n".join(texts)))
+        state.task = task
+        try:
+            await asyncio.wait({task})
+        except asyncio.CancelledError:
+            task.cancel()
+            raise
+        finally:
+            if state.generation == generation:
+                self._states.pop(key, None)
+        if not task.cancelled() and task.exception() is not None:
+            logger.error("处理会话 %s 的请求失败", key, exc_info=task.exception())
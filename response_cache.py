@@ -0,0 +1,103 @@
+import hashlib
+import json
+import logging
+import time
+from collections import OrderedDict
+from pathlib import Path
+
+from data_manager import atomic_write_json
+
+logger = logging.getLogger(__name__)
+
+
+class ResponseCache:
+    """AI 回复缓存，按 (模型, 系统提示词, 归一化后的用户消息) 缓存
+
+    键中不含对话历史，调用方只应缓存不依赖历史的请求（会话的第一轮、仅由关键词触发的消息）。
+
+    内存中使用 TTL + LRU 淘汰；指定 path 时会在启动时加载、关闭时写回磁盘，
+    重启后仍未过期的条目可以继续命中。
+    """
+
+    def __init__(self, max_entries=1000, ttl=3600.0, path=None):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.path = Path(path) if path else None
+        # key -> (过期时间戳, 回复内容)，按最近使用顺序排列
+        self._entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    @staticmethod
+    def make_key(model, system_prompt, text):
+        # 归一化：忽略大小写与多余空白
+        normalized = " ".join(text.casefold().split())
+        raw = json.dumps([model, system_prompt, normalized], ensure_ascii=False)
+        return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+
+    def get(self, key):
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] <= time.time():
+            del self._entries[key]
+            entry = None
+        if entry is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[1]
+
+    def set(self, key, value):
+        self._entries[key] = (time.time() + self.ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self):
+        total = self.hits + self.misses
+        return {
+            'entries': len(self._entries),
+            'max_entries': self.max_entries,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / total if total else 0.0,
+        }
+
+    # ---- 磁盘层 ----
+    def load(self):
+        if self.path is None or not self.path.exists():
+            return
+        try:
+            with open(self.path, 'r') as f:
+                entries = json.load(f)
+        except (OSError, ValueError):
+            logger.exception("读取 AI 回复缓存 %s 失败", self.path)
+            return
+        now = time.time()
+        for key, expires_at, value in entries:
+            if expires_at > now:
+                self._entries[key] = (expires_at, value)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def save(self):
+        if self.path is None:
+            return
+        now = time.time()
+        entries = [
+            [key, expires_at, value]
+            for key, (expires_at, value) in self._entries.items()
+            if expires_at > now
+        ]
+        try:
+            atomic_write_json(self.path, entries)
+        except Exception:
+            logger.exception("写入 AI 回复缓存 %s 失败", self.path)
@@ -273,7 +273,8 @@ class Bot(TelegramObject, contextlib.AbstractAsyncContextManager["Bot"]):
                Supports callable input and string formatting.
         request (:class:`telegram.request.BaseRequest`, optional): Pre initialized
             :class:`telegram.request.BaseRequest` instances. Will be used for all bot methods
-            *except* for :meth:`get_updates`. If not passed, an instance of
+            *except* for :meth:`get_updates` and the ones covered by :paramref:`upload_request`
+            and :paramref:`download_request`. If not passed, an instance of
             :class:`telegram.request.HTTPXRequest` will be used.
         get_updates_request (:class:`telegram.request.BaseRequest`, optional): Pre initialized
             :class:`telegram.request.BaseRequest` instances. Will be used exclusively for
@@ -289,6 +290,17 @@ class Bot(TelegramObject, contextlib.AbstractAsyncContextManager["Bot"]):
             Defaults to :obj:`False`.
 
             .. versionadded:: 20.0.
+        upload_request (:class:`telegram.request.BaseRequest`, optional): Pre initialized
+            :class:`telegram.request.BaseRequest` instance. Will be used for all bot methods that
+            upload files, so that large uploads don't occupy the connections needed by other
+            requests. If not passed, :paramref:`request` will be used.
+
+            .. versionadded:: NEXT.VERSION
+        download_request (:class:`telegram.request.BaseRequest`, optional): Pre initialized
+            :class:`telegram.request.BaseRequest` instance. Will be used for downloading files via
+            :class:`telegram.File`. If not passed, :paramref:`request` will be used.
+
+            .. versionadded:: NEXT.VERSION
 
     .. include:: inclusions/bot_methods.rst
 
@@ -305,11 +317,13 @@ class Bot(TelegramObject, contextlib.AbstractAsyncContextManager["Bot"]):
         "_base_file_url",
         "_base_url",
         "_bot_user",
+        "_download_request",
         "_initialized",
         "_local_mode",
         "_private_key",
         "_request",
         "_token",
+        "_upload_request",
     )
 
     def __init__(
@@ -322,6 +336,9 @@ class Bot(TelegramObject, contextlib.AbstractAsyncContextManager["Bot"]):
         private_key: Optional[bytes] = None,
         private_key_password: Optional[bytes] = None,
         local_mode: bool = False,
+        *,
+        upload_request: Optional[BaseRequest] = None,
+        download_request: Optional[BaseRequest] = None,
     ):
         super().__init__(api_kwargs=None)
         if not token:
@@ -346,6 +363,9 @@ class Bot(TelegramObject, contextlib.AbstractAsyncContextManager["Bot"]):
             ),
             HTTPXRequest() if request is None else request,
         )
+        # If not set, uploads and downloads use self._request[1]
+        self._upload_request: Optional[BaseRequest] = upload_request
+        self._download_request: Optional[BaseRequest] = download_request
 
         # this section is about issuing a warning when using HTTP/2 and connect to a self-hosted
         # bot api instance, which currently only supports HTTP/1.1. Checking if a custom base url
@@ -526,6 +546,35 @@ class Bot(TelegramObject, contextlib.AbstractAsyncContextManager["Bot"]):
         """
         return self._request[1]
 
+    @property
+    def upload_request(self) -> BaseRequest:
+        """The :class:`~telegram.request.BaseRequest` object used by this bot for requests that
+        upload files.
+
+        Warning:
+            Requests to the Bot API are made by the various methods of this class. This attribute
+            should *not* be used manually.
+
+        .. versionadded:: NEXT.VERSION
+        """
+        if self._upload_request is None:
+            return self._request[1]
+        return self._upload_request
+
+    @property
+    def download_request(self) -> BaseRequest:
+        """The :class:`~telegram.request.BaseRequest` object used for downloading files via
+        :class:`telegram.File`.
+
+        Warning:
+            This attribute should *not* be used manually.
+
+        .. versionadded:: NEXT.VERSION
+        """
+        if self._download_request is None:
+            return self._request[1]
+        return self._download_request
+
     @property
     def bot(self) -> User:
         """:class:`telegram.User`: User instance for the bot as returned by :meth:`get_me`.
@@ -725,7 +774,12 @@ class Bot(TelegramObject, contextlib.AbstractAsyncContextManager["Bot"]):
             parameters=[RequestParameter.from_input(key, value) for key, value in data.items()],
         )
 
-        request = self._request[0] if endpoint == "getUpdates" else self._request[1]
+        if endpoint == "getUpdates":
+            request = self._request[0]
+        elif request_data.contains_files:
+            request = self.upload_request
+        else:
+            request = self._request[1]
 
         self._LOGGER.debug("Calling Bot API endpoint `%s` with parameters `%s`", endpoint, data)
         result = await request.post(
@@ -826,6 +880,11 @@ class Bot(TelegramObject, contextlib.AbstractAsyncContextManager["Bot"]):
 
         return Message.de_json(result, self)
 
+    def _unique_requests(self) -> list[BaseRequest]:
+        # the same request object may serve several traffic classes
+        requests = (*self._request, self.upload_request, self.download_request)
+        return list({id(request): request for request in requests}.values())
+
     async def initialize(self) -> None:
         """Initialize resources used by this class. Currently calls :meth:`get_me` to
         cache :attr:`bot` and calls :meth:`telegram.request.BaseRequest.initialize` for
@@ -839,7 +898,7 @@ class Bot(TelegramObject, contextlib.AbstractAsyncContextManager["Bot"]):
             self._LOGGER.debug("This Bot is already initialized.")
             return
 
-        await asyncio.gather(self._request[0].initialize(), self._request[1].initialize())
+        await asyncio.gather(*(request.initialize() for request in self._unique_requests()))
         # this needs to be set before we call get_me, since this can trigger an error in the
         # request backend, which would then NOT lead to a proper shutdown if this flag isn't set
         self._initialized = True
@@ -862,7 +921,7 @@ class Bot(TelegramObject, contextlib.AbstractAsyncContextManager["Bot"]):
             self._LOGGER.debug("This Bot is already shut down. Returning.")
             return
 
-        await asyncio.gather(self._request[0].shutdown(), self._request[1].shutdown())
+        await asyncio.gather(*(request.shutdown() for request in self._unique_requests()))
         self._initialized = False
 
     async def do_api_request(
@@ -22,9 +22,9 @@ import shutil
 import urllib.parse as urllib_parse
 from base64 import b64decode
 from pathlib import Path
-from typing import TYPE_CHECKING, BinaryIO, Optional
+from typing import TYPE_CHECKING, BinaryIO, Callable, Final, Optional
 
-from telegram._passport.credentials import decrypt
+from telegram._passport.credentials import StreamDecryptor
 from telegram._telegramobject import TelegramObject
 from telegram._utils.defaultvalue import DEFAULT_NONE
 from telegram._utils.files import is_local_file
@@ -33,6 +33,9 @@ from telegram._utils.types import FilePathInput, JSONDict, ODVInput
 if TYPE_CHECKING:
     from telegram import FileCredentials
 
+_CHUNK_SIZE: Final[int] = 64 * 1024
+"""The size of the chunks in which files are downloaded and decrypted."""
+
 
 class File(TelegramObject):
     """
@@ -115,8 +118,81 @@ class File(TelegramObject):
             )
         )
 
-    def _prepare_decrypt(self, buf: bytes) -> bytes:
-        return decrypt(b64decode(self._credentials.secret), b64decode(self._credentials.hash), buf)
+    async def _download(
+        self,
+        write: Callable[[bytes], object],
+        read_timeout: ODVInput[float],
+        write_timeout: ODVInput[float],
+        connect_timeout: ODVInput[float],
+        pool_timeout: ODVInput[float],
+        offset: int = 0,
+    ) -> None:
+        """Passes the (decrypted) contents of the file to ``write`` chunk by chunk, such that the
+        file is never held in memory as a whole. For encrypted files, the hash is verified only
+        after the last chunk was passed to ``write``.
+
+        The first ``offset`` bytes of the file are skipped, which is used to resume downloads.
+        Encrypted files can only be decrypted as a whole.
+        """
+        if offset and self._credentials:
+            raise RuntimeError("Encrypted files can not be downloaded from an offset.")
+
+        decryptor = (
+            StreamDecryptor(b64decode(self._credentials.secret), b64decode(self._credentials.hash))
+            if self._credentials
+            else None
+        )
+
+        if is_local_file(self.file_path):
+            # Files of a local Bot API server are on the same machine. Reading them in chunks
+            # blocks the event loop only briefly, so a thread is not worth its overhead
+            with Path(self.file_path).open("rb") as file:  # noqa: ASYNC230
+                file.seek(offset)
+                while chunk := file.read(_CHUNK_SIZE):
+                    write(decryptor.update(chunk) if decryptor else chunk)
+        else:
+            chunks = self.get_bot().download_request.retrieve_stream(
+                self._get_encoded_url(),
+                chunk_size=_CHUNK_SIZE,
+                offset=offset,
+                read_timeout=read_timeout,
+                write_timeout=write_timeout,
+                connect_timeout=connect_timeout,
+                pool_timeout=pool_timeout,
+            )
+            try:
+                async for chunk in chunks:
+                    write(decryptor.update(chunk) if decryptor else chunk)
+            finally:
+                # closes the connection early if writing fails
+                await chunks.aclose()
+
+        if decryptor:
+            write(decryptor.finalize())
+
+    async def _download_to_path(
+        self,
+        path: Path,
+        read_timeout: ODVInput[float],
+        write_timeout: ODVInput[float],
+        connect_timeout: ODVInput[float],
+        pool_timeout: ODVInput[float],
+    ) -> None:
+        # Download to a temporary file first such that `path` is not left with partial or
+        # unverified contents if the download fails
+        part_path = path.with_name(f"{path.name}.part")
+        try:
+            with part_path.open("wb") as file:
+                await self._download(
+                    file.write,
+                    read_timeout=read_timeout,
+                    write_timeout=write_timeout,
+                    connect_timeout=connect_timeout,
+                    pool_timeout=pool_timeout,
+                )
+            part_path.replace(path)
+        finally:
+            part_path.unlink(missing_ok=True)
 
     async def download_to_drive(
         self,
@@ -157,6 +233,11 @@ class File(TelegramObject):
             a :attr:`file_path` could never be downloaded, as this attribute is mandatory for that
             operation.
 
+        .. versionchanged:: NEXT.VERSION
+            The file is downloaded and decrypted in chunks instead of being held in memory as a
+            whole. It is written to a temporary file next to the target path first, which is
+            renamed once the download succeeded.
+
         Args:
             custom_path (:class:`pathlib.Path` | :obj:`str` , optional): The path where the file
                 will be saved to. If not specified, will be saved in the current working directory
@@ -188,17 +269,21 @@ class File(TelegramObject):
             raise RuntimeError("No `file_path` available for this file. Can not download.")
 
         local_file = is_local_file(self.file_path)
-        url = None if local_file else self._get_encoded_url()
 
         # if _credentials exists we want to decrypt the file
         if local_file and self._credentials:
             file_to_decrypt = Path(self.file_path)
-            buf = self._prepare_decrypt(file_to_decrypt.read_bytes())
             if custom_path is not None:
                 path = Path(custom_path)
             else:
                 path = Path(str(file_to_decrypt.parent) + "/decrypted_" + file_to_decrypt.name)
-            path.write_bytes(buf)
+            await self._download_to_path(
+                path,
+                read_timeout=read_timeout,
+                write_timeout=write_timeout,
+                connect_timeout=connect_timeout,
+                pool_timeout=pool_timeout,
+            )
             return path
 
         if custom_path is not None and local_file:
@@ -212,16 +297,13 @@ class File(TelegramObject):
         else:
             filename = Path(Path(self.file_path).name)
 
-        buf = await self.get_bot().request.retrieve(
-            url,
+        await self._download_to_path(
+            filename,
             read_timeout=read_timeout,
             write_timeout=write_timeout,
             connect_timeout=connect_timeout,
             pool_timeout=pool_timeout,
         )
-        if self._credentials:
-            buf = self._prepare_decrypt(buf)
-        filename.write_bytes(buf)
         return filename
 
     async def download_to_memory(
@@ -251,6 +333,11 @@ class File(TelegramObject):
             a :attr:`file_path` could never be downloaded, as this attribute is mandatory for that
             operation.
 
+        .. versionchanged:: NEXT.VERSION
+            The file is downloaded and decrypted in chunks, which are written to :paramref:`out`
+            as they arrive. If the download fails and :paramref:`out` is seekable, the written
+            data is truncated again.
+
         Args:
             out (:obj:`io.BufferedIOBase`): A file-like object. Must be opened for writing in
                 binary mode.
@@ -275,22 +362,21 @@ class File(TelegramObject):
         if not self.file_path:
             raise RuntimeError("No `file_path` available for this file. Can not download.")
 
-        local_file = is_local_file(self.file_path)
-        url = None if local_file else self._get_encoded_url()
-        path = Path(self.file_path) if local_file else None
-        if local_file:
-            buf = path.read_bytes()
-        else:
-            buf = await self.get_bot().request.retrieve(
-                url,
+        start = out.tell() if out.seekable() else None
+        try:
+            await self._download(
+                out.write,
                 read_timeout=read_timeout,
                 write_timeout=write_timeout,
                 connect_timeout=connect_timeout,
                 pool_timeout=pool_timeout,
             )
-        if self._credentials:
-            buf = self._prepare_decrypt(buf)
-        out.write(buf)
+        except BaseException:
+            # Discard partial or unverified contents where possible
+            if start is not None:
+                out.seek(start)
+                out.truncate()
+            raise
 
     async def download_as_bytearray(
         self,
@@ -308,6 +394,10 @@ class File(TelegramObject):
             a :attr:`file_path` could never be downloaded, as this attribute is mandatory for that
             operation.
 
+        .. versionchanged:: NEXT.VERSION
+            The file is downloaded and decrypted in chunks, which extend :paramref:`buf` as they
+            arrive. If the download fails, :paramref:`buf` is restored to its previous length.
+
         Args:
             buf (:obj:`bytearray`, optional): Extend the given bytearray with the downloaded data.
 
@@ -347,20 +437,19 @@ class File(TelegramObject):
         if buf is None:
             buf = bytearray()
 
-        if is_local_file(self.file_path):
-            bytes_data = Path(self.file_path).read_bytes()
-        else:
-            bytes_data = await self.get_bot().request.retrieve(
-                self._get_encoded_url(),
+        start = len(buf)
+        try:
+            await self._download(
+                buf.extend,
                 read_timeout=read_timeout,
                 write_timeout=write_timeout,
                 connect_timeout=connect_timeout,
                 pool_timeout=pool_timeout,
             )
-        if self._credentials:
-            buf.extend(self._prepare_decrypt(bytes_data))
-        else:
-            buf.extend(bytes_data)
+        except BaseException:
+            # Discard partial or unverified contents
+            del buf[start:]
+            raise
         return buf
 
     def set_credentials(self, credentials: "FileCredentials") -> None:
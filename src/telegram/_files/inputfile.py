@@ -19,10 +19,12 @@
 """This module contains an object that represents a Telegram InputFile."""
 
 import mimetypes
+from collections.abc import AsyncIterable
+from pathlib import Path
 from typing import IO, Optional, Union
 from uuid import uuid4
 
-from telegram._utils.files import guess_file_name, load_file
+from telegram._utils.files import guess_file_name, load_file, map_file
 from telegram._utils.strings import TextEncoding
 from telegram._utils.types import FieldTuple
 
@@ -40,15 +42,31 @@ class InputFile:
           in addition.
 
     Args:
-        obj (:term:`file object` | :obj:`bytes` | :obj:`str`): An open file descriptor or the files
-            content as bytes or string.
+        obj (:term:`file object` | :obj:`bytes` | :obj:`str` | :class:`pathlib.Path` | \
+            :term:`asynchronous iterable` of :obj:`bytes`): An open file descriptor, the files
+            content as bytes or string, the path of a local file or an asynchronous iterable
+            yielding the files content in chunks.
 
             Note:
                 If :paramref:`obj` is a string, it will be encoded as bytes via
                 :external:obj:`obj.encode('utf-8') <str.encode>`.
 
+            Tip:
+                Paths and asynchronous iterables are not read on initialization of this object
+                but while the request is sent, such that uploading them does not hold the files
+                content in memory as a whole. See also
+                :paramref:`telegram.request.HTTPXRequest.upload_chunk_size`.
+
+            Important:
+                An asynchronous iterable can usually only be iterated once, e.g. if it is an
+                asynchronous generator. In that case, the :class:`InputFile` can not be reused
+                for another request and the upload can not be retried.
+
             .. versionchanged:: 20.0
                 Accept string input.
+
+            .. versionchanged:: NEXT.VERSION
+                Accept :class:`pathlib.Path` and asynchronous iterables.
         filename (:obj:`str`, optional): Filename for this InputFile.
         attach (:obj:`bool`, optional): Pass :obj:`True` if the parameter this file belongs to in
             the request to Telegram should point to the multipart data via an ``attach://`` URI.
@@ -79,10 +97,33 @@ class InputFile:
                     await bot.send_document(chat_id, input_file)
 
             .. versionadded:: 21.5
+        memory_map (:obj:`bool`, optional): If :obj:`True` and :paramref:`obj` is a
+            :class:`pathlib.Path` or a file handle of a regular, non-empty file, the complete file
+            is memory-mapped instead of being read. The networking backend then sends slices of
+            the mapping without copying the files content into :obj:`bytes` objects first. All
+            :class:`InputFile` objects for the same, unchanged file share a single mapping, also
+            across concurrent requests. Files that can not be mapped are handled as if this was
+            :obj:`False`. Defaults to :obj:`False`.
+
+            Tip:
+                This is useful for files that are sent repeatedly, e.g. the stickers of a sticker
+                pack or a daily report.
+
+            Caution:
+                The file must not be truncated while it is mapped. Depending on the operating
+                system, reading from the truncated part of the mapping may crash the process.
+
+            .. versionadded:: NEXT.VERSION
 
 
     Attributes:
-        input_file_content (:obj:`bytes` | :class:`IO`): The binary content of the file to send.
+        input_file_content (:obj:`bytes` | :obj:`memoryview` | :class:`IO` | \
+            :class:`pathlib.Path` | :term:`asynchronous iterable` of :obj:`bytes`): The binary
+            content of the file to send. A :obj:`memoryview` of the mapped file, if
+            :paramref:`memory_map` was used.
+
+            .. versionchanged:: NEXT.VERSION
+                May be a :obj:`memoryview`.
         attach_name (:obj:`str`): Optional. If present, the parameter this file belongs to in
             the request to Telegram should point to the multipart data via a an URI of the form
             ``attach://<attach_name>`` URI.
@@ -95,15 +136,29 @@ class InputFile:
 
     def __init__(
         self,
-        obj: Union[IO[bytes], bytes, str],
+        obj: Union[IO[bytes], bytes, str, Path, AsyncIterable[bytes]],
         filename: Optional[str] = None,
         attach: bool = False,
         read_file_handle: bool = True,
+        memory_map: bool = False,
     ):
+        self.input_file_content: Union[bytes, memoryview, IO[bytes], Path, AsyncIterable[bytes]]
         if isinstance(obj, bytes):
-            self.input_file_content: Union[bytes, IO[bytes]] = obj
+            self.input_file_content = obj
         elif isinstance(obj, str):
             self.input_file_content = obj.encode(TextEncoding.UTF_8)
+        elif (
+            memory_map
+            and not isinstance(obj, AsyncIterable)
+            and (view := map_file(obj)) is not None
+        ):
+            self.input_file_content = view
+            filename = filename or (obj.name if isinstance(obj, Path) else guess_file_name(obj))
+        elif isinstance(obj, Path):
+            self.input_file_content = obj
+            filename = filename or obj.name
+        elif isinstance(obj, AsyncIterable):
+            self.input_file_content = obj
         elif read_file_handle:
             reported_filename, self.input_file_content = load_file(obj)
             filename = filename or reported_filename
@@ -129,8 +184,13 @@ class InputFile:
         .. versionchanged:: 21.5
             Content may now be a file handle.
 
+        .. versionchanged:: NEXT.VERSION
+            Content may now be a :class:`pathlib.Path`, a :obj:`memoryview` or an asynchronous
+            iterable of :obj:`bytes`.
+
         Returns:
-            tuple[:obj:`str`, :obj:`bytes` | :class:`IO`, :obj:`str`]:
+            tuple[:obj:`str`, :obj:`bytes` | :obj:`memoryview` | :class:`IO` | \
+            :class:`pathlib.Path` | :term:`asynchronous iterable`, :obj:`str`]:
         """
         return self.filename, self.input_file_content, self.mimetype
 
@@ -48,6 +48,92 @@ if TYPE_CHECKING:
     from telegram import Bot
 
 
+class StreamDecryptor:
+    """
+    Decrypt per telegram docs at https://core.telegram.org/passport, chunk by chunk.
+
+    Pass the encrypted data to :meth:`update` in chunks of arbitrary size and call :meth:`finalize`
+    after the last one. The hash can only be verified in :meth:`finalize`, so all data returned by
+    :meth:`update` must be discarded if :meth:`finalize` raises an exception.
+
+    Args:
+        secret (:obj:`bytes`): The encryption secret.
+        hash (:obj:`bytes`): The hash.
+
+    Raises:
+        :exc:`RuntimeError`: If the ``cryptography`` library is not installed.
+    """
+
+    __slots__ = ("_decryptor", "_digest", "_hash", "_padding")
+
+    def __init__(self, secret: bytes, hash: bytes):
+        if not CRYPTO_INSTALLED:
+            raise RuntimeError(
+                "To use Telegram Passports, PTB must be installed via `pip install "
+                '"python-telegram-bot[passport]"`.'
+            )
+        # Make a SHA512 hash of secret + update
+        digest = Hash(SHA512(), backend=default_backend())
+        digest.update(secret + hash)
+        secret_hash_hash = digest.finalize()
+        # First 32 chars is our key, next 16 is the initialisation vector
+        key, init_vector = secret_hash_hash[:32], secret_hash_hash[32 : 32 + 16]
+        # Init a AES-CBC cipher to decrypt the data
+        cipher = Cipher(AES(key), CBC(init_vector), backend=default_backend())
+        self._decryptor = cipher.decryptor()
+        # SHA256 hash of the decrypted data, calculated as the data comes in
+        self._digest = Hash(SHA256(), backend=default_backend())
+        self._hash = hash
+        # The first byte of the decrypted data is the length of the padding. None until known.
+        self._padding: Optional[int] = None
+
+    def update(self, data: bytes) -> bytes:
+        """Decrypts the next chunk of data.
+
+        Args:
+            data (:obj:`bytes`): The next chunk of the encrypted data.
+
+        Returns:
+            :obj:`bytes`: The decrypted data without padding. May be shorter or longer than
+            :paramref:`data`, as the data is decrypted in blocks of 16 bytes.
+        """
+        data = self._decryptor.update(data)
+        self._digest.update(data)
+        return self._strip_padding(data)
+
+    def finalize(self) -> bytes:
+        """Decrypts the remaining data and verifies the hash.
+
+        Raises:
+            :class:`PassportDecryptionError`: Given hash does not match hash of decrypted data.
+
+        Returns:
+            :obj:`bytes`: The remaining decrypted data without padding.
+        """
+        data = self._decryptor.finalize()
+        self._digest.update(data)
+        data_hash = self._digest.finalize()
+        # If the newly calculated hash did not match the one telegram gave us
+        if data_hash != self._hash:
+            # Raise a error that is caught inside telegram.PassportData and transformed into a
+            # warning
+            raise PassportDecryptionError(
+                f"Hashes are not equal! {data_hash.hex()} != {self._hash.hex()}"
+            )
+        return self._strip_padding(data)
+
+    def _strip_padding(self, data: bytes) -> bytes:
+        if not data:
+            return data
+        if self._padding is None:
+            self._padding = data[0]
+        if self._padding:
+            stripped = min(self._padding, len(data))
+            self._padding -= stripped
+            data = data[stripped:]
+        return data
+
+
 @no_type_check
 def decrypt(secret, hash, data):
     """
@@ -70,31 +156,10 @@ def decrypt(secret, hash, data):
         :obj:`bytes`: The decrypted data as bytes.
 
     """
-    if not CRYPTO_INSTALLED:
-        raise RuntimeError(
-            "To use Telegram Passports, PTB must be installed via `pip install "
-            '"python-telegram-bot[passport]"`.'
-        )
-    # Make a SHA512 hash of secret + update
-    digest = Hash(SHA512(), backend=default_backend())
-    digest.update(secret + hash)
-    secret_hash_hash = digest.finalize()
-    # First 32 chars is our key, next 16 is the initialisation vector
-    key, init_vector = secret_hash_hash[:32], secret_hash_hash[32 : 32 + 16]
-    # Init a AES-CBC cipher and decrypt the data
-    cipher = Cipher(AES(key), CBC(init_vector), backend=default_backend())
-    decryptor = cipher.decryptor()
-    data = decryptor.update(data) + decryptor.finalize()
-    # Calculate SHA256 hash of the decrypted data
-    digest = Hash(SHA256(), backend=default_backend())
-    digest.update(data)
-    data_hash = digest.finalize()
-    # If the newly calculated hash did not match the one telegram gave us
-    if data_hash != hash:
-        # Raise a error that is caught inside telegram.PassportData and transformed into a warning
-        raise PassportDecryptionError(f"Hashes are not equal! {data_hash} != {hash}")
+    decryptor = StreamDecryptor(secret, hash)
+    data = decryptor.update(data)
     # Return data without padding
-    return data[data[0] :]
+    return data + decryptor.finalize()
 
 
 @no_type_check
@@ -585,9 +585,15 @@ class TelegramObject:
         .. versionchanged:: 20.0
             Now includes all entries of :attr:`api_kwargs`.
 
+        .. versionchanged:: NEXT.VERSION
+            Uses the :attr:`~telegram.request.BaseRequest.json_codec` of the associated bot, if
+            any.
+
         Returns:
             :obj:`str`
         """
+        if self._bot is not None:
+            return self._bot.request.json_codec.dumps(self.to_dict())
         return json.dumps(self.to_dict())
 
     def to_dict(self, recursive: bool = True) -> JSONDict:
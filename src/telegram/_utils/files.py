@@ -28,8 +28,13 @@ Warning:
     the changelog.
 """
 
+import mmap
+import os
+import stat
+import weakref
+from collections import OrderedDict
 from pathlib import Path
-from typing import IO, TYPE_CHECKING, Any, Optional, TypeVar, Union, cast, overload
+from typing import IO, TYPE_CHECKING, Any, Final, Optional, TypeVar, Union, cast, overload
 
 from telegram._utils.types import FileInput, FilePathInput
 
@@ -38,6 +43,14 @@ if TYPE_CHECKING:
 
 _T = TypeVar("_T", bound=Union[bytes, "InputFile", str, Path, None])
 
+_MappingKey = tuple[int, int, int, int]
+
+_MAPPINGS: "weakref.WeakValueDictionary[_MappingKey, mmap.mmap]" = weakref.WeakValueDictionary()
+# Keep the most recently used mappings alive, such that repeatedly sending the same file does not
+# map it again once all views on the previous mapping were released
+_RECENT_MAPPINGS: "OrderedDict[_MappingKey, mmap.mmap]" = OrderedDict()
+_RECENT_MAPPINGS_SIZE: Final[int] = 32
+
 
 @overload
 def load_file(obj: IO[bytes]) -> tuple[Optional[str], bytes]: ...
@@ -76,6 +89,50 @@ def guess_file_name(obj: FileInput) -> Optional[str]:
     return None
 
 
+def map_file(obj: Union[Path, IO[bytes]]) -> Optional[memoryview]:
+    """Memory-maps the complete contents of a local file for reading.
+
+    Mappings are shared: As long as the file is unchanged, i.e. it has the same device, inode,
+    size and modification time, all calls for the same file return views on the same mapping.
+
+    Args:
+        obj (:class:`pathlib.Path` | :term:`file object`): The path of the file or an open file
+            handle.
+
+    Returns:
+        :obj:`memoryview` | :obj:`None`: A read-only view on the mapped file or :obj:`None`, if the
+        file can not be mapped, e.g. because it is empty, not a regular file or an in-memory
+        buffer.
+    """
+    try:
+        if isinstance(obj, Path):
+            with obj.open("rb") as file:
+                return _memory_map_fileno(file.fileno())
+        return _memory_map_fileno(obj.fileno())
+    except (AttributeError, OSError, ValueError):
+        return None
+
+
+def _memory_map_fileno(fileno: int) -> Optional[memoryview]:
+    status = os.fstat(fileno)
+    if not stat.S_ISREG(status.st_mode) or status.st_size == 0:
+        return None
+
+    key = (status.st_dev, status.st_ino, status.st_size, status.st_mtime_ns)
+    mapping = _MAPPINGS.get(key)
+    if mapping is None:
+        # The mapping duplicates the file descriptor, so it stays valid after the file is closed
+        mapping = mmap.mmap(fileno, 0, access=mmap.ACCESS_READ)
+        _MAPPINGS[key] = mapping
+
+    _RECENT_MAPPINGS[key] = mapping
+    _RECENT_MAPPINGS.move_to_end(key)
+    while len(_RECENT_MAPPINGS) > _RECENT_MAPPINGS_SIZE:
+        _RECENT_MAPPINGS.popitem(last=False)
+
+    return memoryview(mapping)
+
+
 def is_local_file(obj: Optional[FilePathInput]) -> bool:
     """
     Checks if a given string is a file on local system.
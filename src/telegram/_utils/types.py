@@ -25,7 +25,7 @@ Warning:
 """
 
 import datetime as dtm
-from collections.abc import Collection
+from collections.abc import AsyncIterable, Collection
 from pathlib import Path
 from typing import IO, TYPE_CHECKING, Any, Callable, Literal, Optional, TypeVar, Union
 
@@ -74,7 +74,7 @@ ReplyMarkup = Union[
 .. versionadded:: 20.0
 """
 
-FieldTuple = tuple[str, Union[bytes, IO[bytes]], str]
+FieldTuple = tuple[str, Union[bytes, memoryview, IO[bytes], Path, AsyncIterable[bytes]], str]
 """Alias for return type of `InputFile.field_tuple`."""
 UploadFileDict = dict[str, FieldTuple]
 """Dictionary containing file data to be uploaded to the API."""
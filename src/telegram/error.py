@@ -32,6 +32,7 @@ from telegram._utils.types import TimePeriod
 __all__ = (
     "BadRequest",
     "ChatMigrated",
+    "CircuitBreakerOpen",
     "Conflict",
     "EndPointNotFound",
     "Forbidden",
@@ -180,6 +181,24 @@ class TimedOut(NetworkError):
         super().__init__(message or "Timed out")
 
 
+class CircuitBreakerOpen(NetworkError):
+    """Raised without making a request when the :class:`~telegram.request.CircuitBreaker` of
+    the request object is open, i.e. when the upstream server recently failed too often.
+
+    .. seealso:: :paramref:`telegram.request.HTTPXRequest.circuit_breaker`
+
+    .. versionadded:: NEXT.VERSION
+
+    Args:
+        message (:obj:`str`, optional): Any additional information about the exception.
+    """
+
+    __slots__ = ()
+
+    def __init__(self, message: Optional[str] = None) -> None:
+        super().__init__(message or "Circuit breaker is open")
+
+
 class ChatMigrated(TelegramError):
     """
     Raised when the requested group chat migrated to supergroup and has a new chat id.
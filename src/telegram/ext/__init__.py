@@ -41,6 +41,8 @@ __all__ = (
     "ConversationHandler",
     "Defaults",
     "DictPersistence",
+    "DownloadManager",
+    "ExponentialBackoff",
     "ExtBot",
     "InlineQueryHandler",
     "InvalidCallbackData",
@@ -55,12 +57,14 @@ __all__ = (
     "PollHandler",
     "PreCheckoutQueryHandler",
     "PrefixHandler",
+    "RetryPolicy",
     "ShippingQueryHandler",
     "SimpleUpdateProcessor",
     "StringCommandHandler",
     "StringRegexHandler",
     "TypeHandler",
     "Updater",
+    "UploadCache",
     "filters",
 )
 
@@ -76,6 +80,7 @@ from ._callbackdatacache import CallbackDataCache, InvalidCallbackData
 from ._contexttypes import ContextTypes
 from ._defaults import Defaults
 from ._dictpersistence import DictPersistence
+from ._downloadmanager import DownloadManager
 from ._extbot import ExtBot
 from ._handlers.basehandler import BaseHandler
 from ._handlers.businessconnectionhandler import BusinessConnectionHandler
@@ -101,4 +106,6 @@ from ._handlers.stringregexhandler import StringRegexHandler
 from ._handlers.typehandler import TypeHandler
 from ._jobqueue import Job, JobQueue
 from ._picklepersistence import PicklePersistence
+from ._retrypolicy import ExponentialBackoff, RetryPolicy
 from ._updater import Updater
+from ._uploadcache import UploadCache
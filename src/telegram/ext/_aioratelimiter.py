@@ -38,6 +38,7 @@ from telegram._utils.logging import get_logger
 from telegram._utils.types import JSONDict
 from telegram.error import RetryAfter
 from telegram.ext._baseratelimiter import BaseRateLimiter
+from telegram.ext._retrypolicy import RetryPolicy
 
 # Useful for something like:
 #    async with group_limiter if group else null_context():
@@ -131,6 +132,18 @@ class AIORateLimiter(BaseRateLimiter[int]):
         max_retries (:obj:`int`): The maximum number of retries to be made in case of a
             :exc:`~telegram.error.RetryAfter` exception.
             If set to 0, no retries will be made. Defaults to ``0``.
+        retry_policy (:class:`telegram.ext.RetryPolicy`, optional): The policy that decides how
+            long to wait before retrying after a :exc:`~telegram.error.RetryAfter` exception.
+            Defaults to a :class:`~telegram.ext.RetryPolicy` with default settings, i.e.
+            the retries are delayed by between ``0.1`` and ``0.6`` seconds more than requested
+            by Telegram.
+
+            .. versionadded:: NEXT.VERSION
+
+    .. versionchanged:: NEXT.VERSION
+        Retries are no longer delayed by exactly ``0.1`` seconds more than requested by Telegram,
+        but by a random amount as specified by :paramref:`retry_policy`, such that the retries
+        of several bots or processes are spread out.
 
     """
 
@@ -142,6 +155,7 @@ class AIORateLimiter(BaseRateLimiter[int]):
         "_group_time_period",
         "_max_retries",
         "_retry_after_event",
+        "_retry_policy",
     )
 
     def __init__(
@@ -151,6 +165,7 @@ class AIORateLimiter(BaseRateLimiter[int]):
         group_max_rate: float = constants.FloodLimit.MESSAGES_PER_MINUTE_PER_GROUP,
         group_time_period: float = 60,
         max_retries: int = 0,
+        retry_policy: Optional[RetryPolicy] = None,
     ) -> None:
         if not AIO_LIMITER_AVAILABLE:
             raise RuntimeError(
@@ -176,6 +191,7 @@ class AIORateLimiter(BaseRateLimiter[int]):
             max_rate=constants.FloodLimit.PAID_MESSAGES_PER_SECOND, time_period=1
         )
         self._max_retries: int = max_retries
+        self._retry_policy: RetryPolicy = retry_policy or RetryPolicy()
         self._retry_after_event = asyncio.Event()
         self._retry_after_event.set()
 
@@ -289,7 +305,7 @@ class AIORateLimiter(BaseRateLimiter[int]):
                     )
                     raise
 
-                sleep = exc._retry_after.total_seconds() + 0.1  # pylint: disable=protected-access
+                sleep = self._retry_policy.get_delay(exc, i)
                 _LOGGER.info("Rate limit hit. Retrying after %f seconds", sleep)
                 # Make sure we don't allow other requests to be processed
                 self._retry_after_event.clear()
@@ -51,6 +51,8 @@ from telegram.ext._contexttypes import ContextTypes
 from telegram.ext._extbot import ExtBot
 from telegram.ext._handlers.basehandler import BaseHandler
 from telegram.ext._updater import Updater
+from telegram.ext._utils.filtercache import filter_cache
+from telegram.ext._utils.handlerindex import HandlerIndex
 from telegram.ext._utils.networkloop import network_retry_loop
 from telegram.ext._utils.stack import was_called_by
 from telegram.ext._utils.trackingdict import TrackingDict
@@ -64,6 +66,7 @@ if TYPE_CHECKING:
     from telegram.ext import ConversationHandler, JobQueue
     from telegram.ext._applicationbuilder import InitApplicationBuilder
     from telegram.ext._baseupdateprocessor import BaseUpdateProcessor
+    from telegram.ext._downloadmanager import DownloadManager
     from telegram.ext._jobqueue import Job
 
 DEFAULT_GROUP: int = 0
@@ -248,6 +251,8 @@ class Application(
             "_chat_ids_to_be_deleted_in_persistence",
             "_chat_ids_to_be_updated_in_persistence",
             "_conversation_handler_conversations",
+            "_download_manager",
+            "_handler_index",
             "_initialized",
             "_job_queue",
             "_running",
@@ -283,6 +288,7 @@ class Application(
         updater: Optional[Updater],
         job_queue: JQ,
         update_processor: "BaseUpdateProcessor",
+        download_manager: "DownloadManager",
         persistence: Optional[BasePersistence[UD, CD, BD]],
         context_types: ContextTypes[CCT, UD, CD, BD],
         post_init: Optional[
@@ -308,6 +314,8 @@ class Application(
         self.context_types: ContextTypes[CCT, UD, CD, BD] = context_types
         self.updater: Optional[Updater] = updater
         self.handlers: dict[int, list[BaseHandler[Any, CCT, Any]]] = {}
+        # Immutable snapshot of the handlers, rebuilt lazily after they changed
+        self._handler_index: Optional[HandlerIndex] = None
         self.error_handlers: dict[
             HandlerCallback[object, CCT, None], Union[bool, DefaultValue[bool]]
         ] = {}
@@ -321,6 +329,7 @@ class Application(
             Callable[[Application[BT, CCT, UD, CD, BD, JQ]], Coroutine[Any, Any, None]]
         ] = post_stop
         self._update_processor = update_processor
+        self._download_manager: DownloadManager = download_manager
         self.bot_data: BD = self.context_types.bot_data()
         self._user_data: defaultdict[int, UD] = defaultdict(self.context_types.user_data)
         self._chat_data: defaultdict[int, CD] = defaultdict(self.context_types.chat_data)
@@ -444,6 +453,17 @@ class Application(
         """
         return self._update_processor
 
+    @property
+    def download_manager(self) -> "DownloadManager":
+        """:class:`telegram.ext.DownloadManager`: The download manager used by this application
+        to download files concurrently.
+
+        .. seealso:: :meth:`telegram.ext.ApplicationBuilder.download_manager`
+
+        .. versionadded:: NEXT.VERSION
+        """
+        return self._download_manager
+
     @staticmethod
     def _raise_system_exit() -> NoReturn:
         raise SystemExit
@@ -583,6 +603,15 @@ class Application(
                     persistent_data
                 )
 
+        # The bot may also be a plain telegram.Bot, which has no upload cache
+        upload_cache = getattr(self.bot, "upload_cache", None)
+        if self.persistence.store_data.upload_cache and upload_cache is not None:
+            persistent_upload_cache = await self.persistence.get_upload_cache()
+            if persistent_upload_cache is not None:
+                if not isinstance(persistent_upload_cache, dict):
+                    raise ValueError("upload_cache must be a dict")
+                upload_cache.load_persistence_data(persistent_upload_cache)
+
     async def start(self) -> None:
         """Starts
 
@@ -1016,6 +1045,7 @@ class Application(
             description="Bootstrap Initialize Application",
             max_retries=max_retries,
             interval=1,
+            retry_policy=self.updater.retry_policy if self.updater else None,
         )
 
     def __run(
@@ -1268,70 +1298,82 @@ class Application(
         context = None
         any_blocking = False  # Flag which is set to True if any handler specifies block=True
 
-        # We copy the lists to avoid issues with concurrent modification of the
-        # handlers (groups or handlers in groups) while iterating over it via add/remove_handler.
-        # Currently considered implementation detail as described in docstrings of
-        # add/remove_handler
-        # do *not* use `copy.deepcopy` here, as we don't want to deepcopy the handlers themselves
-        for handlers in [v.copy() for v in self.handlers.values()]:
-            try:
-                # no copy needed b/c we copy above
-                for handler in handlers:
-                    check = handler.check_update(update)  # Should the handler handle this update?
-                    if check is None or check is False:
-                        continue
-
-                    if not context:  # build a context if not already built
-                        try:
-                            context = self.context_types.context.from_update(update, self)
-                        except Exception as exc:
-                            _LOGGER.critical(
-                                (
-                                    "Error while building CallbackContext for update %s. "
-                                    "Update will not be processed."
+        # The index is an immutable snapshot of the handlers, so concurrent modification of the
+        # handlers (groups or handlers in groups) via add/remove_handler while iterating over it
+        # is not an issue. Currently considered implementation detail as described in docstrings
+        # of add/remove_handler
+        # Only the handlers that can possibly handle this update are checked, in the same order
+        # The results of filters shared by several handlers are computed only once
+        with filter_cache(update) as cached_filters:
+            for handlers in self._get_handler_index().candidates(update):
+                try:
+                    for handler in handlers:
+                        # Should the handler handle this update?
+                        check = handler.check_update(update)
+                        if check is None or check is False:
+                            continue
+                        # The callback might change what the filters depend on
+                        cached_filters.clear()
+
+                        if not context:  # build a context if not already built
+                            try:
+                                context = self.context_types.context.from_update(update, self)
+                            except Exception as exc:
+                                _LOGGER.critical(
+                                    (
+                                        "Error while building CallbackContext for update %s. "
+                                        "Update will not be processed."
+                                    ),
+                                    update,
+                                    exc_info=exc,
+                                )
+                                return
+                            await context.refresh_data()
+                        coroutine: Coroutine = handler.handle_update(update, self, check, context)
+
+                        if not handler.block or (  # if handler is running with block=False,
+                            handler.block is DEFAULT_TRUE
+                            and isinstance(self.bot, ExtBot)
+                            and self.bot.defaults
+                            and not self.bot.defaults.block
+                        ):
+                            self.create_task(
+                                coroutine,
+                                update=update,
+                                name=(
+                                    f"Application:{self.bot.id}:process_update_non_blocking:"
+                                    f"{handler}"
                                 ),
-                                update,
-                                exc_info=exc,
                             )
-                            return
-                        await context.refresh_data()
-                    coroutine: Coroutine = handler.handle_update(update, self, check, context)
-
-                    if not handler.block or (  # if handler is running with block=False,
-                        handler.block is DEFAULT_TRUE
-                        and isinstance(self.bot, ExtBot)
-                        and self.bot.defaults
-                        and not self.bot.defaults.block
-                    ):
-                        self.create_task(
-                            coroutine,
-                            update=update,
-                            name=(
-                                f"Application:{self.bot.id}:process_update_non_blocking:{handler}"
-                            ),
-                        )
-                    else:
-                        any_blocking = True
-                        await coroutine
-                    break  # Only a max of 1 handler per group is handled
-
-            # Stop processing with any other handler.
-            except ApplicationHandlerStop:
-                _LOGGER.debug("Stopping further handlers due to ApplicationHandlerStop")
-                break
-
-            # Dispatch any error.
-            except Exception as exc:
-                if await self.process_error(update=update, error=exc):
-                    _LOGGER.debug("Error handler stopped further handlers.")
+                        else:
+                            any_blocking = True
+                            await coroutine
+                        break  # Only a max of 1 handler per group is handled
+
+                # Stop processing with any other handler.
+                except ApplicationHandlerStop:
+                    _LOGGER.debug("Stopping further handlers due to ApplicationHandlerStop")
                     break
 
+                # Dispatch any error.
+                except Exception as exc:
+                    if await self.process_error(update=update, error=exc):
+                        _LOGGER.debug("Error handler stopped further handlers.")
+                        break
+
         if any_blocking:
             # Only need to mark the update for persistence if there was at least one
             # blocking handler - the non-blocking handlers mark the update again when finished
             # (in __create_task_callback)
             self._mark_for_persistence_update(update=update)
 
+    def _get_handler_index(self) -> HandlerIndex:
+        index = self._handler_index
+        # The handlers may also have been modified directly instead of via add/remove_handler
+        if index is None or not index.is_current(self.handlers):
+            index = self._handler_index = HandlerIndex(self.handlers)
+        return index
+
     def add_handler(self, handler: BaseHandler[Any, CCT, Any], group: int = DEFAULT_GROUP) -> None:
         """Register a handler.
 
@@ -1404,6 +1446,7 @@ class Application(
             self.handlers = dict(sorted(self.handlers.items()))  # lower -> higher groups
 
         self.handlers[group].append(handler)
+        self._handler_index = None
 
     def add_handlers(
         self,
@@ -1487,6 +1530,7 @@ class Application(
             self.handlers[group].remove(handler)
             if not self.handlers[group]:
                 del self.handlers[group]
+            self._handler_index = None
 
     def drop_chat_data(self, chat_id: int) -> None:
         """Drops the corresponding entry from the :attr:`chat_data`. Will also be deleted from
@@ -1662,7 +1706,8 @@ class Application(
 
     async def update_persistence(self) -> None:
         """Updates :attr:`user_data`, :attr:`chat_data`, :attr:`bot_data` in :attr:`persistence`
-        along with :attr:`~telegram.ext.ExtBot.callback_data_cache` and the conversation states of
+        along with :attr:`~telegram.ext.ExtBot.callback_data_cache`,
+        :attr:`~telegram.ext.ExtBot.upload_cache` and the conversation states of
         any persistent :class:`~telegram.ext.ConversationHandler` registered for this application.
 
         For :attr:`user_data` and :attr:`chat_data`, only those entries are updated which either
@@ -1704,6 +1749,10 @@ class Application(
                 )
             )
 
+        upload_cache = getattr(self.bot, "upload_cache", None)
+        if self.persistence.store_data.upload_cache and upload_cache is not None:
+            coroutines.add(self.persistence.update_upload_cache(upload_cache.persistence_data))
+
         if self.persistence.store_data.bot_data:
             coroutines.add(self.persistence.update_bot_data(deepcopy(self.bot_data)))
 
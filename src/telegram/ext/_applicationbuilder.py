@@ -39,12 +39,15 @@ from telegram._utils.types import (
 from telegram.ext._application import Application
 from telegram.ext._baseupdateprocessor import BaseUpdateProcessor, SimpleUpdateProcessor
 from telegram.ext._contexttypes import ContextTypes
+from telegram.ext._downloadmanager import DownloadManager
 from telegram.ext._extbot import ExtBot
 from telegram.ext._jobqueue import JobQueue
+from telegram.ext._retrypolicy import RetryPolicy
 from telegram.ext._updater import Updater
 from telegram.ext._utils.types import BD, BT, CCT, CD, JQ, UD
-from telegram.request import BaseRequest
+from telegram.request import BaseRequest, CircuitBreaker, JSONCodec
 from telegram.request._httpxrequest import HTTPXRequest
+from telegram.request._multipart import DEFAULT_CHUNK_SIZE
 
 if TYPE_CHECKING:
     from telegram import Update
@@ -76,6 +79,10 @@ _BOT_CHECKS = [
     ("write_timeout", "write_timeout"),
     ("media_write_timeout", "media_write_timeout"),
     ("http_version", "http_version"),
+    ("json_body", "json_body"),
+    ("upload_chunk_size", "upload_chunk_size"),
+    ("circuit_breaker", "circuit_breaker"),
+    ("json_codec", "json_codec"),
     ("get_updates_connection_pool_size", "get_updates_connection_pool_size"),
     ("get_updates_proxy", "get_updates_proxy"),
     ("get_updates_socket_options", "get_updates_socket_options"),
@@ -84,11 +91,26 @@ _BOT_CHECKS = [
     ("get_updates_read_timeout", "get_updates_read_timeout"),
     ("get_updates_write_timeout", "get_updates_write_timeout"),
     ("get_updates_http_version", "get_updates_http_version"),
+    ("get_updates_json_body", "get_updates_json_body"),
+    ("get_updates_circuit_breaker", "get_updates_circuit_breaker"),
+    ("upload_request", "upload_request instance"),
+    ("download_request", "download_request instance"),
+    ("upload_connection_pool_size", "upload_connection_pool_size"),
+    ("upload_connect_timeout", "upload_connect_timeout"),
+    ("upload_read_timeout", "upload_read_timeout"),
+    ("upload_write_timeout", "upload_write_timeout"),
+    ("upload_pool_timeout", "upload_pool_timeout"),
+    ("download_connection_pool_size", "download_connection_pool_size"),
+    ("download_connect_timeout", "download_connect_timeout"),
+    ("download_read_timeout", "download_read_timeout"),
+    ("download_write_timeout", "download_write_timeout"),
+    ("download_pool_timeout", "download_pool_timeout"),
     ("base_file_url", "base_file_url"),
     ("base_url", "base_url"),
     ("token", "token"),
     ("defaults", "defaults"),
     ("arbitrary_callback_data", "arbitrary_callback_data"),
+    ("upload_cache", "upload_cache"),
     ("private_key", "private_key"),
     ("rate_limiter", "rate_limiter instance"),
     ("local_mode", "local_mode setting"),
@@ -96,6 +118,10 @@ _BOT_CHECKS = [
 
 _TWO_ARGS_REQ = "The parameter `{}` may only be set, if no {} was set."
 
+# Default connection pool sizes of the dedicated request objects for uploads and downloads
+_POOL_SIZES = {"upload": 16, "download": 16}
+_POOL_TIMEOUTS = ("connect_timeout", "read_timeout", "write_timeout", "pool_timeout")
+
 
 class ApplicationBuilder(Generic[BT, CCT, UD, CD, BD, JQ]):
     """This class serves as initializer for :class:`telegram.ext.Application` via the so called
@@ -136,13 +162,23 @@ class ApplicationBuilder(Generic[BT, CCT, UD, CD, BD, JQ]):
         "_base_file_url",
         "_base_url",
         "_bot",
+        "_circuit_breaker",
         "_connect_timeout",
         "_connection_pool_size",
         "_context_types",
         "_defaults",
+        "_download_connect_timeout",
+        "_download_connection_pool_size",
+        "_download_manager",
+        "_download_pool_timeout",
+        "_download_read_timeout",
+        "_download_request",
+        "_download_write_timeout",
+        "_get_updates_circuit_breaker",
         "_get_updates_connect_timeout",
         "_get_updates_connection_pool_size",
         "_get_updates_http_version",
+        "_get_updates_json_body",
         "_get_updates_pool_timeout",
         "_get_updates_proxy",
         "_get_updates_read_timeout",
@@ -151,6 +187,8 @@ class ApplicationBuilder(Generic[BT, CCT, UD, CD, BD, JQ]):
         "_get_updates_write_timeout",
         "_http_version",
         "_job_queue",
+        "_json_body",
+        "_json_codec",
         "_local_mode",
         "_media_write_timeout",
         "_persistence",
@@ -164,11 +202,20 @@ class ApplicationBuilder(Generic[BT, CCT, UD, CD, BD, JQ]):
         "_rate_limiter",
         "_read_timeout",
         "_request",
+        "_retry_policy",
         "_socket_options",
         "_token",
         "_update_processor",
         "_update_queue",
         "_updater",
+        "_upload_cache",
+        "_upload_chunk_size",
+        "_upload_connect_timeout",
+        "_upload_connection_pool_size",
+        "_upload_pool_timeout",
+        "_upload_read_timeout",
+        "_upload_request",
+        "_upload_write_timeout",
         "_write_timeout",
     )
 
@@ -183,6 +230,7 @@ class ApplicationBuilder(Generic[BT, CCT, UD, CD, BD, JQ]):
         self._read_timeout: ODVInput[float] = DEFAULT_NONE
         self._write_timeout: ODVInput[float] = DEFAULT_NONE
         self._media_write_timeout: ODVInput[float] = DEFAULT_NONE
+        self._upload_chunk_size: DVType[int] = DefaultValue(DEFAULT_CHUNK_SIZE)
         self._pool_timeout: ODVInput[float] = DEFAULT_NONE
         self._request: DVInput[BaseRequest] = DEFAULT_NONE
         self._get_updates_connection_pool_size: DVInput[int] = DEFAULT_NONE
@@ -194,10 +242,25 @@ class ApplicationBuilder(Generic[BT, CCT, UD, CD, BD, JQ]):
         self._get_updates_pool_timeout: ODVInput[float] = DEFAULT_NONE
         self._get_updates_request: DVInput[BaseRequest] = DEFAULT_NONE
         self._get_updates_http_version: DVInput[str] = DefaultValue("1.1")
+        self._get_updates_json_body: DVType[bool] = DEFAULT_FALSE
+        self._get_updates_circuit_breaker: ODVInput[CircuitBreaker] = DEFAULT_NONE
+        self._upload_request: DVInput[BaseRequest] = DEFAULT_NONE
+        self._upload_connection_pool_size: DVInput[int] = DEFAULT_NONE
+        self._upload_connect_timeout: ODVInput[float] = DEFAULT_NONE
+        self._upload_read_timeout: ODVInput[float] = DEFAULT_NONE
+        self._upload_write_timeout: ODVInput[float] = DEFAULT_NONE
+        self._upload_pool_timeout: ODVInput[float] = DEFAULT_NONE
+        self._download_request: DVInput[BaseRequest] = DEFAULT_NONE
+        self._download_connection_pool_size: DVInput[int] = DEFAULT_NONE
+        self._download_connect_timeout: ODVInput[float] = DEFAULT_NONE
+        self._download_read_timeout: ODVInput[float] = DEFAULT_NONE
+        self._download_write_timeout: ODVInput[float] = DEFAULT_NONE
+        self._download_pool_timeout: ODVInput[float] = DEFAULT_NONE
         self._private_key: ODVInput[bytes] = DEFAULT_NONE
         self._private_key_password: ODVInput[bytes] = DEFAULT_NONE
         self._defaults: ODVInput[Defaults] = DEFAULT_NONE
         self._arbitrary_callback_data: Union[DefaultValue[bool], int] = DEFAULT_FALSE
+        self._upload_cache: Union[DefaultValue[bool], int] = DEFAULT_FALSE
         self._local_mode: DVType[bool] = DEFAULT_FALSE
         self._bot: DVInput[Bot] = DEFAULT_NONE
         self._update_queue: DVType[Queue[Union[Update, object]]] = DefaultValue(Queue())
@@ -216,12 +279,17 @@ class ApplicationBuilder(Generic[BT, CCT, UD, CD, BD, JQ]):
         self._update_processor: BaseUpdateProcessor = SimpleUpdateProcessor(
             max_concurrent_updates=1
         )
+        self._download_manager: DownloadManager = DownloadManager()
         self._updater: ODVInput[Updater] = DEFAULT_NONE
         self._post_init: Optional[Callable[[Application], Coroutine[Any, Any, None]]] = None
         self._post_shutdown: Optional[Callable[[Application], Coroutine[Any, Any, None]]] = None
         self._post_stop: Optional[Callable[[Application], Coroutine[Any, Any, None]]] = None
         self._rate_limiter: ODVInput[BaseRateLimiter] = DEFAULT_NONE
+        self._retry_policy: ODVInput[RetryPolicy] = DEFAULT_NONE
         self._http_version: DVInput[str] = DefaultValue("1.1")
+        self._json_body: DVType[bool] = DEFAULT_FALSE
+        self._circuit_breaker: ODVInput[CircuitBreaker] = DEFAULT_NONE
+        self._json_codec: DVInput[JSONCodec] = DEFAULT_NONE
 
     def _build_request(self, get_updates: bool) -> BaseRequest:
         prefix = "_get_updates_" if get_updates else "_"
@@ -255,12 +323,62 @@ class ApplicationBuilder(Generic[BT, CCT, UD, CD, BD, JQ]):
         }
 
         http_version = DefaultValue.get_value(getattr(self, f"{prefix}http_version")) or "1.1"
+        json_body = DefaultValue.get_value(getattr(self, f"{prefix}json_body"))
+        # get_updates never uploads files
+        upload_chunk_size = (
+            DEFAULT_CHUNK_SIZE if get_updates else DefaultValue.get_value(self._upload_chunk_size)
+        )
 
         return HTTPXRequest(
             connection_pool_size=connection_pool_size,
             proxy=proxy,
             http_version=http_version,  # type: ignore[arg-type]
             socket_options=socket_options,
+            json_body=json_body,
+            upload_chunk_size=upload_chunk_size,
+            circuit_breaker=DefaultValue.get_value(getattr(self, f"{prefix}circuit_breaker")),
+            json_codec=DefaultValue.get_value(self._json_codec),
+            **effective_timeouts,
+        )
+
+    def _build_pool_request(self, pool: str) -> Optional[BaseRequest]:
+        prefix = f"_{pool}_"
+        if not isinstance(getattr(self, f"{prefix}request"), DefaultValue):
+            return getattr(self, f"{prefix}request")
+
+        timeouts = {name: getattr(self, f"{prefix}{name}") for name in _POOL_TIMEOUTS}
+        connection_pool_size = getattr(self, f"{prefix}connection_pool_size")
+        if not isinstance(self._request, DefaultValue) and all(
+            isinstance(value, DefaultValue) for value in (connection_pool_size, *timeouts.values())
+        ):
+            # Share the custom request object unless the pool was configured explicitly
+            return None
+
+        if pool == "upload":
+            # All requests in this pool upload files, so HTTPXRequest uses media_write_timeout
+            timeouts["media_write_timeout"] = timeouts["write_timeout"]
+            if isinstance(timeouts["media_write_timeout"], DefaultValue):
+                timeouts["media_write_timeout"] = self._media_write_timeout
+
+        # Timeouts that were not set for this pool fall back to the ones set for `request`
+        effective_timeouts = {}
+        for key, value in timeouts.items():
+            if isinstance(value, DefaultValue) and key != "media_write_timeout":
+                value = getattr(self, f"_{key}")  # noqa: PLW2901
+            if not isinstance(value, DefaultValue):
+                effective_timeouts[key] = value
+
+        http_version = DefaultValue.get_value(self._http_version) or "1.1"
+
+        return HTTPXRequest(
+            connection_pool_size=DefaultValue.get_value(connection_pool_size) or _POOL_SIZES[pool],
+            proxy=DefaultValue.get_value(self._proxy),
+            http_version=http_version,  # type: ignore[arg-type]
+            socket_options=DefaultValue.get_value(self._socket_options),
+            upload_chunk_size=DefaultValue.get_value(self._upload_chunk_size),
+            # The pools talk to the same server as `request`
+            circuit_breaker=DefaultValue.get_value(self._circuit_breaker),
+            json_codec=DefaultValue.get_value(self._json_codec),
             **effective_timeouts,
         )
 
@@ -280,6 +398,9 @@ class ApplicationBuilder(Generic[BT, CCT, UD, CD, BD, JQ]):
             get_updates_request=self._build_request(get_updates=True),
             rate_limiter=DefaultValue.get_value(self._rate_limiter),
             local_mode=DefaultValue.get_value(self._local_mode),
+            upload_request=self._build_pool_request("upload"),
+            download_request=self._build_pool_request("download"),
+            upload_cache=DefaultValue.get_value(self._upload_cache),
         )
 
     def _bot_check(self, name: str) -> None:
@@ -315,7 +436,11 @@ class ApplicationBuilder(Generic[BT, CCT, UD, CD, BD, JQ]):
             if self._updater is None:
                 updater = None
             else:
-                updater = Updater(bot=bot, update_queue=update_queue)
+                updater = Updater(
+                    bot=bot,
+                    update_queue=update_queue,
+                    retry_policy=DefaultValue.get_value(self._retry_policy),
+                )
         else:  # if they set an updater, get all necessary attributes for Application from Updater:
             updater = self._updater
             bot = self._updater.bot
@@ -328,6 +453,7 @@ class ApplicationBuilder(Generic[BT, CCT, UD, CD, BD, JQ]):
             update_queue=update_queue,
             updater=updater,
             update_processor=self._update_processor,
+            download_manager=self._download_manager,
             job_queue=job_queue,
             persistence=persistence,
             context_types=DefaultValue.get_value(self._context_types),
@@ -439,6 +565,8 @@ class ApplicationBuilder(Generic[BT, CCT, UD, CD, BD, JQ]):
         timeouts = ["connect_timeout", "read_timeout", "write_timeout", "pool_timeout"]
         if not get_updates:
             timeouts.append("media_write_timeout")
+            if not isinstance(self._upload_chunk_size, DefaultValue):
+                raise RuntimeError(_TWO_ARGS_REQ.format(name, "upload_chunk_size"))
 
         # Code below tests if it's okay to set a Request object. Only okay if no other request args
         # or instances containing a Request were set previously
@@ -458,6 +586,16 @@ class ApplicationBuilder(Generic[BT, CCT, UD, CD, BD, JQ]):
         if not isinstance(getattr(self, f"_{prefix}http_version"), DefaultValue):
             raise RuntimeError(_TWO_ARGS_REQ.format(name, "http_version"))
 
+        if not isinstance(getattr(self, f"_{prefix}json_body"), DefaultValue):
+            raise RuntimeError(_TWO_ARGS_REQ.format(name, "json_body"))
+
+        if not isinstance(getattr(self, f"_{prefix}circuit_breaker"), DefaultValue):
+            raise RuntimeError(_TWO_ARGS_REQ.format(name, "circuit_breaker"))
+
+        # The codec is shared by all requests of the bot, so it can't be combined with either
+        if not isinstance(self._json_codec, DefaultValue):
+            raise RuntimeError(_TWO_ARGS_REQ.format(name, "json_codec"))
+
         self._bot_check(name)
 
         if self._updater not in (DEFAULT_NONE, None):
@@ -483,6 +621,22 @@ class ApplicationBuilder(Generic[BT, CCT, UD, CD, BD, JQ]):
                 _TWO_ARGS_REQ.format(f"get_updates_{name}" if get_updates else name, "updater")
             )
 
+    def _pool_request_check(self, pool: str) -> None:
+        name = f"{pool}_request"
+        for attr in ("connection_pool_size", *_POOL_TIMEOUTS):
+            if not isinstance(getattr(self, f"_{pool}_{attr}"), DefaultValue):
+                raise RuntimeError(_TWO_ARGS_REQ.format(name, f"{pool}_{attr}"))
+
+        self._bot_check(name)
+        self._updater_check(name)
+
+    def _pool_param_check(self, name: str, pool: str) -> None:
+        name = f"{pool}_{name}"
+        if not isinstance(getattr(self, f"_{pool}_request"), DefaultValue):
+            raise RuntimeError(_TWO_ARGS_REQ.format(name, f"{pool}_request instance"))
+        self._bot_check(name)
+        self._updater_check(name)
+
     def request(self: BuilderType, request: BaseRequest) -> BuilderType:
         """Sets a :class:`telegram.request.BaseRequest` instance for the
         :paramref:`telegram.Bot.request` parameter of :attr:`telegram.ext.Application.bot`.
@@ -692,6 +846,66 @@ class ApplicationBuilder(Generic[BT, CCT, UD, CD, BD, JQ]):
         self._http_version = http_version
         return self
 
+    def json_body(self: BuilderType, json_body: bool) -> BuilderType:
+        """Sets the :paramref:`~telegram.request.HTTPXRequest.json_body` parameter of
+        :attr:`telegram.Bot.request`. Defaults to :obj:`False`.
+
+        .. seealso:: :meth:`get_updates_json_body`
+
+        .. versionadded:: NEXT.VERSION
+
+        Args:
+            json_body (:obj:`bool`): Whether to send requests without file uploads as JSON body.
+
+        Returns:
+            :class:`ApplicationBuilder`: The same builder with the updated argument.
+        """
+        self._request_param_check(name="json_body", get_updates=False)
+        self._json_body = json_body
+        return self
+
+    def upload_chunk_size(self: BuilderType, upload_chunk_size: int) -> BuilderType:
+        """Sets the :paramref:`~telegram.request.HTTPXRequest.upload_chunk_size` parameter of
+        :attr:`telegram.Bot.request` and :attr:`telegram.Bot.upload_request`. Defaults to
+        ``65536``.
+
+        .. versionadded:: NEXT.VERSION
+
+        Args:
+            upload_chunk_size (:obj:`int`): See
+                :paramref:`telegram.request.HTTPXRequest.upload_chunk_size` for more information.
+
+        Returns:
+            :class:`ApplicationBuilder`: The same builder with the updated argument.
+        """
+        self._request_param_check(name="upload_chunk_size", get_updates=False)
+        self._upload_chunk_size = upload_chunk_size
+        return self
+
+    def circuit_breaker(self: BuilderType, circuit_breaker: CircuitBreaker) -> BuilderType:
+        """Sets the :paramref:`~telegram.request.HTTPXRequest.circuit_breaker` parameter of
+        :attr:`telegram.Bot.request` and of the request objects built for
+        :paramref:`~telegram.Bot.upload_request` and :paramref:`~telegram.Bot.download_request`.
+        Defaults to :obj:`None`.
+
+        .. seealso:: :meth:`get_updates_circuit_breaker`
+
+        .. versionadded:: NEXT.VERSION
+
+        Tip:
+            Pass the same breaker to :meth:`get_updates_circuit_breaker` to have polling back off
+            as well while Telegram is failing.
+
+        Args:
+            circuit_breaker (:class:`telegram.request.CircuitBreaker`): The circuit breaker.
+
+        Returns:
+            :class:`ApplicationBuilder`: The same builder with the updated argument.
+        """
+        self._request_param_check(name="circuit_breaker", get_updates=False)
+        self._circuit_breaker = circuit_breaker
+        return self
+
     def get_updates_request(self: BuilderType, get_updates_request: BaseRequest) -> BuilderType:
         """Sets a :class:`telegram.request.BaseRequest` instance for the
         :paramref:`~telegram.Bot.get_updates_request` parameter of
@@ -893,6 +1107,291 @@ class ApplicationBuilder(Generic[BT, CCT, UD, CD, BD, JQ]):
         self._get_updates_http_version = get_updates_http_version
         return self
 
+    def get_updates_json_body(self: BuilderType, get_updates_json_body: bool) -> BuilderType:
+        """Sets the :paramref:`~telegram.request.HTTPXRequest.json_body` parameter which is used
+        for the :meth:`telegram.Bot.get_updates` request. Defaults to :obj:`False`.
+
+        .. seealso:: :meth:`json_body`
+
+        .. versionadded:: NEXT.VERSION
+
+        Args:
+            get_updates_json_body (:obj:`bool`): Whether to send the request as JSON body.
+
+        Returns:
+            :class:`ApplicationBuilder`: The same builder with the updated argument.
+        """
+        self._request_param_check(name="json_body", get_updates=True)
+        self._get_updates_json_body = get_updates_json_body
+        return self
+
+    def get_updates_circuit_breaker(
+        self: BuilderType, get_updates_circuit_breaker: CircuitBreaker
+    ) -> BuilderType:
+        """Sets the :paramref:`~telegram.request.HTTPXRequest.circuit_breaker` parameter which
+        is used for the :meth:`telegram.Bot.get_updates` request. Defaults to :obj:`None`.
+
+        .. seealso:: :meth:`circuit_breaker`
+
+        .. versionadded:: NEXT.VERSION
+
+        Args:
+            get_updates_circuit_breaker (:class:`telegram.request.CircuitBreaker`): The circuit
+                breaker.
+
+        Returns:
+            :class:`ApplicationBuilder`: The same builder with the updated argument.
+        """
+        self._request_param_check(name="circuit_breaker", get_updates=True)
+        self._get_updates_circuit_breaker = get_updates_circuit_breaker
+        return self
+
+    def upload_request(self: BuilderType, upload_request: BaseRequest) -> BuilderType:
+        """Sets a :class:`telegram.request.BaseRequest` instance for the
+        :paramref:`~telegram.Bot.upload_request` parameter of
+        :attr:`telegram.ext.Application.bot`.
+
+        .. seealso:: :meth:`download_request`
+
+        .. versionadded:: NEXT.VERSION
+
+        Args:
+            upload_request (:class:`telegram.request.BaseRequest`): The request instance.
+
+        Returns:
+            :class:`ApplicationBuilder`: The same builder with the updated argument.
+        """
+        self._pool_request_check("upload")
+        self._upload_request = upload_request
+        return self
+
+    def upload_connection_pool_size(
+        self: BuilderType, upload_connection_pool_size: int
+    ) -> BuilderType:
+        """Sets the size of the connection pool for the
+        :paramref:`~telegram.request.HTTPXRequest.connection_pool_size` parameter of
+        :attr:`telegram.Bot.upload_request`, which is used for requests that upload files.
+        Defaults to ``16``.
+
+        .. versionadded:: NEXT.VERSION
+
+        Args:
+            upload_connection_pool_size (:obj:`int`): The size of the connection pool.
+
+        Returns:
+            :class:`ApplicationBuilder`: The same builder with the updated argument.
+        """
+        self._pool_param_check(name="connection_pool_size", pool="upload")
+        self._upload_connection_pool_size = upload_connection_pool_size
+        return self
+
+    def upload_connect_timeout(
+        self: BuilderType, upload_connect_timeout: Optional[float]
+    ) -> BuilderType:
+        """Sets the connection attempt timeout for the
+        :paramref:`~telegram.request.HTTPXRequest.connect_timeout` parameter of
+        :attr:`telegram.Bot.upload_request`.
+        Defaults to the value passed to :meth:`connect_timeout`.
+
+        .. versionadded:: NEXT.VERSION
+
+        Args:
+            upload_connect_timeout (:obj:`float`): See
+                :paramref:`telegram.request.HTTPXRequest.connect_timeout` for more information.
+
+        Returns:
+            :class:`ApplicationBuilder`: The same builder with the updated argument.
+        """
+        self._pool_param_check(name="connect_timeout", pool="upload")
+        self._upload_connect_timeout = upload_connect_timeout
+        return self
+
+    def upload_read_timeout(
+        self: BuilderType, upload_read_timeout: Optional[float]
+    ) -> BuilderType:
+        """Sets the waiting timeout for the
+        :paramref:`~telegram.request.HTTPXRequest.read_timeout` parameter of
+        :attr:`telegram.Bot.upload_request`.
+        Defaults to the value passed to :meth:`read_timeout`.
+
+        .. versionadded:: NEXT.VERSION
+
+        Args:
+            upload_read_timeout (:obj:`float`): See
+                :paramref:`telegram.request.HTTPXRequest.read_timeout` for more information.
+
+        Returns:
+            :class:`ApplicationBuilder`: The same builder with the updated argument.
+        """
+        self._pool_param_check(name="read_timeout", pool="upload")
+        self._upload_read_timeout = upload_read_timeout
+        return self
+
+    def upload_write_timeout(
+        self: BuilderType, upload_write_timeout: Optional[float]
+    ) -> BuilderType:
+        """Sets the write operation timeout for the
+        :paramref:`~telegram.request.HTTPXRequest.media_write_timeout` parameter of
+        :attr:`telegram.Bot.upload_request`.
+        Defaults to the value passed to :meth:`media_write_timeout`.
+
+        .. versionadded:: NEXT.VERSION
+
+        Args:
+            upload_write_timeout (:obj:`float`): See
+                :paramref:`telegram.request.HTTPXRequest.media_write_timeout` for more information.
+
+        Returns:
+            :class:`ApplicationBuilder`: The same builder with the updated argument.
+        """
+        self._pool_param_check(name="write_timeout", pool="upload")
+        self._upload_write_timeout = upload_write_timeout
+        return self
+
+    def upload_pool_timeout(
+        self: BuilderType, upload_pool_timeout: Optional[float]
+    ) -> BuilderType:
+        """Sets the connection pool timeout for the
+        :paramref:`~telegram.request.HTTPXRequest.pool_timeout` parameter of
+        :attr:`telegram.Bot.upload_request`.
+        Defaults to the value passed to :meth:`pool_timeout`.
+
+        .. versionadded:: NEXT.VERSION
+
+        Args:
+            upload_pool_timeout (:obj:`float`): See
+                :paramref:`telegram.request.HTTPXRequest.pool_timeout` for more information.
+
+        Returns:
+            :class:`ApplicationBuilder`: The same builder with the updated argument.
+        """
+        self._pool_param_check(name="pool_timeout", pool="upload")
+        self._upload_pool_timeout = upload_pool_timeout
+        return self
+
+    def download_request(self: BuilderType, download_request: BaseRequest) -> BuilderType:
+        """Sets a :class:`telegram.request.BaseRequest` instance for the
+        :paramref:`~telegram.Bot.download_request` parameter of
+        :attr:`telegram.ext.Application.bot`.
+
+        .. seealso:: :meth:`upload_request`
+
+        .. versionadded:: NEXT.VERSION
+
+        Args:
+            download_request (:class:`telegram.request.BaseRequest`): The request instance.
+
+        Returns:
+            :class:`ApplicationBuilder`: The same builder with the updated argument.
+        """
+        self._pool_request_check("download")
+        self._download_request = download_request
+        return self
+
+    def download_connection_pool_size(
+        self: BuilderType, download_connection_pool_size: int
+    ) -> BuilderType:
+        """Sets the size of the connection pool for the
+        :paramref:`~telegram.request.HTTPXRequest.connection_pool_size` parameter of
+        :attr:`telegram.Bot.download_request`, which is used for downloading files.
+        Defaults to ``16``.
+
+        .. versionadded:: NEXT.VERSION
+
+        Args:
+            download_connection_pool_size (:obj:`int`): The size of the connection pool.
+
+        Returns:
+            :class:`ApplicationBuilder`: The same builder with the updated argument.
+        """
+        self._pool_param_check(name="connection_pool_size", pool="download")
+        self._download_connection_pool_size = download_connection_pool_size
+        return self
+
+    def download_connect_timeout(
+        self: BuilderType, download_connect_timeout: Optional[float]
+    ) -> BuilderType:
+        """Sets the connection attempt timeout for the
+        :paramref:`~telegram.request.HTTPXRequest.connect_timeout` parameter of
+        :attr:`telegram.Bot.download_request`.
+        Defaults to the value passed to :meth:`connect_timeout`.
+
+        .. versionadded:: NEXT.VERSION
+
+        Args:
+            download_connect_timeout (:obj:`float`): See
+                :paramref:`telegram.request.HTTPXRequest.connect_timeout` for more information.
+
+        Returns:
+            :class:`ApplicationBuilder`: The same builder with the updated argument.
+        """
+        self._pool_param_check(name="connect_timeout", pool="download")
+        self._download_connect_timeout = download_connect_timeout
+        return self
+
+    def download_read_timeout(
+        self: BuilderType, download_read_timeout: Optional[float]
+    ) -> BuilderType:
+        """Sets the waiting timeout for the
+        :paramref:`~telegram.request.HTTPXRequest.read_timeout` parameter of
+        :attr:`telegram.Bot.download_request`.
+        Defaults to the value passed to :meth:`read_timeout`.
+
+        .. versionadded:: NEXT.VERSION
+
+        Args:
+            download_read_timeout (:obj:`float`): See
+                :paramref:`telegram.request.HTTPXRequest.read_timeout` for more information.
+
+        Returns:
+            :class:`ApplicationBuilder`: The same builder with the updated argument.
+        """
+        self._pool_param_check(name="read_timeout", pool="download")
+        self._download_read_timeout = download_read_timeout
+        return self
+
+    def download_write_timeout(
+        self: BuilderType, download_write_timeout: Optional[float]
+    ) -> BuilderType:
+        """Sets the write operation timeout for the
+        :paramref:`~telegram.request.HTTPXRequest.write_timeout` parameter of
+        :attr:`telegram.Bot.download_request`.
+        Defaults to the value passed to :meth:`write_timeout`.
+
+        .. versionadded:: NEXT.VERSION
+
+        Args:
+            download_write_timeout (:obj:`float`): See
+                :paramref:`telegram.request.HTTPXRequest.write_timeout` for more information.
+
+        Returns:
+            :class:`ApplicationBuilder`: The same builder with the updated argument.
+        """
+        self._pool_param_check(name="write_timeout", pool="download")
+        self._download_write_timeout = download_write_timeout
+        return self
+
+    def download_pool_timeout(
+        self: BuilderType, download_pool_timeout: Optional[float]
+    ) -> BuilderType:
+        """Sets the connection pool timeout for the
+        :paramref:`~telegram.request.HTTPXRequest.pool_timeout` parameter of
+        :attr:`telegram.Bot.download_request`.
+        Defaults to the value passed to :meth:`pool_timeout`.
+
+        .. versionadded:: NEXT.VERSION
+
+        Args:
+            download_pool_timeout (:obj:`float`): See
+                :paramref:`telegram.request.HTTPXRequest.pool_timeout` for more information.
+
+        Returns:
+            :class:`ApplicationBuilder`: The same builder with the updated argument.
+        """
+        self._pool_param_check(name="pool_timeout", pool="download")
+        self._download_pool_timeout = download_pool_timeout
+        return self
+
     def private_key(
         self: BuilderType,
         private_key: Union[bytes, FilePathInput],
@@ -981,6 +1480,28 @@ class ApplicationBuilder(Generic[BT, CCT, UD, CD, BD, JQ]):
         self._arbitrary_callback_data = arbitrary_callback_data
         return self
 
+    def upload_cache(self: BuilderType, upload_cache: Union[bool, int]) -> BuilderType:
+        """Specifies whether :attr:`telegram.ext.Application.bot` should cache the ``file_id`` s
+        of uploaded files and send those instead of uploading the same files again and how many
+        ``file_id`` s should be cached in memory. If not called, files are always uploaded.
+
+        .. seealso:: :paramref:`telegram.ext.ExtBot.upload_cache`,
+            :class:`telegram.ext.UploadCache`
+
+        .. versionadded:: NEXT.VERSION
+
+        Args:
+            upload_cache (:obj:`bool` | :obj:`int`): If :obj:`True` is passed, the default cache
+                size of ``1024`` will be used. Pass an integer to specify a different cache size.
+
+        Returns:
+            :class:`ApplicationBuilder`: The same builder with the updated argument.
+        """
+        self._bot_check("upload_cache")
+        self._updater_check("upload_cache")
+        self._upload_cache = upload_cache
+        return self
+
     def local_mode(self: BuilderType, local_mode: bool) -> BuilderType:
         """Specifies the value for :paramref:`~telegram.Bot.local_mode` for the
         :attr:`telegram.ext.Application.bot`.
@@ -1086,6 +1607,28 @@ class ApplicationBuilder(Generic[BT, CCT, UD, CD, BD, JQ]):
         self._update_processor: BaseUpdateProcessor = concurrent_updates  # type: ignore[no-redef]
         return self
 
+    def download_manager(
+        self: BuilderType, download_manager: Union[int, DownloadManager]
+    ) -> BuilderType:
+        """Sets the :class:`telegram.ext.DownloadManager` to be used for
+        :attr:`telegram.ext.Application.download_manager`. If not called, a download manager
+        with default settings will be used.
+
+        .. versionadded:: NEXT.VERSION
+
+        Args:
+            download_manager (:obj:`int` | :class:`telegram.ext.DownloadManager`): Pass an
+                integer to specify how many files may be downloaded concurrently. Pass an instance
+                of :class:`telegram.ext.DownloadManager` to use that instance.
+
+        Returns:
+            :class:`ApplicationBuilder`: The same builder with the updated argument.
+        """
+        if isinstance(download_manager, int):
+            download_manager = DownloadManager(max_concurrent_downloads=download_manager)
+        self._download_manager = download_manager
+        return self
+
     def job_queue(
         self: "ApplicationBuilder[BT, CCT, UD, CD, BD, JQ]",
         job_queue: InJQ,
@@ -1192,6 +1735,7 @@ class ApplicationBuilder(Generic[BT, CCT, UD, CD, BD, JQ]):
         for attr, error in (
             (self._bot, "bot instance"),
             (self._update_queue, "update_queue"),
+            (self._retry_policy, "retry_policy"),
         ):
             if not isinstance(attr, DefaultValue):
                 raise RuntimeError(_TWO_ARGS_REQ.format("updater", error))
@@ -1351,6 +1895,65 @@ class ApplicationBuilder(Generic[BT, CCT, UD, CD, BD, JQ]):
         self._rate_limiter = rate_limiter
         return self  # type: ignore[return-value]
 
+    def retry_policy(self: BuilderType, retry_policy: RetryPolicy) -> BuilderType:
+        """Sets the :class:`telegram.ext.RetryPolicy` used by
+        :attr:`telegram.ext.Application.updater` to decide how long to wait before retrying
+        after an error while polling for updates or while bootstrapping
+        :meth:`telegram.ext.Application.run_polling` and
+        :meth:`telegram.ext.Application.run_webhook`. If not called, a
+        :class:`~telegram.ext.RetryPolicy` with default settings will be used.
+
+        Tip:
+            To use the same policy for retries after rate limits, pass it to
+            :paramref:`telegram.ext.AIORateLimiter.retry_policy` as well.
+
+        .. seealso:: :paramref:`telegram.ext.Updater.retry_policy`
+
+        .. versionadded:: NEXT.VERSION
+
+        Args:
+            retry_policy (:class:`telegram.ext.RetryPolicy`): The retry policy.
+
+        Returns:
+            :class:`ApplicationBuilder`: The same builder with the updated argument.
+        """
+        self._updater_check("retry_policy")
+        self._retry_policy = retry_policy
+        return self
+
+    def json_codec(self: BuilderType, json_codec: JSONCodec) -> BuilderType:
+        """Sets the :class:`telegram.request.JSONCodec` used for encoding requests, decoding
+        responses of the Bot API, decoding updates received via webhook and for
+        :meth:`telegram.TelegramObject.to_json`.
+
+        Example:
+            .. code:: python
+
+                # use orjson or msgspec if one of them is installed
+                application = ApplicationBuilder().token("TOKEN").json_codec(
+                    JSONCodec("auto")
+                ).build()
+
+        Note:
+            The codec is passed to all :class:`telegram.request.HTTPXRequest` instances built by
+            this builder, including the ones for :meth:`get_updates_request`,
+            :meth:`upload_request` and :meth:`download_request`. It does not affect other
+            :class:`telegram.Bot` instances.
+
+        .. versionadded:: NEXT.VERSION
+
+        Args:
+            json_codec (:class:`telegram.request.JSONCodec`): The codec.
+
+        Returns:
+            :class:`ApplicationBuilder`: The same builder with the updated argument.
+        """
+        self._request_param_check(name="json_codec", get_updates=False)
+        if self._get_updates_request is not DEFAULT_NONE:
+            raise RuntimeError(_TWO_ARGS_REQ.format("json_codec", "get_updates_request instance"))
+        self._json_codec = json_codec
+        return self
+
 
 InitApplicationBuilder = (  # This is defined all the way down here so that its type is inferred
     ApplicationBuilder[  # by Pylance correctly.
@@ -23,7 +23,15 @@ from typing import Generic, NamedTuple, NoReturn, Optional
 
 from telegram._bot import Bot
 from telegram.ext._extbot import ExtBot
-from telegram.ext._utils.types import BD, CD, UD, CDCData, ConversationDict, ConversationKey
+from telegram.ext._utils.types import (
+    BD,
+    CD,
+    UD,
+    CDCData,
+    ConversationDict,
+    ConversationKey,
+    UCData,
+)
 
 
 class PersistenceInput(NamedTuple):
@@ -39,12 +47,20 @@ class PersistenceInput(NamedTuple):
             Defaults to :obj:`True`.
         callback_data (:obj:`bool`, optional): Whether the setting should be applied for
             ``callback_data``. Defaults to :obj:`True`.
+        upload_cache (:obj:`bool`, optional): Whether the setting should be applied for the
+            ``file_id`` s in :attr:`telegram.ext.ExtBot.upload_cache`. Defaults to :obj:`True`.
+
+            .. versionadded:: NEXT.VERSION
 
     Attributes:
         bot_data (:obj:`bool`): Whether the setting should be applied for ``bot_data``.
         chat_data (:obj:`bool`): Whether the setting should be applied for ``chat_data``.
         user_data (:obj:`bool`): Whether the setting should be applied for ``user_data``.
         callback_data (:obj:`bool`): Whether the setting should be applied for ``callback_data``.
+        upload_cache (:obj:`bool`): Whether the setting should be applied for the ``file_id`` s in
+            :attr:`telegram.ext.ExtBot.upload_cache`.
+
+            .. versionadded:: NEXT.VERSION
 
     """
 
@@ -52,6 +68,7 @@ class PersistenceInput(NamedTuple):
     chat_data: bool = True
     user_data: bool = True
     callback_data: bool = True
+    upload_cache: bool = True
 
 
 class BasePersistence(Generic[UD, CD, BD], ABC):
@@ -82,6 +99,9 @@ class BasePersistence(Generic[UD, CD, BD], ABC):
     * :meth:`update_conversation`
     * :meth:`flush`
 
+    Overwriting :meth:`get_upload_cache` and :meth:`update_upload_cache` is optional. By default,
+    the ``file_id`` s in :attr:`telegram.ext.ExtBot.upload_cache` are not persisted.
+
     If you don't actually need one of those methods, a simple :keyword:`pass` is enough.
     For example, if you don't store ``bot_data``, you don't need :meth:`get_bot_data`,
     :meth:`update_bot_data` or :meth:`refresh_bot_data`.
@@ -254,6 +274,22 @@ class BasePersistence(Generic[UD, CD, BD], ABC):
             if no data was stored.
         """
 
+    async def get_upload_cache(self) -> Optional[UCData]:
+        """Will be called by :class:`telegram.ext.Application` upon creation with a
+        persistence object, if :attr:`telegram.ext.ExtBot.upload_cache` is set. If ``file_id`` s
+        were stored, they should be returned.
+
+        Unlike most other methods, this method is not abstract. The default implementation
+        returns :obj:`None`.
+
+        .. versionadded:: NEXT.VERSION
+
+        Returns:
+            dict[:obj:`str`, :obj:`str`] | :obj:`None`: The restored ``file_id`` s or
+            :obj:`None`, if no data was stored.
+        """
+        return None
+
     @abstractmethod
     async def get_conversations(self, name: str) -> ConversationDict:
         """Will be called by :class:`telegram.ext.Application` when a
@@ -330,6 +366,20 @@ class BasePersistence(Generic[UD, CD, BD], ABC):
                 The relevant data to restore :class:`telegram.ext.CallbackDataCache`.
         """
 
+    async def update_upload_cache(self, data: UCData) -> None:
+        """Will be called by the :class:`telegram.ext.Application` in regular intervals, if
+        :attr:`telegram.ext.ExtBot.upload_cache` is set.
+
+        Unlike most other methods, this method is not abstract. The default implementation does
+        nothing.
+
+        .. versionadded:: NEXT.VERSION
+
+        Args:
+            data (dict[:obj:`str`, :obj:`str`]): The relevant data to restore
+                :class:`telegram.ext.UploadCache`.
+        """
+
     @abstractmethod
     async def drop_chat_data(self, chat_id: int) -> None:
         """Will be called by the :class:`telegram.ext.Application`, when using
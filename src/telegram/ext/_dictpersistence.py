@@ -23,7 +23,7 @@ from copy import deepcopy
 from typing import TYPE_CHECKING, Any, Optional, cast
 
 from telegram.ext import BasePersistence, PersistenceInput
-from telegram.ext._utils.types import CDCData, ConversationDict, ConversationKey
+from telegram.ext._utils.types import CDCData, ConversationDict, ConversationKey, UCData
 
 if TYPE_CHECKING:
     from telegram._utils.types import JSONDict
@@ -73,6 +73,11 @@ class DictPersistence(BasePersistence[dict[Any, Any], dict[Any, Any], dict[Any,
             wait between two consecutive runs of updating the persistence. Defaults to 60 seconds.
 
             .. versionadded:: 20.0
+        upload_cache_json (:obj:`str`, optional): JSON string that will be used to reconstruct
+            the ``file_id`` s of :attr:`telegram.ext.ExtBot.upload_cache` on creating this
+            persistence. Default is ``""``.
+
+            .. versionadded:: NEXT.VERSION
     Attributes:
         store_data (:class:`~telegram.ext.PersistenceInput`): Specifies which kinds of data will
             be saved by this persistence instance.
@@ -87,6 +92,8 @@ class DictPersistence(BasePersistence[dict[Any, Any], dict[Any, Any], dict[Any,
         "_chat_data_json",
         "_conversations",
         "_conversations_json",
+        "_upload_cache",
+        "_upload_cache_json",
         "_user_data",
         "_user_data_json",
     )
@@ -100,17 +107,20 @@ class DictPersistence(BasePersistence[dict[Any, Any], dict[Any, Any], dict[Any,
         conversations_json: str = "",
         callback_data_json: str = "",
         update_interval: float = 60,
+        upload_cache_json: str = "",
     ):
         super().__init__(store_data=store_data, update_interval=update_interval)
         self._user_data = None
         self._chat_data = None
         self._bot_data = None
         self._callback_data = None
+        self._upload_cache: Optional[UCData] = None
         self._conversations = None
         self._user_data_json: Optional[str] = None
         self._chat_data_json: Optional[str] = None
         self._bot_data_json: Optional[str] = None
         self._callback_data_json: Optional[str] = None
+        self._upload_cache_json: Optional[str] = None
         self._conversations_json: Optional[str] = None
         if user_data_json:
             try:
@@ -160,6 +170,17 @@ class DictPersistence(BasePersistence[dict[Any, Any], dict[Any, Any], dict[Any,
                 or not isinstance(self._callback_data[1], dict)
             ):
                 raise TypeError("callback_data_json is not in the required format")
+        if upload_cache_json:
+            try:
+                self._upload_cache = json.loads(upload_cache_json)
+                self._upload_cache_json = upload_cache_json
+            except (ValueError, AttributeError) as exc:
+                raise TypeError("Unable to deserialize upload_cache_json. Not valid JSON") from exc
+            if self._upload_cache is not None and not (
+                isinstance(self._upload_cache, dict)
+                and all(isinstance(value, str) for value in self._upload_cache.values())
+            ):
+                raise TypeError("upload_cache_json is not in the required format")
 
         if conversations_json:
             try:
@@ -225,6 +246,24 @@ class DictPersistence(BasePersistence[dict[Any, Any], dict[Any, Any], dict[Any,
             return self._callback_data_json
         return json.dumps(self.callback_data)
 
+    @property
+    def upload_cache(self) -> Optional[UCData]:
+        """dict[:obj:`str`, :obj:`str`]: The ``file_id`` s of the upload cache.
+
+        .. versionadded:: NEXT.VERSION
+        """
+        return self._upload_cache
+
+    @property
+    def upload_cache_json(self) -> str:
+        """:obj:`str`: The ``file_id`` s of the upload cache as a JSON-string.
+
+        .. versionadded:: NEXT.VERSION
+        """
+        if self._upload_cache_json:
+            return self._upload_cache_json
+        return json.dumps(self.upload_cache)
+
     @property
     def conversations(self) -> Optional[dict[str, ConversationDict]]:
         """:obj:`dict`: The conversations as a dict."""
@@ -284,6 +323,20 @@ class DictPersistence(BasePersistence[dict[Any, Any], dict[Any, Any], dict[Any,
             return None
         return deepcopy(self.callback_data)
 
+    async def get_upload_cache(self) -> Optional[UCData]:
+        """Returns the ``file_id`` s of the upload cache created from the ``upload_cache_json`` or
+        :obj:`None`.
+
+        .. versionadded:: NEXT.VERSION
+
+        Returns:
+            dict[:obj:`str`, :obj:`str`] | :obj:`None`: The restored ``file_id`` s or
+            :obj:`None`, if no data was stored.
+        """
+        if self.upload_cache is None:
+            return None
+        return self.upload_cache.copy()
+
     async def get_conversations(self, name: str) -> ConversationDict:
         """Returns the conversations created from the ``conversations_json`` or an empty
         :obj:`dict`.
@@ -366,6 +419,20 @@ class DictPersistence(BasePersistence[dict[Any, Any], dict[Any, Any], dict[Any,
         self._callback_data = data
         self._callback_data_json = None
 
+    async def update_upload_cache(self, data: UCData) -> None:
+        """Will update the ``file_id`` s of the upload cache (if changed).
+
+        .. versionadded:: NEXT.VERSION
+
+        Args:
+            data (dict[:obj:`str`, :obj:`str`]): The relevant data to restore
+                :class:`telegram.ext.UploadCache`.
+        """
+        if self._upload_cache == data:
+            return
+        self._upload_cache = data
+        self._upload_cache_json = None
+
     async def drop_chat_data(self, chat_id: int) -> None:
         """Will delete the specified key from the :attr:`chat_data`.
 
@@ -0,0 +1,367 @@
+#!/usr/bin/env python
+#
+#  A library that provides a Python interface to the Telegram Bot API
+#  Copyright (C) 2015-2025
+#  Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser Public License
+#  along with this program.  If not, see [http://www.gnu.org/licenses/].
+"""This module contains the DownloadManager class."""
+
+import asyncio
+import shutil
+from pathlib import Path
+from typing import Callable, Optional
+
+from telegram import File
+from telegram._utils.defaultvalue import DEFAULT_NONE
+from telegram._utils.files import is_local_file
+from telegram._utils.logging import get_logger
+from telegram._utils.types import FilePathInput, ODVInput
+from telegram.error import BadRequest, NetworkError
+from telegram.ext._utils.asyncio import TrackedBoundedSemaphore
+
+_LOGGER = get_logger(__name__, class_name="DownloadManager")
+
+ProgressCallback = Callable[[int, Optional[int]], object]
+"""Callable that is called with the number of bytes downloaded so far and the size of the file,
+if known."""
+
+
+class _Download:
+    """Bookkeeping for a download that may be awaited by several callers."""
+
+    __slots__ = ("callbacks", "path", "task", "waiters")
+
+    def __init__(self, path: Path):
+        self.path: Path = path
+        self.callbacks: list[ProgressCallback] = []
+        self.task: Optional[asyncio.Task[Path]] = None
+        self.waiters: int = 0
+
+
+class DownloadManager:
+    """Downloads files with a bounded number of concurrent transfers. The downloads use the
+    :attr:`~telegram.Bot.download_request` of the bot the files belong to, just like
+    :meth:`telegram.File.download_to_drive` does.
+
+    In contrast to :meth:`telegram.File.download_to_drive`, downloads that fail due to a
+    :class:`telegram.error.NetworkError` are retried. The data received so far is kept in a file
+    named ``<name>.<file_unique_id>.part`` next to the target path, and the next attempt, or the
+    next call for the same file, only requests the missing part with a HTTP ``Range`` header.
+    This is most useful for large files served by a
+    `local Bot API Server <https://github.com/tdlib/telegram-bot-api>`_. Encrypted files (e.g.
+    passport files) can only be decrypted as a whole and are downloaded from the start on every
+    attempt.
+
+    If a file is requested again while it is still being downloaded, no second transfer is
+    started. Instead, the second call waits for the first one and copies the file if a different
+    path was requested. Files are identified by their :attr:`~telegram.File.file_unique_id`.
+
+    Example:
+        .. code:: python
+
+            async def save_document(update, context):
+                file = await update.message.document.get_file()
+                await context.application.download_manager.download(
+                    file, "downloads/document.pdf", progress_callback=print
+                )
+
+    .. seealso:: :attr:`telegram.ext.Application.download_manager`,
+        :meth:`telegram.ext.ApplicationBuilder.download_manager`
+
+    .. versionadded:: NEXT.VERSION
+
+    Args:
+        max_concurrent_downloads (:obj:`int`, optional): The maximum number of files that are
+            downloaded at the same time. Defaults to ``4``.
+        max_retries (:obj:`int`, optional): How often a failed download is retried before the
+            error is raised. Defaults to ``3``.
+        retry_delay (:obj:`float`, optional): The number of seconds to wait before the first
+            retry. The delay is doubled for every further retry. Defaults to ``1.0``.
+
+    Raises:
+        :exc:`ValueError`: If :paramref:`max_concurrent_downloads` is not a positive integer or
+            :paramref:`max_retries` or :paramref:`retry_delay` are negative.
+    """
+
+    __slots__ = (
+        "_downloads",
+        "_max_concurrent_downloads",
+        "_max_retries",
+        "_retry_delay",
+        "_semaphore",
+    )
+
+    def __init__(
+        self,
+        max_concurrent_downloads: int = 4,
+        max_retries: int = 3,
+        retry_delay: float = 1.0,
+    ):
+        if max_concurrent_downloads < 1:
+            raise ValueError("`max_concurrent_downloads` must be a positive integer!")
+        if max_retries < 0:
+            raise ValueError("`max_retries` must not be negative!")
+        if retry_delay < 0:
+            raise ValueError("`retry_delay` must not be negative!")
+
+        self._max_concurrent_downloads: int = max_concurrent_downloads
+        self._max_retries: int = max_retries
+        self._retry_delay: float = retry_delay
+        self._semaphore = TrackedBoundedSemaphore(max_concurrent_downloads)
+        self._downloads: dict[str, _Download] = {}
+
+    @property
+    def max_concurrent_downloads(self) -> int:
+        """:obj:`int`: The maximum number of files that are downloaded at the same time."""
+        return self._max_concurrent_downloads
+
+    @property
+    def max_retries(self) -> int:
+        """:obj:`int`: How often a failed download is retried."""
+        return self._max_retries
+
+    @property
+    def retry_delay(self) -> float:
+        """:obj:`float`: The number of seconds to wait before the first retry."""
+        return self._retry_delay
+
+    @property
+    def active_downloads(self) -> int:
+        """:obj:`int`: The number of files that are currently being transferred. Downloads that
+        wait for a free slot or for a retry are not included.
+        """
+        return self._max_concurrent_downloads - self._semaphore.current_value
+
+    @property
+    def pending_downloads(self) -> int:
+        """:obj:`int`: The number of files that were requested and are not downloaded yet,
+        including the ones that are currently being transferred.
+        """
+        return len(self._downloads)
+
+    async def download(
+        self,
+        file: File,
+        custom_path: Optional[FilePathInput] = None,
+        *,
+        progress_callback: Optional[ProgressCallback] = None,
+        read_timeout: ODVInput[float] = DEFAULT_NONE,
+        write_timeout: ODVInput[float] = DEFAULT_NONE,
+        connect_timeout: ODVInput[float] = DEFAULT_NONE,
+        pool_timeout: ODVInput[float] = DEFAULT_NONE,
+    ) -> Path:
+        """Downloads a file to the drive. The target path is chosen just like in
+        :meth:`telegram.File.download_to_drive`.
+
+        Note:
+            If the call is cancelled while other calls wait for the same file, the download
+            continues for them. Otherwise, it is cancelled and the ``.part`` file is kept, such
+            that a later call can resume the download.
+
+        Args:
+            file (:class:`telegram.File`): The file to download.
+            custom_path (:class:`pathlib.Path` | :obj:`str`, optional): The path where the file
+                will be saved to. If not specified, will be saved in the current working directory
+                with :attr:`~telegram.File.file_path` as file name.
+
+        Keyword Args:
+            progress_callback (Callable[[:obj:`int`, :obj:`int` | :obj:`None`], :obj:`object`], \
+                optional): Called after each received chunk with the number of bytes downloaded
+                so far and the :attr:`~telegram.File.file_size`, if known. For resumed downloads,
+                the count includes the bytes downloaded before.
+            read_timeout (:obj:`float` | :obj:`None`, optional): Value to pass to
+                :paramref:`telegram.request.BaseRequest.post.read_timeout`. Defaults to
+                :attr:`~telegram.request.BaseRequest.DEFAULT_NONE`.
+            write_timeout (:obj:`float` | :obj:`None`, optional): Value to pass to
+                :paramref:`telegram.request.BaseRequest.post.write_timeout`. Defaults to
+                :attr:`~telegram.request.BaseRequest.DEFAULT_NONE`.
+            connect_timeout (:obj:`float` | :obj:`None`, optional): Value to pass to
+                :paramref:`telegram.request.BaseRequest.post.connect_timeout`. Defaults to
+                :attr:`~telegram.request.BaseRequest.DEFAULT_NONE`.
+            pool_timeout (:obj:`float` | :obj:`None`, optional): Value to pass to
+                :paramref:`telegram.request.BaseRequest.post.pool_timeout`. Defaults to
+                :attr:`~telegram.request.BaseRequest.DEFAULT_NONE`.
+
+        Returns:
+            :class:`pathlib.Path`: The path the file was downloaded to.
+
+        Raises:
+            RuntimeError: If :attr:`~telegram.File.file_path` is not set.
+            :class:`telegram.error.TelegramError`: If the download failed for good.
+        """
+        if not file.file_path:
+            raise RuntimeError("No `file_path` available for this file. Can not download.")
+
+        if custom_path is not None:
+            path = Path(custom_path)
+        elif is_local_file(file.file_path):
+            local_path = Path(file.file_path)
+            if not file._credentials:  # pylint: disable=protected-access
+                return local_path
+            path = local_path.with_name(f"decrypted_{local_path.name}")
+        else:
+            path = Path(Path(file.file_path).name)
+
+        download = self._downloads.get(file.file_unique_id)
+        if download is None:
+            download = self._start(
+                file,
+                path,
+                read_timeout=read_timeout,
+                write_timeout=write_timeout,
+                connect_timeout=connect_timeout,
+                pool_timeout=pool_timeout,
+            )
+
+        if progress_callback:
+            download.callbacks.append(progress_callback)
+        download.waiters += 1
+        try:
+            downloaded_path = await asyncio.shield(download.task)  # type: ignore[arg-type]
+        except asyncio.CancelledError:
+            if download.waiters == 1:
+                download.task.cancel()  # type: ignore[union-attr]
+            raise
+        finally:
+            download.waiters -= 1
+            if progress_callback:
+                download.callbacks.remove(progress_callback)
+
+        if path.resolve() != downloaded_path.resolve():
+            shutil.copyfile(downloaded_path, path)
+        return path
+
+    def _start(
+        self,
+        file: File,
+        path: Path,
+        read_timeout: ODVInput[float],
+        write_timeout: ODVInput[float],
+        connect_timeout: ODVInput[float],
+        pool_timeout: ODVInput[float],
+    ) -> _Download:
+        download = _Download(path)
+        download.task = asyncio.create_task(
+            self._run(
+                file,
+                download,
+                read_timeout=read_timeout,
+                write_timeout=write_timeout,
+                connect_timeout=connect_timeout,
+                pool_timeout=pool_timeout,
+            ),
+            name=f"DownloadManager:{file.file_unique_id}",
+        )
+        self._downloads[file.file_unique_id] = download
+
+        def remove(_: object) -> None:
+            if self._downloads.get(file.file_unique_id) is download:
+                del self._downloads[file.file_unique_id]
+
+        download.task.add_done_callback(remove)
+        return download
+
+    async def _run(
+        self,
+        file: File,
+        download: _Download,
+        read_timeout: ODVInput[float],
+        write_timeout: ODVInput[float],
+        connect_timeout: ODVInput[float],
+        pool_timeout: ODVInput[float],
+    ) -> Path:
+        delay = self._retry_delay
+        for retries_left in range(self._max_retries, -1, -1):
+            try:
+                async with self._semaphore:
+                    await self._download_to_path(
+                        file,
+                        download,
+                        read_timeout=read_timeout,
+                        write_timeout=write_timeout,
+                        connect_timeout=connect_timeout,
+                        pool_timeout=pool_timeout,
+                    )
+            except BadRequest:
+                # e.g. the file is too big or the link expired - trying again won't help
+                raise
+            except NetworkError as exc:
+                if not retries_left:
+                    raise
+                _LOGGER.info(
+                    "Download of %s failed: %s. Retrying in %.1f seconds.",
+                    file.file_unique_id,
+                    exc,
+                    delay,
+                )
+                await asyncio.sleep(delay)
+                delay *= 2
+            else:
+                return download.path
+
+        raise RuntimeError("Unreachable")  # pragma: no cover
+
+    @staticmethod
+    async def _download_to_path(
+        file: File,
+        download: _Download,
+        read_timeout: ODVInput[float],
+        write_timeout: ODVInput[float],
+        connect_timeout: ODVInput[float],
+        pool_timeout: ODVInput[float],
+    ) -> None:
+        path = download.path
+        part_path = path.with_name(f"{path.name}.{file.file_unique_id}.part")
+        total = file.file_size
+        # Encrypted files can only be decrypted as a whole
+        resumable = not file._credentials  # pylint: disable=protected-access
+
+        offset = part_path.stat().st_size if resumable and part_path.is_file() else 0
+        if total is not None and offset > total:
+            offset = 0
+        received = offset
+
+        def write(chunk: bytes) -> None:
+            nonlocal received
+            out.write(chunk)
+            received += len(chunk)
+            for callback in tuple(download.callbacks):
+                callback(received, total)
+
+        try:
+            with part_path.open("ab" if offset else "wb") as out:
+                if total is None or offset < total:
+                    # pylint: disable=protected-access
+                    await file._download(
+                        write,
+                        read_timeout=read_timeout,
+                        write_timeout=write_timeout,
+                        connect_timeout=connect_timeout,
+                        pool_timeout=pool_timeout,
+                        offset=offset,
+                    )
+        except BaseException:
+            if not resumable:
+                part_path.unlink(missing_ok=True)
+            raise
+
+        if resumable and total is not None and received != total:
+            # The data on the drive does not match the file anymore, so we start from scratch
+            part_path.unlink()
+            raise NetworkError(
+                f"Downloaded {received} bytes of {file.file_unique_id}, expected {total} bytes."
+            )
+
+        part_path.replace(path)
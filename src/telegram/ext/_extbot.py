@@ -20,12 +20,14 @@
 """This module contains an object that represents a Telegram Bot with convenience extensions."""
 
 import datetime as dtm
+import re
 from collections.abc import Sequence
 from copy import copy
 from typing import (
     TYPE_CHECKING,
     Any,
     Callable,
+    Final,
     Generic,
     Optional,
     TypeVar,
@@ -64,6 +66,7 @@ from telegram import (
     InlineKeyboardMarkup,
     InlineQueryResultsButton,
     InputChecklist,
+    InputFile,
     InputMedia,
     InputPaidMedia,
     InputPollOption,
@@ -110,7 +113,9 @@ from telegram._utils.types import (
     ReplyMarkup,
     TimePeriod,
 )
+from telegram.error import BadRequest
 from telegram.ext._callbackdatacache import CallbackDataCache
+from telegram.ext._uploadcache import UploadCache
 from telegram.ext._utils.types import RLARGS
 from telegram.request import BaseRequest
 from telegram.warnings import PTBUserWarning
@@ -135,6 +140,38 @@ if TYPE_CHECKING:
 HandledTypes = TypeVar("HandledTypes", bound=Union[Message, CallbackQuery, ChatFullInfo])
 KT = TypeVar("KT", bound=ReplyMarkup)
 
+# The endpoints for which the upload cache may replace files by file_ids. Other endpoints, e.g.
+# setChatPhoto or uploadStickerFile, only accept uploads.
+_UPLOAD_CACHE_ENDPOINTS: Final[frozenset[str]] = frozenset(
+    {
+        "editMessageMedia",
+        "sendAnimation",
+        "sendAudio",
+        "sendDocument",
+        "sendMediaGroup",
+        "sendPhoto",
+        "sendSticker",
+        "sendVideo",
+        "sendVideoNote",
+        "sendVoice",
+    }
+)
+# The parameters of those endpoints that hold the file. They coincide with the attributes of the
+# returned message that hold the sent file, just like InputMedia.type
+_UPLOAD_CACHE_PARAMETERS: Final[tuple[str, ...]] = (
+    "animation",
+    "audio",
+    "document",
+    "photo",
+    "sticker",
+    "video",
+    "video_note",
+    "voice",
+)
+_STALE_FILE_ID_PATTERN: Final[re.Pattern[str]] = re.compile(
+    r"file[ _]?(?:id|identifier|reference)|type of file mismatch", re.IGNORECASE
+)
+
 
 class ExtBot(Bot, Generic[RLARGS]):
     """This object represents a Telegram Bot with convenience extensions.
@@ -187,10 +224,22 @@ class ExtBot(Bot, Generic[RLARGS]):
             limiting the number of requests made by the bot per time interval.
 
             .. versionadded:: 20.0
+        upload_cache (:obj:`bool` | :obj:`int`, optional): Whether to remember the ``file_id`` s
+            of uploaded files and to send those instead of uploading the same files again.
+            Pass an integer to specify the maximum number of ``file_id`` s kept in memory.
+            Defaults to :obj:`False`.
+
+            This applies to the methods sending a single file, e.g. :meth:`send_photo`, as well
+            as to :meth:`send_media_group` and :meth:`edit_message_media`. If Telegram rejects a
+            cached ``file_id``, it is dropped from the cache and the files are uploaded again.
+
+            .. seealso:: :class:`telegram.ext.UploadCache`
+
+            .. versionadded:: NEXT.VERSION
 
     """
 
-    __slots__ = ("_callback_data_cache", "_defaults", "_rate_limiter")
+    __slots__ = ("_callback_data_cache", "_defaults", "_rate_limiter", "_upload_cache")
 
     _LOGGER = get_logger(__name__, class_name="ExtBot")
 
@@ -210,6 +259,10 @@ class ExtBot(Bot, Generic[RLARGS]):
         defaults: Optional["Defaults"] = None,
         arbitrary_callback_data: Union[bool, int] = False,
         local_mode: bool = False,
+        *,
+        upload_request: Optional[BaseRequest] = None,
+        download_request: Optional[BaseRequest] = None,
+        upload_cache: Union[bool, int] = False,
     ): ...
 
     @overload
@@ -226,6 +279,10 @@ class ExtBot(Bot, Generic[RLARGS]):
         arbitrary_callback_data: Union[bool, int] = False,
         local_mode: bool = False,
         rate_limiter: Optional["BaseRateLimiter[RLARGS]"] = None,
+        *,
+        upload_request: Optional[BaseRequest] = None,
+        download_request: Optional[BaseRequest] = None,
+        upload_cache: Union[bool, int] = False,
     ): ...
 
     def __init__(
@@ -241,6 +298,10 @@ class ExtBot(Bot, Generic[RLARGS]):
         arbitrary_callback_data: Union[bool, int] = False,
         local_mode: bool = False,
         rate_limiter: Optional["BaseRateLimiter[RLARGS]"] = None,
+        *,
+        upload_request: Optional[BaseRequest] = None,
+        download_request: Optional[BaseRequest] = None,
+        upload_cache: Union[bool, int] = False,
     ):
         super().__init__(
             token=token,
@@ -251,11 +312,19 @@ class ExtBot(Bot, Generic[RLARGS]):
             private_key=private_key,
             private_key_password=private_key_password,
             local_mode=local_mode,
+            upload_request=upload_request,
+            download_request=download_request,
         )
         with self._unfrozen():
             self._defaults: Optional[Defaults] = defaults
             self._rate_limiter: Optional[BaseRateLimiter] = rate_limiter
             self._callback_data_cache: Optional[CallbackDataCache] = None
+            self._upload_cache: Optional[UploadCache] = None
+
+            if upload_cache is not False:
+                self._upload_cache = (
+                    UploadCache() if upload_cache is True else UploadCache(maxsize=upload_cache)
+                )
 
             # set up callback_data
             if arbitrary_callback_data is False:
@@ -306,6 +375,16 @@ class ExtBot(Bot, Generic[RLARGS]):
         """
         return self._callback_data_cache
 
+    @property
+    def upload_cache(self) -> Optional[UploadCache]:
+        """:class:`telegram.ext.UploadCache`: Optional. The cache for the ``file_id`` s of
+        uploaded files. :obj:`None`, if :paramref:`~telegram.ext.ExtBot.upload_cache` is set to
+        :obj:`False`.
+
+        .. versionadded:: NEXT.VERSION
+        """
+        return self._upload_cache
+
     async def initialize(self) -> None:
         """See :meth:`telegram.Bot.initialize`. Also initializes the
         :paramref:`ExtBot.rate_limiter` (if set)
@@ -358,7 +437,7 @@ class ExtBot(Bot, Generic[RLARGS]):
         pool_timeout: ODVInput[float] = DEFAULT_NONE,
     ) -> Union[bool, JSONDict, list[JSONDict]]:
         """Order of method calls is: Bot.some_method -> Bot._post -> Bot._do_post.
-        So we can override Bot._do_post to add rate limiting.
+        So we can override Bot._do_post to add rate limiting and the upload cache.
         """
         rate_limit_args = self._extract_rl_kwargs(data)
         if not self.rate_limiter and rate_limit_args is not None:
@@ -366,23 +445,29 @@ class ExtBot(Bot, Generic[RLARGS]):
                 "`rate_limit_args` can only be used if a `ExtBot.rate_limiter` is set."
             )
 
-        # getting updates should not be rate limited!
-        if endpoint == "getUpdates" or not self.rate_limiter:
-            return await super()._do_post(
-                endpoint=endpoint,
-                data=data,
-                write_timeout=write_timeout,
-                connect_timeout=connect_timeout,
-                pool_timeout=pool_timeout,
-                read_timeout=read_timeout,
-            )
-
         kwargs = {
             "read_timeout": read_timeout,
             "write_timeout": write_timeout,
             "connect_timeout": connect_timeout,
             "pool_timeout": pool_timeout,
         }
+        if self.upload_cache is not None and endpoint in _UPLOAD_CACHE_ENDPOINTS:
+            return await self._do_upload_cache_post(
+                self.upload_cache, endpoint, data, rate_limit_args, kwargs
+            )
+        return await self._do_rate_limited_post(endpoint, data, rate_limit_args, kwargs)
+
+    async def _do_rate_limited_post(
+        self,
+        endpoint: str,
+        data: JSONDict,
+        rate_limit_args: Optional[RLARGS],
+        kwargs: dict[str, ODVInput[float]],
+    ) -> Union[bool, JSONDict, list[JSONDict]]:
+        # getting updates should not be rate limited!
+        if endpoint == "getUpdates" or not self.rate_limiter:
+            return await super()._do_post(endpoint=endpoint, data=data, **kwargs)
+
         self._LOGGER.debug(
             "Passing request through rate limiter of type %s with rate_limit_args %s",
             type(self.rate_limiter),
@@ -397,6 +482,103 @@ class ExtBot(Bot, Generic[RLARGS]):
             rate_limit_args=rate_limit_args,
         )
 
+    async def _do_upload_cache_post(
+        self,
+        upload_cache: UploadCache,
+        endpoint: str,
+        data: JSONDict,
+        rate_limit_args: Optional[RLARGS],
+        kwargs: dict[str, ODVInput[float]],
+        retry_stale: bool = True,
+    ) -> Union[bool, JSONDict, list[JSONDict]]:
+        """Replaces the files in data by the file_ids cached for them, makes the request and
+        caches the file_ids of the files that were actually uploaded.
+        If Telegram rejects a cached file_id, the inserted file_ids are dropped from the cache
+        and the request is repeated once with the original files.
+        """
+        # the cache keys of the files replaced by file_ids
+        inserted: list[str] = []
+        # the index of the message in the result (None if the result is a single message), the
+        # media type and the cache key of the files to upload
+        uploaded: list[tuple[Optional[int], str, str]] = []
+
+        def insert_file_id(index: Optional[int], media_type: str, media: object) -> object:
+            if not isinstance(media, InputFile):
+                return media
+            if (key := upload_cache.build_key(media_type, media)) is None:
+                return media
+            if (file_id := upload_cache.get_file_id(key)) is not None:
+                inserted.append(key)
+                return file_id
+            uploaded.append((index, media_type, key))
+            return media
+
+        def insert_file_id_into_media(index: Optional[int], media: object) -> object:
+            if not isinstance(media, InputMedia):
+                return media
+            file_id = insert_file_id(index, media.type, media.media)
+            if file_id is media.media:
+                return media
+            # Copy object as not to edit it in-place
+            new = copy(media)
+            with new._unfrozen():
+                new.media = file_id  # type: ignore[assignment]
+            return new
+
+        cached_data = dict(data)
+        for name in _UPLOAD_CACHE_PARAMETERS:
+            if name in cached_data:
+                cached_data[name] = insert_file_id(None, name, cached_data[name])
+        if isinstance(media := cached_data.get("media"), Sequence) and not isinstance(media, str):
+            cached_data["media"] = [
+                insert_file_id_into_media(index, item) for index, item in enumerate(media)
+            ]
+        elif media is not None:
+            cached_data["media"] = insert_file_id_into_media(None, media)
+
+        try:
+            result = await self._do_rate_limited_post(
+                endpoint, cached_data, rate_limit_args, kwargs
+            )
+        except BadRequest as exc:
+            if not (inserted and retry_stale and _STALE_FILE_ID_PATTERN.search(exc.message)):
+                raise
+            self._LOGGER.debug(
+                "Telegram rejected a cached file_id (%s). Uploading the files again.", exc.message
+            )
+            for key in inserted:
+                upload_cache.drop_file_id(key)
+            return await self._do_upload_cache_post(
+                upload_cache, endpoint, data, rate_limit_args, kwargs, retry_stale=False
+            )
+
+        for index, media_type, key in uploaded:
+            if index is None:
+                message: object = result
+            elif isinstance(result, list) and index < len(result):
+                message = result[index]
+            else:
+                continue
+            if (file_id := self._extract_file_id(message, media_type)) is not None:
+                upload_cache.set_file_id(key, file_id)
+
+        return result
+
+    @staticmethod
+    def _extract_file_id(message: object, media_type: str) -> Optional[str]:
+        """Extracts the file_id of the file of the given media type from a message as returned
+        by Telegram.
+        """
+        if not isinstance(message, dict):
+            return None
+        media = message.get(media_type)
+        if media_type == "photo" and isinstance(media, list) and media:
+            # The largest size is listed last
+            media = media[-1]
+        if isinstance(media, dict) and isinstance(file_id := media.get("file_id"), str):
+            return file_id
+        return None
+
     @property
     def defaults(self) -> Optional["Defaults"]:
         """The :class:`telegram.ext.Defaults` used by this bot, if any."""
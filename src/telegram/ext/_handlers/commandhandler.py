@@ -21,11 +21,12 @@
 import re
 from typing import TYPE_CHECKING, Any, Optional, TypeVar, Union
 
-from telegram import MessageEntity, Update
+from telegram import Update
 from telegram._utils.defaultvalue import DEFAULT_TRUE
 from telegram._utils.types import SCT, DVType
 from telegram.ext import filters as filters_module
 from telegram.ext._handlers.basehandler import BaseHandler
+from telegram.ext._utils._update_parsing import parse_command
 from telegram.ext._utils.types import CCT, FilterDataDict, HandlerCallback
 
 if TYPE_CHECKING:
@@ -181,24 +182,15 @@ class CommandHandler(BaseHandler[Update, CCT, RT]):
         if isinstance(update, Update) and update.effective_message:
             message = update.effective_message
 
-            if (
-                message.entities
-                and message.entities[0].type == MessageEntity.BOT_COMMAND
-                and message.entities[0].offset == 0
-                and message.text
-                and message.get_bot()
-            ):
-                command = message.text[1 : message.entities[0].length]
-                args = message.text.split()[1:]
-                command_parts = command.split("@")
-                command_parts.append(message.get_bot().username)
-
-                if not (
-                    command_parts[0].lower() in self.commands
-                    and command_parts[1].lower() == message.get_bot().username.lower()
+            if (parsed := parse_command(message)) and message.get_bot():
+                command, username = parsed
+                if command not in self.commands or (
+                    username is not None and username.lower() != message.get_bot().username.lower()
                 ):
                     return None
 
+                args = message.text.split()[1:]  # type: ignore[union-attr]
+
                 if not self._check_correct_args(args):
                     return None
 
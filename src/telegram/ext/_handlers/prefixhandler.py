@@ -26,6 +26,7 @@ from telegram._utils.defaultvalue import DEFAULT_TRUE
 from telegram._utils.types import SCT, DVType
 from telegram.ext import filters as filters_module
 from telegram.ext._handlers.basehandler import BaseHandler
+from telegram.ext._utils._update_parsing import parse_prefix_command
 from telegram.ext._utils.types import CCT, HandlerCallback
 
 if TYPE_CHECKING:
@@ -159,13 +160,12 @@ class PrefixHandler(BaseHandler[Update, CCT, RT]):
         if isinstance(update, Update) and update.effective_message:
             message = update.effective_message
 
-            if message.text:
-                text_list = message.text.split()
-                if text_list[0].lower() not in self.commands:
+            if (command := parse_prefix_command(message)) is not None:
+                if command not in self.commands:
                     return None
                 filter_result = self.filters.check_update(update)
                 if filter_result:
-                    return text_list[1:], filter_result
+                    return message.text.split()[1:], filter_result  # type: ignore[union-attr]
                 return False
         return None
 
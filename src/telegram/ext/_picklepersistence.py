@@ -28,7 +28,15 @@ from telegram._utils.types import FilePathInput
 from telegram._utils.warnings import warn
 from telegram.ext import BasePersistence, PersistenceInput
 from telegram.ext._contexttypes import ContextTypes
-from telegram.ext._utils.types import BD, CD, UD, CDCData, ConversationDict, ConversationKey
+from telegram.ext._utils.types import (
+    BD,
+    CD,
+    UD,
+    CDCData,
+    ConversationDict,
+    ConversationKey,
+    UCData,
+)
 
 _REPLACED_KNOWN_BOT = "a known bot replaced by PTB's PicklePersistence"
 _REPLACED_UNKNOWN_BOT = "an unknown bot replaced by PTB's PicklePersistence"
@@ -149,9 +157,13 @@ class PicklePersistence(BasePersistence[UD, CD, BD]):
         store_data (:class:`~telegram.ext.PersistenceInput`, optional): Specifies which kinds of
             data will be saved by this persistence instance. By default, all available kinds of
             data will be saved.
-        single_file (:obj:`bool`, optional): When :obj:`False` will store 5 separate files of
+        single_file (:obj:`bool`, optional): When :obj:`False` will store 6 separate files of
             `filename_user_data`, `filename_bot_data`, `filename_chat_data`,
-            `filename_callback_data` and `filename_conversations`. Default is :obj:`True`.
+            `filename_callback_data`, `filename_upload_cache` and `filename_conversations`.
+            Default is :obj:`True`.
+
+            .. versionchanged:: NEXT.VERSION
+                Also stores `filename_upload_cache`.
         on_flush (:obj:`bool`, optional): When :obj:`True` will only save to file when
             :meth:`flush` is called and keep data in memory until that happens. When
             :obj:`False` will store data on any transaction *and* on call to :meth:`flush`.
@@ -173,9 +185,10 @@ class PicklePersistence(BasePersistence[UD, CD, BD]):
             When :attr:`single_file` is :obj:`False` this will be used as a prefix.
         store_data (:class:`~telegram.ext.PersistenceInput`): Specifies which kinds of data will
             be saved by this persistence instance.
-        single_file (:obj:`bool`): Optional. When :obj:`False` will store 5 separate files of
+        single_file (:obj:`bool`): Optional. When :obj:`False` will store 6 separate files of
             `filename_user_data`, `filename_bot_data`, `filename_chat_data`,
-            `filename_callback_data` and `filename_conversations`. Default is :obj:`True`.
+            `filename_callback_data`, `filename_upload_cache` and `filename_conversations`.
+            Default is :obj:`True`.
         on_flush (:obj:`bool`): Optional. When :obj:`True` will only save to file when
             :meth:`flush` is called and keep data in memory until that happens. When
             :obj:`False` will store data on any transaction *and* on call to :meth:`flush`.
@@ -195,6 +208,7 @@ class PicklePersistence(BasePersistence[UD, CD, BD]):
         "filepath",
         "on_flush",
         "single_file",
+        "upload_cache",
         "user_data",
     )
 
@@ -236,6 +250,7 @@ class PicklePersistence(BasePersistence[UD, CD, BD]):
         self.chat_data: Optional[dict[int, CD]] = None
         self.bot_data: Optional[BD] = None
         self.callback_data: Optional[CDCData] = None
+        self.upload_cache: Optional[UCData] = None
         self.conversations: Optional[dict[str, dict[tuple[Union[int, str], ...], object]]] = None
         self.context_types: ContextTypes[Any, UD, CD, BD] = cast(
             "ContextTypes[Any, UD, CD, BD]", context_types or ContextTypes()
@@ -251,6 +266,8 @@ class PicklePersistence(BasePersistence[UD, CD, BD]):
             # For backwards compatibility with files not containing bot data
             self.bot_data = data.get("bot_data", self.context_types.bot_data())
             self.callback_data = data.get("callback_data", {})
+            # For backwards compatibility with files not containing the upload cache
+            self.upload_cache = data.get("upload_cache", {})
             self.conversations = data["conversations"]
         except OSError:
             self.conversations = {}
@@ -258,6 +275,7 @@ class PicklePersistence(BasePersistence[UD, CD, BD]):
             self.chat_data = {}
             self.bot_data = self.context_types.bot_data()
             self.callback_data = None
+            self.upload_cache = {}
         except pickle.UnpicklingError as exc:
             filename = self.filepath.name
             raise TypeError(f"File {filename} does not contain valid pickle data") from exc
@@ -283,6 +301,7 @@ class PicklePersistence(BasePersistence[UD, CD, BD]):
             "chat_data": self.chat_data,
             "bot_data": self.bot_data,
             "callback_data": self.callback_data,
+            "upload_cache": self.upload_cache,
         }
         with self.filepath.open("wb") as file:
             _BotPickler(self.bot, file, protocol=pickle.HIGHEST_PROTOCOL).dump(data)
@@ -366,6 +385,29 @@ class PicklePersistence(BasePersistence[UD, CD, BD]):
             return None
         return deepcopy(self.callback_data)
 
+    async def get_upload_cache(self) -> Optional[UCData]:
+        """Returns the ``file_id`` s of the upload cache from the pickle file if it exists or
+        :obj:`None`.
+
+        .. versionadded:: NEXT.VERSION
+
+        Returns:
+            dict[:obj:`str`, :obj:`str`] | :obj:`None`: The restored ``file_id`` s or
+            :obj:`None`, if no data was stored.
+        """
+        if self.upload_cache:
+            pass
+        elif not self.single_file:
+            data = self._load_file(Path(f"{self.filepath}_upload_cache"))
+            if not data:
+                data = None
+            self.upload_cache = data
+        else:
+            self._load_singlefile()
+        if self.upload_cache is None:
+            return None
+        return self.upload_cache.copy()
+
     async def get_conversations(self, name: str) -> ConversationDict:
         """Returns the conversations from the pickle file if it exists or an empty dict.
 
@@ -480,6 +522,25 @@ class PicklePersistence(BasePersistence[UD, CD, BD]):
             else:
                 self._dump_singlefile()
 
+    async def update_upload_cache(self, data: UCData) -> None:
+        """Will update the ``file_id`` s of the upload cache (if changed) and depending on
+        :attr:`on_flush` save the pickle file.
+
+        .. versionadded:: NEXT.VERSION
+
+        Args:
+            data (dict[:obj:`str`, :obj:`str`]): The relevant data to restore
+                :class:`telegram.ext.UploadCache`.
+        """
+        if self.upload_cache == data:
+            return
+        self.upload_cache = data
+        if not self.on_flush:
+            if not self.single_file:
+                self._dump_file(Path(f"{self.filepath}_upload_cache"), self.upload_cache)
+            else:
+                self._dump_singlefile()
+
     async def drop_chat_data(self, chat_id: int) -> None:
         """Will delete the specified key from the ``chat_data`` and depending on
         :attr:`on_flush` save the pickle file.
@@ -542,13 +603,8 @@ class PicklePersistence(BasePersistence[UD, CD, BD]):
     async def flush(self) -> None:
         """Will save all data in memory to pickle file(s)."""
         if self.single_file:
-            if (
-                self.user_data
-                or self.chat_data
-                or self.bot_data
-                or self.callback_data
-                or self.conversations
-            ):
+            has_update_data = self.user_data or self.chat_data or self.bot_data
+            if has_update_data or self.callback_data or self.upload_cache or self.conversations:
                 self._dump_singlefile()
         else:
             if self.user_data:
@@ -559,5 +615,7 @@ class PicklePersistence(BasePersistence[UD, CD, BD]):
                 self._dump_file(Path(f"{self.filepath}_bot_data"), self.bot_data)
             if self.callback_data:
                 self._dump_file(Path(f"{self.filepath}_callback_data"), self.callback_data)
+            if self.upload_cache:
+                self._dump_file(Path(f"{self.filepath}_upload_cache"), self.upload_cache)
             if self.conversations:
                 self._dump_file(Path(f"{self.filepath}_conversations"), self.conversations)
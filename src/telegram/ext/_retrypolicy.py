@@ -0,0 +1,245 @@
+#!/usr/bin/env python
+#
+#  A library that provides a Python interface to the Telegram Bot API
+#  Copyright (C) 2015-2025
+#  Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser Public License
+#  along with this program.  If not, see [http://www.gnu.org/licenses/].
+"""This module contains the classes that decide how long to wait before retrying a request."""
+
+import random
+from typing import Optional
+
+from telegram._utils.repr import build_repr_with_selected_attrs
+from telegram.error import RetryAfter, TimedOut
+
+
+class ExponentialBackoff:
+    """Computes exponentially growing delays for consecutive failed attempts. Attempt number
+    ``n`` (counting from ``0``) has the base delay
+    ``min(maximum, initial * multiplier ** n)``.
+
+    With *full jitter*, which is the default, the actual delay is drawn uniformly from the range
+    between ``0`` and the base delay. This spreads out the retries of many clients that failed at
+    the same time, e.g. because they were restarted together, instead of having them retry in
+    lockstep.
+
+    .. seealso:: :class:`telegram.ext.RetryPolicy`
+
+    .. versionadded:: NEXT.VERSION
+
+    Args:
+        initial (:obj:`float`, optional): The base delay in seconds for the first retry.
+            Defaults to ``1``.
+        multiplier (:obj:`float`, optional): The factor by which the base delay grows with each
+            further retry. Defaults to ``2``.
+        maximum (:obj:`float`, optional): The maximum base delay in seconds. Defaults to ``30``.
+        jitter (:obj:`bool`, optional): Whether to randomize the delay. Defaults to
+            :obj:`True`.
+
+    Raises:
+        :exc:`ValueError`: If :paramref:`initial` or :paramref:`maximum` are negative or
+            :paramref:`multiplier` is smaller than ``1``.
+    """
+
+    __slots__ = ("_initial", "_jitter", "_maximum", "_multiplier")
+
+    def __init__(
+        self,
+        initial: float = 1.0,
+        multiplier: float = 2.0,
+        maximum: float = 30.0,
+        jitter: bool = True,
+    ):
+        if initial < 0 or maximum < 0:
+            raise ValueError("`initial` and `maximum` must not be negative!")
+        if multiplier < 1:
+            raise ValueError("`multiplier` must be at least 1!")
+
+        self._initial: float = initial
+        self._multiplier: float = multiplier
+        self._maximum: float = maximum
+        self._jitter: bool = jitter
+
+    def __repr__(self) -> str:
+        """Give a string representation of the backoff in the form
+        ``ExponentialBackoff[initial=..., multiplier=..., maximum=..., jitter=...]``.
+
+        Returns:
+            :obj:`str`
+        """
+        return build_repr_with_selected_attrs(
+            self,
+            initial=self._initial,
+            multiplier=self._multiplier,
+            maximum=self._maximum,
+            jitter=self._jitter,
+        )
+
+    @property
+    def initial(self) -> float:
+        """:obj:`float`: The base delay in seconds for the first retry."""
+        return self._initial
+
+    @property
+    def multiplier(self) -> float:
+        """:obj:`float`: The factor by which the base delay grows with each further retry."""
+        return self._multiplier
+
+    @property
+    def maximum(self) -> float:
+        """:obj:`float`: The maximum base delay in seconds."""
+        return self._maximum
+
+    @property
+    def jitter(self) -> bool:
+        """:obj:`bool`: Whether the delay is randomized."""
+        return self._jitter
+
+    def get_delay(self, attempt: int) -> float:
+        """Computes the delay before the next retry.
+
+        Args:
+            attempt (:obj:`int`): The number of consecutive failed attempts before the one that
+                just failed, i.e. ``0`` for the first retry.
+
+        Returns:
+            :obj:`float`: The number of seconds to wait.
+        """
+        try:
+            delay = min(self._maximum, self._initial * self._multiplier**attempt)
+        except OverflowError:
+            delay = self._maximum
+        return random.uniform(0, delay) if self._jitter else delay  # noqa: S311
+
+
+class RetryPolicy:
+    """Decides how long to wait before a failed request is retried, depending on the error that
+    was raised. The same policy can be shared by the polling and bootstrapping retries of
+    :class:`telegram.ext.Updater` and :class:`telegram.ext.Application` and by
+    :class:`telegram.ext.AIORateLimiter`.
+
+    * For :exc:`telegram.error.RetryAfter`, the delay requested by Telegram is extended by
+      :paramref:`retry_after_slack` and a random share of up to :paramref:`retry_after_jitter`
+      seconds. The delay is never shorter than the one requested by Telegram.
+    * For :exc:`telegram.error.TimedOut`, :paramref:`timed_out` is used.
+    * For all other errors, i.e. :exc:`telegram.error.NetworkError` and other
+      :exc:`telegram.error.TelegramError` subclasses, :paramref:`network_error` is used.
+
+    Subclasses can override :meth:`get_delay` to treat further errors differently.
+
+    .. seealso:: :meth:`telegram.ext.ApplicationBuilder.retry_policy`,
+        :paramref:`telegram.ext.AIORateLimiter.retry_policy`
+
+    .. versionadded:: NEXT.VERSION
+
+    Args:
+        network_error (:class:`telegram.ext.ExponentialBackoff`, optional): The backoff for
+            network errors. Defaults to an :class:`~telegram.ext.ExponentialBackoff` that starts
+            at ``1`` second and grows by a factor of ``1.5`` up to ``30`` seconds.
+        timed_out (:class:`telegram.ext.ExponentialBackoff`, optional): The backoff for
+            timeouts. Defaults to an :class:`~telegram.ext.ExponentialBackoff` that starts at
+            ``0.5`` seconds and doubles up to ``10`` seconds.
+        retry_after_slack (:obj:`float`, optional): The number of seconds that are always added
+            to :attr:`telegram.error.RetryAfter.retry_after`. Defaults to ``0.1``.
+        retry_after_jitter (:obj:`float`, optional): The maximum number of seconds that are
+            randomly added to :attr:`telegram.error.RetryAfter.retry_after` on top of
+            :paramref:`retry_after_slack`. Pass ``0`` to disable this. Defaults to ``0.5``.
+
+    Raises:
+        :exc:`ValueError`: If :paramref:`retry_after_slack` or :paramref:`retry_after_jitter`
+            are negative.
+    """
+
+    __slots__ = ("_network_error", "_retry_after_jitter", "_retry_after_slack", "_timed_out")
+
+    def __init__(
+        self,
+        network_error: Optional[ExponentialBackoff] = None,
+        timed_out: Optional[ExponentialBackoff] = None,
+        retry_after_slack: float = 0.1,
+        retry_after_jitter: float = 0.5,
+    ):
+        if retry_after_slack < 0 or retry_after_jitter < 0:
+            raise ValueError("`retry_after_slack` and `retry_after_jitter` must not be negative!")
+
+        self._network_error: ExponentialBackoff = network_error or ExponentialBackoff(
+            initial=1, multiplier=1.5, maximum=30
+        )
+        self._timed_out: ExponentialBackoff = timed_out or ExponentialBackoff(
+            initial=0.5, multiplier=2, maximum=10
+        )
+        self._retry_after_slack: float = retry_after_slack
+        self._retry_after_jitter: float = retry_after_jitter
+
+    def __repr__(self) -> str:
+        """Give a string representation of the policy in the form
+        ``RetryPolicy[network_error=..., timed_out=..., ...]``.
+
+        Returns:
+            :obj:`str`
+        """
+        return build_repr_with_selected_attrs(
+            self,
+            network_error=self._network_error,
+            timed_out=self._timed_out,
+            retry_after_slack=self._retry_after_slack,
+            retry_after_jitter=self._retry_after_jitter,
+        )
+
+    @property
+    def network_error(self) -> ExponentialBackoff:
+        """:class:`telegram.ext.ExponentialBackoff`: The backoff for network errors."""
+        return self._network_error
+
+    @property
+    def timed_out(self) -> ExponentialBackoff:
+        """:class:`telegram.ext.ExponentialBackoff`: The backoff for timeouts."""
+        return self._timed_out
+
+    @property
+    def retry_after_slack(self) -> float:
+        """:obj:`float`: The number of seconds that are always added to
+        :attr:`telegram.error.RetryAfter.retry_after`.
+        """
+        return self._retry_after_slack
+
+    @property
+    def retry_after_jitter(self) -> float:
+        """:obj:`float`: The maximum number of seconds that are randomly added to
+        :attr:`telegram.error.RetryAfter.retry_after`.
+        """
+        return self._retry_after_jitter
+
+    def get_delay(self, error: Exception, attempt: int) -> float:
+        """Computes the delay before retrying after :paramref:`error`.
+
+        Args:
+            error (:exc:`Exception`): The error that made the request fail.
+            attempt (:obj:`int`): The number of consecutive failed attempts before the one that
+                just failed, i.e. ``0`` for the first retry.
+
+        Returns:
+            :obj:`float`: The number of seconds to wait.
+        """
+        if isinstance(error, RetryAfter):
+            # pylint: disable=protected-access
+            return (
+                error._retry_after.total_seconds()
+                + self._retry_after_slack
+                + random.uniform(0, self._retry_after_jitter)  # noqa: S311
+            )
+        if isinstance(error, TimedOut):
+            return self._timed_out.get_delay(attempt)
+        return self._network_error.get_delay(attempt)
@@ -32,6 +32,7 @@ from telegram._utils.logging import get_logger
 from telegram._utils.repr import build_repr_with_selected_attrs
 from telegram._utils.types import DVType, TimePeriod
 from telegram.error import TelegramError
+from telegram.ext._retrypolicy import RetryPolicy
 from telegram.ext._utils.networkloop import network_retry_loop
 
 try:
@@ -88,10 +89,19 @@ class Updater(contextlib.AbstractAsyncContextManager["Updater"]):
     Args:
         bot (:class:`telegram.Bot`): The bot used with this Updater.
         update_queue (:class:`asyncio.Queue`): Queue for the updates.
+        retry_policy (:class:`telegram.ext.RetryPolicy`, optional): The policy that decides how
+            long to wait before retrying after an error while polling or bootstrapping. Defaults
+            to a :class:`~telegram.ext.RetryPolicy` with default settings.
+
+            .. versionadded:: NEXT.VERSION
 
     Attributes:
         bot (:class:`telegram.Bot`): The bot used with this Updater.
         update_queue (:class:`asyncio.Queue`): Queue for the updates.
+        retry_policy (:class:`telegram.ext.RetryPolicy`): The policy that decides how long to
+            wait before retrying after an error while polling or bootstrapping.
+
+            .. versionadded:: NEXT.VERSION
 
     """
 
@@ -105,6 +115,7 @@ class Updater(contextlib.AbstractAsyncContextManager["Updater"]):
         "_last_update_id",
         "_running",
         "bot",
+        "retry_policy",
         "update_queue",
     )
 
@@ -112,9 +123,11 @@ class Updater(contextlib.AbstractAsyncContextManager["Updater"]):
         self,
         bot: "Bot",
         update_queue: "asyncio.Queue[object]",
+        retry_policy: Optional[RetryPolicy] = None,
     ):
         self.bot: Bot = bot
         self.update_queue: asyncio.Queue[object] = update_queue
+        self.retry_policy: RetryPolicy = retry_policy or RetryPolicy()
 
         self._last_update_id = 0
         self._running = False
@@ -382,6 +395,7 @@ class Updater(contextlib.AbstractAsyncContextManager["Updater"]):
                 interval=poll_interval,
                 stop_event=self.__polling_task_stop_event,
                 max_retries=-1,
+                retry_policy=self.retry_policy,
             ),
             name="Updater:start_polling:polling_task",
         )
@@ -710,6 +724,7 @@ class Updater(contextlib.AbstractAsyncContextManager["Updater"]):
                 interval=bootstrap_interval,
                 stop_event=None,
                 max_retries=max_retries,
+                retry_policy=self.retry_policy,
             )
 
         # Restore/set webhook settings, if needed. Again, we don't know ahead if a webhook is set,
@@ -722,6 +737,7 @@ class Updater(contextlib.AbstractAsyncContextManager["Updater"]):
                 interval=bootstrap_interval,
                 stop_event=None,
                 max_retries=max_retries,
+                retry_policy=self.retry_policy,
             )
 
     async def stop(self) -> None:
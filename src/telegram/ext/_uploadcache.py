@@ -0,0 +1,175 @@
+#!/usr/bin/env python
+#
+#  A library that provides a Python interface to the Telegram Bot API
+#  Copyright (C) 2015-2025
+#  Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser Public License
+#  along with this program.  If not, see [http://www.gnu.org/licenses/].
+"""This module contains the UploadCache class."""
+
+import hashlib
+import os
+from collections import OrderedDict
+from collections.abc import AsyncIterable
+from pathlib import Path
+from typing import Optional
+
+from telegram import InputFile
+from telegram.ext._utils.types import UCData
+
+
+class UploadCache:
+    """A cache for the ``file_id`` s that Telegram assigns to files uploaded by a
+    :class:`telegram.ext.ExtBot`. When the same file is sent again, the bot passes the cached
+    ``file_id`` instead of uploading the file once more.
+
+    Files are identified by the kind of media they are sent as (e.g. ``photo`` or ``document``)
+    together with
+
+    * the SHA-256 hash of their content, if the content is available in memory, i.e. if the
+      :class:`telegram.InputFile` was built from :obj:`bytes`, a :obj:`str`, a file handle that
+      was read on initialization or a memory-mapped file.
+    * their absolute path, size and modification time, if the :class:`telegram.InputFile` was
+      built from a :class:`pathlib.Path`.
+    * their device, inode, size and modification time, if the :class:`telegram.InputFile` holds a
+      file handle that is read only when the request is made.
+
+    Files given as asynchronous iterables are never cached.
+    If necessary, the least recently used entries are dropped.
+
+    .. seealso:: :paramref:`telegram.ext.ExtBot.upload_cache`
+
+    .. versionadded:: NEXT.VERSION
+
+    Args:
+        maxsize (:obj:`int`, optional): Maximum number of ``file_id`` s to keep. Defaults to
+            ``1024``.
+        persistent_data (dict[:obj:`str`, :obj:`str`], optional): Data to initialize the cache
+            with, as returned by :meth:`telegram.ext.BasePersistence.get_upload_cache`.
+    """
+
+    __slots__ = ("_file_ids", "_maxsize")
+
+    def __init__(self, maxsize: int = 1024, persistent_data: Optional[UCData] = None):
+        if maxsize < 1:
+            raise ValueError("`maxsize` must be a positive integer.")
+
+        self._maxsize: int = maxsize
+        self._file_ids: OrderedDict[str, str] = OrderedDict()
+
+        if persistent_data:
+            self.load_persistence_data(persistent_data)
+
+    def __len__(self) -> int:
+        """Returns the number of cached ``file_id`` s.
+
+        Returns:
+            :obj:`int`
+        """
+        return len(self._file_ids)
+
+    @property
+    def maxsize(self) -> int:
+        """:obj:`int`: The maximum size of the cache."""
+        return self._maxsize
+
+    @property
+    def persistence_data(self) -> UCData:
+        """dict[:obj:`str`, :obj:`str`]: The data that needs to be persisted to allow reusing the
+        ``file_id`` s across bot reboots. Entries are ordered from least to most recently used.
+        """
+        return dict(self._file_ids)
+
+    def load_persistence_data(self, persistent_data: UCData) -> None:
+        """Loads data into the cache.
+
+        Warning:
+            This method is not intended to be called by users directly.
+
+        Args:
+            persistent_data (dict[:obj:`str`, :obj:`str`]): Data to load, as returned by
+                :meth:`telegram.ext.BasePersistence.get_upload_cache`.
+        """
+        for key, file_id in persistent_data.items():
+            self.set_file_id(key, file_id)
+
+    @staticmethod
+    def build_key(media_type: str, input_file: InputFile) -> Optional[str]:
+        """Builds the key that identifies the file in the cache.
+
+        Args:
+            media_type (:obj:`str`): The kind of media the file is sent as, e.g. ``"photo"``.
+            input_file (:class:`telegram.InputFile`): The file.
+
+        Returns:
+            :obj:`str` | :obj:`None`: The key or :obj:`None`, if the file can not be cached.
+        """
+        content = input_file.input_file_content
+        if isinstance(content, (bytes, memoryview)):
+            return f"{media_type}:sha256:{hashlib.sha256(content).hexdigest()}"
+        if isinstance(content, AsyncIterable):
+            return None
+        try:
+            if isinstance(content, Path):
+                status = content.stat()
+                return (
+                    f"{media_type}:path:{content.resolve()}:{status.st_size}:{status.st_mtime_ns}"
+                )
+            status = os.fstat(content.fileno())
+        except (AttributeError, OSError):
+            return None
+        return (
+            f"{media_type}:file:{status.st_dev}:{status.st_ino}:{status.st_size}:"
+            f"{status.st_mtime_ns}"
+        )
+
+    def get_file_id(self, key: str) -> Optional[str]:
+        """Returns the ``file_id`` cached for the given key and marks it as recently used.
+
+        Args:
+            key (:obj:`str`): The key as returned by :meth:`build_key`.
+
+        Returns:
+            :obj:`str` | :obj:`None`: The ``file_id`` or :obj:`None`, if none is cached.
+        """
+        file_id = self._file_ids.get(key)
+        if file_id is not None:
+            self._file_ids.move_to_end(key)
+        return file_id
+
+    def set_file_id(self, key: str, file_id: str) -> None:
+        """Caches the ``file_id`` for the given key. If the cache is full, the least recently
+        used entry is dropped.
+
+        Args:
+            key (:obj:`str`): The key as returned by :meth:`build_key`.
+            file_id (:obj:`str`): The ``file_id`` Telegram assigned to the file.
+        """
+        self._file_ids[key] = file_id
+        self._file_ids.move_to_end(key)
+        while len(self._file_ids) > self._maxsize:
+            self._file_ids.popitem(last=False)
+
+    def drop_file_id(self, key: str) -> None:
+        """Drops the ``file_id`` cached for the given key, e.g. because Telegram rejected it.
+        Does nothing, if no ``file_id`` is cached for the key.
+
+        Args:
+            key (:obj:`str`): The key as returned by :meth:`build_key`.
+        """
+        self._file_ids.pop(key, None)
+
+    def clear(self) -> None:
+        """Drops all cached ``file_id`` s."""
+        self._file_ids.clear()
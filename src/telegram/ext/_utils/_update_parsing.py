@@ -28,6 +28,7 @@ Warning:
 
 from typing import Optional
 
+from telegram import Message, MessageEntity
 from telegram._utils.types import SCT
 
 
@@ -49,3 +50,32 @@ def parse_username(username: Optional[SCT[str]]) -> frozenset[str]:
     if isinstance(username, str):
         return frozenset({username.removeprefix("@")})
     return frozenset(usr.removeprefix("@") for usr in username)
+
+
+def parse_command(message: Message) -> Optional[tuple[str, Optional[str]]]:
+    """Accepts a message and returns the lowercased command and the bot username that the
+    command is addressed to, if the message starts with a
+    :attr:`telegram.MessageEntity.BOT_COMMAND`. Returns :obj:`None` otherwise.
+
+    .. versionadded:: NEXT.VERSION
+    """
+    if (
+        message.entities
+        and message.entities[0].type == MessageEntity.BOT_COMMAND
+        and message.entities[0].offset == 0
+        and message.text
+    ):
+        command_parts = message.text[1 : message.entities[0].length].split("@")
+        return command_parts[0].lower(), command_parts[1] if len(command_parts) > 1 else None
+    return None
+
+
+def parse_prefix_command(message: Message) -> Optional[str]:
+    """Accepts a message and returns the lowercased first word of its text, i.e. the command
+    for :class:`telegram.ext.PrefixHandler`. Returns :obj:`None` if the message has no text.
+
+    .. versionadded:: NEXT.VERSION
+    """
+    if message.text and (words := message.text.split(maxsplit=1)):
+        return words[0].lower()
+    return None
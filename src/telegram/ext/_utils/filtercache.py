@@ -0,0 +1,79 @@
+#!/usr/bin/env python
+#
+# A library that provides a Python interface to the Telegram Bot API
+# Copyright (C) 2015-2025
+# Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser Public License for more details.
+#
+# You should have received a copy of the GNU Lesser Public License
+# along with this program.  If not, see [http://www.gnu.org/licenses/].
+"""This module contains a cache for the results of filters while the handlers for an update are
+checked.
+
+.. versionadded:: NEXT.VERSION
+
+Warning:
+    Contents of this module are intended to be used internally by the library and *not* by the
+    user. Changes to this module are not considered breaking changes and may not be documented in
+    the changelog.
+"""
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Optional
+
+_CURRENT: ContextVar[Optional["FilterCache"]] = ContextVar("filter_cache", default=None)
+
+
+class FilterCache:
+    """Holds the results of filters for one update.
+
+    The results are keyed by the filter objects themselves, which keeps them alive while they are
+    cached, so their ids can't be reused for other filters.
+
+    Args:
+        update (:obj:`object`): The update that the results belong to.
+    """
+
+    __slots__ = ("results", "update")
+
+    def __init__(self, update: object):
+        self.update: object = update
+        self.results: dict[object, Any] = {}
+
+    def clear(self) -> None:
+        """Drops all results, e.g. because a handler callback might change the state that the
+        filters depend on.
+        """
+        self.results.clear()
+
+
+@contextmanager
+def filter_cache(update: object) -> Iterator[FilterCache]:
+    """Caches the results of filters for :paramref:`update` within the context."""
+    cache = FilterCache(update)
+    token = _CURRENT.set(cache)
+    try:
+        yield cache
+    finally:
+        _CURRENT.reset(token)
+
+
+def get_filter_results(update: object) -> Optional[dict[object, Any]]:
+    """Returns the cached filter results for :paramref:`update` or :obj:`None`, if the results
+    for this update are not cached.
+    """
+    cache = _CURRENT.get()
+    if cache is not None and cache.update is update:
+        return cache.results
+    return None
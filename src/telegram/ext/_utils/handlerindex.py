@@ -0,0 +1,340 @@
+#!/usr/bin/env python
+#
+# A library that provides a Python interface to the Telegram Bot API
+# Copyright (C) 2015-2025
+# Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser Public License for more details.
+#
+# You should have received a copy of the GNU Lesser Public License
+# along with this program.  If not, see [http://www.gnu.org/licenses/].
+"""This module contains an index that narrows down the handlers that can possibly handle an
+update before their :meth:`~telegram.ext.BaseHandler.check_update` is called.
+
+.. versionadded:: NEXT.VERSION
+
+Warning:
+    Contents of this module are intended to be used internally by the library and *not* by the
+    user. Changes to this module are not considered breaking changes and may not be documented in
+    the changelog.
+"""
+
+from collections.abc import Mapping, Sequence
+from re import Pattern
+from typing import Any, Callable, Final, Optional, Union
+
+from telegram import Message, Update
+from telegram.ext import filters as filters_module
+from telegram.ext._handlers.basehandler import BaseHandler
+from telegram.ext._handlers.businessconnectionhandler import BusinessConnectionHandler
+from telegram.ext._handlers.businessmessagesdeletedhandler import BusinessMessagesDeletedHandler
+from telegram.ext._handlers.callbackqueryhandler import CallbackQueryHandler
+from telegram.ext._handlers.chatboosthandler import ChatBoostHandler
+from telegram.ext._handlers.chatjoinrequesthandler import ChatJoinRequestHandler
+from telegram.ext._handlers.chatmemberhandler import ChatMemberHandler
+from telegram.ext._handlers.choseninlineresulthandler import ChosenInlineResultHandler
+from telegram.ext._handlers.commandhandler import CommandHandler
+from telegram.ext._handlers.inlinequeryhandler import InlineQueryHandler
+from telegram.ext._handlers.messagehandler import MessageHandler
+from telegram.ext._handlers.messagereactionhandler import MessageReactionHandler
+from telegram.ext._handlers.paidmediapurchasedhandler import PaidMediaPurchasedHandler
+from telegram.ext._handlers.pollanswerhandler import PollAnswerHandler
+from telegram.ext._handlers.pollhandler import PollHandler
+from telegram.ext._handlers.precheckoutqueryhandler import PreCheckoutQueryHandler
+from telegram.ext._handlers.prefixhandler import PrefixHandler
+from telegram.ext._handlers.shippingqueryhandler import ShippingQueryHandler
+from telegram.ext._handlers.stringcommandhandler import StringCommandHandler
+from telegram.ext._handlers.stringregexhandler import StringRegexHandler
+from telegram.ext._utils._update_parsing import parse_command, parse_prefix_command
+from telegram.ext._utils.patternset import PatternSet
+
+_Handlers = tuple[BaseHandler[Any, Any, Any], ...]
+# The routing values of an update are the commands or callback query patterns that it matches
+_Values = Union[str, tuple[object, ...]]
+# The update types of an update, its command, its command for PrefixHandler and the patterns of
+# callback query handlers that match its callback data
+_Key = tuple[Union[str, tuple[str, ...]], _Values, _Values, _Values]
+# A handler, its update types, the position of its routing values in the key and the routing
+# values that the handler can handle
+_Entry = tuple[
+    BaseHandler[Any, Any, Any], Optional[frozenset[str]], int, Optional[frozenset[object]]
+]
+
+_COMMAND: Final = 1
+_PREFIX_COMMAND: Final = 2
+_CALLBACK_PATTERN: Final = 3
+_CHECK_COMMAND: Final = CommandHandler.check_update
+_CHECK_PREFIX: Final = PrefixHandler.check_update
+_CHECK_CALLBACK_QUERY: Final = CallbackQueryHandler.check_update
+
+# The kind of all updates that are strings rather than Update objects
+_STRING: Final = "<str>"
+# Marks updates for which the routing values were not computed, i.e. the handlers are not
+# narrowed down by them
+_UNPARSED: Final = "<unparsed>"
+
+# The update types that filters.BaseFilter.check_update accepts, in the order in which
+# Update.effective_message checks them
+_MESSAGE_TYPES: Final[tuple[str, ...]] = (
+    Update.MESSAGE,
+    Update.EDITED_MESSAGE,
+    Update.CHANNEL_POST,
+    Update.EDITED_CHANNEL_POST,
+    Update.BUSINESS_MESSAGE,
+    Update.EDITED_BUSINESS_MESSAGE,
+)
+# The update types with an Update.effective_message
+_EFFECTIVE_MESSAGE_TYPES: Final[frozenset[str]] = frozenset(
+    (*_MESSAGE_TYPES, Update.CALLBACK_QUERY)
+)
+_ALL_TYPES: Final[tuple[str, ...]] = tuple(Update.ALL_TYPES)
+
+# The filter implementations that only accept updates of one of the _MESSAGE_TYPES. All filters
+# of the library build on these.
+_MESSAGE_FILTER_CHECKS: Final = (
+    filters_module.BaseFilter.check_update,
+    filters_module.MessageFilter.check_update,
+    filters_module.UpdateFilter.check_update,
+)
+
+
+def _message_handler_types(handler: MessageHandler[Any, Any]) -> Optional[frozenset[str]]:
+    if type(handler.filters).check_update in _MESSAGE_FILTER_CHECKS:
+        return frozenset(_MESSAGE_TYPES)
+    return None
+
+
+def _fixed(*update_types: str) -> Callable[[BaseHandler[Any, Any, Any]], frozenset[str]]:
+    result = frozenset(update_types)
+    return lambda _: result
+
+
+# For each handler class, a function that returns the update types that the handler can handle
+# at all or None, if that can not be determined. Only used if the class of the handler does not
+# override check_update.
+_UPDATE_TYPES: Final[Mapping[type, Callable[[Any], Optional[frozenset[str]]]]] = {
+    BusinessConnectionHandler: _fixed(Update.BUSINESS_CONNECTION),
+    BusinessMessagesDeletedHandler: _fixed(Update.DELETED_BUSINESS_MESSAGES),
+    CallbackQueryHandler: _fixed(Update.CALLBACK_QUERY),
+    ChatBoostHandler: _fixed(Update.CHAT_BOOST, Update.REMOVED_CHAT_BOOST),
+    ChatJoinRequestHandler: _fixed(Update.CHAT_JOIN_REQUEST),
+    ChatMemberHandler: _fixed(Update.MY_CHAT_MEMBER, Update.CHAT_MEMBER),
+    ChosenInlineResultHandler: _fixed(Update.CHOSEN_INLINE_RESULT),
+    CommandHandler: _fixed(*_EFFECTIVE_MESSAGE_TYPES),
+    InlineQueryHandler: _fixed(Update.INLINE_QUERY),
+    MessageHandler: _message_handler_types,
+    MessageReactionHandler: _fixed(Update.MESSAGE_REACTION, Update.MESSAGE_REACTION_COUNT),
+    PaidMediaPurchasedHandler: _fixed(Update.PURCHASED_PAID_MEDIA),
+    PollAnswerHandler: _fixed(Update.POLL_ANSWER),
+    PollHandler: _fixed(Update.POLL),
+    PreCheckoutQueryHandler: _fixed(Update.PRE_CHECKOUT_QUERY),
+    PrefixHandler: _fixed(*_EFFECTIVE_MESSAGE_TYPES),
+    ShippingQueryHandler: _fixed(Update.SHIPPING_QUERY),
+    StringCommandHandler: _fixed(_STRING),
+    StringRegexHandler: _fixed(_STRING),
+}
+
+
+def _update_types(handler: BaseHandler[Any, Any, Any]) -> Optional[frozenset[str]]:
+    """Returns the update types that the handler can handle or :obj:`None`, if it might handle
+    any update.
+    """
+    handler_class = type(handler)
+    for cls in handler_class.__mro__:
+        if cls in _UPDATE_TYPES:
+            # Subclasses that override check_update might handle other updates as well
+            if handler_class.check_update is cls.check_update:  # type: ignore[attr-defined]
+                return _UPDATE_TYPES[cls](handler)
+            return None
+    return None
+
+
+def _routing(handler: BaseHandler[Any, Any, Any]) -> tuple[int, Optional[frozenset[object]]]:
+    """Returns the position of the routing values that the handler checks in the key of an update
+    and the values that the handler can handle. The values are :obj:`None`, if the handler is not
+    narrowed down by them.
+    """
+    handler_class = type(handler)
+    if isinstance(handler, CommandHandler) and handler_class.check_update is _CHECK_COMMAND:
+        return _COMMAND, handler.commands
+    if isinstance(handler, PrefixHandler) and handler_class.check_update is _CHECK_PREFIX:
+        return _PREFIX_COMMAND, handler.commands
+    if (
+        isinstance(handler, CallbackQueryHandler)
+        and handler_class.check_update is _CHECK_CALLBACK_QUERY
+        and isinstance(handler.pattern, Pattern)
+        and isinstance(handler.pattern.pattern, str)
+    ):
+        return _CALLBACK_PATTERN, frozenset((handler.pattern,))
+    return _COMMAND, None
+
+
+class HandlerIndex:
+    """An immutable snapshot of the handlers of an application, which narrows down the handlers
+    that can possibly handle an update by
+
+    * the update type, e.g. :attr:`telegram.Update.callback_query` and
+    * for :class:`~telegram.ext.CommandHandler` and :class:`~telegram.ext.PrefixHandler`, the
+      command of the message. The command is parsed only once per update and looked up in the
+      commands of all handlers, so the costs don't grow with the number of commands.
+    * for :class:`~telegram.ext.CallbackQueryHandler` with a regex
+      :attr:`~telegram.ext.CallbackQueryHandler.pattern`, the patterns that match the callback
+      data. The patterns of all handlers are matched at once by a
+      :class:`~telegram.ext._utils.patternset.PatternSet`, which for patterns that start with
+      literal text, like ``^page:(\\d+)$``, only checks the patterns that can match.
+
+    Handlers of unknown classes and subclasses that override
+    :meth:`~telegram.ext.BaseHandler.check_update` are never filtered out. The order of the
+    groups and of the handlers within each group is the same as in the snapshot.
+
+    The candidates are computed once per kind of update and cached.
+
+    Args:
+        handlers (Mapping[:obj:`int`, Sequence[:class:`telegram.ext.BaseHandler`]]): The
+            handlers of the application, sorted by group.
+    """
+
+    __slots__ = (
+        "_cache",
+        "_callback_patterns",
+        "_commands",
+        "_entries",
+        "_prefix_commands",
+        "_source",
+        "groups",
+    )
+
+    def __init__(self, handlers: Mapping[int, Sequence[BaseHandler[Any, Any, Any]]]):
+        self.groups: tuple[_Handlers, ...] = tuple(tuple(group) for group in handlers.values())
+        # To detect changes of the handlers that were not made through the application
+        self._source: tuple[tuple[object, int], ...] = tuple(
+            (group, len(group)) for group in handlers.values()
+        )
+        self._entries: tuple[tuple[_Entry, ...], ...] = tuple(
+            tuple((handler, _update_types(handler), *_routing(handler)) for handler in group)
+            for group in self.groups
+        )
+        # dicts rather than sets to keep the order of the callback query patterns
+        values: dict[int, dict[Any, None]] = {
+            _COMMAND: {},
+            _PREFIX_COMMAND: {},
+            _CALLBACK_PATTERN: {},
+        }
+        for group in self._entries:
+            for _, _, position, handler_values in group:
+                if handler_values:
+                    values[position].update(dict.fromkeys(handler_values))
+        self._commands: frozenset[str] = frozenset(values[_COMMAND])
+        self._prefix_commands: frozenset[str] = frozenset(values[_PREFIX_COMMAND])
+        self._callback_patterns: Optional[PatternSet] = (
+            PatternSet(values[_CALLBACK_PATTERN], search=False)
+            if values[_CALLBACK_PATTERN]
+            else None
+        )
+        self._cache: dict[_Key, tuple[_Handlers, ...]] = {}
+
+    def is_current(self, handlers: Mapping[int, Sequence[BaseHandler[Any, Any, Any]]]) -> bool:
+        """Whether the index still reflects :paramref:`handlers`."""
+        source = self._source
+        if len(handlers) != len(source):
+            return False
+        return all(
+            group is expected and len(group) == length
+            for group, (expected, length) in zip(handlers.values(), source)
+        )
+
+    def _parse_command(self, message: Message) -> tuple[str, ...]:
+        if not (parsed := parse_command(message)):
+            return ()
+        command, username = parsed
+        if command not in self._commands:
+            # Keeps the cache small, no command handler matches anyway
+            return ()
+        if username is not None:
+            try:
+                bot_username = message.get_bot().username
+            except RuntimeError:
+                # Let the command handlers fail just as without the index
+                return (command,)
+            if username.lower() != bot_username.lower():
+                # The command is addressed to another bot
+                return ()
+        return (command,)
+
+    def _parse_prefix_command(self, message: Message) -> tuple[str, ...]:
+        command = parse_prefix_command(message)
+        return (command,) if command in self._prefix_commands else ()
+
+    def _match_callback_data(self, data: object) -> _Values:
+        if self._callback_patterns is None or not data:
+            # Without callback data, the handlers check the game short name instead
+            return _UNPARSED
+        if not isinstance(data, str):
+            # Arbitrary callback data never matches a regex pattern
+            return ()
+        patterns = self._callback_patterns.patterns
+        return tuple(patterns[index] for index in self._callback_patterns.matching(data))
+
+    def _key(self, update: object) -> _Key:
+        if isinstance(update, str):
+            return _STRING, (), (), ()
+        if not isinstance(update, Update):
+            return "", (), (), ()
+
+        update_types = tuple(name for name in _ALL_TYPES if getattr(update, name) is not None)
+        if update.callback_query:
+            return (
+                update_types,
+                _UNPARSED,
+                _UNPARSED,
+                self._match_callback_data(update.callback_query.data),
+            )
+        if not (self._commands or self._prefix_commands):
+            return update_types, _UNPARSED, _UNPARSED, ()
+
+        message = next(
+            (getattr(update, name) for name in _MESSAGE_TYPES if getattr(update, name)), None
+        )
+        if not message:
+            return update_types, (), (), ()
+        return (
+            update_types,
+            self._parse_command(message) if self._commands else (),
+            self._parse_prefix_command(message) if self._prefix_commands else (),
+            (),
+        )
+
+    def candidates(self, update: object) -> tuple[_Handlers, ...]:
+        """Returns the handlers that can possibly handle :paramref:`update`, one tuple per
+        group in order of priority.
+        """
+        key = self._key(update)
+        try:
+            return self._cache[key]
+        except KeyError:
+            pass
+
+        update_types = (key[0],) if isinstance(key[0], str) else key[0]
+        candidates = tuple(
+            tuple(
+                handler
+                for handler, handler_types, position, values in group
+                if (handler_types is None or not handler_types.isdisjoint(update_types))
+                and (
+                    values is None
+                    or key[position] is _UNPARSED
+                    or not values.isdisjoint(key[position])
+                )
+            )
+            for group in self._entries
+        )
+        self._cache[key] = candidates
+        return candidates
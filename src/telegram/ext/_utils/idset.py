@@ -0,0 +1,130 @@
+#!/usr/bin/env python
+#
+# A library that provides a Python interface to the Telegram Bot API
+# Copyright (C) 2015-2025
+# Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser Public License for more details.
+#
+# You should have received a copy of the GNU Lesser Public License
+# along with this program.  If not, see [http://www.gnu.org/licenses/].
+"""This module contains an immutable set of chat or user ids, which stores the ids compactly.
+
+.. versionadded:: NEXT.VERSION
+
+Warning:
+    Contents of this module are intended to be used internally by the library and *not* by the
+    user. Changes to this module are not considered breaking changes and may not be documented in
+    the changelog.
+"""
+
+from array import array
+from bisect import bisect_left
+from collections.abc import Hashable, Iterable, Iterator
+from collections.abc import Set as AbstractSet
+from itertools import chain
+from typing import Final
+
+_TYPECODE: Final = "q"
+_MIN: Final = -(2**63)
+_MAX: Final = 2**63 - 1
+
+
+def _split(values: Iterable[Hashable]) -> tuple[set[int], set[Hashable]]:
+    """Splits values into 64 bit integers and other values."""
+    ids: set[int] = set()
+    others: set[Hashable] = set()
+    for value in values:
+        if isinstance(value, int) and _MIN <= value <= _MAX:
+            ids.add(value)
+        else:
+            others.add(value)
+    return ids, others
+
+
+class IdSet(AbstractSet[int]):
+    """An immutable set of ids, stored as a sorted :class:`array.array` of 64 bit integers, i.e.
+    8 bytes per id instead of a Python :obj:`int` and a hash table slot. Membership is checked by
+    binary search. Other values, which never match a chat or user id, are kept in a
+    :obj:`frozenset`.
+
+    Changes create a new set, which makes instances safe to share as snapshots: replacing a
+    snapshot by a changed one is a single assignment, so readers never see a half updated set.
+    :meth:`union` and :meth:`difference` change many ids at once in linear time.
+
+    Args:
+        ids (Iterable[:obj:`int`]): The ids.
+    """
+
+    __slots__ = ("_ids", "_others")
+
+    def __init__(self, ids: Iterable[int] = ()):
+        int_ids, others = _split(ids)
+        # Not evaluated at runtime, where array is only subscriptable from Python 3.12 on
+        self._ids: array[int] = array(  # pylint: disable=unsubscriptable-object
+            _TYPECODE, sorted(int_ids)
+        )
+        self._others: frozenset[Hashable] = frozenset(others)
+
+    @classmethod
+    def _create(cls, ids: "array[int]", others: frozenset[Hashable]) -> "IdSet":
+        id_set = cls.__new__(cls)
+        id_set._ids = ids
+        id_set._others = others
+        return id_set
+
+    def __contains__(self, value: object) -> bool:
+        if isinstance(value, int) and _MIN <= value <= _MAX:
+            ids = self._ids
+            index = bisect_left(ids, value)
+            return index < len(ids) and ids[index] == value
+        return bool(self._others) and value in self._others
+
+    def __iter__(self) -> Iterator[int]:
+        if self._others:
+            return chain(self._ids, self._others)  # type: ignore[arg-type]
+        return iter(self._ids)
+
+    def __len__(self) -> int:
+        return len(self._ids) + len(self._others)
+
+    def __hash__(self) -> int:
+        # Consistent with the hash of an equal frozenset
+        return hash(frozenset(self))
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({{{', '.join(map(repr, self))}}})"
+
+    def union(self, ids: Iterable[int]) -> "IdSet":
+        """Returns a set with the ids of this set and :paramref:`ids`."""
+        new_ids, others = _split(id_ for id_ in ids if id_ not in self)
+        if not (new_ids or others):
+            return self
+        return self._create(
+            # Sorting two sorted runs merges them in linear time, so only the new ids are sorted
+            # as a whole
+            array(_TYPECODE, sorted(chain(self._ids, sorted(new_ids)))) if new_ids else self._ids,
+            self._others.union(others),
+        )
+
+    def difference(self, ids: Iterable[int]) -> "IdSet":
+        """Returns a set with the ids of this set that are not in :paramref:`ids`."""
+        removed_ids, others = _split(id_ for id_ in ids if id_ in self)
+        if not (removed_ids or others):
+            return self
+        return self._create(
+            (
+                array(_TYPECODE, [id_ for id_ in self._ids if id_ not in removed_ids])
+                if removed_ids
+                else self._ids
+            ),
+            self._others.difference(others),
+        )
@@ -38,6 +38,7 @@ from typing import Callable, Optional
 
 from telegram._utils.logging import get_logger
 from telegram.error import InvalidToken, RetryAfter, TelegramError, TimedOut
+from telegram.ext._retrypolicy import RetryPolicy
 
 _LOGGER = get_logger(__name__)
 
@@ -51,6 +52,7 @@ async def network_retry_loop(
     stop_event: Optional[asyncio.Event] = None,
     is_running: Optional[Callable[[], bool]] = None,
     max_retries: int,
+    retry_policy: Optional[RetryPolicy] = None,
 ) -> None:
     """Perform a loop calling `action_cb`, retrying after network errors.
 
@@ -86,11 +88,17 @@ async def network_retry_loop(
             * < 0: Retry indefinitely.
             * 0: No retries.
             * > 0: Number of retries.
+        retry_policy (:class:`telegram.ext.RetryPolicy` | :obj:`None`): The policy that decides
+            how long to wait before retrying after an error. Defaults to a
+            :class:`~telegram.ext.RetryPolicy` with default settings.
+
+            .. versionadded:: NEXT.VERSION
 
     """
     infinite_loop = max_retries < 0
     log_prefix = f"Network Retry Loop ({description}):"
     effective_is_running = is_running or (lambda: True)
+    effective_retry_policy = retry_policy or RetryPolicy()
 
     async def do_action() -> None:
         if not stop_event:
@@ -117,6 +125,8 @@ async def network_retry_loop(
     _LOGGER.debug("%s Starting", log_prefix)
     cur_interval = interval
     retries = 0
+    # Number of failed attempts since the last successful one, used to grow the retry delays
+    failures = 0
     while effective_is_running():
         try:
             await do_action()
@@ -124,16 +134,15 @@ async def network_retry_loop(
                 _LOGGER.debug("%s Action succeeded. Stopping loop.", log_prefix)
                 break
         except RetryAfter as exc:
-            slack_time = 0.5
-            _LOGGER.info(
-                "%s %s. Adding %s seconds to the specified time.", log_prefix, exc, slack_time
-            )
-            # pylint: disable=protected-access
-            cur_interval = slack_time + exc._retry_after.total_seconds()
+            cur_interval = effective_retry_policy.get_delay(exc, failures)
+            failures += 1
+            _LOGGER.info("%s %s. Retrying in %.2f seconds.", log_prefix, exc, cur_interval)
         except TimedOut as toe:
-            _LOGGER.debug("%s Timed out: %s. Retrying immediately.", log_prefix, toe)
-            # If failure is due to timeout, we should retry asap.
-            cur_interval = 0
+            cur_interval = effective_retry_policy.get_delay(toe, failures)
+            failures += 1
+            _LOGGER.debug(
+                "%s Timed out: %s. Retrying in %.2f seconds.", log_prefix, toe, cur_interval
+            )
         except InvalidToken:
             _LOGGER.exception("%s Invalid token. Aborting retry loop.", log_prefix)
             raise
@@ -151,10 +160,11 @@ async def network_retry_loop(
                 )
                 raise
 
-            # increase waiting times on subsequent errors up to 30secs
-            cur_interval = 1 if cur_interval == 0 else min(30, 1.5 * cur_interval)
+            cur_interval = effective_retry_policy.get_delay(telegram_exc, failures)
+            failures += 1
         else:
             cur_interval = interval
+            failures = 0
         finally:
             retries += 1
 
@@ -0,0 +1,138 @@
+#!/usr/bin/env python
+#
+# A library that provides a Python interface to the Telegram Bot API
+# Copyright (C) 2015-2025
+# Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser Public License for more details.
+#
+# You should have received a copy of the GNU Lesser Public License
+# along with this program.  If not, see [http://www.gnu.org/licenses/].
+"""This module contains a set of regex patterns that reports all patterns that match a text
+without checking every pattern.
+
+.. versionadded:: NEXT.VERSION
+
+Warning:
+    Contents of this module are intended to be used internally by the library and *not* by the
+    user. Changes to this module are not considered breaking changes and may not be documented in
+    the changelog.
+"""
+
+import re
+from collections import defaultdict
+from collections.abc import Iterable
+from re import Match, Pattern
+from typing import Final, Optional, Union
+
+_METACHARACTERS: Final = frozenset(".^$*+?{}[]\\|()")
+_QUANTIFIERS: Final = frozenset("*+?{")
+
+
+def _literal_prefix(pattern: Pattern[str], search: bool) -> Optional[str]:
+    """Returns the text that the text must start with for :paramref:`pattern` to match or
+    :obj:`None`, if there is no such text. This is deliberately conservative.
+    """
+    source = pattern.pattern
+    if not isinstance(source, str) or pattern.flags & (re.IGNORECASE | re.VERBOSE):
+        return None
+    if "|" in source:
+        return None
+
+    if source.startswith("\\A"):
+        source = source[2:]
+    elif source.startswith("^") and not (search and pattern.flags & re.MULTILINE):
+        source = source[1:]
+    elif search:
+        # The pattern may match anywhere in the text
+        return None
+
+    prefix: list[str] = []
+    for char in source:
+        if char in _METACHARACTERS:
+            if char in _QUANTIFIERS and prefix:
+                # The quantifier applies to the last character
+                prefix.pop()
+            break
+        prefix.append(char)
+    return "".join(prefix) or None
+
+
+class PatternSet:
+    """A set of regex patterns that reports all patterns that match a text.
+
+    Patterns that can only match at the start of the text and start with literal text, like
+    ``^action_1:(\\d+)$``, are looked up by the start of the text, so usually only the patterns
+    that actually match are checked, no matter how many patterns there are. All other patterns
+    are checked one after another.
+
+    Args:
+        patterns (Iterable[:obj:`str` | :func:`re.Pattern <re.compile>`]): The patterns.
+        search (:obj:`bool`, optional): Whether the patterns may match anywhere in the text like
+            :meth:`re.Pattern.search` or only at the start of the text like
+            :meth:`re.Pattern.match`. Defaults to :obj:`True`.
+
+    Attributes:
+        patterns (tuple[:func:`re.Pattern <re.compile>`]): The compiled patterns.
+        search (:obj:`bool`): Whether the patterns may match anywhere in the text.
+    """
+
+    __slots__ = ("_by_prefix", "_unindexed", "patterns", "search")
+
+    def __init__(self, patterns: Iterable[Union[str, Pattern[str]]], search: bool = True):
+        self.patterns: tuple[Pattern[str], ...] = tuple(
+            re.compile(pattern) if isinstance(pattern, str) else pattern for pattern in patterns
+        )
+        self.search: bool = search
+
+        by_prefix: defaultdict[int, defaultdict[str, list[int]]] = defaultdict(
+            lambda: defaultdict(list)
+        )
+        unindexed: list[int] = []
+        for index, pattern in enumerate(self.patterns):
+            if (prefix := _literal_prefix(pattern, search)) is None:
+                unindexed.append(index)
+            else:
+                by_prefix[len(prefix)][prefix].append(index)
+
+        # The lengths of the prefixes and for each length, the patterns by prefix
+        self._by_prefix: tuple[tuple[int, dict[str, tuple[int, ...]]], ...] = tuple(
+            (length, {prefix: tuple(indices) for prefix, indices in prefixes.items()})
+            for length, prefixes in by_prefix.items()
+        )
+        self._unindexed: tuple[int, ...] = tuple(unindexed)
+
+    def __len__(self) -> int:
+        return len(self.patterns)
+
+    def _find(self, text: str) -> dict[int, Match[str]]:
+        candidates = list(self._unindexed)
+        for length, prefixes in self._by_prefix:
+            candidates.extend(prefixes.get(text[:length], ()))
+        candidates.sort()
+
+        found = {}
+        for index in candidates:
+            pattern = self.patterns[index]
+            if match := pattern.search(text) if self.search else pattern.match(text):
+                found[index] = match
+        return found
+
+    def matching(self, text: str) -> tuple[int, ...]:
+        """Returns the indices of the patterns that match :paramref:`text` in ascending order."""
+        return tuple(self._find(text))
+
+    def matches(self, text: str) -> list[Match[str]]:
+        """Returns the matches of the patterns that match :paramref:`text` in the order of the
+        patterns. The matches are the same as those of :meth:`re.Pattern.search` or
+        :meth:`re.Pattern.match`, respectively.
+        """
+        return list(self._find(text).values())
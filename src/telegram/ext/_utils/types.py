@@ -70,6 +70,13 @@ CDCData = tuple[list[tuple[str, float, dict[str, Any]]], dict[str, str]]
     .. versionadded:: 13.6
 """
 
+UCData = dict[str, str]
+"""dict[:obj:`str`, :obj:`str`]: Data returned by
+    :attr:`telegram.ext.UploadCache.persistence_data`.
+
+    .. versionadded:: NEXT.VERSION
+"""
+
 BT = TypeVar("BT", bound="Bot")
 """Type of the bot.
 
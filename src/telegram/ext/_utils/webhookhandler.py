@@ -18,7 +18,7 @@
 # along with this program.  If not, see [http://www.gnu.org/licenses/].
 # pylint: disable=missing-module-docstring
 import asyncio
-import json
+import logging
 from http import HTTPStatus
 from pathlib import Path
 from socket import socket
@@ -158,10 +158,11 @@ class TelegramHandler(tornado.web.RequestHandler):
         _LOGGER.debug("Webhook triggered")
         self._validate_post()
 
-        json_string = self.request.body.decode()
-        data = json.loads(json_string)
+        data = self.bot.request.json_codec.loads(self.request.body)
         self.set_status(HTTPStatus.OK)
-        _LOGGER.debug("Webhook received data: %s", json_string)
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            # The codec parses the raw bytes, so only decode them if they are logged
+            _LOGGER.debug("Webhook received data: %s", self.request.body.decode())
 
         try:
             update = Update.de_json(data, self.bot)
@@ -95,6 +95,7 @@ __all__ = (
     "Mention",
     "MessageFilter",
     "Regex",
+    "RegexSet",
     "SenderChat",
     "StatusUpdate",
     "Sticker",
@@ -110,7 +111,7 @@ import re
 from abc import ABC, abstractmethod
 from collections.abc import Collection, Iterable, Sequence
 from re import Match, Pattern
-from typing import NoReturn, Optional, Union, cast
+from typing import Any, Callable, Final, NoReturn, Optional, Union, cast
 
 from telegram import Chat as TGChat
 from telegram import (
@@ -125,6 +126,9 @@ from telegram import User as TGUser
 from telegram._utils.types import SCT
 from telegram.constants import DiceEmoji as DiceEmojiEnum
 from telegram.ext._utils._update_parsing import parse_chat_id, parse_username
+from telegram.ext._utils.filtercache import get_filter_results
+from telegram.ext._utils.idset import IdSet
+from telegram.ext._utils.patternset import PatternSet
 from telegram.ext._utils.types import FilterDataDict
 
 
@@ -163,6 +167,15 @@ class BaseFilter:
         With ``message.text == 'x'``, will only ever return the matches for the first filter,
         since the second one is never evaluated.
 
+    .. versionchanged:: NEXT.VERSION
+        Combined filters are compiled into a flat evaluation plan when they are first used. The
+        filters of this module are checked cheapest first, e.g. :attr:`TEXT` before
+        :class:`Regex`, as long as this does not change the result. While
+        :class:`telegram.ext.Application` checks the handlers for an update, their results are
+        cached, so filters shared by several handlers are checked only once. Custom filters are
+        always checked in the order in which they were combined and are never cached. Combined
+        filters must not be modified after they were first used.
+
     If you want to create your own filters create a class inheriting from either
     :class:`MessageFilter` or :class:`UpdateFilter` and implement a ``filter()``
     method that returns a boolean: :obj:`True` if the message should be
@@ -380,14 +393,15 @@ class _InvertedFilter(UpdateFilter):
 
     """
 
-    __slots__ = ("inv_filter",)
+    __slots__ = ("_plan", "inv_filter")
 
     def __init__(self, f: BaseFilter):
         super().__init__()
         self.inv_filter = f
+        self._plan: Optional[_Evaluator] = None
 
     def filter(self, update: Update) -> bool:
-        return not bool(self.inv_filter.check_update(update))
+        return _evaluate(self, update)
 
     @property
     def name(self) -> str:
@@ -408,7 +422,7 @@ class _MergedFilter(UpdateFilter):
 
     """
 
-    __slots__ = ("and_filter", "base_filter", "or_filter")
+    __slots__ = ("_plan", "and_filter", "base_filter", "or_filter")
 
     def __init__(
         self,
@@ -430,6 +444,7 @@ class _MergedFilter(UpdateFilter):
         self.or_filter = or_filter
         if self.or_filter and not isinstance(self.and_filter, bool) and self.or_filter.data_filter:
             self.data_filter = True
+        self._plan: Optional[_Evaluator] = None
 
     @staticmethod
     def _merge(base_output: Union[bool, dict], comp_output: Union[bool, dict]) -> FilterDataDict:
@@ -448,34 +463,8 @@ class _MergedFilter(UpdateFilter):
                 base[k] = comp_value
         return base
 
-    # pylint: disable=too-many-return-statements
     def filter(self, update: Update) -> Union[bool, FilterDataDict]:
-        base_output = self.base_filter.check_update(update)
-        # We need to check if the filters are data filters and if so return the merged data.
-        # If it's not a data filter or an or_filter but no matches return bool
-        if self.and_filter:
-            # And filter needs to short circuit if base is falsy
-            if base_output:
-                comp_output = self.and_filter.check_update(update)
-                if comp_output:
-                    if self.data_filter:
-                        merged = self._merge(base_output, comp_output)
-                        if merged:
-                            return merged
-                    return True
-        elif self.or_filter:
-            # Or filter needs to short circuit if base is truthy
-            if base_output:
-                if self.data_filter:
-                    return base_output
-                return True
-
-            comp_output = self.or_filter.check_update(update)
-            if comp_output:
-                if self.data_filter:
-                    return comp_output
-                return True
-        return False
+        return _evaluate(self, update)
 
     @property
     def name(self) -> str:
@@ -499,16 +488,17 @@ class _XORFilter(UpdateFilter):
 
     """
 
-    __slots__ = ("base_filter", "merged_filter", "xor_filter")
+    __slots__ = ("_plan", "base_filter", "merged_filter", "xor_filter")
 
     def __init__(self, base_filter: BaseFilter, xor_filter: BaseFilter):
         super().__init__()
         self.base_filter = base_filter
         self.xor_filter = xor_filter
         self.merged_filter = (base_filter & ~xor_filter) | (~base_filter & xor_filter)
+        self._plan: Optional[_Evaluator] = None
 
     def filter(self, update: Update) -> Optional[Union[bool, FilterDataDict]]:
-        return self.merged_filter.check_update(update)
+        return _evaluate(self, update)
 
     @property
     def name(self) -> str:
@@ -519,6 +509,152 @@ class _XORFilter(UpdateFilter):
         raise RuntimeError("Cannot set name for combined filters.")
 
 
+# Checks a compiled filter, given the cached filter results for the update if available
+_Evaluator = Callable[[Update, Optional[dict[object, Any]]], Any]
+# The evaluator of a filter, its estimated costs and whether it's a filter of this module
+_Compiled = tuple[_Evaluator, int, bool]
+
+_LEAF_COSTS: Final = 1
+_CUSTOM_COSTS: Final = 5
+_REGEX_COSTS: Final = 10
+
+
+def _compile_leaf(leaf: BaseFilter) -> _Compiled:
+    # Only the filters of this module are known to not have side effects and to return the same
+    # result when they are checked repeatedly for the same update
+    if type(leaf).__module__ != __name__:
+        return (lambda update, _: leaf.check_update(update)), _CUSTOM_COSTS, False
+
+    def evaluate(update: Update, results: Optional[dict[object, Any]]) -> Any:
+        if results is None:
+            return leaf.check_update(update)
+        try:
+            result = results[leaf]
+        except KeyError:
+            result = results[leaf] = leaf.check_update(update)
+        if isinstance(result, dict):
+            # _MergedFilter._merge modifies the dicts
+            return {
+                key: value.copy() if isinstance(value, list) else value
+                for key, value in result.items()
+            }
+        return result
+
+    costs = _REGEX_COSTS if isinstance(leaf, (CaptionRegex, Regex, RegexSet)) else _LEAF_COSTS
+    return evaluate, costs, True
+
+
+def _merged_operator(merged: "_MergedFilter") -> Optional[bool]:
+    """Returns :obj:`True` for an `and`, :obj:`False` for an `or` and :obj:`None` otherwise."""
+    if merged.and_filter:
+        return True
+    if merged.or_filter:
+        return False
+    return None
+
+
+def _collect_operands(
+    merged: "_MergedFilter",
+    is_and: bool,
+    data_filter: bool,
+    operands: list[tuple[_Compiled, bool]],
+) -> None:
+    # Chains like `a & b & c` are nested merged filters, which are flattened as long as that does
+    # not change the merging of the data. Subclasses of _MergedFilter may override `check_update`,
+    # so they are compiled as a whole instead.
+    for operand in (merged.base_filter, merged.and_filter if is_and else merged.or_filter):
+        if (
+            type(operand) is _MergedFilter  # pylint: disable=unidiomatic-typecheck
+            and _merged_operator(operand) is is_and
+            and operand.data_filter == data_filter
+        ):
+            _collect_operands(operand, is_and, data_filter, operands)
+        else:
+            operand_filter = cast("BaseFilter", operand)
+            operands.append((_compile(operand_filter), operand_filter.data_filter))
+
+
+def _compile_merged(merged: "_MergedFilter") -> _Compiled:
+    is_and = _merged_operator(merged)
+    if is_and is None:
+        evaluate_base, costs, pure = _compile(merged.base_filter)
+
+        def evaluate_none(update: Update, results: Optional[dict[object, Any]]) -> bool:
+            evaluate_base(update, results)
+            return False
+
+        return evaluate_none, costs, pure
+
+    data_filter = merged.data_filter
+    collected: list[tuple[_Compiled, bool]] = []
+    _collect_operands(merged, is_and, data_filter, collected)
+    pure = all(operand_pure for (_, _, operand_pure), _ in collected)
+    if pure and not data_filter:
+        collected.sort(key=lambda operand: operand[0][1])
+    elif pure and is_and:
+        # The data of `and` is merged in the order of the data filters, so only the other
+        # filters are moved ahead of them. `or` returns the data of the first matching filter.
+        collected.sort(key=lambda operand: (operand[1], 0 if operand[1] else operand[0][1]))
+    operands = [compiled for compiled, _ in collected]
+    evaluators = tuple(evaluate for evaluate, _, _ in operands)
+    costs = sum(operand_costs for _, operand_costs, _ in operands)
+
+    if not is_and:
+
+        def evaluate_or(update: Update, results: Optional[dict[object, Any]]) -> Any:
+            for evaluate in evaluators:
+                if output := evaluate(update, results):
+                    return output if data_filter else True
+            return False
+
+        return evaluate_or, costs, pure
+
+    if not data_filter:
+
+        def evaluate_and(update: Update, results: Optional[dict[object, Any]]) -> bool:
+            return all(evaluate(update, results) for evaluate in evaluators)
+
+        return evaluate_and, costs, pure
+
+    def evaluate_and_data(update: Update, results: Optional[dict[object, Any]]) -> Any:
+        outputs = []
+        for evaluate in evaluators:
+            if not (output := evaluate(update, results)):
+                return False
+            outputs.append(output)
+        merge = _MergedFilter._merge  # pylint: disable=protected-access
+        merged_output = outputs[0]
+        for output in outputs[1:]:
+            merged_output = merge(merged_output, output) or True
+        return merged_output
+
+    return evaluate_and_data, costs, pure
+
+
+def _compile(filter_: BaseFilter) -> _Compiled:
+    """Compiles a (combined) filter. Only the combined filter that is checked by the handler
+    checks whether the update is a message update, which is the same for all nested filters.
+    """
+    filter_type = type(filter_)
+    if filter_type is _XORFilter:
+        return _compile(cast("_XORFilter", filter_).merged_filter)
+    if filter_type is _InvertedFilter:
+        evaluate_inverted, costs, pure = _compile(cast("_InvertedFilter", filter_).inv_filter)
+        return (lambda update, results: not evaluate_inverted(update, results)), costs, pure
+    if filter_type is _MergedFilter:
+        return _compile_merged(cast("_MergedFilter", filter_))
+    return _compile_leaf(filter_)
+
+
+def _evaluate(
+    filter_: Union["_InvertedFilter", "_MergedFilter", "_XORFilter"], update: Update
+) -> Any:
+    # pylint: disable=protected-access
+    if filter_._plan is None:
+        filter_._plan = _compile(filter_)[0]
+    return filter_._plan(update, get_filter_results(update))
+
+
 class _All(MessageFilter):
     __slots__ = ()
 
@@ -677,8 +813,9 @@ class _ChatUserBaseFilter(MessageFilter, ABC):
         self._username_name: str = "username"
         self.allow_empty: bool = allow_empty
 
-        self._chat_ids: set[int] = set()
-        self._usernames: set[str] = set()
+        # Immutable snapshots, which are replaced as a whole on every change
+        self._chat_ids: IdSet = IdSet()
+        self._usernames: frozenset[str] = frozenset()
 
         self._set_chat_ids(chat_id)
         self._set_usernames(username)
@@ -692,7 +829,7 @@ class _ChatUserBaseFilter(MessageFilter, ABC):
                 f"Can't set {self._chat_id_name} in conjunction with (already set) "
                 f"{self._username_name}s."
             )
-        self._chat_ids = set(parse_chat_id(chat_id))
+        self._chat_ids = IdSet(parse_chat_id(chat_id))
 
     def _set_usernames(self, username: Optional[SCT[str]]) -> None:
         if username and self._chat_ids:
@@ -700,7 +837,7 @@ class _ChatUserBaseFilter(MessageFilter, ABC):
                 f"Can't set {self._username_name} in conjunction with (already set) "
                 f"{self._chat_id_name}s."
             )
-        self._usernames = set(parse_username(username))
+        self._usernames = frozenset(parse_username(username))
 
     @property
     def chat_ids(self) -> frozenset[int]:
@@ -714,17 +851,20 @@ class _ChatUserBaseFilter(MessageFilter, ABC):
     def usernames(self) -> frozenset[str]:
         """Which username(s) to allow through.
 
-        Warning:
-            :attr:`usernames` will give a *copy* of the saved usernames as :obj:`frozenset`. This
-            is to ensure thread safety. To add/remove a user, you should use :meth:`add_usernames`,
-            and :meth:`remove_usernames`. Only update the entire set by
-            ``filter.usernames = new_set``, if you are entirely sure that it is not causing race
-            conditions, as this will complete replace the current set of allowed users.
+        Note:
+            :attr:`usernames` is an immutable snapshot of the allowed usernames.
+            :meth:`add_usernames`, :meth:`remove_usernames` and ``filter.usernames = new_set``
+            replace the snapshot at once, so updates that are filtered at the same time see either
+            all or none of the changes. Changes from several threads at once may still overwrite
+            each other.
+
+        .. versionchanged:: NEXT.VERSION
+            Returns the snapshot itself instead of a copy.
 
         Returns:
             frozenset(:obj:`str`)
         """
-        return frozenset(self._usernames)
+        return self._usernames
 
     @usernames.setter
     def usernames(self, username: SCT[str]) -> None:
@@ -744,8 +884,7 @@ class _ChatUserBaseFilter(MessageFilter, ABC):
                 f"{self._chat_id_name}s."
             )
 
-        parsed_username = set(parse_username(username))
-        self._usernames |= parsed_username
+        self._usernames = self._usernames.union(parse_username(username))
 
     def _add_chat_ids(self, chat_id: SCT[int]) -> None:
         if self._usernames:
@@ -754,9 +893,7 @@ class _ChatUserBaseFilter(MessageFilter, ABC):
                 f"{self._username_name}s."
             )
 
-        parsed_chat_id = set(parse_chat_id(chat_id))
-
-        self._chat_ids |= parsed_chat_id
+        self._chat_ids = self._chat_ids.union(parse_chat_id(chat_id))
 
     def remove_usernames(self, username: SCT[str]) -> None:
         """
@@ -772,8 +909,7 @@ class _ChatUserBaseFilter(MessageFilter, ABC):
                 f"{self._chat_id_name}s."
             )
 
-        parsed_username = set(parse_username(username))
-        self._usernames -= parsed_username
+        self._usernames = self._usernames.difference(parse_username(username))
 
     def _remove_chat_ids(self, chat_id: SCT[int]) -> None:
         if self._usernames:
@@ -781,16 +917,15 @@ class _ChatUserBaseFilter(MessageFilter, ABC):
                 f"Can't set {self._chat_id_name} in conjunction with (already set) "
                 f"{self._username_name}s."
             )
-        parsed_chat_id = set(parse_chat_id(chat_id))
-        self._chat_ids -= parsed_chat_id
+        self._chat_ids = self._chat_ids.difference(parse_chat_id(chat_id))
 
     def filter(self, message: Message) -> bool:
         chat_or_user = self._get_chat_or_user(message)
         if chat_or_user:
-            if self.chat_ids:
-                return chat_or_user.id in self.chat_ids
-            if self.usernames:
-                return bool(chat_or_user.username and chat_or_user.username in self.usernames)
+            if chat_ids := self._chat_ids:
+                return chat_or_user.id in chat_ids
+            if usernames := self._usernames:
+                return bool(chat_or_user.username and chat_or_user.username in usernames)
             return self.allow_empty
         return False
 
@@ -812,12 +947,14 @@ class Chat(_ChatUserBaseFilter):
     Examples:
         ``MessageHandler(filters.Chat(-1234), callback_method)``
 
-    Warning:
-        :attr:`chat_ids` will give a *copy* of the saved chat ids as :class:`frozenset`. This
-        is to ensure thread safety. To add/remove a chat, you should use :meth:`add_chat_ids`, and
-        :meth:`remove_chat_ids`. Only update the entire set by ``filter.chat_ids = new_set``,
-        if you are entirely sure that it is not causing race conditions, as this will complete
-        replace the current set of allowed chats.
+    Note:
+        :attr:`chat_ids` is a copy of an immutable snapshot of the allowed chats.
+        :meth:`add_chat_ids`, :meth:`remove_chat_ids` and ``filter.chat_ids = new_set`` replace
+        the snapshot at once, so updates that are filtered at the same time see either all or
+        none of the changes. Changes from several threads at once may still overwrite each other.
+
+    .. versionchanged:: NEXT.VERSION
+        The allowed ids are stored compactly as an immutable snapshot.
 
     Args:
         chat_id(:obj:`int` | Collection[:obj:`int`], optional):
@@ -1421,12 +1558,14 @@ class ForwardedFrom(_ChatUserBaseFilter):
         :class:`telegram.MessageOriginHiddenUser`. However, this behaviour
         is undocumented and might be changed by Telegram.
 
-    Warning:
-        :attr:`chat_ids` will give a *copy* of the saved chat ids as :class:`frozenset`. This
-        is to ensure thread safety. To add/remove a chat, you should use :meth:`add_chat_ids`, and
-        :meth:`remove_chat_ids`. Only update the entire set by ``filter.chat_ids = new_set``, if
-        you are entirely sure that it is not causing race conditions, as this will complete replace
-        the current set of allowed chats.
+    Note:
+        :attr:`chat_ids` is a copy of an immutable snapshot of the allowed chats.
+        :meth:`add_chat_ids`, :meth:`remove_chat_ids` and ``filter.chat_ids = new_set`` replace
+        the snapshot at once, so updates that are filtered at the same time see either all or
+        none of the changes. Changes from several threads at once may still overwrite each other.
+
+    .. versionchanged:: NEXT.VERSION
+        The allowed ids are stored compactly as an immutable snapshot.
 
     Args:
         chat_id(:obj:`int` | Collection[:obj:`int`], optional):
@@ -1805,6 +1944,50 @@ class Regex(MessageFilter):
         return {}
 
 
+class RegexSet(MessageFilter):
+    """
+    Filters updates by searching for occurrences of any of :paramref:`~RegexSet.patterns` in the
+    message text. Unlike combining :class:`Regex` filters with ``|``, this filter returns the
+    matches of *all* patterns that occur in the text, in the order of the patterns.
+
+    The patterns are checked as with :func:`re.search`. Patterns that can only match at the start
+    of the text and start with literal text, like ``r'^/todo_add\b'``, are looked up by the start
+    of the message text, so only the patterns that can actually match are checked, no matter how
+    many patterns there are. All other patterns are checked one after another.
+
+    To get the groups and groupdict matched, see :attr:`telegram.ext.CallbackContext.matches`.
+
+    Examples:
+        Use ``MessageHandler(filters.RegexSet([r'help', r'^info\b']), callback)`` to capture all
+        messages that contain the word 'help' or start with the word 'info'.
+
+    .. seealso:: :wiki:`Types of Handlers <Types-of-Handlers>`
+
+    .. versionadded:: NEXT.VERSION
+
+    Args:
+        patterns (Collection[:obj:`str` | :func:`re.Pattern <re.compile>`]): The regex patterns.
+
+    Attributes:
+        patterns (tuple[:func:`re.Pattern <re.compile>`]): The compiled regex patterns.
+    """
+
+    __slots__ = ("_pattern_set", "patterns")
+
+    def __init__(self, patterns: Collection[Union[str, Pattern[str]]]):
+        self._pattern_set: PatternSet = PatternSet(patterns)
+        self.patterns: tuple[Pattern[str], ...] = self._pattern_set.patterns
+        super().__init__(
+            name=f"filters.RegexSet({[pattern.pattern for pattern in self.patterns]})",
+            data_filter=True,
+        )
+
+    def filter(self, message: Message) -> Optional[dict[str, list[Match[str]]]]:
+        if message.text and (matches := self._pattern_set.matches(message.text)):
+            return {"matches": matches}
+        return {}
+
+
 class _Reply(MessageFilter):
     __slots__ = ()
 
@@ -1849,12 +2032,14 @@ class SenderChat(_ChatUserBaseFilter):
 
     .. seealso:: :attr:`telegram.ext.filters.IS_AUTOMATIC_FORWARD`
 
-    Warning:
-        :attr:`chat_ids` will return a *copy* of the saved chat ids as :obj:`frozenset`. This
-        is to ensure thread safety. To add/remove a chat, you should use :meth:`add_chat_ids`, and
-        :meth:`remove_chat_ids`. Only update the entire set by ``filter.chat_ids = new_set``, if
-        you are entirely sure that it is not causing race conditions, as this will complete replace
-        the current set of allowed chats.
+    Note:
+        :attr:`chat_ids` is a copy of an immutable snapshot of the allowed chats.
+        :meth:`add_chat_ids`, :meth:`remove_chat_ids` and ``filter.chat_ids = new_set`` replace
+        the snapshot at once, so updates that are filtered at the same time see either all or
+        none of the changes. Changes from several threads at once may still overwrite each other.
+
+    .. versionchanged:: NEXT.VERSION
+        The allowed ids are stored compactly as an immutable snapshot.
 
     Args:
         chat_id(:obj:`int` | Collection[:obj:`int`], optional):
@@ -2764,12 +2949,15 @@ class User(_ChatUserBaseFilter):
         """
         Which user ID(s) to allow through.
 
-        Warning:
-            :attr:`user_ids` will give a *copy* of the saved user ids as :obj:`frozenset`. This
-            is to ensure thread safety. To add/remove a user, you should use :meth:`add_user_ids`,
-            and :meth:`remove_user_ids`. Only update the entire set by
-            ``filter.user_ids = new_set``, if you are entirely sure that it is not causing race
-            conditions, as this will complete replace the current set of allowed users.
+        Note:
+            :attr:`user_ids` is a copy of an immutable snapshot of the allowed users.
+            :meth:`add_user_ids`, :meth:`remove_user_ids` and ``filter.user_ids = new_set``
+            replace the snapshot at once, so updates that are filtered at the same time see either
+            all or none of the changes. Changes from several threads at once may still overwrite
+            each other.
+
+        .. versionchanged:: NEXT.VERSION
+            The allowed ids are stored compactly as an immutable snapshot.
 
         Returns:
             frozenset(:obj:`int`)
@@ -2902,12 +3090,15 @@ class ViaBot(_ChatUserBaseFilter):
         """
         Which bot ID(s) to allow through.
 
-        Warning:
-            :attr:`bot_ids` will give a *copy* of the saved bot ids as :obj:`frozenset`. This
-            is to ensure thread safety. To add/remove a bot, you should use :meth:`add_bot_ids`,
-            and :meth:`remove_bot_ids`. Only update the entire set by ``filter.bot_ids = new_set``,
-            if you are entirely sure that it is not causing race conditions, as this will complete
-            replace the current set of allowed bots.
+        Note:
+            :attr:`bot_ids` is a copy of an immutable snapshot of the allowed bots.
+            :meth:`add_bot_ids`, :meth:`remove_bot_ids` and ``filter.bot_ids = new_set``
+            replace the snapshot at once, so updates that are filtered at the same time see either
+            all or none of the changes. Changes from several threads at once may still overwrite
+            each other.
+
+        .. versionchanged:: NEXT.VERSION
+            The allowed ids are stored compactly as an immutable snapshot.
 
         Returns:
             frozenset(:obj:`int`)
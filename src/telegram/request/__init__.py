@@ -18,7 +18,9 @@
 """This module contains classes that handle the networking backend of ``python-telegram-bot``."""
 
 from ._baserequest import BaseRequest
+from ._circuitbreaker import CircuitBreaker
 from ._httpxrequest import HTTPXRequest
+from ._jsoncodec import JSONCodec
 from ._requestdata import RequestData
 
-__all__ = ("BaseRequest", "HTTPXRequest", "RequestData")
+__all__ = ("BaseRequest", "CircuitBreaker", "HTTPXRequest", "JSONCodec", "RequestData")
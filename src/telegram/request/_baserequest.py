@@ -20,10 +20,16 @@
 
 import abc
 import json
-from contextlib import AbstractAsyncContextManager
+from collections.abc import AsyncGenerator, AsyncIterator
+from contextlib import (
+    AbstractAsyncContextManager,
+    AbstractContextManager,
+    asynccontextmanager,
+    nullcontext,
+)
 from http import HTTPStatus
 from types import TracebackType
-from typing import Final, Optional, TypeVar, Union, final
+from typing import Final, NoReturn, Optional, TypeVar, Union, final
 
 from telegram._utils.defaultvalue import DEFAULT_NONE as _DEFAULT_NONE
 from telegram._utils.defaultvalue import DefaultValue
@@ -41,6 +47,8 @@ from telegram.error import (
     RetryAfter,
     TelegramError,
 )
+from telegram.request._circuitbreaker import CircuitBreaker
+from telegram.request._jsoncodec import DEFAULT_JSON_CODEC, JSONCodec
 from telegram.request._requestdata import RequestData
 
 RT = TypeVar("RT", bound="BaseRequest")
@@ -48,6 +56,17 @@ RT = TypeVar("RT", bound="BaseRequest")
 _LOGGER = get_logger(__name__, class_name="BaseRequest")
 
 
+def _is_server_failure(exc: Exception) -> bool:
+    # Errors that Telegram reported for the request itself mean that the server is fine
+    return isinstance(exc, NetworkError) and not isinstance(exc, BadRequest)
+
+
+async def _iter_chunks(payload: bytes, chunk_size: Optional[int]) -> AsyncIterator[bytes]:
+    step = chunk_size or len(payload)
+    for start in range(0, len(payload), step or 1):
+        yield payload[start : start + step]
+
+
 class BaseRequest(
     AbstractAsyncContextManager["BaseRequest"],
     abc.ABC,
@@ -77,8 +96,15 @@ class BaseRequest(
 
     Tip:
         JSON encoding and decoding is done with the standard library's :mod:`json` by default.
-        To use a custom library for this, you can override :meth:`parse_json_payload` and implement
-        custom logic to encode the keys of :attr:`telegram.request.RequestData.parameters`.
+        To use a faster library, override :attr:`json_codec` or pass a
+        :class:`telegram.request.JSONCodec` to
+        :paramref:`telegram.request.HTTPXRequest.json_codec` or
+        :meth:`telegram.ext.ApplicationBuilder.json_codec`. For full control, you can override
+        :meth:`parse_json_payload` and implement custom logic to encode the keys of
+        :attr:`telegram.request.RequestData.parameters`.
+
+    .. versionchanged:: NEXT.VERSION
+        JSON encoding and decoding now use :class:`telegram.request.JSONCodec`.
 
     .. seealso:: :wiki:`Architecture Overview <Architecture>`,
         :wiki:`Builder Pattern <Builder-Pattern>`
@@ -146,6 +172,49 @@ class BaseRequest(
             :obj:`float` | :obj:`None`: The read timeout in seconds.
         """
 
+    @property
+    def circuit_breaker(self) -> Optional[CircuitBreaker]:
+        """The circuit breaker that protects the requests made by this object. Requests fail
+        fast with :exc:`telegram.error.CircuitBreakerOpen` while it is open. Network errors and
+        server errors count as failures, while errors that Telegram reported for the request
+        itself, e.g. :exc:`telegram.error.BadRequest` or :exc:`telegram.error.RetryAfter`,
+        do not.
+
+        The default implementation returns :obj:`None`, i.e. no circuit breaker is used.
+        Subclasses can override this property to use one.
+
+        .. seealso:: :paramref:`telegram.request.HTTPXRequest.circuit_breaker`
+
+        .. versionadded:: NEXT.VERSION
+
+        Returns:
+            :class:`telegram.request.CircuitBreaker` | :obj:`None`: The circuit breaker.
+        """
+        return None
+
+    @property
+    def json_codec(self) -> JSONCodec:
+        """The codec used to encode the requests made by this object and to decode the responses
+        of the Bot API. :meth:`telegram.TelegramObject.to_json` uses the codec of the
+        :attr:`~telegram.Bot.request` of the bot that the object belongs to.
+
+        The default implementation returns a codec that uses the standard library's :mod:`json`.
+        Subclasses can override this property to use another one.
+
+        .. seealso:: :paramref:`telegram.request.HTTPXRequest.json_codec`
+
+        .. versionadded:: NEXT.VERSION
+
+        Returns:
+            :class:`telegram.request.JSONCodec`: The codec.
+        """
+        return DEFAULT_JSON_CODEC
+
+    def _circuit_guard(self) -> AbstractContextManager[None]:
+        if (breaker := self.circuit_breaker) is None:
+            return nullcontext()
+        return breaker.guard(is_failure=_is_server_failure)
+
     @abc.abstractmethod
     async def initialize(self) -> None:
         """Initialize resources used by this class. Must be implemented by a subclass."""
@@ -204,7 +273,7 @@ class BaseRequest(
             connect_timeout=connect_timeout,
             pool_timeout=pool_timeout,
         )
-        json_data = self.parse_json_payload(result)
+        json_data = self._parse_json_payload(result)
         # For successful requests, the results are in the 'result' entry
         # see https://core.telegram.org/bots/api#making-requests
         return json_data["result"]
@@ -256,6 +325,92 @@ class BaseRequest(
             pool_timeout=pool_timeout,
         )
 
+    @final
+    async def retrieve_stream(
+        self,
+        url: str,
+        chunk_size: Optional[int] = None,
+        offset: int = 0,
+        read_timeout: ODVInput[float] = DEFAULT_NONE,
+        write_timeout: ODVInput[float] = DEFAULT_NONE,
+        connect_timeout: ODVInput[float] = DEFAULT_NONE,
+        pool_timeout: ODVInput[float] = DEFAULT_NONE,
+    ) -> AsyncGenerator[bytes, None]:
+        """Retrieve the contents of a file by its URL chunk by chunk. In contrast to
+        :meth:`retrieve`, the contents are never held in memory as a whole, if the implementation
+        supports streaming responses via :meth:`do_stream_request`.
+
+        Warning:
+            This method will be called by the methods of :class:`telegram.File` and should *not*
+            be called manually.
+
+        .. versionadded:: NEXT.VERSION
+
+        Args:
+            url (:obj:`str`): The web location we want to retrieve.
+            chunk_size (:obj:`int`, optional): The maximum size of the yielded chunks in bytes.
+                If not passed, the chunks are yielded as they arrive.
+            offset (:obj:`int`, optional): The number of bytes at the start of the file to skip.
+                If passed, only the rest of the file is requested with a HTTP ``Range`` header.
+                Servers that ignore the header send the complete file, in which case the
+                skipped bytes are dropped while reading. Defaults to ``0``.
+
+                .. versionadded:: NEXT.VERSION
+            read_timeout (:obj:`float` | :obj:`None`, optional): If passed, specifies the maximum
+                amount of time (in seconds) to wait for a response from Telegram's server instead
+                of the time specified during creating of this object. Defaults to
+                :attr:`DEFAULT_NONE`.
+            write_timeout (:obj:`float` | :obj:`None`, optional): If passed, specifies the maximum
+                amount of time (in seconds) to wait for a write operation to complete (in terms of
+                a network socket; i.e. POSTing a request or uploading a file) instead of the time
+                specified during creating of this object. Defaults to :attr:`DEFAULT_NONE`.
+            connect_timeout (:obj:`float` | :obj:`None`, optional): If passed, specifies the
+                maximum amount of time (in seconds) to wait for a connection attempt to a server
+                to succeed instead of the time specified during creating of this object. Defaults
+                to :attr:`DEFAULT_NONE`.
+            pool_timeout (:obj:`float` | :obj:`None`, optional): If passed, specifies the maximum
+                amount of time (in seconds) to wait for a connection to become available instead
+                of the time specified during creating of this object. Defaults to
+                :attr:`DEFAULT_NONE`.
+
+        Yields:
+            :obj:`bytes`: The next chunk of the files contents.
+
+        Raises:
+            TelegramError
+
+        """
+        with self._circuit_guard():
+            try:
+                async with self.do_stream_request(
+                    url=url,
+                    method="GET",
+                    chunk_size=chunk_size,
+                    headers={"Range": f"bytes={offset}-"} if offset else None,
+                    read_timeout=read_timeout,
+                    write_timeout=write_timeout,
+                    connect_timeout=connect_timeout,
+                    pool_timeout=pool_timeout,
+                ) as (code, chunks):
+                    if HTTPStatus.OK <= code <= 299:
+                        # Anything but 206 Partial Content means that the range was ignored
+                        skip = offset if code != HTTPStatus.PARTIAL_CONTENT else 0
+                        async for chunk in chunks:
+                            if skip >= len(chunk):
+                                skip -= len(chunk)
+                                continue
+                            yield chunk[skip:] if skip else chunk
+                            skip = 0
+                        return
+                    # error responses are small, so we can afford to read them in full
+                    payload = b"".join([chunk async for chunk in chunks])
+            except TelegramError:
+                raise
+            except Exception as exc:
+                raise NetworkError(f"Unknown error in HTTP implementation: {exc!r}") from exc
+
+            self._raise_for_error_response(code, payload)
+
     async def _request_wrapper(
         self,
         url: str,
@@ -301,26 +456,42 @@ class BaseRequest(
             TelegramError
 
         """
-        try:
-            code, payload = await self.do_request(
-                url=url,
-                method=method,
-                request_data=request_data,
-                read_timeout=read_timeout,
-                write_timeout=write_timeout,
-                connect_timeout=connect_timeout,
-                pool_timeout=pool_timeout,
-            )
-        except TelegramError:
-            raise
-        except Exception as exc:
-            raise NetworkError(f"Unknown error in HTTP implementation: {exc!r}") from exc
+        if request_data is not None:
+            request_data.json_codec = self.json_codec
+
+        with self._circuit_guard():
+            try:
+                code, payload = await self.do_request(
+                    url=url,
+                    method=method,
+                    request_data=request_data,
+                    read_timeout=read_timeout,
+                    write_timeout=write_timeout,
+                    connect_timeout=connect_timeout,
+                    pool_timeout=pool_timeout,
+                )
+            except TelegramError:
+                raise
+            except Exception as exc:
+                raise NetworkError(f"Unknown error in HTTP implementation: {exc!r}") from exc
 
-        if HTTPStatus.OK <= code <= 299:
             # 200-299 range are HTTP success statuses
             # starting with Py 3.12 we can use `HTTPStatus.is_success`
+            if not HTTPStatus.OK <= code <= 299:
+                self._raise_for_error_response(code, payload)
             return payload
 
+    def _raise_for_error_response(self, code: int, payload: bytes) -> NoReturn:
+        """Raises the exception matching an unsuccessful response of the Bot API.
+
+        Args:
+            code (:obj:`int`): The HTTP status code of the response.
+            payload (:obj:`bytes`): The payload part of the response.
+
+        Raises:
+            TelegramError
+
+        """
         try:
             message = f"{HTTPStatus(code).phrase} ({code})"
         except ValueError:
@@ -329,7 +500,7 @@ class BaseRequest(
         parsing_exception: Optional[TelegramError] = None
 
         try:
-            response_data = self.parse_json_payload(payload)
+            response_data = self._parse_json_payload(payload)
         except TelegramError as exc:
             message += f". Parsing the server response {payload!r} failed"
             parsing_exception = exc
@@ -383,6 +554,13 @@ class BaseRequest(
             ``errors="replace"`` in :meth:`bytes.decode`.
             You can override it to customize either of these behaviors.
 
+        Note:
+            Unless this method is overridden, responses of the Bot API are decoded with
+            :meth:`telegram.request.JSONCodec.loads` of :attr:`json_codec` instead.
+
+        .. versionchanged:: NEXT.VERSION
+            Responses are decoded with :attr:`json_codec` unless this method is overridden.
+
         Args:
             payload (:obj:`bytes`): The UTF-8 encoded JSON payload as returned by Telegram.
 
@@ -399,6 +577,25 @@ class BaseRequest(
             _LOGGER.exception('Can not load invalid JSON data: "%s"', decoded_s)
             raise TelegramError("Invalid server response") from exc
 
+    def _parse_json_payload(self, payload: bytes) -> JSONDict:
+        # Subclasses that customize the parsing keep doing so
+        if type(self).parse_json_payload is not BaseRequest.parse_json_payload:
+            return self.parse_json_payload(payload)
+
+        codec = self.json_codec
+        # Only decode to str if the codec can not handle the raw bytes, e.g. invalid UTF-8
+        try:
+            return codec.loads(payload)
+        except ValueError:
+            pass
+
+        decoded_s = payload.decode(TextEncoding.UTF_8, "replace")
+        try:
+            return codec.loads(decoded_s)
+        except ValueError as exc:
+            _LOGGER.exception('Can not load invalid JSON data: "%s"', decoded_s)
+            raise TelegramError("Invalid server response") from exc
+
     @abc.abstractmethod
     async def do_request(
         self,
@@ -442,3 +639,67 @@ class BaseRequest(
             tuple[:obj:`int`, :obj:`bytes`]: The HTTP return code & the payload part of the server
             response.
         """
+
+    @asynccontextmanager
+    async def do_stream_request(
+        self,
+        url: str,
+        method: str,
+        chunk_size: Optional[int] = None,
+        headers: Optional[dict[str, str]] = None,
+        read_timeout: ODVInput[float] = DEFAULT_NONE,
+        write_timeout: ODVInput[float] = DEFAULT_NONE,
+        connect_timeout: ODVInput[float] = DEFAULT_NONE,
+        pool_timeout: ODVInput[float] = DEFAULT_NONE,
+    ) -> AsyncIterator[tuple[int, AsyncIterator[bytes]]]:
+        """Makes a request to the Bot API and streams the response. Can be implemented by a
+        subclass that supports streaming responses. The default implementation calls
+        :meth:`do_request` and yields its payload in chunks, i.e. the response is still held in
+        memory as a whole, and ignores :paramref:`headers`.
+
+        Warning:
+            This method will be called by :meth:`retrieve_stream`. It should *not* be called
+            manually.
+
+        .. versionadded:: NEXT.VERSION
+
+        Args:
+            url (:obj:`str`): The URL to request.
+            method (:obj:`str`): HTTP method (i.e. ``'POST'``, ``'GET'``, etc.).
+            chunk_size (:obj:`int`, optional): The maximum size of the yielded chunks in bytes.
+                If not passed, the chunks should be yielded as they arrive.
+            headers (dict[:obj:`str`, :obj:`str`], optional): Additional HTTP headers to send,
+                e.g. a ``Range`` header to request only a part of the file.
+            read_timeout (:obj:`float` | :obj:`None`, optional): If passed, specifies the maximum
+                amount of time (in seconds) to wait for a response from Telegram's server instead
+                of the time specified during creating of this object. Defaults to
+                :attr:`DEFAULT_NONE`.
+            write_timeout (:obj:`float` | :obj:`None`, optional): If passed, specifies the maximum
+                amount of time (in seconds) to wait for a write operation to complete (in terms of
+                a network socket; i.e. POSTing a request or uploading a file) instead of the time
+                specified during creating of this object. Defaults to :attr:`DEFAULT_NONE`.
+            connect_timeout (:obj:`float` | :obj:`None`, optional): If passed, specifies the
+                maximum amount of time (in seconds) to wait for a connection attempt to a server
+                to succeed instead of the time specified during creating of this object. Defaults
+                to :attr:`DEFAULT_NONE`.
+            pool_timeout (:obj:`float` | :obj:`None`, optional): If passed, specifies the maximum
+                amount of time (in seconds) to wait for a connection to become available instead
+                of the time specified during creating of this object. Defaults to
+                :attr:`DEFAULT_NONE`.
+
+        Returns:
+            An asynchronous context manager that yields the HTTP return code and an asynchronous
+            iterator over the payload part of the server response. The response must only be
+            consumed while the context is active.
+        """
+        if headers:
+            _LOGGER.debug("%s can not send the headers %s", type(self).__name__, headers)
+        code, payload = await self.do_request(
+            url=url,
+            method=method,
+            read_timeout=read_timeout,
+            write_timeout=write_timeout,
+            connect_timeout=connect_timeout,
+            pool_timeout=pool_timeout,
+        )
+        yield code, _iter_chunks(payload, chunk_size)
@@ -0,0 +1,352 @@
+#!/usr/bin/env python
+#
+# A library that provides a Python interface to the Telegram Bot API
+# Copyright (C) 2015-2025
+# Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser Public License for more details.
+#
+# You should have received a copy of the GNU Lesser Public License
+# along with this program.  If not, see [http://www.gnu.org/licenses/].
+"""This module contains a circuit breaker that stops requests to a failing server."""
+
+import contextlib
+import time
+from collections import deque
+from collections.abc import Iterator
+from typing import Callable, Final, Optional
+
+from telegram._utils.logging import get_logger
+from telegram._utils.repr import build_repr_with_selected_attrs
+from telegram.error import CircuitBreakerOpen
+
+_LOGGER = get_logger(__name__, class_name="CircuitBreaker")
+
+
+class CircuitBreaker:
+    """A circuit breaker that makes requests fail fast while the server they go to is failing,
+    instead of having every caller wait for its own timeout.
+
+    The breaker starts out :attr:`CLOSED`, where all requests are made. It switches to
+    :attr:`OPEN`, if either
+
+    * :paramref:`failure_threshold` requests in a row failed or
+    * at least :paramref:`minimum_calls` requests were made within the last
+      :paramref:`window` seconds and the share of failed requests among them reached
+      :paramref:`error_rate_threshold`.
+
+    While open, :meth:`before_call` raises :exc:`telegram.error.CircuitBreakerOpen` without a
+    request being made. After :paramref:`recovery_timeout` seconds, the breaker becomes
+    :attr:`HALF_OPEN` and lets up to :paramref:`half_open_max_calls` requests through as probes.
+    The first successful probe closes the breaker, the first failed probe opens it again.
+
+    State changes are logged and passed to :paramref:`on_state_change`, which can e.g. be used
+    to update metrics.
+
+    The breaker is usually passed to :paramref:`telegram.request.HTTPXRequest.circuit_breaker`,
+    but can also protect calls to other servers with :meth:`guard`:
+
+    .. code:: python
+
+        breaker = CircuitBreaker(name="my_api")
+
+        with breaker.guard():
+            await call_my_api()
+
+    Note:
+        This class is not thread safe. All calls should happen in the same event loop.
+
+    .. versionadded:: NEXT.VERSION
+
+    Args:
+        failure_threshold (:obj:`int`, optional): The number of consecutive failed requests
+            after which the breaker opens. Defaults to ``5``.
+        error_rate_threshold (:obj:`float` | :obj:`None`, optional): The share of failed
+            requests within :paramref:`window` between ``0`` and ``1`` at which the breaker
+            opens. Pass :obj:`None` to only open after consecutive failures. Defaults to ``0.5``.
+        minimum_calls (:obj:`int`, optional): The number of requests that must have been made
+            within :paramref:`window` before :paramref:`error_rate_threshold` is applied.
+            Defaults to ``20``.
+        window (:obj:`float`, optional): The length in seconds of the sliding window in which
+            the error rate is measured. Defaults to ``60``.
+        recovery_timeout (:obj:`float`, optional): The number of seconds the breaker stays open
+            before it lets probe requests through. Defaults to ``30``.
+        half_open_max_calls (:obj:`int`, optional): The maximum number of probe requests that
+            may run concurrently while the breaker is half-open. Defaults to ``1``.
+        name (:obj:`str`, optional): A name for the breaker that is used in log messages and
+            error messages. Defaults to ``"default"``.
+        on_state_change (Callable[[:class:`CircuitBreaker`, :obj:`str`, :obj:`str`], \
+            :obj:`object`], optional): Called with the breaker, the old state and the new state
+            whenever the state changes. Exceptions raised by the callback are logged and
+            otherwise ignored.
+
+    Raises:
+        :exc:`ValueError`: If one of the arguments is out of range.
+    """
+
+    CLOSED: Final[str] = "closed"
+    """:obj:`str`: The state in which all requests are made."""
+    OPEN: Final[str] = "open"
+    """:obj:`str`: The state in which all requests fail fast."""
+    HALF_OPEN: Final[str] = "half_open"
+    """:obj:`str`: The state in which a limited number of probe requests are made."""
+
+    __slots__ = (
+        "_consecutive_failures",
+        "_error_rate_threshold",
+        "_failure_threshold",
+        "_half_open_calls",
+        "_half_open_max_calls",
+        "_minimum_calls",
+        "_name",
+        "_on_state_change",
+        "_opened_at",
+        "_outcomes",
+        "_recovery_timeout",
+        "_rejected_calls",
+        "_state",
+        "_window",
+        "_window_failures",
+    )
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        error_rate_threshold: Optional[float] = 0.5,
+        minimum_calls: int = 20,
+        window: float = 60.0,
+        recovery_timeout: float = 30.0,
+        half_open_max_calls: int = 1,
+        name: str = "default",
+        on_state_change: Optional[Callable[["CircuitBreaker", str, str], object]] = None,
+    ):
+        if failure_threshold < 1 or minimum_calls < 1 or half_open_max_calls < 1:
+            raise ValueError(
+                "`failure_threshold`, `minimum_calls` and `half_open_max_calls` must be at "
+                "least 1!"
+            )
+        if error_rate_threshold is not None and not 0 < error_rate_threshold <= 1:
+            raise ValueError("`error_rate_threshold` must be greater than 0 and at most 1!")
+        if window <= 0 or recovery_timeout < 0:
+            raise ValueError("`window` must be positive and `recovery_timeout` not negative!")
+
+        self._failure_threshold: int = failure_threshold
+        self._error_rate_threshold: Optional[float] = error_rate_threshold
+        self._minimum_calls: int = minimum_calls
+        self._window: float = window
+        self._recovery_timeout: float = recovery_timeout
+        self._half_open_max_calls: int = half_open_max_calls
+        self._name: str = name
+        self._on_state_change: Optional[Callable[[CircuitBreaker, str, str], object]] = (
+            on_state_change
+        )
+
+        self._state: str = self.CLOSED
+        self._opened_at: float = 0.0
+        self._consecutive_failures: int = 0
+        self._half_open_calls: int = 0
+        self._rejected_calls: int = 0
+        # (time, failed) of the requests that finished within the window, oldest first
+        self._outcomes: deque[tuple[float, bool]] = deque()
+        self._window_failures: int = 0
+
+    def __repr__(self) -> str:
+        """Give a string representation of the breaker in the form
+        ``CircuitBreaker[name=..., state=...]``.
+
+        Returns:
+            :obj:`str`
+        """
+        return build_repr_with_selected_attrs(self, name=self._name, state=self.state)
+
+    @property
+    def name(self) -> str:
+        """:obj:`str`: The name of the breaker."""
+        return self._name
+
+    @property
+    def failure_threshold(self) -> int:
+        """:obj:`int`: The number of consecutive failed requests after which the breaker
+        opens."""
+        return self._failure_threshold
+
+    @property
+    def error_rate_threshold(self) -> Optional[float]:
+        """:obj:`float` | :obj:`None`: The share of failed requests within :attr:`window` at
+        which the breaker opens."""
+        return self._error_rate_threshold
+
+    @property
+    def minimum_calls(self) -> int:
+        """:obj:`int`: The number of requests within :attr:`window` before
+        :attr:`error_rate_threshold` is applied."""
+        return self._minimum_calls
+
+    @property
+    def window(self) -> float:
+        """:obj:`float`: The length in seconds of the window in which the error rate is
+        measured."""
+        return self._window
+
+    @property
+    def recovery_timeout(self) -> float:
+        """:obj:`float`: The number of seconds the breaker stays open before probing."""
+        return self._recovery_timeout
+
+    @property
+    def half_open_max_calls(self) -> int:
+        """:obj:`int`: The maximum number of concurrent probe requests while half-open."""
+        return self._half_open_max_calls
+
+    @property
+    def state(self) -> str:
+        """:obj:`str`: The current state, one of :attr:`CLOSED`, :attr:`OPEN` and
+        :attr:`HALF_OPEN`. An open breaker becomes half-open when this is accessed after
+        :attr:`recovery_timeout` has passed.
+        """
+        if (
+            self._state == self.OPEN
+            and time.monotonic() - self._opened_at >= self._recovery_timeout
+        ):
+            self._set_state(self.HALF_OPEN, "Recovery timeout passed")
+        return self._state
+
+    @property
+    def rejected_calls(self) -> int:
+        """:obj:`int`: The total number of requests that failed fast since the breaker was
+        created."""
+        return self._rejected_calls
+
+    def _set_state(self, state: str, reason: str) -> None:
+        old_state = self._state
+        self._state = state
+        self._consecutive_failures = 0
+        self._half_open_calls = 0
+        self._outcomes.clear()
+        self._window_failures = 0
+
+        if state == self.OPEN:
+            self._opened_at = time.monotonic()
+            _LOGGER.warning(
+                "Circuit breaker %r opened: %s. Requests will fail for %s seconds.",
+                self._name,
+                reason,
+                self._recovery_timeout,
+            )
+        else:
+            _LOGGER.info("Circuit breaker %r is now %s: %s.", self._name, state, reason)
+
+        if self._on_state_change is not None:
+            try:
+                self._on_state_change(self, old_state, state)
+            except Exception:
+                _LOGGER.exception("Error in the state change callback of circuit breaker.")
+
+    def _reject(self, message: str) -> CircuitBreakerOpen:
+        self._rejected_calls += 1
+        return CircuitBreakerOpen(f"Circuit breaker {self._name!r} is {message}.")
+
+    def before_call(self) -> None:
+        """Must be called before each request. Each call must be followed by exactly one call
+        of :meth:`record_success`, :meth:`record_failure` or :meth:`release`, once the request
+        is finished. :meth:`guard` takes care of this.
+
+        Raises:
+            :exc:`telegram.error.CircuitBreakerOpen`: If the request must not be made.
+        """
+        state = self.state
+        if state == self.OPEN:
+            remaining = self._recovery_timeout - (time.monotonic() - self._opened_at)
+            raise self._reject(f"open. Retry in {remaining:.1f} seconds")
+        if state == self.HALF_OPEN:
+            if self._half_open_calls >= self._half_open_max_calls:
+                raise self._reject("half-open and waiting for the result of a probe request")
+            self._half_open_calls += 1
+
+    def record_success(self) -> None:
+        """Records that a request finished successfully."""
+        if self._state == self.HALF_OPEN:
+            self._set_state(self.CLOSED, "Probe request succeeded")
+            return
+        if self._state == self.CLOSED:
+            self._consecutive_failures = 0
+            self._add_outcome(failed=False)
+
+    def record_failure(self) -> None:
+        """Records that a request failed."""
+        if self._state == self.HALF_OPEN:
+            self._set_state(self.OPEN, "Probe request failed")
+            return
+        if self._state != self.CLOSED:
+            # A request that was started before the breaker opened
+            return
+
+        self._consecutive_failures += 1
+        self._add_outcome(failed=True)
+
+        if self._consecutive_failures >= self._failure_threshold:
+            self._set_state(self.OPEN, f"{self._consecutive_failures} consecutive failures")
+        elif (
+            self._error_rate_threshold is not None
+            and len(self._outcomes) >= self._minimum_calls
+            and self._window_failures / len(self._outcomes) >= self._error_rate_threshold
+        ):
+            self._set_state(
+                self.OPEN,
+                f"{self._window_failures} of {len(self._outcomes)} requests failed within "
+                f"{self._window} seconds",
+            )
+
+    def release(self) -> None:
+        """Records that a request ended without a result, e.g. because it was cancelled."""
+        if self._state == self.HALF_OPEN and self._half_open_calls > 0:
+            self._half_open_calls -= 1
+
+    def _add_outcome(self, failed: bool) -> None:
+        now = time.monotonic()
+        self._outcomes.append((now, failed))
+        self._window_failures += failed
+        while self._outcomes and self._outcomes[0][0] <= now - self._window:
+            self._window_failures -= self._outcomes.popleft()[1]
+
+    @contextlib.contextmanager
+    def guard(self, is_failure: Optional[Callable[[Exception], bool]] = None) -> Iterator[None]:
+        """Context manager that wraps a single request. It calls :meth:`before_call` on entry
+        and records the outcome on exit:
+
+        * Leaving the block normally counts as success.
+        * An :exc:`Exception` counts as failure if :paramref:`is_failure` returns :obj:`True`
+          for it and as success otherwise, because the server did respond.
+        * Other exceptions, like :exc:`asyncio.CancelledError`, are not counted.
+
+        The exception is re-raised in any case.
+
+        Args:
+            is_failure (Callable[[:exc:`Exception`], :obj:`bool`], optional): Decides whether an
+                exception raised in the block means that the server is failing. By default,
+                every exception counts as failure.
+
+        Raises:
+            :exc:`telegram.error.CircuitBreakerOpen`: If the request must not be made.
+        """
+        self.before_call()
+        try:
+            yield
+        except Exception as exc:
+            if is_failure is None or is_failure(exc):
+                self.record_failure()
+            else:
+                self.record_success()
+            raise
+        except BaseException:
+            self.release()
+            raise
+        self.record_success()
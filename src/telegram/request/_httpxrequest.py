@@ -18,7 +18,8 @@
 # along with this program.  If not, see [http://www.gnu.org/licenses/].
 """This module contains methods to make POST and GET requests using the httpx library."""
 
-from collections.abc import Collection
+from collections.abc import AsyncIterator, Collection
+from contextlib import asynccontextmanager
 from typing import Any, Optional, Union
 
 import httpx
@@ -26,8 +27,11 @@ import httpx
 from telegram._utils.defaultvalue import DefaultValue
 from telegram._utils.logging import get_logger
 from telegram._utils.types import HTTPVersion, ODVInput, SocketOpt
-from telegram.error import NetworkError, TimedOut
+from telegram.error import NetworkError, TelegramError, TimedOut
 from telegram.request._baserequest import BaseRequest
+from telegram.request._circuitbreaker import CircuitBreaker
+from telegram.request._jsoncodec import DEFAULT_JSON_CODEC, JSONCodec
+from telegram.request._multipart import DEFAULT_CHUNK_SIZE, MultipartStream
 from telegram.request._requestdata import RequestData
 
 # Note to future devs:
@@ -137,10 +141,55 @@ class HTTPXRequest(BaseRequest):
                 way.
 
             .. versionadded:: 21.6
+        json_body (:obj:`bool`, optional): If :obj:`True`, requests that do not upload any files
+            are sent with the content type ``application/json`` and
+            :attr:`telegram.request.RequestData.json_payload` as body. Otherwise, and for all
+            requests that upload files, the parameters are sent as form data. Defaults to
+            :obj:`False`.
+
+            Tip:
+                Sending JSON bodies avoids encoding nested parameters like ``reply_markup`` or
+                ``entities`` into separate JSON strings that are then URL-encoded again, which
+                reduces both the CPU time for encoding and the size of the request.
+
+            .. versionadded:: NEXT.VERSION
+        upload_chunk_size (:obj:`int`, optional): The size of the chunks in bytes in which files
+            are read while they are uploaded. Applies to files that are not passed to
+            :class:`telegram.InputFile` as :obj:`bytes`, i.e. file handles with
+            :paramref:`~telegram.InputFile.read_file_handle` set to :obj:`False`, paths and
+            asynchronous iterables. The request body for these is encoded while it is being sent,
+            such that uploading them does not hold their content in memory as a whole. Defaults to
+            ``65536`` (64 KiB).
+
+            .. versionadded:: NEXT.VERSION
+        circuit_breaker (:class:`telegram.request.CircuitBreaker`, optional): A circuit breaker
+            that makes requests fail fast with :exc:`telegram.error.CircuitBreakerOpen` while
+            Telegram is failing, instead of having each of them wait for its timeout. The same
+            breaker can be shared by several request objects. Defaults to :obj:`None`.
+
+            .. versionadded:: NEXT.VERSION
+        json_codec (:class:`telegram.request.JSONCodec`, optional): The codec used to encode the
+            request parameters and to decode the responses of Telegram. Defaults to a codec that
+            uses the standard library :mod:`json` module.
+
+            .. versionadded:: NEXT.VERSION
 
     """
 
-    __slots__ = ("_client", "_client_kwargs", "_http_version", "_media_write_timeout")
+    __slots__ = (
+        "_circuit_breaker",
+        "_client",
+        "_client_kwargs",
+        "_http_version",
+        "_in_flight",
+        "_json_body",
+        "_json_codec",
+        "_max_in_flight",
+        "_media_write_timeout",
+        "_pool_timeouts",
+        "_requests",
+        "_upload_chunk_size",
+    )
 
     def __init__(
         self,
@@ -154,9 +203,24 @@ class HTTPXRequest(BaseRequest):
         proxy: Optional[Union[str, httpx.Proxy, httpx.URL]] = None,
         media_write_timeout: Optional[float] = 20.0,
         httpx_kwargs: Optional[dict[str, Any]] = None,
+        json_body: bool = False,
+        upload_chunk_size: int = DEFAULT_CHUNK_SIZE,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        json_codec: Optional[JSONCodec] = None,
     ):
+        if upload_chunk_size < 1:
+            raise ValueError("`upload_chunk_size` must be a positive integer.")
+
         self._http_version = http_version
+        self._json_body = json_body
+        self._upload_chunk_size = upload_chunk_size
+        self._circuit_breaker = circuit_breaker
+        self._json_codec = json_codec or DEFAULT_JSON_CODEC
         self._media_write_timeout = media_write_timeout
+        self._in_flight = 0
+        self._max_in_flight = 0
+        self._requests = 0
+        self._pool_timeouts = 0
         timeout = httpx.Timeout(
             connect=connect_timeout,
             read=read_timeout,
@@ -223,6 +287,75 @@ class HTTPXRequest(BaseRequest):
         """
         return self._client.timeout.read
 
+    @property
+    def circuit_breaker(self) -> Optional[CircuitBreaker]:
+        """See :attr:`BaseRequest.circuit_breaker`.
+
+        .. versionadded:: NEXT.VERSION
+
+        Returns:
+            :class:`telegram.request.CircuitBreaker` | :obj:`None`: The circuit breaker as passed
+                to :paramref:`HTTPXRequest.circuit_breaker`.
+        """
+        return self._circuit_breaker
+
+    @property
+    def json_codec(self) -> JSONCodec:
+        """See :attr:`BaseRequest.json_codec`.
+
+        .. versionadded:: NEXT.VERSION
+
+        Returns:
+            :class:`telegram.request.JSONCodec`: The codec as passed to
+                :paramref:`HTTPXRequest.json_codec`.
+        """
+        return self._json_codec
+
+    @property
+    def json_body(self) -> bool:
+        """:obj:`bool`: Whether requests without files are sent as JSON body. See
+        :paramref:`json_body`.
+
+        .. versionadded:: NEXT.VERSION
+        """
+        return self._json_body
+
+    @property
+    def upload_chunk_size(self) -> int:
+        """:obj:`int`: The size of the chunks in which files are read while they are uploaded.
+        See :paramref:`upload_chunk_size`.
+
+        .. versionadded:: NEXT.VERSION
+        """
+        return self._upload_chunk_size
+
+    @property
+    def stats(self) -> dict[str, Optional[float]]:
+        """Utilisation statistics of the connection pool of this instance. Contains the keys
+
+        * ``"connection_pool_size"``: The maximum number of connections, :obj:`None` if unlimited.
+        * ``"in_flight"``: The number of requests currently being made.
+        * ``"max_in_flight"``: The highest value of ``"in_flight"`` observed so far.
+        * ``"utilisation"``: ``"in_flight"`` divided by ``"connection_pool_size"``.
+        * ``"requests"``: The number of requests made so far, including failed ones.
+        * ``"pool_timeouts"``: The number of requests that failed, because no connection was
+          available within the pool timeout.
+
+        .. versionadded:: NEXT.VERSION
+
+        Returns:
+            dict[:obj:`str`, :obj:`int` | :obj:`float` | :obj:`None`]
+        """
+        pool_size = self._client_kwargs["limits"].max_connections
+        return {
+            "connection_pool_size": pool_size,
+            "in_flight": self._in_flight,
+            "max_in_flight": self._max_in_flight,
+            "utilisation": self._in_flight / pool_size if pool_size else 0.0,
+            "requests": self._requests,
+            "pool_timeouts": self._pool_timeouts,
+        }
+
     def _build_client(self) -> httpx.AsyncClient:
         return httpx.AsyncClient(**self._client_kwargs)
 
@@ -255,7 +388,111 @@ class HTTPXRequest(BaseRequest):
 
         files = request_data.multipart_data if request_data else None
         data = request_data.json_parameters if request_data else None
+        # httpx can only encode files that are in memory, the others are streamed by us
+        in_memory_files = {
+            name: (filename, content, mimetype)
+            for name, (filename, content, mimetype) in (files or {}).items()
+            if isinstance(content, bytes)
+        }
+
+        timeout = self._build_timeout(
+            read_timeout=read_timeout,
+            write_timeout=write_timeout,
+            connect_timeout=connect_timeout,
+            pool_timeout=pool_timeout,
+            has_files=bool(files),
+        )
 
+        self._requests += 1
+        self._in_flight += 1
+        self._max_in_flight = max(self._max_in_flight, self._in_flight)
+        try:
+            if self._json_body and request_data and not files:
+                res = await self._client.request(
+                    method=method,
+                    url=url,
+                    headers={"User-Agent": self.USER_AGENT, "Content-Type": "application/json"},
+                    timeout=timeout,
+                    content=request_data.json_payload,
+                )
+            elif files and len(in_memory_files) < len(files):
+                stream = MultipartStream(data or {}, files, self._upload_chunk_size)
+                headers = {"User-Agent": self.USER_AGENT, "Content-Type": stream.content_type}
+                if stream.content_length is not None:
+                    headers["Content-Length"] = str(stream.content_length)
+                res = await self._client.request(
+                    method=method,
+                    url=url,
+                    headers=headers,
+                    timeout=timeout,
+                    content=stream,
+                )
+            else:
+                res = await self._client.request(
+                    method=method,
+                    url=url,
+                    headers={"User-Agent": self.USER_AGENT},
+                    timeout=timeout,
+                    files=in_memory_files or None,
+                    data=data,
+                )
+        except httpx.HTTPError as err:
+            raise self._convert_error(err) from err
+        finally:
+            self._in_flight -= 1
+
+        return res.status_code, res.content
+
+    @asynccontextmanager
+    async def do_stream_request(
+        self,
+        url: str,
+        method: str,
+        chunk_size: Optional[int] = None,
+        headers: Optional[dict[str, str]] = None,
+        read_timeout: ODVInput[float] = BaseRequest.DEFAULT_NONE,
+        write_timeout: ODVInput[float] = BaseRequest.DEFAULT_NONE,
+        connect_timeout: ODVInput[float] = BaseRequest.DEFAULT_NONE,
+        pool_timeout: ODVInput[float] = BaseRequest.DEFAULT_NONE,
+    ) -> AsyncIterator[tuple[int, AsyncIterator[bytes]]]:
+        """See :meth:`BaseRequest.do_stream_request`."""
+        if self._client.is_closed:
+            raise RuntimeError("This HTTPXRequest is not initialized!")
+
+        timeout = self._build_timeout(
+            read_timeout=read_timeout,
+            write_timeout=write_timeout,
+            connect_timeout=connect_timeout,
+            pool_timeout=pool_timeout,
+            has_files=False,
+        )
+
+        self._requests += 1
+        self._in_flight += 1
+        self._max_in_flight = max(self._max_in_flight, self._in_flight)
+        try:
+            async with self._client.stream(
+                method=method,
+                url=url,
+                headers={"User-Agent": self.USER_AGENT, **(headers or {})},
+                timeout=timeout,
+            ) as res:
+                # Errors while reading the body are raised at the `yield`, so they are converted
+                # just like the ones raised while sending the request
+                yield res.status_code, res.aiter_bytes(chunk_size=chunk_size)
+        except httpx.HTTPError as err:
+            raise self._convert_error(err) from err
+        finally:
+            self._in_flight -= 1
+
+    def _build_timeout(
+        self,
+        read_timeout: ODVInput[float],
+        write_timeout: ODVInput[float],
+        connect_timeout: ODVInput[float],
+        pool_timeout: ODVInput[float],
+        has_files: bool,
+    ) -> httpx.Timeout:
         # If user did not specify timeouts (for e.g. in a bot method), use the default ones when we
         # created this instance.
         if isinstance(read_timeout, DefaultValue):
@@ -266,40 +503,32 @@ class HTTPXRequest(BaseRequest):
             pool_timeout = self._client.timeout.pool
 
         if isinstance(write_timeout, DefaultValue):
-            write_timeout = self._client.timeout.write if not files else self._media_write_timeout
+            write_timeout = (
+                self._client.timeout.write if not has_files else self._media_write_timeout
+            )
 
-        timeout = httpx.Timeout(
+        return httpx.Timeout(
             connect=connect_timeout,
             read=read_timeout,
             write=write_timeout,
             pool=pool_timeout,
         )
 
-        try:
-            res = await self._client.request(
-                method=method,
-                url=url,
-                headers={"User-Agent": self.USER_AGENT},
-                timeout=timeout,
-                files=files,
-                data=data,
-            )
-        except httpx.TimeoutException as err:
+    def _convert_error(self, err: httpx.HTTPError) -> TelegramError:
+        if isinstance(err, httpx.TimeoutException):
             if isinstance(err, httpx.PoolTimeout):
-                raise TimedOut(
+                self._pool_timeouts += 1
+                return TimedOut(
                     message=(
                         "Pool timeout: All connections in the connection pool are occupied. "
                         "Request was *not* sent to Telegram. Consider adjusting the connection "
                         "pool size or the pool timeout."
                     )
-                ) from err
-            raise TimedOut from err
-        except httpx.HTTPError as err:
-            # HTTPError must come last as its the base httpx exception class
-            # TODO p4: do something smart here; for now just raise NetworkError
+                )
+            return TimedOut()
 
-            # We include the class name for easier debugging. Especially useful if the error
-            # message of `err` is empty.
-            raise NetworkError(f"httpx.{err.__class__.__name__}: {err}") from err
+        # TODO p4: do something smart here; for now just raise NetworkError
 
-        return res.status_code, res.content
+        # We include the class name for easier debugging. Especially useful if the error
+        # message of `err` is empty.
+        return NetworkError(f"httpx.{err.__class__.__name__}: {err}")
@@ -0,0 +1,176 @@
+#!/usr/bin/env python
+#
+# A library that provides a Python interface to the Telegram Bot API
+# Copyright (C) 2015-2025
+# Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser Public License for more details.
+#
+# You should have received a copy of the GNU Lesser Public License
+# along with this program.  If not, see [http://www.gnu.org/licenses/].
+"""This module contains the JSONCodec class used for encoding and decoding data exchanged with
+the Bot API."""
+
+import json
+from typing import Any, Callable, Final, Optional, Union
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import msgspec
+
+    MSGSPEC_AVAILABLE = True
+except ImportError:
+    MSGSPEC_AVAILABLE = False
+
+from telegram._utils.logging import get_logger
+
+_LOGGER = get_logger(__name__, class_name="JSONCodec")
+
+
+def _stdlib_dumps_bytes(obj: object) -> bytes:
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+class JSONCodec:
+    """Encodes and decodes JSON data exchanged with the Bot API.
+
+    The codec of a bot is the :attr:`~telegram.request.BaseRequest.json_codec` of its
+    :attr:`~telegram.Bot.request` objects. It is used by
+    :attr:`telegram.request.RequestData.json_parameters`,
+    :attr:`telegram.request.RequestData.json_payload`,
+    :meth:`telegram.request.BaseRequest.parse_json_payload`,
+    :meth:`telegram.TelegramObject.to_json` and the webhook server of
+    :class:`telegram.ext.Updater`. By default, the standard library's :mod:`json` is used. Use
+    :meth:`telegram.ext.ApplicationBuilder.json_codec` to switch to a faster library.
+
+    Values that the selected library can not handle, e.g. integers that exceed 64 bit for
+    `orjson <https://github.com/ijl/orjson>`_, are transparently handled by :mod:`json` instead.
+    Data that can not be decoded raises a :exc:`ValueError` regardless of the library.
+
+    Note:
+        The output of the third party libraries is equivalent but not necessarily identical to
+        the output of :mod:`json`. For example, :meth:`dumps` does not insert whitespace after
+        separators when using ``"orjson"`` or ``"msgspec"``.
+
+    .. versionadded:: NEXT.VERSION
+
+    Args:
+        backend (:obj:`str`, optional): The library to use. One of ``"json"``, ``"orjson"``,
+            ``"msgspec"`` or ``"auto"``. ``"auto"`` uses the first one of ``"orjson"`` and
+            ``"msgspec"`` that is installed and falls back to ``"json"``. Defaults to ``"json"``.
+
+    Raises:
+        :exc:`ValueError`: If :paramref:`backend` is not one of the supported values.
+        :exc:`RuntimeError`: If the library requested by :paramref:`backend` is not installed.
+
+    Attributes:
+        backend (:obj:`str`): The library in use, i.e. ``"json"``, ``"orjson"`` or
+            ``"msgspec"``. Never ``"auto"``.
+    """
+
+    __slots__ = ("_dumps_bytes", "_loads", "backend")
+
+    BACKENDS: Final[tuple[str, ...]] = ("json", "orjson", "msgspec", "auto")
+    """tuple[:obj:`str`]: The supported values for :paramref:`backend`."""
+
+    def __init__(self, backend: str = "json"):
+        if backend not in self.BACKENDS:
+            raise ValueError(
+                f"Unknown JSON backend {backend!r}. Must be one of {', '.join(self.BACKENDS)}."
+            )
+        if backend == "auto":
+            if ORJSON_AVAILABLE:
+                backend = "orjson"
+            elif MSGSPEC_AVAILABLE:
+                backend = "msgspec"
+            else:
+                backend = "json"
+        elif (backend == "orjson" and not ORJSON_AVAILABLE) or (
+            backend == "msgspec" and not MSGSPEC_AVAILABLE
+        ):
+            raise RuntimeError(f"To use the JSON backend {backend!r}, it must be installed.")
+
+        self.backend: str = backend
+        self._dumps_bytes: Optional[Callable[[Any], bytes]] = None
+        self._loads: Optional[Callable[[Union[str, bytes]], Any]] = None
+        if backend == "orjson":
+            self._dumps_bytes = orjson.dumps
+            self._loads = orjson.loads
+        elif backend == "msgspec":
+            self._dumps_bytes = msgspec.json.encode
+            self._loads = msgspec.json.decode
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(backend={self.backend!r})"
+
+    def dumps(self, obj: object) -> str:
+        """Encodes :paramref:`obj` as JSON string.
+
+        Args:
+            obj (:obj:`object`): The object to encode.
+
+        Returns:
+            :obj:`str`
+        """
+        if self._dumps_bytes is not None:
+            try:
+                return self._dumps_bytes(obj).decode("utf-8")
+            except (TypeError, ValueError, OverflowError):
+                pass
+        return json.dumps(obj)
+
+    def dumps_bytes(self, obj: object) -> bytes:
+        """Encodes :paramref:`obj` as compact, UTF-8 encoded JSON.
+
+        Args:
+            obj (:obj:`object`): The object to encode.
+
+        Returns:
+            :obj:`bytes`
+        """
+        if self._dumps_bytes is not None:
+            try:
+                return self._dumps_bytes(obj)
+            except (TypeError, ValueError, OverflowError):
+                pass
+        return _stdlib_dumps_bytes(obj)
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        """Decodes the JSON document :paramref:`data`.
+
+        Args:
+            data (:obj:`str` | :obj:`bytes`): The JSON document. :obj:`bytes` must be UTF-8
+                encoded.
+
+        Returns:
+            The decoded data.
+
+        Raises:
+            :exc:`ValueError`: If :paramref:`data` is not valid JSON.
+        """
+        if self._loads is not None:
+            try:
+                return self._loads(data)
+            except Exception:  # pylint: disable=broad-exception-caught
+                # msgspec.DecodeError is not a ValueError. Let json decide whether the data is
+                # actually invalid, so that the raised exception is the same for all backends
+                _LOGGER.debug("%s could not decode the data, falling back to json", self.backend)
+        return json.loads(data)
+
+
+DEFAULT_JSON_CODEC: Final[JSONCodec] = JSONCodec()
+"""The codec that is used if no other codec was configured."""
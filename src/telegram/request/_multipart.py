@@ -0,0 +1,191 @@
+#!/usr/bin/env python
+#
+#  A library that provides a Python interface to the Telegram Bot API
+#  Copyright (C) 2015-2025
+#  Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser Public License
+#  along with this program.  If not, see [http://www.gnu.org/licenses/].
+"""This module contains a streaming encoder for multipart/form-data request bodies."""
+
+import contextlib
+import os
+from collections.abc import AsyncIterable, AsyncIterator
+from pathlib import Path
+from typing import IO, Final, Optional, Union
+from uuid import uuid4
+
+from telegram._utils.strings import TextEncoding
+from telegram._utils.types import UploadFileDict
+
+_Content = Union[bytes, memoryview, IO[bytes], Path, AsyncIterable[bytes]]
+
+DEFAULT_CHUNK_SIZE: Final[int] = 64 * 1024
+"""The default size of the chunks in which files are read for uploading."""
+
+_ESCAPES: Final[dict[int, str]] = {
+    ord('"'): "%22",
+    ord("\\"): "\\\\",
+    ord("\r"): "%0D",
+    ord("\n"): "%0A",
+}
+
+
+def _quote(value: str) -> str:
+    # Same escaping as used by browsers and httpx for names and filenames
+    return value.translate(_ESCAPES)
+
+
+def _file_size(content: _Content) -> Optional[int]:
+    """Returns the size of the content in bytes if it can be determined without reading it."""
+    if isinstance(content, bytes):
+        return len(content)
+    if isinstance(content, memoryview):
+        return content.nbytes
+    if isinstance(content, Path):
+        return content.stat().st_size
+    if isinstance(content, AsyncIterable):
+        return None
+    return _file_handle_size(content)
+
+
+def _file_handle_size(file: IO[bytes]) -> Optional[int]:
+    try:
+        return os.fstat(file.fileno()).st_size
+    except (AttributeError, OSError):
+        pass
+    try:
+        if not file.seekable():
+            return None
+        position = file.tell()
+        size = file.seek(0, os.SEEK_END)
+        file.seek(position)
+    except (AttributeError, OSError):
+        return None
+    return size
+
+
+async def _iter_content(content: _Content, chunk_size: int) -> AsyncIterator[bytes]:
+    if isinstance(content, bytes):
+        # Already in memory, so there is nothing to gain from chunking
+        yield content
+    elif isinstance(content, memoryview):
+        # Slicing does not copy, so the transport reads directly from the underlying buffer, e.g.
+        # a memory-mapped file
+        for start in range(0, content.nbytes, chunk_size):
+            yield content[start : start + chunk_size]
+    elif isinstance(content, Path):
+        with content.open("rb") as file:
+            while chunk := file.read(chunk_size):
+                yield chunk
+    elif isinstance(content, AsyncIterable):
+        async for chunk in content:
+            yield chunk
+    else:
+        # Start from the beginning in case the file was already (partially) read, e.g. when a
+        # request is retried
+        with contextlib.suppress(AttributeError, OSError):
+            content.seek(0)
+        while chunk := content.read(chunk_size):
+            yield chunk
+
+
+class MultipartStream:
+    """Encodes parameters and files as multipart/form-data body while it is being sent. Files are
+    read chunk by chunk, such that they are never held in memory as a whole.
+
+    Args:
+        parameters (dict[:obj:`str`, :obj:`str`]): The parameters to send as form fields, as
+            returned by :attr:`telegram.request.RequestData.json_parameters`.
+        files (dict[:obj:`str`, tuple]): The files to send, as returned by
+            :attr:`telegram.request.RequestData.multipart_data`.
+        chunk_size (:obj:`int`, optional): The size of the chunks in which files are read.
+
+    Attributes:
+        content_type (:obj:`str`): The value for the ``Content-Type`` header, including the
+            boundary.
+        content_length (:obj:`int` | :obj:`None`): The size of the body in bytes or :obj:`None`, if
+            it can not be determined in advance. In that case, the body has to be sent with
+            chunked transfer encoding.
+    """
+
+    __slots__ = (
+        "_boundary",
+        "_chunk_size",
+        "_files",
+        "_parameters",
+        "content_length",
+        "content_type",
+    )
+
+    def __init__(
+        self,
+        parameters: dict[str, str],
+        files: UploadFileDict,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ):
+        boundary = uuid4().hex
+        self._boundary: bytes = boundary.encode("ascii")
+        self._chunk_size: int = chunk_size
+        self._parameters: list[tuple[bytes, bytes]] = [
+            (self._parameter_header(name), value.encode(TextEncoding.UTF_8))
+            for name, value in parameters.items()
+        ]
+        self._files: list[tuple[bytes, _Content]] = [
+            (self._file_header(name, filename, mimetype), content)
+            for name, (filename, content, mimetype) in files.items()
+        ]
+        self.content_type: str = f"multipart/form-data; boundary={boundary}"
+        self.content_length: Optional[int] = self._content_length()
+
+    def _parameter_header(self, name: str) -> bytes:
+        return b'--%s\r\nContent-Disposition: form-data; name="%s"\r\n\r\n' % (
+            self._boundary,
+            _quote(name).encode(TextEncoding.UTF_8),
+        )
+
+    def _file_header(self, name: str, filename: str, mimetype: str) -> bytes:
+        return (
+            b'--%s\r\nContent-Disposition: form-data; name="%s"; filename="%s"\r\n'
+            b"Content-Type: %s\r\n\r\n"
+            % (
+                self._boundary,
+                _quote(name).encode(TextEncoding.UTF_8),
+                _quote(filename).encode(TextEncoding.UTF_8),
+                mimetype.encode(TextEncoding.UTF_8),
+            )
+        )
+
+    def _trailer(self) -> bytes:
+        return b"--%s--\r\n" % self._boundary
+
+    def _content_length(self) -> Optional[int]:
+        length = len(self._trailer())
+        for header, value in self._parameters:
+            length += len(header) + len(value) + 2
+        for header, content in self._files:
+            size = _file_size(content)
+            if size is None:
+                return None
+            length += len(header) + size + 2
+        return length
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        for header, value in self._parameters:
+            yield header + value + b"\r\n"
+        for header, content in self._files:
+            yield header
+            async for chunk in _iter_content(content, self._chunk_size):
+                yield chunk
+            yield b"\r\n"
+        yield self._trailer()
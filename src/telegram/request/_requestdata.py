@@ -18,12 +18,11 @@
 #  along with this program.  If not, see [http://www.gnu.org/licenses/].
 """This module contains a class that holds the parameters of a request to the Bot API."""
 
-import json
 from typing import Any, Optional, Union, final
 from urllib.parse import urlencode
 
-from telegram._utils.strings import TextEncoding
 from telegram._utils.types import UploadFileDict
+from telegram.request._jsoncodec import DEFAULT_JSON_CODEC, JSONCodec
 from telegram.request._requestparameter import RequestParameter
 
 
@@ -42,13 +41,20 @@ class RequestData:
     Attributes:
         contains_files (:obj:`bool`): Whether this object contains files to be uploaded via
             ``multipart/form-data``.
+        json_codec (:class:`telegram.request.JSONCodec`): The codec used by
+            :attr:`json_parameters` and :attr:`json_payload`.
+            :meth:`telegram.request.BaseRequest.post` sets it to the
+            :attr:`~telegram.request.BaseRequest.json_codec` of the request object.
+
+            .. versionadded:: NEXT.VERSION
     """
 
-    __slots__ = ("_parameters", "contains_files")
+    __slots__ = ("_parameters", "contains_files", "json_codec")
 
     def __init__(self, parameters: Optional[list[RequestParameter]] = None):
         self._parameters: list[RequestParameter] = parameters or []
         self.contains_files: bool = any(param.input_files for param in self._parameters)
+        self.json_codec: JSONCodec = DEFAULT_JSON_CODEC
 
     @property
     def parameters(self) -> dict[str, Union[str, int, list[Any], dict[Any, Any]]]:
@@ -72,7 +78,8 @@ class RequestData:
         value.
 
         Tip:
-            By default, this property uses the standard library's :func:`json.dumps`.
+            By default, this property uses :meth:`telegram.request.JSONCodec.dumps` of
+            :attr:`json_codec`.
             To use a custom library for JSON encoding, you can directly encode the keys of
             :attr:`parameters` - note that string valued keys should not be JSON encoded.
 
@@ -80,9 +87,9 @@ class RequestData:
             dict[:obj:`str`, :obj:`str`]
         """
         return {
-            param.name: param.json_value
+            param.name: json_value
             for param in self._parameters
-            if param.json_value is not None
+            if (json_value := param.encode_json_value(self.json_codec)) is not None
         }
 
     def url_encoded_parameters(self, encode_kwargs: Optional[dict[str, Any]] = None) -> str:
@@ -116,17 +123,24 @@ class RequestData:
 
     @property
     def json_payload(self) -> bytes:
-        """The :attr:`parameters` as UTF-8 encoded JSON payload.
+        """The :attr:`parameters` as UTF-8 encoded JSON payload. Nested values are encoded
+        together with the rest of the payload, i.e. the payload is suitable to be sent as a
+        request body with the content type ``application/json``.
+
+        .. versionchanged:: NEXT.VERSION
+            Nested values are no longer encoded into JSON strings separately. Instead, the
+            :attr:`parameters` are encoded exactly once.
 
         Tip:
-            By default, this property uses the standard library's :func:`json.dumps`.
-            To use a custom library for JSON encoding, you can directly encode the keys of
-            :attr:`parameters` - note that string valued keys should not be JSON encoded.
+            By default, this property uses :meth:`telegram.request.JSONCodec.dumps_bytes` of
+            :attr:`json_codec`.
+            To use a custom library for JSON encoding, you can directly encode
+            :attr:`parameters`.
 
         Returns:
             :obj:`bytes`
         """
-        return json.dumps(self.json_parameters).encode(TextEncoding.UTF_8)
+        return self.json_codec.dumps_bytes(self.parameters)
 
     @property
     def multipart_data(self) -> UploadFileDict:
@@ -134,6 +148,11 @@ class RequestData:
 
         .. versionchanged:: 21.5
             Content may now be a file handle.
+
+        .. versionchanged:: NEXT.VERSION
+            Content may now be a :class:`pathlib.Path` or an asynchronous iterable of
+            :obj:`bytes`, see :paramref:`telegram.InputFile.obj`. Implementations of
+            :class:`~telegram.request.BaseRequest` must read these while sending the request.
         """
         multipart_data: UploadFileDict = {}
         for param in self._parameters:
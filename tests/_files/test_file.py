@@ -24,7 +24,7 @@ from tempfile import TemporaryFile, mkstemp
 import pytest
 
 from telegram import File, FileCredentials, Voice
-from telegram.error import TelegramError
+from telegram.error import PassportDecryptionError, TelegramError
 from tests.auxil.files import data_file
 from tests.auxil.slots import mro_slots
 
@@ -154,9 +154,9 @@ class TestFileWithoutRequest(FileTestBase):
 
     async def test_download(self, monkeypatch, file):
         async def test(*args, **kwargs):
-            return self.file_content
+            yield self.file_content
 
-        monkeypatch.setattr(file.get_bot().request, "retrieve", test)
+        monkeypatch.setattr(file.get_bot().request, "retrieve_stream", test)
         out_file = await file.download_to_drive()
 
         try:
@@ -169,9 +169,9 @@ class TestFileWithoutRequest(FileTestBase):
     )
     async def test_download_custom_path(self, monkeypatch, file, custom_path_type):
         async def test(*args, **kwargs):
-            return self.file_content
+            yield self.file_content
 
-        monkeypatch.setattr(file.get_bot().request, "retrieve", test)
+        monkeypatch.setattr(file.get_bot().request, "retrieve_stream", test)
         file_handle, custom_path = mkstemp()
         custom_path = Path(custom_path)
         try:
@@ -184,9 +184,9 @@ class TestFileWithoutRequest(FileTestBase):
 
     async def test_download_file_obj(self, monkeypatch, file):
         async def test(*args, **kwargs):
-            return self.file_content
+            yield self.file_content
 
-        monkeypatch.setattr(file.get_bot().request, "retrieve", test)
+        monkeypatch.setattr(file.get_bot().request, "retrieve_stream", test)
         with TemporaryFile() as custom_fobj:
             await file.download_to_memory(out=custom_fobj)
             custom_fobj.seek(0)
@@ -194,9 +194,9 @@ class TestFileWithoutRequest(FileTestBase):
 
     async def test_download_bytearray(self, monkeypatch, file):
         async def test(*args, **kwargs):
-            return self.file_content
+            yield self.file_content
 
-        monkeypatch.setattr(file.get_bot().request, "retrieve", test)
+        monkeypatch.setattr(file.get_bot().request, "retrieve_stream", test)
 
         # Check that a download to a newly allocated bytearray works.
         buf = await file.download_as_bytearray()
@@ -211,9 +211,12 @@ class TestFileWithoutRequest(FileTestBase):
 
     async def test_download_encrypted(self, monkeypatch, offline_bot, encrypted_file):
         async def test(*args, **kwargs):
-            return data_file("image_encrypted.jpg").read_bytes()
+            # chunk boundaries do not align with the AES block size
+            data = data_file("image_encrypted.jpg").read_bytes()
+            for start in range(0, len(data), 1000):
+                yield data[start : start + 1000]
 
-        monkeypatch.setattr(encrypted_file.get_bot().request, "retrieve", test)
+        monkeypatch.setattr(encrypted_file.get_bot().request, "retrieve_stream", test)
         out_file = await encrypted_file.download_to_drive()
 
         try:
@@ -223,9 +226,12 @@ class TestFileWithoutRequest(FileTestBase):
 
     async def test_download_file_obj_encrypted(self, monkeypatch, encrypted_file):
         async def test(*args, **kwargs):
-            return data_file("image_encrypted.jpg").read_bytes()
+            # chunk boundaries do not align with the AES block size
+            data = data_file("image_encrypted.jpg").read_bytes()
+            for start in range(0, len(data), 1000):
+                yield data[start : start + 1000]
 
-        monkeypatch.setattr(encrypted_file.get_bot().request, "retrieve", test)
+        monkeypatch.setattr(encrypted_file.get_bot().request, "retrieve_stream", test)
         with TemporaryFile() as custom_fobj:
             await encrypted_file.download_to_memory(out=custom_fobj)
             custom_fobj.seek(0)
@@ -233,9 +239,12 @@ class TestFileWithoutRequest(FileTestBase):
 
     async def test_download_file_obj_local_file_encrypted(self, monkeypatch, encrypted_local_file):
         async def test(*args, **kwargs):
-            return data_file("image_encrypted.jpg").read_bytes()
+            # chunk boundaries do not align with the AES block size
+            data = data_file("image_encrypted.jpg").read_bytes()
+            for start in range(0, len(data), 1000):
+                yield data[start : start + 1000]
 
-        monkeypatch.setattr(encrypted_local_file.get_bot().request, "retrieve", test)
+        monkeypatch.setattr(encrypted_local_file.get_bot().request, "retrieve_stream", test)
         with TemporaryFile() as custom_fobj:
             await encrypted_local_file.download_to_memory(out=custom_fobj)
             custom_fobj.seek(0)
@@ -243,9 +252,12 @@ class TestFileWithoutRequest(FileTestBase):
 
     async def test_download_bytearray_encrypted(self, monkeypatch, encrypted_file):
         async def test(*args, **kwargs):
-            return data_file("image_encrypted.jpg").read_bytes()
+            # chunk boundaries do not align with the AES block size
+            data = data_file("image_encrypted.jpg").read_bytes()
+            for start in range(0, len(data), 1000):
+                yield data[start : start + 1000]
 
-        monkeypatch.setattr(encrypted_file.get_bot().request, "retrieve", test)
+        monkeypatch.setattr(encrypted_file.get_bot().request, "retrieve_stream", test)
 
         # Check that a download to a newly allocated bytearray works.
         buf = await encrypted_file.download_as_bytearray()
@@ -258,6 +270,39 @@ class TestFileWithoutRequest(FileTestBase):
         assert buf2[len(buf) :] == buf
         assert buf2[: len(buf)] == buf
 
+    async def test_download_encrypted_wrong_hash(self, monkeypatch, offline_bot, tmp_path):
+        # The data is only verified after it was downloaded, so nothing must be left over
+        fc = FileCredentials(
+            "Oq3G4sX+bKZthoyms1YlPqvWou9esb+z0Bi/KqQUG8s=",
+            "Pt7fKPgYWKA/7a8E64Ea1X8C+Wf7Ky1tF4ANBl63vl4=",
+        )
+        ef = File(self.file_id, self.file_unique_id, self.file_size, self.file_path)
+        ef.set_bot(offline_bot)
+        ef.set_credentials(fc)
+
+        async def test(*args, **kwargs):
+            data = bytearray(data_file("image_encrypted.jpg").read_bytes())
+            data[-1] ^= 1
+            yield bytes(data)
+
+        monkeypatch.setattr(ef.get_bot().request, "retrieve_stream", test)
+
+        path = tmp_path / "file.jpg"
+        with pytest.raises(PassportDecryptionError, match="Hashes are not equal"):
+            await ef.download_to_drive(path)
+        assert list(tmp_path.iterdir()) == []
+
+        out = BytesIO(b"existing")
+        out.seek(0, os.SEEK_END)
+        with pytest.raises(PassportDecryptionError, match="Hashes are not equal"):
+            await ef.download_to_memory(out)
+        assert out.getvalue() == b"existing"
+
+        buf = bytearray(b"existing")
+        with pytest.raises(PassportDecryptionError, match="Hashes are not equal"):
+            await ef.download_as_bytearray(buf)
+        assert buf == bytearray(b"existing")
+
     async def test_download_no_file_path(self):
         with pytest.raises(RuntimeError, match="No `file_path` available"):
             await File(self.file_id, self.file_unique_id).download_to_drive()
@@ -206,6 +206,57 @@ class TestInputFileWithoutRequest:
             assert isinstance(content, BufferedReader)
             assert content.read() == data_file("telegram.jpg").read_bytes()
 
+    def test_path(self):
+        input_file = InputFile(data_file("telegram.jpg"))
+        # the file is only read when the request is made
+        assert input_file.field_tuple == ("telegram.jpg", data_file("telegram.jpg"), "image/jpeg")
+
+        input_file = InputFile(data_file("telegram.jpg"), filename="blah.mp3")
+        assert input_file.field_tuple == ("blah.mp3", data_file("telegram.jpg"), "audio/mpeg")
+
+    def test_memory_map(self, tmp_path):
+        path = tmp_path / "telegram.jpg"
+        path.write_bytes(data_file("telegram.jpg").read_bytes())
+
+        input_file = InputFile(path, memory_map=True)
+        filename, content, mimetype = input_file.field_tuple
+        assert (filename, mimetype) == ("telegram.jpg", "image/jpeg")
+        assert isinstance(content, memoryview)
+        assert content == path.read_bytes()
+
+        # the mapping is shared with all input files for the same file
+        with path.open("rb") as file:
+            other = InputFile(file, filename="blah.mp3", memory_map=True)
+            assert other.field_tuple[0] == "blah.mp3"
+            assert other.input_file_content.obj is content.obj
+        assert InputFile(path, memory_map=True).input_file_content.obj is content.obj
+
+        # but a changed file is mapped again. It is replaced rather than truncated, because
+        # reading the truncated part of a mapping may crash the process
+        (tmp_path / "new.jpg").write_bytes(b"changed")
+        (tmp_path / "new.jpg").replace(path)
+        changed = InputFile(path, memory_map=True).input_file_content
+        assert changed.obj is not content.obj
+        assert changed == b"changed"
+        assert content == data_file("telegram.jpg").read_bytes()
+
+    def test_memory_map_fallback(self, tmp_path):
+        path = tmp_path / "empty.txt"
+        path.touch()
+        assert InputFile(path, memory_map=True).input_file_content == path
+
+        buffer = BytesIO(b"blah")
+        assert InputFile(buffer, memory_map=True).input_file_content == b"blah"
+
+    def test_async_iterable(self):
+        async def chunks():
+            yield b"blah"
+
+        content = chunks()
+        input_file = InputFile(content, filename="tg.jpg", read_file_handle=True)
+        assert input_file.field_tuple == ("tg.jpg", content, "image/jpeg")
+        assert InputFile(content).filename == "application.octet-stream"
+
 
 class TestInputFileWithRequest:
     async def test_send_bytes(self, bot, chat_id):
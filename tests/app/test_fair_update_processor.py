@@ -0,0 +1,69 @@
+import asyncio
+
+import pytest
+
+from fair_update_processor import PRIORITY_HIGH, PRIORITY_NORMAL, FairUpdateProcessor
+
+
+def classify(update):
+    # 测试中的 update 就是 (优先级, 会话键)
+    return update
+
+
+@pytest.fixture
+def shed():
+    return []
+
+
+@pytest.fixture
+def processor(shed):
+    async def on_shed(update):
+        shed.append(update)
+
+    return FairUpdateProcessor(
+        max_concurrent_updates=1, max_backlog=2, classify=classify, on_shed=on_shed
+    )
+
+
+class TestFairUpdateProcessorWithoutRequest:
+    async def test_sheds_normal_updates_beyond_backlog(self, processor, shed):
+        release = asyncio.Event()
+        processed = []
+
+        async def handle(update):
+            await release.wait()
+            processed.append(update)
+
+        updates = [(PRIORITY_NORMAL, i) for i in range(4)]
+        tasks = [asyncio.create_task(processor.do_process_update(u, handle(u))) for u in updates]
+        await asyncio.sleep(0)
+        # 一个在运行、两个在排队, 第四个被丢弃
+        assert shed == [updates[3]]
+        assert processor.shed == 1
+
+        release.set()
+        await asyncio.gather(*tasks)
+        assert processed == updates[:3]
+
+    async def test_high_priority_backlog_does_not_shed_normal_updates(self, processor, shed):
+        release = asyncio.Event()
+        processed = []
+
+        async def handle(update):
+            await release.wait()
+            processed.append(update)
+
+        high = [(PRIORITY_HIGH, i) for i in range(4)]
+        normal = [(PRIORITY_NORMAL, i) for i in range(2)]
+        tasks = [asyncio.create_task(processor.do_process_update(u, handle(u))) for u in high]
+        await asyncio.sleep(0)
+        tasks += [asyncio.create_task(processor.do_process_update(u, handle(u))) for u in normal]
+        await asyncio.sleep(0)
+        assert processor.queue_depth == 5
+        assert shed == []
+
+        release.set()
+        await asyncio.gather(*tasks)
+        # 高优先级的更新先被处理
+        assert processed == high + normal
+        assert processor.processed == 6
@@ -0,0 +1,85 @@
+import pytest
+
+import response_cache
+from response_cache import ResponseCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(response_cache.time, "time", clock)
+    return clock
+
+
+class TestResponseCacheWithoutRequest:
+    def test_make_key_normalizes_text(self):
+        key = ResponseCache.make_key("model", "prompt", "Hello   World")
+        assert key == ResponseCache.make_key("model", "prompt", " hello world ")
+        assert key != ResponseCache.make_key("other", "prompt", "hello world")
+        assert key != ResponseCache.make_key("model", "other", "hello world")
+        assert key != ResponseCache.make_key("model", "prompt", "hello there")
+
+    def test_hit_and_miss(self, clock):
+        cache = ResponseCache()
+        assert cache.get("key") is None
+        cache.set("key", "value")
+        assert cache.get("key") == "value"
+        assert cache.stats() == {
+            "entries": 1,
+            "max_entries": 1000,
+            "hits": 1,
+            "misses": 1,
+            "hit_rate": 0.5,
+        }
+
+    def test_ttl(self, clock):
+        cache = ResponseCache(ttl=10)
+        cache.set("key", "value")
+        clock.now += 9.9
+        assert cache.get("key") == "value"
+        clock.now += 0.1
+        assert cache.get("key") is None
+        assert len(cache) == 0
+        assert cache.misses == 1
+
+    def test_lru_eviction(self, clock):
+        cache = ResponseCache(max_entries=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        # a 被访问后 b 成为最久未使用的条目
+        assert cache.get("a") == 1
+        cache.set("c", 3)
+        assert len(cache) == 2
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+
+    def test_clear(self, clock):
+        cache = ResponseCache()
+        cache.set("key", "value")
+        cache.get("key")
+        cache.clear()
+        assert len(cache) == 0
+        assert cache.stats()["hits"] == 0
+
+    def test_save_and_load(self, clock, tmp_path):
+        path = tmp_path / "cache.json"
+        cache = ResponseCache(ttl=10, path=path)
+        cache.set("stale", "value")
+        clock.now += 5
+        cache.set("live", "value")
+        clock.now += 6
+        cache.save()
+
+        loaded = ResponseCache(path=path)
+        loaded.load()
+        assert len(loaded) == 1
+        assert loaded.get("live") == "value"
@@ -0,0 +1,69 @@
+#!/usr/bin/env python
+#
+# A library that provides a Python interface to the Telegram Bot API
+# Copyright (C) 2015-2025
+# Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser Public License for more details.
+#
+# You should have received a copy of the GNU Lesser Public License
+# along with this program.  If not, see [http://www.gnu.org/licenses/].
+import asyncio
+
+from telegram.ext._utils.filtercache import FilterCache, filter_cache, get_filter_results
+from tests.auxil.slots import mro_slots
+
+
+class TestFilterCache:
+    def test_slot_behaviour(self):
+        inst = FilterCache(object())
+        for attr in inst.__slots__:
+            assert getattr(inst, attr, "err") != "err", f"got extra slot '{attr}'"
+        assert len(mro_slots(inst)) == len(set(mro_slots(inst))), "duplicate slot"
+
+    def test_scope(self):
+        update = object()
+        assert get_filter_results(update) is None
+
+        with filter_cache(update) as cache:
+            assert get_filter_results(update) is cache.results
+            assert get_filter_results(object()) is None
+
+            cache.results[1] = 2
+            with filter_cache(update) as nested_cache:
+                assert get_filter_results(update) is nested_cache.results
+                assert nested_cache.results == {}
+            assert get_filter_results(update) == {1: 2}
+
+            cache.clear()
+            assert get_filter_results(update) == {}
+
+        assert get_filter_results(update) is None
+
+    async def test_tasks(self):
+        first_update, second_update = object(), object()
+        event = asyncio.Event()
+
+        async def check(update, other_update):
+            with filter_cache(update):
+                await event.wait()
+                return (
+                    get_filter_results(update) is not None
+                    and get_filter_results(other_update) is None
+                )
+
+        tasks = (
+            asyncio.create_task(check(first_update, second_update)),
+            asyncio.create_task(check(second_update, first_update)),
+        )
+        await asyncio.sleep(0)
+        event.set()
+        assert await asyncio.gather(*tasks) == [True, True]
@@ -0,0 +1,225 @@
+#!/usr/bin/env python
+#
+# A library that provides a Python interface to the Telegram Bot API
+# Copyright (C) 2015-2025
+# Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser Public License for more details.
+#
+# You should have received a copy of the GNU Lesser Public License
+# along with this program.  If not, see [http://www.gnu.org/licenses/].
+import re
+
+import pytest
+
+from telegram import CallbackQuery, InlineQuery, Message, MessageEntity, Update, User
+from telegram.ext import (
+    CallbackQueryHandler,
+    CommandHandler,
+    ConversationHandler,
+    InlineQueryHandler,
+    MessageHandler,
+    PrefixHandler,
+    StringCommandHandler,
+    TypeHandler,
+    filters,
+)
+from telegram.ext._utils.handlerindex import HandlerIndex
+from tests.auxil.build_messages import make_command_update, make_message, make_message_update
+from tests.auxil.pytest_classes import make_bot
+from tests.auxil.slots import mro_slots
+
+
+async def callback(_, __):
+    pass
+
+
+@pytest.fixture
+def callback_query_update():
+    return Update(0, callback_query=CallbackQuery("1", User(1, "", False), "chat", data="data"))
+
+
+@pytest.fixture
+def inline_query_update():
+    return Update(0, inline_query=InlineQuery("1", User(1, "", False), "query", "offset"))
+
+
+class TestHandlerIndex:
+    def test_slot_behaviour(self):
+        inst = HandlerIndex({})
+        for attr in inst.__slots__:
+            assert getattr(inst, attr, "err") != "err", f"got extra slot '{attr}'"
+        assert len(mro_slots(inst)) == len(set(mro_slots(inst))), "duplicate slot"
+
+    def test_groups(self):
+        handlers = {
+            -1: [TypeHandler(object, callback)],
+            0: [CommandHandler("a", callback), MessageHandler(None, callback)],
+        }
+        index = HandlerIndex(handlers)
+        assert index.groups == (tuple(handlers[-1]), tuple(handlers[0]))
+
+        # The index is a snapshot
+        handlers[0].pop()
+        assert index.groups[1] == (handlers[0][0], index.groups[1][1])
+
+    def test_is_current(self):
+        handlers = {0: [TypeHandler(object, callback)]}
+        index = HandlerIndex(handlers)
+        assert index.is_current(handlers)
+
+        handlers[0].append(TypeHandler(object, callback))
+        assert not index.is_current(handlers)
+        handlers[0].pop()
+        assert index.is_current(handlers)
+
+        handlers[1] = [TypeHandler(object, callback)]
+        assert not index.is_current(handlers)
+        assert not index.is_current({0: list(handlers[0])})
+
+    def test_update_types(self, callback_query_update, inline_query_update):
+        type_handler = TypeHandler(object, callback)
+        callback_query_handler = CallbackQueryHandler(callback)
+        inline_query_handler = InlineQueryHandler(callback)
+        message_handler = MessageHandler(filters.TEXT, callback)
+        string_handler = StringCommandHandler("a", callback)
+        conversation_handler = ConversationHandler([message_handler], {}, [])
+        index = HandlerIndex(
+            {
+                0: [callback_query_handler, inline_query_handler, message_handler, type_handler],
+                1: [string_handler, conversation_handler],
+            }
+        )
+
+        assert index.candidates(callback_query_update) == (
+            (callback_query_handler, type_handler),
+            (conversation_handler,),
+        )
+        assert index.candidates(inline_query_update) == (
+            (inline_query_handler, type_handler),
+            (conversation_handler,),
+        )
+        for update in (
+            make_message_update("text"),
+            make_message_update("text", edited=True),
+            Update(0, channel_post=make_message_update("text").message),
+        ):
+            assert index.candidates(update) == (
+                (message_handler, type_handler),
+                (conversation_handler,),
+            )
+        assert index.candidates("string") == (
+            (type_handler,),
+            (string_handler, conversation_handler),
+        )
+        assert index.candidates(object()) == ((type_handler,), (conversation_handler,))
+        assert index.candidates(Update(0)) == ((type_handler,), (conversation_handler,))
+
+    def test_custom_check_update(self, inline_query_update):
+        class CustomCallbackQueryHandler(CallbackQueryHandler):
+            def check_update(self, update):
+                return True
+
+        class CustomFilter(filters.BaseFilter):
+            def check_update(self, update):
+                return True
+
+        handler = CustomCallbackQueryHandler(callback)
+        message_handler = MessageHandler(CustomFilter(), callback)
+        # Subclasses that don't override check_update are still narrowed down
+        subclass_handler = type("Subclass", (CallbackQueryHandler,), {})(callback)
+        index = HandlerIndex({0: [handler, message_handler, subclass_handler]})
+
+        assert index.candidates(inline_query_update) == ((handler, message_handler),)
+
+    def test_commands(self, callback_query_update):
+        start = CommandHandler("start", callback)
+        help_ = CommandHandler(["help", "Info"], callback)
+        text = MessageHandler(filters.TEXT, callback)
+        index = HandlerIndex({0: [start, help_, text]})
+
+        assert index.candidates(make_command_update("/start arg")) == ((start, text),)
+        assert index.candidates(make_command_update("/info")) == ((help_, text),)
+        entity = MessageEntity(MessageEntity.BOT_COMMAND, 0, 5)
+        upper_case = make_message("/HELP", entities=[entity])
+        assert index.candidates(make_message_update(upper_case)) == ((help_, text),)
+        assert index.candidates(make_command_update("/unknown")) == ((text,),)
+        assert index.candidates(make_command_update("not /start")) == ((text,),)
+        assert index.candidates(make_message_update("/start")) == ((text,),)
+        assert index.candidates(make_message_update(Message(1, None, None))) == ((text,),)
+        # The message of a callback query is not parsed
+        assert index.candidates(callback_query_update) == ((start, help_),)
+
+    def test_commands_username(self, offline_bot, bot_info):
+        start = CommandHandler("start", callback)
+        index = HandlerIndex({0: [start]})
+
+        update = make_command_update(f"/start@{offline_bot.username.upper()}", bot=offline_bot)
+        assert index.candidates(update) == ((start,),)
+        update = make_command_update("/start@other_bot", bot=offline_bot)
+        assert index.candidates(update) == ((),)
+        # The bot is not initialized, the handler has to deal with that
+        update = make_command_update("/start@other_bot", bot=make_bot(bot_info))
+        assert index.candidates(update) == ((start,),)
+
+    def test_prefix_commands(self, callback_query_update):
+        prefix = PrefixHandler(["!", "#"], ["start", "Help"], callback)
+        command = CommandHandler("start", callback)
+        index = HandlerIndex({0: [prefix, command]})
+
+        assert index.candidates(make_message_update("!start arg")) == ((prefix,),)
+        assert index.candidates(make_message_update("#HELP")) == ((prefix,),)
+        assert index.candidates(make_message_update("!unknown")) == ((),)
+        assert index.candidates(make_message_update("text !start")) == ((),)
+        assert index.candidates(make_message_update(" ")) == ((),)
+        assert index.candidates(make_command_update("/start")) == ((command,),)
+        assert index.candidates(callback_query_update) == ((prefix, command),)
+
+    def test_callback_patterns(self):
+        page = CallbackQueryHandler(callback, pattern=r"^page:(\d+)$")
+        pages = CallbackQueryHandler(callback, pattern=re.compile(r"^page"))
+        delete = CallbackQueryHandler(callback, pattern=r"delete")
+        any_data = CallbackQueryHandler(callback)
+        callable_pattern = CallbackQueryHandler(callback, pattern=lambda data: True)
+        index = HandlerIndex({0: [page, pages, delete], 1: [any_data, callable_pattern]})
+
+        def make_update(data, game_short_name=None):
+            return Update(
+                0,
+                callback_query=CallbackQuery(
+                    "1", User(1, "", False), "chat", data=data, game_short_name=game_short_name
+                ),
+            )
+
+        assert index.candidates(make_update("page:1")) == (
+            (page, pages),
+            (any_data, callable_pattern),
+        )
+        assert index.candidates(make_update("pages")) == ((pages,), (any_data, callable_pattern))
+        assert index.candidates(make_update("delete")) == ((delete,), (any_data, callable_pattern))
+        assert index.candidates(make_update("other")) == ((), (any_data, callable_pattern))
+        # Arbitrary callback data never matches a regex pattern
+        assert index.candidates(make_update(object())) == ((), (any_data, callable_pattern))
+        # Without callback data, the handlers check the game short name
+        assert index.candidates(make_update(None, "game")) == (
+            (page, pages, delete),
+            (any_data, callable_pattern),
+        )
+        assert index.candidates(make_update("page:1")) is index.candidates(make_update("page:2"))
+
+    def test_candidates_cached(self):
+        index = HandlerIndex({0: [CommandHandler("start", callback)]})
+        first = index.candidates(make_command_update("/start"))
+        assert index.candidates(make_command_update("/start arg")) is first
+        assert index.candidates(make_command_update("/unknown")) is not first
+        assert index.candidates(make_command_update("/other")) is index.candidates(
+            make_command_update("/unknown")
+        )
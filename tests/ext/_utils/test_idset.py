@@ -0,0 +1,73 @@
+#!/usr/bin/env python
+#
+# A library that provides a Python interface to the Telegram Bot API
+# Copyright (C) 2015-2025
+# Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser Public License for more details.
+#
+# You should have received a copy of the GNU Lesser Public License
+# along with this program.  If not, see [http://www.gnu.org/licenses/].
+from telegram.ext._utils.idset import IdSet
+from tests.auxil.slots import mro_slots
+
+
+class TestIdSet:
+    def test_slot_behaviour(self):
+        inst = IdSet()
+        for attr in inst.__slots__:
+            assert getattr(inst, attr, "err") != "err", f"got extra slot '{attr}'"
+        assert len(mro_slots(inst)) == len(set(mro_slots(inst))), "duplicate slot"
+
+    def test_set_behaviour(self):
+        ids = IdSet([3, -1001234567890, 3, 2**62])
+        assert len(ids) == 3
+        assert list(ids) == [-1001234567890, 3, 2**62]
+        assert 3 in ids
+        assert -1001234567890 in ids
+        assert 4 not in ids
+        assert 2**70 not in ids
+        assert "3" not in ids
+        assert not IdSet()
+        assert 1 not in IdSet()
+
+        assert ids == {3, -1001234567890, 2**62}
+        assert frozenset({3, -1001234567890, 2**62}) == ids
+        assert ids != {3}
+        assert hash(ids) == hash(frozenset(ids))
+        assert ids & {3, 4} == {3}
+        assert isinstance(ids | {4}, IdSet)
+        assert repr(IdSet([2, 1])) == "IdSet({1, 2})"
+
+    def test_other_values(self):
+        ids = IdSet([1, "a", 2**70])
+        assert len(ids) == 3
+        assert ids == {1, "a", 2**70}
+        assert "a" in ids
+        assert 2**70 in ids
+        assert "b" not in ids
+        assert ids.union(["b", 2]) == {1, 2, "a", "b", 2**70}
+        assert ids.difference(["a", 2**70]) == {1}
+
+    def test_union_difference(self):
+        ids = IdSet(range(0, 100, 2))
+        union = ids.union(range(1, 10))
+        assert union == set(range(0, 100, 2)) | set(range(1, 10))
+        assert list(union) == sorted(union)
+        assert ids.union([2, 4]) is ids
+        assert ids.union([]) is ids
+
+        difference = ids.difference([0, 1, 98, 200])
+        assert difference == set(range(2, 98, 2))
+        assert ids.difference([1, 3]) is ids
+
+        # The original snapshot is unchanged
+        assert ids == set(range(0, 100, 2))
@@ -0,0 +1,92 @@
+#!/usr/bin/env python
+#
+# A library that provides a Python interface to the Telegram Bot API
+# Copyright (C) 2015-2025
+# Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser Public License for more details.
+#
+# You should have received a copy of the GNU Lesser Public License
+# along with this program.  If not, see [http://www.gnu.org/licenses/].
+import re
+
+import pytest
+
+from telegram.ext._utils.patternset import PatternSet, _literal_prefix
+from tests.auxil.slots import mro_slots
+
+PATTERNS = (
+    r"^page:(\d+)$",
+    r"^page:",
+    r"\Adelete:(?P<id>\d+)",
+    r"pages?",
+    r"^pa+ge",
+    r"confirm|cancel",
+    r"(?i)^PAGE",
+    re.compile(r"^page", re.IGNORECASE),
+    re.compile(r"^line\d", re.MULTILINE),
+    r"\d+$",
+    r"^\^\.",
+    r"",
+)
+TEXTS = ("", "page:1", "page:x", "Page:1", "paaage", "pages", "delete:42", "x\nline1", "^.", "9")
+
+
+class TestPatternSet:
+    def test_slot_behaviour(self):
+        inst = PatternSet([])
+        for attr in inst.__slots__:
+            assert getattr(inst, attr, "err") != "err", f"got extra slot '{attr}'"
+        assert len(mro_slots(inst)) == len(set(mro_slots(inst))), "duplicate slot"
+
+    @pytest.mark.parametrize(
+        ("pattern", "search", "prefix"),
+        [
+            (r"^page:(\d+)$", True, "page:"),
+            (r"\Apage", True, "page"),
+            (r"page", True, None),
+            (r"page", False, "page"),
+            (r"^pages?", True, "page"),
+            (r"^pa{2}ge", True, "p"),
+            (r"^\^", True, None),
+            (r"^a|b", True, None),
+            (r"(?i)^page", True, None),
+            (re.compile(r"^page", re.IGNORECASE), True, None),
+            (re.compile(r"^page", re.MULTILINE), True, None),
+            (re.compile(r"^page", re.MULTILINE), False, "page"),
+        ],
+    )
+    def test_literal_prefix(self, pattern, search, prefix):
+        assert _literal_prefix(re.compile(pattern), search) == prefix
+
+    @pytest.mark.parametrize("search", [True, False])
+    def test_matches(self, search):
+        pattern_set = PatternSet(PATTERNS, search=search)
+        assert len(pattern_set) == len(PATTERNS)
+        assert all(isinstance(pattern, re.Pattern) for pattern in pattern_set.patterns)
+
+        for text in TEXTS:
+            expected = [
+                (index, match)
+                for index, pattern in enumerate(pattern_set.patterns)
+                if (match := pattern.search(text) if search else pattern.match(text))
+            ]
+            assert pattern_set.matching(text) == tuple(index for index, _ in expected)
+            assert [
+                (match.re, match.span(), match.groups()) for match in pattern_set.matches(text)
+            ] == [(match.re, match.span(), match.groups()) for _, match in expected]
+
+    def test_many_patterns(self):
+        pattern_set = PatternSet([rf"^action_{i}:(\d+)$" for i in range(100)], search=False)
+        assert pattern_set.matching("action_42:7") == (42,)
+        assert pattern_set.matches("action_7:42")[0].group(1) == "42"
+        assert pattern_set.matching("action_42:x") == ()
+        assert pattern_set.matching("other") == ()
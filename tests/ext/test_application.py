@@ -48,6 +48,7 @@ from telegram.ext import (
     CommandHandler,
     ContextTypes,
     Defaults,
+    DownloadManager,
     JobQueue,
     MessageHandler,
     PicklePersistence,
@@ -58,7 +59,7 @@ from telegram.ext import (
 )
 from telegram.warnings import PTBDeprecationWarning, PTBUserWarning
 from tests.auxil.asyncio_helpers import call_after
-from tests.auxil.build_messages import make_message_update
+from tests.auxil.build_messages import make_command_update, make_message_update
 from tests.auxil.files import SOURCE_ROOT_PATH
 from tests.auxil.monkeypatch import empty_get_updates, return_true
 from tests.auxil.networking import send_webhook_message
@@ -139,6 +140,7 @@ class TestApplication:
             context_types=ContextTypes(),
             updater=updater,
             update_processor=False,
+            download_manager=None,
             post_init=None,
             post_shutdown=None,
             post_stop=None,
@@ -158,6 +160,7 @@ class TestApplication:
         persistence = PicklePersistence("file_path")
         context_types = ContextTypes()
         update_processor = SimpleUpdateProcessor(1)
+        download_manager = DownloadManager()
         updater = Updater(bot=one_time_bot, update_queue=update_queue)
 
         async def post_init(application: Application) -> None:
@@ -177,6 +180,7 @@ class TestApplication:
             context_types=context_types,
             updater=updater,
             update_processor=update_processor,
+            download_manager=download_manager,
             post_init=post_init,
             post_shutdown=post_shutdown,
             post_stop=post_stop,
@@ -190,6 +194,7 @@ class TestApplication:
         assert app.update_queue is updater.update_queue
         assert app.bot is updater.bot
         assert app.update_processor is update_processor
+        assert app.download_manager is download_manager
         assert app.post_init is post_init
         assert app.post_shutdown is post_shutdown
         assert app.post_stop is post_stop
@@ -2660,6 +2665,72 @@ class TestApplication:
         # process_update was called
         assert checked_handlers == {"remove"}
 
+    async def test_process_update_checks_only_candidates(self, app):
+        checked_handlers = []
+        called = []
+
+        async def dummy_callback(_, __):
+            pass
+
+        async def start_callback(_, __):
+            called.append("start")
+
+        class TrackCommandHandler(CommandHandler):
+            def check_update(self, update):
+                checked_handlers.append(self.commands)
+                return super().check_update(update)
+
+        class TrackFilter(filters.MessageFilter):
+            def filter(self, message):
+                checked_handlers.append("filter")
+                return True
+
+        app.add_handler(CommandHandler("help", dummy_callback))
+        app.add_handler(CommandHandler("start", start_callback))
+        app.add_handler(MessageHandler(TrackFilter(), dummy_callback))
+        app.add_handler(TrackCommandHandler("other", dummy_callback), group=1)
+
+        async with app:
+            await app.process_update(make_command_update("/start", bot=app.bot))
+            assert called == ["start"]
+            # Command handlers overriding check_update are never skipped
+            assert checked_handlers == [frozenset({"other"})]
+
+            # Handlers added directly to the handlers dict are taken into account as well
+            checked_handlers.clear()
+            app.handlers[1].append(MessageHandler(TrackFilter(), dummy_callback))
+            await app.process_update(make_message_update("text", bot=app.bot))
+            assert checked_handlers == ["filter", frozenset({"other"}), "filter"]
+
+    async def test_process_update_filter_cache(self, app, monkeypatch):
+        checked = []
+        handled = []
+        original_filter = filters.Regex.filter
+
+        def tracking_filter(self, message):
+            checked.append(self.pattern.pattern)
+            return original_filter(self, message)
+
+        async def callback(_, __):
+            handled.append(True)
+
+        class FalseFilter(filters.MessageFilter):
+            def filter(self, message):
+                return False
+
+        monkeypatch.setattr(filters.Regex, "filter", tracking_filter)
+        regex = filters.Regex("t")
+        app.add_handler(MessageHandler(regex & FalseFilter(), callback))
+        app.add_handler(MessageHandler(filters.TEXT & regex, callback))
+        app.add_handler(MessageHandler(regex & filters.ALL, callback), group=1)
+
+        async with app:
+            await app.process_update(make_message_update("test"))
+
+        # The result is cached until a handler callback is run
+        assert checked == ["t", "t"]
+        assert handled == [True, True]
+
     async def test_process_error_exception_in_building_context(self, monkeypatch, caplog, app):
         # Makes sure that exceptions in building the context don't stop the application
         exception = ValueError("TestException")
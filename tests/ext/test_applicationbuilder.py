@@ -34,14 +34,17 @@ from telegram.ext import (
     CallbackDataCache,
     ContextTypes,
     Defaults,
+    DownloadManager,
     ExtBot,
     JobQueue,
     PicklePersistence,
+    RetryPolicy,
     Updater,
 )
 from telegram.ext._applicationbuilder import _BOT_CHECKS
 from telegram.ext._baseupdateprocessor import SimpleUpdateProcessor
-from telegram.request import HTTPXRequest
+from telegram.request import CircuitBreaker, HTTPXRequest, JSONCodec
+from telegram.request._jsoncodec import DEFAULT_JSON_CODEC
 from tests.auxil.constants import PRIVATE_KEY
 from tests.auxil.envvars import TEST_WITH_OPT_DEPS
 from tests.auxil.files import data_file
@@ -76,9 +79,12 @@ class TestApplicationBuilder:
         for argument in arguments:
             if argument in ("self", "httpx_kwargs"):
                 continue
-            if argument == "media_write_timeout" and get_updates:
+            if argument in ("media_write_timeout", "upload_chunk_size") and get_updates:
                 # get_updates never makes media requests
                 continue
+            if argument == "json_codec" and get_updates:
+                # the codec is shared by all requests of the bot
+                continue
             assert hasattr(builder, prefix + argument), f"missing method {prefix}{argument}"
 
     @pytest.mark.parametrize("bot_class", [Bot, ExtBot])
@@ -136,6 +142,8 @@ class TestApplicationBuilder:
         assert isinstance(app, Application)
         assert isinstance(app.update_processor, SimpleUpdateProcessor)
         assert app.update_processor.max_concurrent_updates == 1
+        assert isinstance(app.download_manager, DownloadManager)
+        assert app.download_manager.max_concurrent_downloads == 4
 
         assert isinstance(app.bot, ExtBot)
         assert isinstance(app.bot.request, HTTPXRequest)
@@ -145,6 +153,7 @@ class TestApplicationBuilder:
         assert bot.token in app.bot.base_file_url
         assert app.bot.private_key is None
         assert app.bot.callback_data_cache is None
+        assert app.bot.upload_cache is None
         assert app.bot.defaults is None
         assert app.bot.rate_limiter is None
         assert app.bot.local_mode is False
@@ -165,6 +174,15 @@ class TestApplicationBuilder:
         assert client.http1 is True
         assert not client.http2
 
+        for request in (app.bot.upload_request, app.bot.download_request):
+            assert isinstance(request, HTTPXRequest)
+            assert request is not app.bot.request
+            assert request._client.limits == httpx.Limits(max_connections=16)
+            assert request._client.timeout == httpx.Timeout(
+                connect=5.0, read=5.0, write=5.0, pool=1.0
+            )
+        assert app.bot.upload_request is not app.bot.download_request
+
         assert isinstance(app.update_queue, asyncio.Queue)
         assert isinstance(app.updater, Updater)
         assert app.updater.bot is app.bot
@@ -209,6 +227,10 @@ class TestApplicationBuilder:
             "bot",
             "updater",
             "http_version",
+            "json_body",
+            "upload_chunk_size",
+            "circuit_breaker",
+            "json_codec",
         ],
     )
     def test_mutually_exclusive_for_request(self, builder, method):
@@ -235,6 +257,9 @@ class TestApplicationBuilder:
             "get_updates_proxy",
             "get_updates_socket_options",
             "get_updates_http_version",
+            "get_updates_json_body",
+            "get_updates_circuit_breaker",
+            "json_codec",
             "bot",
             "updater",
         ],
@@ -276,6 +301,7 @@ class TestApplicationBuilder:
             "bot",
             "update_queue",
             "rate_limiter",
+            "retry_policy",
         ]
         + [entry[0] for entry in _BOT_CHECKS],
     )
@@ -344,7 +370,7 @@ class TestApplicationBuilder:
             PRIVATE_KEY
         ).defaults(defaults).arbitrary_callback_data(42).request(request).get_updates_request(
             get_updates_request
-        ).rate_limiter(rate_limiter).local_mode(True)
+        ).rate_limiter(rate_limiter).local_mode(True).upload_cache(24)
         built_bot = builder.build().bot
 
         # In the following we access some private attributes of bot and request. this is not
@@ -357,7 +383,10 @@ class TestApplicationBuilder:
         assert built_bot.defaults is defaults
         assert built_bot.request is request
         assert built_bot._request[0] is get_updates_request
+        assert built_bot.upload_request is request
+        assert built_bot.download_request is request
         assert built_bot.callback_data_cache.maxsize == 42
+        assert built_bot.upload_cache.maxsize == 24
         assert built_bot.private_key
         assert built_bot.rate_limiter is rate_limiter
         assert built_bot.local_mode is True
@@ -381,19 +410,36 @@ class TestApplicationBuilder:
         monkeypatch.setattr(httpx, "AsyncClient", Client)
         monkeypatch.setattr(HTTPXRequest, "__init__", init_httpx_request)
 
+        circuit_breaker = CircuitBreaker()
         builder = ApplicationBuilder().token(bot.token)
         builder.connection_pool_size(1).connect_timeout(2).pool_timeout(3).read_timeout(
             4
-        ).write_timeout(5).media_write_timeout(6).http_version("1.1").proxy("proxy")
+        ).write_timeout(5).media_write_timeout(6).http_version("1.1").proxy("proxy").json_body(
+            True
+        ).upload_chunk_size(1024).circuit_breaker(circuit_breaker)
         app = builder.build()
         client = app.bot.request._client
+        assert app.bot.request.json_body is True
+        assert app.bot._request[0].json_body is False
+        assert app.bot.request.circuit_breaker is circuit_breaker
+        assert app.bot.upload_request.circuit_breaker is circuit_breaker
+        assert app.bot.download_request.circuit_breaker is circuit_breaker
+        assert app.bot._request[0].circuit_breaker is None
+        assert app.bot.request.upload_chunk_size == 1024
+        assert app.bot.upload_request.upload_chunk_size == 1024
+        assert app.bot._request[0].upload_chunk_size == 65536
 
         assert client.timeout == httpx.Timeout(pool=3, connect=2, read=4, write=5)
         assert client.limits == httpx.Limits(max_connections=1)
         assert client.proxy == "proxy"
         assert client.http1 is True
         assert client.http2 is False
-        assert media_write_timeout == [6, None]
+        # request, get_updates_request, upload_request, download_request
+        assert media_write_timeout == [6, None, 6, None]
+        for request in (app.bot.upload_request, app.bot.download_request):
+            assert request._client.timeout == httpx.Timeout(pool=3, connect=2, read=4, write=5)
+            assert request._client.limits == httpx.Limits(max_connections=16)
+            assert request._client.proxy == "proxy"
 
         media_write_timeout.clear()
         builder = ApplicationBuilder().token(bot.token)
@@ -401,16 +447,83 @@ class TestApplicationBuilder:
             2
         ).get_updates_pool_timeout(3).get_updates_read_timeout(4).get_updates_write_timeout(
             5
-        ).get_updates_http_version("1.1").get_updates_proxy("get_updates_proxy")
+        ).get_updates_http_version("1.1").get_updates_proxy(
+            "get_updates_proxy"
+        ).get_updates_json_body(True).get_updates_circuit_breaker(circuit_breaker)
         app = builder.build()
         client = app.bot._request[0]._client
+        assert app.bot._request[0].json_body is True
+        assert app.bot.request.json_body is False
+        assert app.bot._request[0].circuit_breaker is circuit_breaker
+        assert app.bot.request.circuit_breaker is None
 
         assert client.timeout == httpx.Timeout(pool=3, connect=2, read=4, write=5)
         assert client.limits == httpx.Limits(max_connections=1)
         assert client.proxy == "get_updates_proxy"
         assert client.http1 is True
         assert client.http2 is False
-        assert media_write_timeout == [None, None]
+        assert media_write_timeout == [None, None, None, None]
+
+        media_write_timeout.clear()
+        builder = ApplicationBuilder().token(bot.token)
+        builder.read_timeout(4).upload_connection_pool_size(2).upload_connect_timeout(
+            3
+        ).upload_write_timeout(30).download_connection_pool_size(5).download_read_timeout(
+            60
+        ).download_pool_timeout(7)
+        app = builder.build()
+        assert media_write_timeout == [None, None, 30, None]
+
+        client = app.bot.upload_request._client
+        assert client.limits == httpx.Limits(max_connections=2)
+        assert client.timeout == httpx.Timeout(pool=1, connect=3, read=4, write=30)
+
+        client = app.bot.download_request._client
+        assert client.limits == httpx.Limits(max_connections=5)
+        assert client.timeout == httpx.Timeout(pool=7, connect=5, read=60, write=5)
+
+    def test_pool_requests_with_custom_request(self, bot, builder):
+        request = HTTPXRequest()
+        upload_request = HTTPXRequest()
+        app = builder.token(bot.token).request(request).upload_request(upload_request).build()
+        assert app.bot.request is request
+        assert app.bot.upload_request is upload_request
+        assert app.bot.download_request is request
+
+        app = (
+            ApplicationBuilder()
+            .token(bot.token)
+            .request(request)
+            .download_connection_pool_size(3)
+            .build()
+        )
+        assert app.bot.upload_request is request
+        assert app.bot.download_request is not request
+        assert app.bot.download_request.stats["connection_pool_size"] == 3
+
+    @pytest.mark.parametrize("pool", ["upload", "download"])
+    @pytest.mark.parametrize(
+        "method",
+        [
+            "connection_pool_size",
+            "connect_timeout",
+            "read_timeout",
+            "write_timeout",
+            "pool_timeout",
+        ],
+    )
+    def test_mutually_exclusive_for_pool_request(self, builder, pool, method):
+        getattr(builder, f"{pool}_request")(1)
+        with pytest.raises(
+            RuntimeError,
+            match=f"`{pool}_{method}` may only be set, if no {pool}_request instance",
+        ):
+            getattr(builder, f"{pool}_{method}")(1)
+
+        builder = ApplicationBuilder()
+        getattr(builder, f"{pool}_{method}")(1)
+        with pytest.raises(RuntimeError, match=f"`{pool}_request` may only be set, if no"):
+            getattr(builder, f"{pool}_request")(1)
 
     def test_custom_socket_options(self, builder, monkeypatch, bot):
         httpx_request_kwargs = []
@@ -435,11 +548,13 @@ class TestApplicationBuilder:
             "get_updates"
         ).build()
 
+        assert len(httpx_request_kwargs) == 4
         for kwargs in httpx_request_kwargs:
-            if kwargs.get("connection_pool_size") == "request":
-                assert kwargs.get("socket_options") == ((1, 2, 3),)
-            else:
+            # upload_request and download_request use the settings of request
+            if kwargs.get("connection_pool_size") == "get_updates":
                 assert kwargs.get("socket_options") == ((4, 5, 6),)
+            else:
+                assert kwargs.get("socket_options") == ((1, 2, 3),)
 
     def test_custom_application_class(self, bot, builder):
         class CustomApplication(Application):
@@ -468,6 +583,7 @@ class TestApplicationBuilder:
         persistence = PicklePersistence("file_path")
         update_queue = asyncio.Queue()
         context_types = ContextTypes()
+        retry_policy = RetryPolicy()
 
         async def post_init(app: Application) -> None:
             pass
@@ -485,6 +601,8 @@ class TestApplicationBuilder:
             .update_queue(update_queue)
             .context_types(context_types)
             .concurrent_updates(concurrent_updates)
+            .download_manager(8)
+            .retry_policy(retry_policy)
             .post_init(post_init)
             .post_shutdown(post_shutdown)
             .post_stop(post_stop)
@@ -498,10 +616,12 @@ class TestApplicationBuilder:
         assert app.update_queue is update_queue
         assert app.updater.update_queue is update_queue
         assert app.updater.bot is app.bot
+        assert app.updater.retry_policy is retry_policy
         assert app.context_types is context_types
         assert isinstance(app.update_processor, SimpleUpdateProcessor)
         assert app.update_processor.max_concurrent_updates == expected.max_concurrent_updates
         assert app.concurrent_updates == app.update_processor.max_concurrent_updates
+        assert app.download_manager.max_concurrent_downloads == 8
         assert app.post_init is post_init
         assert app.post_shutdown is post_shutdown
         assert app.post_stop is post_stop
@@ -526,6 +646,10 @@ class TestApplicationBuilder:
         ).build()
         assert app.update_processor is expected
 
+        download_manager = DownloadManager()
+        app = builder.token(bot.token).download_manager(download_manager).build()
+        assert app.download_manager is download_manager
+
     @pytest.mark.parametrize("input_type", ["bytes", "str", "Path"])
     def test_all_private_key_input_types(self, builder, bot, input_type):
         private_key = data_file("private.key")
@@ -561,6 +685,22 @@ class TestApplicationBuilder:
         assert isinstance(app.update_queue, asyncio.Queue)
         assert isinstance(app.updater, Updater)
 
+    def test_json_codec(self, bot, builder):
+        codec = JSONCodec()
+        app = builder.token(bot.token).json_codec(codec).build()
+        assert app.bot.request.json_codec is codec
+        assert app.bot._request[0].json_codec is codec
+        assert app.bot.upload_request.json_codec is codec
+        assert app.bot.download_request.json_codec is codec
+        # The codec is not installed globally
+        assert DEFAULT_JSON_CODEC is not codec
+        assert HTTPXRequest().json_codec is DEFAULT_JSON_CODEC
+
+    def test_json_codec_not_set(self, bot, builder):
+        app = builder.token(bot.token).build()
+        assert app.bot.request.json_codec is DEFAULT_JSON_CODEC
+        assert app.bot._request[0].json_codec is DEFAULT_JSON_CODEC
+
     @pytest.mark.parametrize(
         ("read_timeout", "timeout", "expected"),
         [
@@ -103,8 +103,24 @@ class TestDictPersistence:
         assert await dict_persistence.get_chat_data() == {}
         assert await dict_persistence.get_bot_data() == {}
         assert await dict_persistence.get_callback_data() is None
+        assert await dict_persistence.get_upload_cache() is None
         assert await dict_persistence.get_conversations("noname") == {}
 
+    async def test_upload_cache(self):
+        with pytest.raises(TypeError, match="upload_cache_json"):
+            DictPersistence(upload_cache_json="thisisnojson99900()))(")
+        with pytest.raises(TypeError, match="upload_cache_json is not in the required format"):
+            DictPersistence(upload_cache_json='{"key": 42}')
+
+        upload_cache_json = json.dumps({"key": "file_id"})
+        dict_persistence = DictPersistence(upload_cache_json=upload_cache_json)
+        assert dict_persistence.upload_cache_json == upload_cache_json
+        assert await dict_persistence.get_upload_cache() == {"key": "file_id"}
+
+        await dict_persistence.update_upload_cache({"key": "other_file_id"})
+        assert dict_persistence.upload_cache == {"key": "other_file_id"}
+        assert dict_persistence.upload_cache_json == json.dumps({"key": "other_file_id"})
+
     async def test_bad_json_string_given(self):
         bad_user_data = "thisisnojson99900()))("
         bad_chat_data = "thisisnojson99900()))("
@@ -0,0 +1,412 @@
+#!/usr/bin/env python
+#
+# A library that provides a Python interface to the Telegram Bot API
+# Copyright (C) 2015-2025
+# Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser Public License for more details.
+#
+# You should have received a copy of the GNU Lesser Public License
+# along with this program.  If not, see [http://www.gnu.org/licenses/].
+import asyncio
+import json
+import os
+import sys
+from http import HTTPStatus
+from pathlib import Path
+from typing import Optional
+
+import pytest
+
+from telegram import Bot, File, FileCredentials
+from telegram.error import BadRequest, NetworkError
+from telegram.ext import DownloadManager
+from telegram.request import HTTPXRequest
+from tests.auxil.files import data_file
+from tests.auxil.slots import mro_slots
+
+
+class FileServer:
+    """A minimal stand-in for the file endpoint of a local Bot API server, which serves
+    ``/<name>`` from :attr:`files` and supports ``Range: bytes=<start>-`` headers."""
+
+    def __init__(self):
+        self.files: dict[str, bytes] = {}
+        self.requests: list[tuple[str, Optional[str]]] = []
+        self.request_received = asyncio.Event()
+        # Closes the connection after sending this many bytes of the next response
+        self.fail_after: list[int] = []
+        self.support_range = True
+        self.status = HTTPStatus.OK
+        self.release: Optional[asyncio.Event] = None
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.server: Optional[asyncio.Server] = None
+        self.handlers: set[asyncio.Task] = set()
+
+    @property
+    def url(self) -> str:
+        host, port = self.server.sockets[0].getsockname()[:2]
+        return f"http://{host}:{port}"
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.handlers.add(asyncio.current_task())
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            head = await reader.readuntil(b"\r\n\r\n")
+            request_line, *header_lines = head.decode().strip().split("\r\n")
+            headers = dict(line.split(": ", 1) for line in header_lines)
+            name = request_line.split()[1].lstrip("/")
+            self.requests.append((name, headers.get("Range")))
+            self.request_received.set()
+            if self.release:
+                await self.release.wait()
+
+            if self.status != HTTPStatus.OK:
+                status = self.status
+                body = json.dumps({"ok": False, "description": "File is too big"}).encode()
+                extra = ""
+            elif "Range" in headers and self.support_range:
+                start = int(headers["Range"].removeprefix("bytes=").rstrip("-"))
+                content = self.files[name]
+                status = HTTPStatus.PARTIAL_CONTENT
+                body = content[start:]
+                extra = f"Content-Range: bytes {start}-{len(content) - 1}/{len(content)}\r\n"
+            else:
+                status = HTTPStatus.OK
+                body = self.files[name]
+                extra = ""
+
+            writer.write(
+                f"HTTP/1.1 {status.value} {status.phrase}\r\nContent-Length: {len(body)}\r\n"
+                f"{extra}Connection: close\r\n\r\n".encode()
+            )
+            writer.write(body[: self.fail_after.pop(0)] if self.fail_after else body)
+            await writer.drain()
+        finally:
+            self.in_flight -= 1
+            writer.close()
+
+    async def wait_for_requests(self, count: int) -> None:
+        while len(self.requests) < count:
+            self.request_received.clear()
+            await self.request_received.wait()
+
+    async def __aenter__(self) -> "FileServer":
+        self.server = await asyncio.start_server(self.handle, "127.0.0.1", 0)
+        return self
+
+    async def __aexit__(self, *args: object) -> None:
+        if self.release:
+            self.release.set()
+        await asyncio.gather(*self.handlers, return_exceptions=True)
+        self.server.close()
+        await self.server.wait_closed()
+
+
+@pytest.fixture
+async def server():
+    async with FileServer() as server:
+        yield server
+
+
+@pytest.fixture
+async def bot():
+    async with HTTPXRequest() as request:
+        yield Bot("1234:abcd", request=request)
+
+
+def make_file(bot: Bot, server: FileServer, name: str, content: bytes, size: bool = True) -> File:
+    server.files[name] = content
+    file = File(
+        file_id=f"id_{name}",
+        file_unique_id=f"unique_{name}",
+        file_size=len(content) if size else None,
+        file_path=f"{server.url}/{name}",
+    )
+    file.set_bot(bot)
+    return file
+
+
+class TestDownloadManagerWithoutRequest:
+    content = os.urandom(300_000)
+    # Chunks that were not received completely when the connection broke are discarded
+    chunk_size = 64 * 1024
+
+    def test_slot_behaviour(self):
+        manager = DownloadManager()
+        for attr in manager.__slots__:
+            assert getattr(manager, attr, "err") != "err", f"got extra slot '{attr}'"
+        assert len(mro_slots(manager)) == len(set(mro_slots(manager))), "duplicate slot"
+
+    def test_init(self):
+        manager = DownloadManager(max_concurrent_downloads=2, max_retries=5, retry_delay=0.5)
+        assert manager.max_concurrent_downloads == 2
+        assert manager.max_retries == 5
+        assert manager.retry_delay == 0.5
+        assert manager.active_downloads == 0
+        assert manager.pending_downloads == 0
+
+    @pytest.mark.parametrize(
+        ("kwargs", "match"),
+        [
+            ({"max_concurrent_downloads": 0}, "positive integer"),
+            ({"max_retries": -1}, "must not be negative"),
+            ({"retry_delay": -1}, "must not be negative"),
+        ],
+    )
+    def test_init_errors(self, kwargs, match):
+        with pytest.raises(ValueError, match=match):
+            DownloadManager(**kwargs)
+
+    async def test_download(self, server, bot, tmp_path):
+        file = make_file(bot, server, "file.bin", self.content)
+        progress = []
+
+        path = await DownloadManager().download(
+            file, tmp_path / "out.bin", progress_callback=lambda *args: progress.append(args)
+        )
+
+        assert path == tmp_path / "out.bin"
+        assert path.read_bytes() == self.content
+        assert list(tmp_path.iterdir()) == [path]
+        assert server.requests == [("file.bin", None)]
+        assert progress[-1] == (len(self.content), len(self.content))
+        assert [count for count, _ in progress] == sorted({count for count, _ in progress})
+
+    async def test_download_default_path(self, server, bot, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        file = make_file(bot, server, "file.bin", self.content)
+
+        path = await DownloadManager().download(file)
+
+        assert path == Path("file.bin")
+        assert (tmp_path / "file.bin").read_bytes() == self.content
+
+    async def test_download_local_file(self, bot, tmp_path):
+        local_path = tmp_path / "local.bin"
+        local_path.write_bytes(self.content)
+        file = File("id", "unique", file_path=str(local_path))
+        file.set_bot(bot)
+
+        assert await DownloadManager().download(file) == local_path
+
+        copy = await DownloadManager().download(file, tmp_path / "copy.bin")
+        assert copy.read_bytes() == self.content
+
+    async def test_download_no_file_path(self, bot):
+        with pytest.raises(RuntimeError, match="No `file_path` available"):
+            await DownloadManager().download(File("id", "unique"))
+
+    @pytest.mark.parametrize("support_range", [True, False])
+    @pytest.mark.parametrize("size", [True, False])
+    async def test_resume_after_interruption(self, server, bot, tmp_path, support_range, size):
+        server.fail_after = [2 * self.chunk_size + 10, self.chunk_size + 10]
+        server.support_range = support_range
+        file = make_file(bot, server, "file.bin", self.content, size=size)
+        progress = []
+
+        path = await DownloadManager(retry_delay=0).download(
+            file, tmp_path / "out.bin", progress_callback=lambda *args: progress.append(args)
+        )
+
+        assert path.read_bytes() == self.content
+        # Without range support, the second attempt receives nothing new
+        offset = 3 if support_range else 2
+        assert [range_ for _, range_ in server.requests] == [
+            None,
+            f"bytes={2 * self.chunk_size}-",
+            f"bytes={offset * self.chunk_size}-",
+        ]
+        total = len(self.content) if size else None
+        assert progress[-1] == (len(self.content), total)
+
+    async def test_resume_part_file(self, server, bot, tmp_path):
+        file = make_file(bot, server, "file.bin", self.content)
+        (tmp_path / "out.bin.unique_file.bin.part").write_bytes(self.content[:1234])
+
+        path = await DownloadManager().download(file, tmp_path / "out.bin")
+
+        assert path.read_bytes() == self.content
+        assert server.requests == [("file.bin", "bytes=1234-")]
+        assert list(tmp_path.iterdir()) == [path]
+
+    async def test_complete_part_file(self, server, bot, tmp_path):
+        file = make_file(bot, server, "file.bin", self.content)
+        (tmp_path / "out.bin.unique_file.bin.part").write_bytes(self.content)
+
+        path = await DownloadManager().download(file, tmp_path / "out.bin")
+
+        assert path.read_bytes() == self.content
+        assert server.requests == []
+
+    async def test_part_file_too_large(self, server, bot, tmp_path):
+        file = make_file(bot, server, "file.bin", self.content)
+        (tmp_path / "out.bin.unique_file.bin.part").write_bytes(self.content + b"garbage")
+
+        path = await DownloadManager().download(file, tmp_path / "out.bin")
+
+        assert path.read_bytes() == self.content
+        assert server.requests == [("file.bin", None)]
+
+    async def test_encrypted_file_not_resumed(self, server, bot, tmp_path):
+        # check tests/_files/test_file.py for the source of these values
+        credentials = FileCredentials(
+            "Oq3G4sX+bKZthoyms1YlPqvWou9esb+z0Bi/KqQUG8s=",
+            "Pt7fKPgYWKA/7a8E64Ea1X8C+Wf7Ky1tF4ANBl63vl4=",
+        )
+        encrypted = data_file("image_encrypted.jpg").read_bytes()
+        server.fail_after = [100]
+        file = make_file(bot, server, "file.bin", encrypted)
+        file.set_credentials(credentials)
+        (tmp_path / "out.bin.unique_file.bin.part").write_bytes(b"stale data")
+
+        path = await DownloadManager(retry_delay=0).download(file, tmp_path / "out.bin")
+
+        assert path.read_bytes() == data_file("image_decrypted.jpg").read_bytes()
+        assert server.requests == [("file.bin", None), ("file.bin", None)]
+        assert list(tmp_path.iterdir()) == [path]
+
+    async def test_size_mismatch(self, server, bot, tmp_path):
+        file = make_file(bot, server, "file.bin", self.content)
+        server.files["file.bin"] = self.content[:1000]
+
+        with pytest.raises(NetworkError, match="Downloaded 1000 bytes of unique_file.bin"):
+            await DownloadManager(max_retries=1, retry_delay=0).download(
+                file, tmp_path / "out.bin"
+            )
+
+        assert len(server.requests) == 2
+        assert list(tmp_path.iterdir()) == []
+
+    async def test_retries_exhausted(self, server, bot, tmp_path):
+        server.fail_after = [self.chunk_size + 10] * 3
+        file = make_file(bot, server, "file.bin", self.content)
+
+        with pytest.raises(NetworkError):
+            await DownloadManager(max_retries=2, retry_delay=0).download(
+                file, tmp_path / "out.bin"
+            )
+
+        assert len(server.requests) == 3
+        # the part file is kept such that the download can be resumed later on
+        part_path = tmp_path / "out.bin.unique_file.bin.part"
+        assert part_path.read_bytes() == self.content[: 3 * self.chunk_size]
+
+    async def test_retry_delay(self, server, bot, tmp_path, monkeypatch):
+        delays = []
+        original_sleep = asyncio.sleep
+
+        async def sleep(delay, *args, **kwargs):
+            # Other code running in the same event loop may sleep, too
+            if sys._getframe(1).f_code is DownloadManager._run.__code__:
+                delays.append(delay)
+                delay = 0
+            await original_sleep(delay, *args, **kwargs)
+
+        monkeypatch.setattr(asyncio, "sleep", sleep)
+        server.fail_after = [10, 10, 10]
+        file = make_file(bot, server, "file.bin", self.content)
+
+        await DownloadManager(retry_delay=0.5).download(file, tmp_path / "out.bin")
+
+        assert delays == [0.5, 1, 2]
+
+    async def test_bad_request_not_retried(self, server, bot, tmp_path):
+        server.status = HTTPStatus.BAD_REQUEST
+        file = make_file(bot, server, "file.bin", self.content)
+
+        with pytest.raises(BadRequest, match="File is too big"):
+            await DownloadManager(retry_delay=0).download(file, tmp_path / "out.bin")
+
+        assert len(server.requests) == 1
+
+    async def test_deduplication(self, server, bot, tmp_path):
+        server.release = asyncio.Event()
+        file = make_file(bot, server, "file.bin", self.content)
+        manager = DownloadManager()
+        progress_1, progress_2 = [], []
+
+        tasks = [
+            asyncio.create_task(
+                manager.download(
+                    file, tmp_path / "first.bin", progress_callback=lambda *a: progress_1.append(a)
+                )
+            ),
+            asyncio.create_task(
+                manager.download(
+                    file,
+                    tmp_path / "second.bin",
+                    progress_callback=lambda *a: progress_2.append(a),
+                )
+            ),
+        ]
+        await server.wait_for_requests(1)
+        assert manager.pending_downloads == 1
+        server.release.set()
+        first, second = await asyncio.gather(*tasks)
+
+        assert server.requests == [("file.bin", None)]
+        assert first.read_bytes() == second.read_bytes() == self.content
+        assert progress_1 == progress_2
+        assert manager.pending_downloads == 0
+
+        # The file is downloaded again once the previous download is done
+        await manager.download(file, tmp_path / "third.bin")
+        assert len(server.requests) == 2
+
+    async def test_concurrency_limit(self, server, bot, tmp_path):
+        server.release = asyncio.Event()
+        manager = DownloadManager(max_concurrent_downloads=2)
+        files = [make_file(bot, server, f"file{i}.bin", self.content) for i in range(5)]
+
+        tasks = [
+            asyncio.create_task(manager.download(file, tmp_path / file.file_unique_id))
+            for file in files
+        ]
+        await server.wait_for_requests(2)
+        await asyncio.sleep(0.05)
+        assert len(server.requests) == 2
+        assert manager.active_downloads == 2
+        assert manager.pending_downloads == 5
+
+        server.release.set()
+        paths = await asyncio.gather(*tasks)
+
+        assert all(path.read_bytes() == self.content for path in paths)
+        assert server.max_in_flight == 2
+        assert manager.active_downloads == 0
+        assert manager.pending_downloads == 0
+
+    @pytest.mark.parametrize("other_waiter", [True, False])
+    async def test_cancel(self, server, bot, tmp_path, other_waiter):
+        server.release = asyncio.Event()
+        file = make_file(bot, server, "file.bin", self.content)
+        manager = DownloadManager()
+
+        task = asyncio.create_task(manager.download(file, tmp_path / "first.bin"))
+        if other_waiter:
+            other_task = asyncio.create_task(manager.download(file, tmp_path / "second.bin"))
+        await server.wait_for_requests(1)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        if other_waiter:
+            # the download continues for the remaining caller
+            server.release.set()
+            path = await other_task
+            assert path.read_bytes() == self.content
+        else:
+            await asyncio.sleep(0.01)
+            assert manager.pending_downloads == 0
+            assert not (tmp_path / "first.bin").exists()
@@ -41,6 +41,7 @@ from telegram import (
     User,
 )
 from telegram.ext import filters
+from telegram.ext._utils.filtercache import filter_cache
 from tests.auxil.slots import mro_slots
 
 
@@ -226,6 +227,31 @@ class TestFilters:
         update.message.text = None
         assert not filters.Regex(r"fail").check_update(update)
 
+    def test_filters_regex_set(self, update):
+        regex_set = filters.RegexSet([r"help", re.compile(r"^/start\b"), r"^(\w+)$", r"(p)"])
+        assert regex_set.data_filter
+        assert regex_set.patterns[1] is re.compile(r"^/start\b")
+        assert str(regex_set) == r"filters.RegexSet(['help', '^/start\\b', '^(\\w+)$', '(p)'])"
+
+        update.message.text = "/start help"
+        result = regex_set.check_update(update)
+        assert isinstance(result, dict)
+        assert [match.group() for match in result["matches"]] == ["help", "/start", "p"]
+
+        update.message.text = "word"
+        assert [match.group(1) for match in regex_set.check_update(update)["matches"]] == ["word"]
+        update.message.text = "no match"
+        assert not regex_set.check_update(update)
+        update.message.text = None
+        assert not regex_set.check_update(update)
+
+    def test_filters_regex_set_merged(self, update):
+        update.message.text = "/start help"
+        result = (filters.RegexSet([r"help", r"^/start"]) & filters.Regex(r"(\w+)")).check_update(
+            update
+        )
+        assert [match.group() for match in result["matches"]] == ["help", "/start", "start"]
+
     def test_filters_regex_multiple(self, update):
         sre_type = type(re.match("", ""))
         update.message.text = "/start deep-linked param"
@@ -1443,6 +1469,31 @@ class TestFilters:
         with pytest.raises(RuntimeError, match="username in conjunction"):
             f.add_usernames("chat")
 
+    def test_filters_chat_snapshots(self, update):
+        f = filters.Chat(range(0, 20_000, 2))
+        internal = f._chat_ids
+        snapshot = f.chat_ids
+        assert isinstance(snapshot, frozenset)
+        assert f._chat_ids is internal
+
+        f.add_chat_ids(range(1, 20_000, 2))
+        f.remove_chat_ids([0, 1])
+        assert f._chat_ids is not internal
+        assert f.chat_ids == set(range(2, 20_000))
+        # Earlier snapshots are not changed
+        assert snapshot == set(range(0, 20_000, 2))
+
+        update.message.chat.id = 19_999
+        assert f.check_update(update)
+        update.message.chat.id = 1
+        assert not f.check_update(update)
+
+        f = filters.Chat(username="chat")
+        snapshot = f.usernames
+        f.add_usernames("other")
+        assert f.usernames == {"chat", "other"}
+        assert snapshot == {"chat"}
+
     def test_filters_chat_remove_chat_by_name(self, update):
         chats = ["chat_a", "chat_b", "chat_c"]
         f = filters.Chat(username=chats)
@@ -2557,6 +2608,118 @@ class TestFilters:
         result = (filters.COMMAND | DataFilter("blah")).check_update(update)
         assert result["test"] == ["blah"]
 
+    def test_merged_cost_ordering(self, update, monkeypatch):
+        class TestException(Exception):
+            pass
+
+        def raising_filter(self, message):
+            raise TestException
+
+        monkeypatch.setattr(filters.Regex, "filter", raising_filter)
+        update.message.text = "test"
+
+        # Cheap filters of this module are checked before regexes
+        assert not (filters.Regex("t") & filters.COMMAND).check_update(update)
+        assert (~filters.COMMAND | filters.Regex("t")).check_update(update)
+        assert not (filters.Regex("t") & (filters.PHOTO | filters.COMMAND)).check_update(update)
+        # Or returns the data of the first filter that matches, so the order is kept
+        with pytest.raises(TestException):
+            (filters.Regex("t") | filters.TEXT).check_update(update)
+
+    def test_merged_cost_ordering_custom_filter(self, update, base_class):
+        class TestException(Exception):
+            pass
+
+        class RaisingFilter(base_class):
+            def filter(self, _):
+                raise TestException
+
+        update.message.text = "test"
+        # Custom filters are checked in the order in which they were combined
+        with pytest.raises(TestException):
+            (RaisingFilter() & filters.COMMAND).check_update(update)
+        with pytest.raises(TestException):
+            (filters.Regex("t") & RaisingFilter() & filters.COMMAND).check_update(update)
+
+    def test_merged_data_merging_reordered(self, update):
+        update.message.text = "test"
+        result = (
+            filters.Regex("t")
+            & filters.TEXT
+            & ~filters.COMMAND
+            & filters.Regex("e")
+            & filters.ChatType.PRIVATE
+        ).check_update(update)
+        assert [match.group() for match in result["matches"]] == ["t", "e"]
+
+        result = (filters.Regex("s") & filters.TEXT).check_update(update)
+        assert [match.group() for match in result["matches"]] == ["s"]
+        result = (filters.TEXT & filters.Regex("x")).check_update(update)
+        assert result is False
+
+    def test_merged_data_merging_nested_order(self, update):
+        update.message.text = "ab"
+        # Nested data filters are more expensive but their data still comes first
+        result = ((filters.Regex("a") | filters.TEXT) & filters.Regex("b")).check_update(update)
+        assert [match.group() for match in result["matches"]] == ["a", "b"]
+        result = (
+            (filters.Regex("a") & filters.TEXT) & ~filters.COMMAND & filters.Regex("b")
+        ).check_update(update)
+        assert [match.group() for match in result["matches"]] == ["a", "b"]
+        result = (
+            filters.Regex("b") & ((filters.Regex("a") | filters.PHOTO) & filters.TEXT)
+        ).check_update(update)
+        assert [match.group() for match in result["matches"]] == ["b", "a"]
+
+    def test_filter_cache(self, update, monkeypatch):
+        checked = []
+        original_filter = filters.Regex.filter
+
+        def tracking_filter(self, message):
+            checked.append(self.pattern.pattern)
+            return original_filter(self, message)
+
+        monkeypatch.setattr(filters.Regex, "filter", tracking_filter)
+        update.message.text = "test"
+        regex = filters.Regex("t")
+        first = filters.TEXT & regex
+        second = regex & ~filters.COMMAND
+
+        with filter_cache(update) as cache:
+            first_result = first.check_update(update)
+            # Modifying the data must not affect the cached result
+            first_result["matches"].append("modified")
+            second_result = second.check_update(update)
+            assert checked == ["t"]
+            assert [match.group() for match in second_result["matches"]] == ["t"]
+
+            # Only the results for this update are cached
+            other_update = Update(1, message=update.message)
+            first.check_update(other_update)
+            assert checked == ["t", "t"]
+
+            cache.clear()
+            first.check_update(update)
+            assert checked == ["t", "t", "t"]
+
+        first.check_update(update)
+        assert checked == ["t", "t", "t", "t"]
+
+    def test_filter_cache_custom_filter(self, update, base_class):
+        checked = []
+
+        class TrackingFilter(base_class):
+            def filter(self, _):
+                checked.append(True)
+                return True
+
+        tracking_filter = TrackingFilter()
+        with filter_cache(update):
+            (filters.TEXT | tracking_filter).check_update(update)
+            (tracking_filter & filters.ALL).check_update(update)
+        # Custom filters might have side effects and are never cached
+        assert checked == [True, True]
+
     def test_filters_via_bot_init(self):
         with pytest.raises(RuntimeError, match="in conjunction with"):
             filters.ViaBot(bot_id=1, username="bot")
@@ -683,6 +683,21 @@ class TestPicklePersistence:
         assert pickle_persistence.conversations["name1"] == {(123, 123): 5}
         assert await pickle_persistence.get_conversations("name1") == {(123, 123): 5}
 
+    @pytest.mark.parametrize("single_file", [True, False])
+    async def test_upload_cache(self, pickle_persistence, single_file):
+        pickle_persistence.single_file = single_file
+        filepath = Path("pickletest" if single_file else "pickletest_upload_cache")
+
+        assert not await pickle_persistence.get_upload_cache()
+        await pickle_persistence.update_upload_cache({"key": "file_id"})
+        assert filepath.is_file()
+
+        new_persistence = PicklePersistence(filepath="pickletest", single_file=single_file)
+        upload_cache = await new_persistence.get_upload_cache()
+        assert upload_cache == {"key": "file_id"}
+        upload_cache["other"] = "other_file_id"
+        assert new_persistence.upload_cache == {"key": "file_id"}
+
     async def test_updating_single_file_no_data(self, pickle_persistence):
         pickle_persistence.single_file = True
         assert not any(
@@ -35,7 +35,7 @@ import pytest
 from telegram import BotCommand, Chat, Message, User
 from telegram.constants import ParseMode
 from telegram.error import RetryAfter
-from telegram.ext import AIORateLimiter, BaseRateLimiter, Defaults, ExtBot
+from telegram.ext import AIORateLimiter, BaseRateLimiter, Defaults, ExtBot, RetryPolicy
 from telegram.request import BaseRequest, RequestData
 from tests.auxil.envvars import GITHUB_ACTIONS, TEST_WITH_OPT_DEPS
 
@@ -221,7 +221,10 @@ class TestAIORateLimiter:
             token=bot.token,
             request=self.CountRequest(retry_after=1),
             rate_limiter=AIORateLimiter(
-                max_retries=max_retries, overall_max_rate=0, group_max_rate=0
+                max_retries=max_retries,
+                overall_max_rate=0,
+                group_max_rate=0,
+                retry_policy=RetryPolicy(retry_after_jitter=0),
             ),
         )
         with pytest.raises(RetryAfter):
@@ -237,12 +240,32 @@ class TestAIORateLimiter:
         delays = [j - i for i, j in zip(times[:-1], times[1:])]
         assert delays == pytest.approx([1.1 for _ in range(max_retries)], rel=0.05)
 
+    async def test_retry_after_jitter(self, bot):
+        bot = ExtBot(
+            token=bot.token,
+            request=self.CountRequest(retry_after=1),
+            rate_limiter=AIORateLimiter(max_retries=2, overall_max_rate=0, group_max_rate=0),
+        )
+        with pytest.raises(RetryAfter):
+            await bot.get_me()
+
+        # The default policy adds 0.1 seconds and up to 0.5 seconds of jitter
+        times = TestAIORateLimiter.call_times
+        delays = [j - i for i, j in zip(times[:-1], times[1:])]
+        assert len(delays) == 2
+        assert all(1.05 <= delay <= 1.7 for delay in delays)
+
     async def test_delay_all_pending_on_retry(self, bot):
         # Makes sure that a RetryAfter blocks *all* pending requests
         bot = ExtBot(
             token=bot.token,
             request=self.CountRequest(retry_after=1),
-            rate_limiter=AIORateLimiter(max_retries=1, overall_max_rate=0, group_max_rate=0),
+            rate_limiter=AIORateLimiter(
+                max_retries=1,
+                overall_max_rate=0,
+                group_max_rate=0,
+                retry_policy=RetryPolicy(retry_after_jitter=0),
+            ),
         )
         task_1 = asyncio.create_task(bot.get_me())
         await asyncio.sleep(0.1)
@@ -0,0 +1,165 @@
+#!/usr/bin/env python
+#
+# A library that provides a Python interface to the Telegram Bot API
+# Copyright (C) 2015-2025
+# Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser Public License for more details.
+#
+# You should have received a copy of the GNU Lesser Public License
+# along with this program.  If not, see [http://www.gnu.org/licenses/].
+import pytest
+
+from telegram.error import BadRequest, NetworkError, RetryAfter, TelegramError, TimedOut
+from telegram.ext import ExponentialBackoff, RetryPolicy
+from tests.auxil.slots import mro_slots
+
+
+class TestExponentialBackoffWithoutRequest:
+    def test_slot_behaviour(self):
+        inst = ExponentialBackoff()
+        for attr in inst.__slots__:
+            assert getattr(inst, attr, "err") != "err", f"got extra slot '{attr}'"
+        assert len(mro_slots(inst)) == len(set(mro_slots(inst))), "duplicate slot"
+
+    def test_init(self):
+        backoff = ExponentialBackoff()
+        assert backoff.initial == 1
+        assert backoff.multiplier == 2
+        assert backoff.maximum == 30
+        assert backoff.jitter is True
+
+        backoff = ExponentialBackoff(initial=0.5, multiplier=3, maximum=10, jitter=False)
+        assert backoff.initial == 0.5
+        assert backoff.multiplier == 3
+        assert backoff.maximum == 10
+        assert backoff.jitter is False
+
+    @pytest.mark.parametrize(
+        "kwargs", [{"initial": -1}, {"maximum": -1}, {"multiplier": 0.5}], ids=str
+    )
+    def test_init_invalid(self, kwargs):
+        with pytest.raises(ValueError, match="must"):
+            ExponentialBackoff(**kwargs)
+
+    def test_repr(self):
+        backoff = ExponentialBackoff(initial=0.5, multiplier=3, maximum=10, jitter=False)
+        assert (
+            repr(backoff)
+            == "ExponentialBackoff[initial=0.5, multiplier=3, maximum=10, jitter=False]"
+        )
+
+    def test_get_delay_without_jitter(self):
+        backoff = ExponentialBackoff(initial=1, multiplier=1.5, maximum=5, jitter=False)
+        assert [backoff.get_delay(i) for i in range(6)] == [1, 1.5, 2.25, 3.375, 5, 5]
+
+    def test_get_delay_overflow(self):
+        backoff = ExponentialBackoff(initial=1, multiplier=10, maximum=30, jitter=False)
+        assert backoff.get_delay(10_000) == 30
+
+    def test_get_delay_with_jitter(self):
+        backoff = ExponentialBackoff(initial=1, multiplier=2, maximum=8)
+        for attempt in range(6):
+            base = min(8, 2**attempt)
+            delays = {backoff.get_delay(attempt) for _ in range(50)}
+            assert all(0 <= delay <= base for delay in delays)
+            # The delays are actually randomized
+            assert len(delays) > 1
+
+
+class TestRetryPolicyWithoutRequest:
+    def test_slot_behaviour(self):
+        inst = RetryPolicy()
+        for attr in inst.__slots__:
+            assert getattr(inst, attr, "err") != "err", f"got extra slot '{attr}'"
+        assert len(mro_slots(inst)) == len(set(mro_slots(inst))), "duplicate slot"
+
+    def test_init_defaults(self):
+        policy = RetryPolicy()
+        assert policy.retry_after_slack == 0.1
+        assert policy.retry_after_jitter == 0.5
+
+        assert policy.network_error.initial == 1
+        assert policy.network_error.multiplier == 1.5
+        assert policy.network_error.maximum == 30
+        assert policy.network_error.jitter is True
+
+        assert policy.timed_out.initial == 0.5
+        assert policy.timed_out.multiplier == 2
+        assert policy.timed_out.maximum == 10
+        assert policy.timed_out.jitter is True
+
+    def test_init(self):
+        network_error = ExponentialBackoff()
+        timed_out = ExponentialBackoff()
+        policy = RetryPolicy(
+            network_error=network_error,
+            timed_out=timed_out,
+            retry_after_slack=1,
+            retry_after_jitter=2,
+        )
+        assert policy.network_error is network_error
+        assert policy.timed_out is timed_out
+        assert policy.retry_after_slack == 1
+        assert policy.retry_after_jitter == 2
+
+    @pytest.mark.parametrize(
+        "kwargs", [{"retry_after_slack": -1}, {"retry_after_jitter": -1}], ids=str
+    )
+    def test_init_invalid(self, kwargs):
+        with pytest.raises(ValueError, match="must not be negative"):
+            RetryPolicy(**kwargs)
+
+    def test_repr(self):
+        policy = RetryPolicy(
+            network_error=ExponentialBackoff(jitter=False),
+            timed_out=ExponentialBackoff(initial=2),
+            retry_after_slack=0,
+            retry_after_jitter=1,
+        )
+        assert repr(policy) == (
+            "RetryPolicy[network_error=ExponentialBackoff[initial=1.0, multiplier=2.0, "
+            "maximum=30.0, jitter=False], timed_out=ExponentialBackoff[initial=2, "
+            "multiplier=2.0, maximum=30.0, jitter=True], retry_after_slack=0, "
+            "retry_after_jitter=1]"
+        )
+
+    def test_get_delay_retry_after(self):
+        policy = RetryPolicy(retry_after_slack=0.25, retry_after_jitter=0)
+        assert policy.get_delay(RetryAfter(3), 0) == 3.25
+        # The attempt number does not matter, Telegram tells us how long to wait
+        assert policy.get_delay(RetryAfter(3), 10) == 3.25
+
+    def test_get_delay_retry_after_jitter(self):
+        policy = RetryPolicy()
+        delays = {policy.get_delay(RetryAfter(3), 0) for _ in range(50)}
+        assert all(3.1 <= delay <= 3.6 for delay in delays)
+        assert len(delays) > 1
+
+    @pytest.mark.parametrize(
+        ("error", "backoff"),
+        [
+            (TimedOut(), "timed_out"),
+            (NetworkError("test"), "network_error"),
+            (BadRequest("test"), "network_error"),
+            (TelegramError("test"), "network_error"),
+        ],
+        ids=("TimedOut", "NetworkError", "BadRequest", "TelegramError"),
+    )
+    def test_get_delay_backoff(self, error, backoff):
+        policy = RetryPolicy(
+            network_error=ExponentialBackoff(initial=1, multiplier=3, jitter=False),
+            timed_out=ExponentialBackoff(initial=0.5, multiplier=2, jitter=False),
+        )
+        expected = getattr(policy, backoff)
+        assert [policy.get_delay(error, i) for i in range(4)] == [
+            expected.get_delay(i) for i in range(4)
+        ]
@@ -29,7 +29,7 @@ import pytest
 
 from telegram import Bot, InlineKeyboardButton, InlineKeyboardMarkup, Update
 from telegram.error import InvalidToken, RetryAfter, TelegramError, TimedOut
-from telegram.ext import ExtBot, InvalidCallbackData, Updater
+from telegram.ext import ExtBot, InvalidCallbackData, RetryPolicy, Updater
 from tests.auxil.build_messages import make_message, make_message_update
 from tests.auxil.envvars import TEST_WITH_OPT_DEPS
 from tests.auxil.files import TEST_DATA_PATH, data_file
@@ -112,6 +112,11 @@ class TestUpdater:
         updater = Updater(bot=bot, update_queue=queue)
         assert updater.bot is bot
         assert updater.update_queue is queue
+        assert isinstance(updater.retry_policy, RetryPolicy)
+
+        retry_policy = RetryPolicy()
+        updater = Updater(bot=bot, update_queue=queue, retry_policy=retry_policy)
+        assert updater.retry_policy is retry_policy
 
     def test_repr(self, bot):
         queue = asyncio.Queue()
@@ -488,6 +493,51 @@ class TestUpdater:
                 with pytest.raises(TelegramError, match=str(retries + 1)):
                     await updater.start_polling(bootstrap_retries=retries)
 
+    async def test_start_polling_retry_policy(self, bot, monkeypatch):
+        calls = []
+
+        class RecordingPolicy(RetryPolicy):
+            def get_delay(self, error, attempt):
+                calls.append((type(error), attempt))
+                return 0
+
+        updater = Updater(bot=bot, update_queue=asyncio.Queue(), retry_policy=RecordingPolicy())
+        errors = [TimedOut("1"), TelegramError("2"), None, RetryAfter(1)]
+        done = asyncio.Event()
+
+        async def get_updates(*args, **kwargs):
+            await asyncio.sleep(0)
+            if not errors:
+                done.set()
+                return []
+            error = errors.pop(0)
+            if error:
+                raise error
+            return []
+
+        async def delete_webhook(*args, **kwargs):
+            self.message_count += 1
+            if self.message_count < 3:
+                raise TelegramError(str(self.message_count))
+            return True
+
+        monkeypatch.setattr(updater.bot, "get_updates", get_updates)
+        monkeypatch.setattr(updater.bot, "delete_webhook", delete_webhook)
+
+        async with updater:
+            await updater.start_polling(bootstrap_retries=2, error_callback=lambda _: None)
+            await done.wait()
+            await updater.stop()
+
+        # The attempt counter grows with consecutive failures and is reset after a success
+        assert calls == [
+            (TelegramError, 0),
+            (TelegramError, 1),
+            (TimedOut, 0),
+            (TelegramError, 1),
+            (RetryAfter, 0),
+        ]
+
     @pytest.mark.parametrize(
         ("error", "callback_should_be_called"),
         argvalues=[
@@ -0,0 +1,249 @@
+#!/usr/bin/env python
+#
+# A library that provides a Python interface to the Telegram Bot API
+# Copyright (C) 2015-2025
+# Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser Public License for more details.
+#
+# You should have received a copy of the GNU Lesser Public License
+# along with this program.  If not, see [http://www.gnu.org/licenses/].
+import json
+from io import BytesIO
+
+import pytest
+
+from telegram import Bot, InputFile, InputMediaDocument, InputMediaPhoto
+from telegram.error import BadRequest
+from telegram.ext import ApplicationBuilder, DictPersistence, UploadCache
+from tests.auxil.pytest_classes import make_bot
+from tests.auxil.slots import mro_slots
+
+
+def message_json(message_id: int = 1, **media: object) -> dict:
+    return {
+        "message_id": message_id,
+        "date": 0,
+        "chat": {"id": 1, "type": "private"},
+        **media,
+    }
+
+
+def file_json(file_id: str) -> dict:
+    return {"file_id": file_id, "file_unique_id": f"unique_{file_id}", "width": 1, "height": 1}
+
+
+def media_json(media_type: str, file: dict) -> dict:
+    return {media_type: [file] if media_type == "photo" else file}
+
+
+class FakeDoPost:
+    """Replacement for Bot._do_post that records the sent data and returns messages holding
+    new file_ids for uploaded files."""
+
+    def __init__(self, error: str = "Wrong file identifier/HTTP URL specified"):
+        self.error = error
+        self.requests = []
+        self.counter = 0
+
+    def file_id(self, media: object) -> dict:
+        if isinstance(media, str):
+            if media.startswith("stale"):
+                raise BadRequest(self.error)
+            return file_json(media)
+        self.counter += 1
+        return file_json(f"file_id_{self.counter}")
+
+    async def __call__(self, endpoint, data, **kwargs):
+        self.requests.append((endpoint, dict(data)))
+        if endpoint == "sendMediaGroup":
+            return [
+                message_json(index, **media_json(media.type, self.file_id(media.media)))
+                for index, media in enumerate(data["media"])
+            ]
+        if endpoint == "sendPhoto":
+            return message_json(photo=[file_json("small"), self.file_id(data["photo"])])
+        if endpoint == "sendDocument":
+            return message_json(document=self.file_id(data["document"]))
+        return True
+
+
+@pytest.fixture
+def fake_do_post(monkeypatch):
+    fake = FakeDoPost()
+
+    async def _do_post(self, endpoint, data, **kwargs):
+        return await fake(endpoint, data, **kwargs)
+
+    monkeypatch.setattr(Bot, "_do_post", _do_post)
+    return fake
+
+
+@pytest.fixture
+async def upload_bot(bot_info):
+    async with make_bot(bot_info, upload_cache=True) as bot:
+        yield bot
+
+
+class TestUploadCacheWithoutRequest:
+    def test_slot_behaviour(self):
+        inst = UploadCache()
+        for attr in inst.__slots__:
+            assert getattr(inst, attr, "err") != "err", f"got extra slot '{attr}'"
+        assert len(mro_slots(inst)) == len(set(mro_slots(inst))), "duplicate slot"
+
+    @pytest.mark.parametrize("maxsize", [0, -1])
+    def test_init_invalid_maxsize(self, maxsize):
+        with pytest.raises(ValueError, match="positive integer"):
+            UploadCache(maxsize=maxsize)
+
+    def test_build_key_content(self, tmp_path):
+        key = UploadCache.build_key("photo", InputFile(b"content"))
+        assert key.startswith("photo:sha256:")
+        assert UploadCache.build_key("photo", InputFile(BytesIO(b"content"))) == key
+        assert UploadCache.build_key("document", InputFile(b"content")) != key
+        assert UploadCache.build_key("photo", InputFile(b"other")) != key
+
+        path = tmp_path / "file.bin"
+        path.write_bytes(b"content")
+        assert UploadCache.build_key("photo", InputFile(path, memory_map=True)) == key
+
+    def test_build_key_path(self, tmp_path):
+        path = tmp_path / "file.bin"
+        path.write_bytes(b"content")
+        key = UploadCache.build_key("document", InputFile(path))
+        assert key.startswith(f"document:path:{path.resolve()}:7:")
+        with path.open("rb") as file:
+            assert UploadCache.build_key(
+                "document", InputFile(file, read_file_handle=False)
+            ).startswith("document:file:")
+
+        path.write_bytes(b"changed content")
+        assert UploadCache.build_key("document", InputFile(path)) != key
+
+    def test_build_key_not_cacheable(self, tmp_path):
+        async def chunks():
+            yield b"content"
+
+        assert UploadCache.build_key("document", InputFile(chunks())) is None
+        assert UploadCache.build_key("document", InputFile(tmp_path / "missing.bin")) is None
+
+    def test_lru(self):
+        cache = UploadCache(maxsize=2)
+        cache.set_file_id("a", "file_a")
+        cache.set_file_id("b", "file_b")
+        assert cache.get_file_id("a") == "file_a"
+        cache.set_file_id("c", "file_c")
+
+        assert len(cache) == 2
+        assert cache.get_file_id("b") is None
+        assert cache.persistence_data == {"a": "file_a", "c": "file_c"}
+
+    def test_persistence_data(self):
+        cache = UploadCache(persistent_data={"a": "file_a", "b": "file_b"})
+        assert cache.persistence_data == {"a": "file_a", "b": "file_b"}
+        cache.persistence_data["c"] = "file_c"
+        assert cache.get_file_id("c") is None
+
+        cache.drop_file_id("a")
+        cache.drop_file_id("unknown")
+        assert cache.persistence_data == {"b": "file_b"}
+        cache.clear()
+        assert len(cache) == 0
+
+    async def test_no_upload_cache(self, bot_info):
+        assert make_bot(bot_info).upload_cache is None
+        bot = make_bot(bot_info, upload_cache=42)
+        assert bot.upload_cache.maxsize == 42
+
+    async def test_send_reuses_file_id(self, upload_bot, fake_do_post):
+        message = await upload_bot.send_document(1, b"content", filename="file.txt")
+        assert message.document.file_id == "file_id_1"
+        assert isinstance(fake_do_post.requests[0][1]["document"], InputFile)
+
+        message = await upload_bot.send_document(1, BytesIO(b"content"))
+        assert message.document.file_id == "file_id_1"
+        assert fake_do_post.requests[1][1]["document"] == "file_id_1"
+
+        # the same content sent as a different kind of media is uploaded
+        message = await upload_bot.send_photo(1, b"content")
+        assert message.photo[-1].file_id == "file_id_2"
+        message = await upload_bot.send_photo(1, b"content")
+        assert fake_do_post.requests[3][1]["photo"] == "file_id_2"
+
+        # endpoints that only accept uploads are not affected
+        await upload_bot.set_chat_photo(1, b"content")
+        assert isinstance(fake_do_post.requests[4][1]["photo"], InputFile)
+        assert len(upload_bot.upload_cache) == 2
+
+    async def test_send_media_group(self, upload_bot, fake_do_post, tmp_path):
+        path = tmp_path / "file.bin"
+        path.write_bytes(b"document")
+        media = [
+            InputMediaDocument(InputFile(path, attach=True)),
+            InputMediaPhoto(b"photo"),
+            InputMediaPhoto("known_file_id"),
+        ]
+        await upload_bot.send_media_group(1, media[:2])
+        assert set(upload_bot.upload_cache.persistence_data.values()) == {
+            "file_id_1",
+            "file_id_2",
+        }
+
+        messages = await upload_bot.send_media_group(1, media)
+        sent = fake_do_post.requests[1][1]["media"]
+        assert [item.media for item in sent] == ["file_id_1", "file_id_2", "known_file_id"]
+        assert [(message.document or message.photo[-1]).file_id for message in messages] == [
+            "file_id_1",
+            "file_id_2",
+            "known_file_id",
+        ]
+        # the passed objects are not changed
+        assert isinstance(media[0].media, InputFile)
+
+    async def test_stale_file_id(self, upload_bot, fake_do_post):
+        key = UploadCache.build_key("document", InputFile(b"content"))
+        upload_bot.upload_cache.set_file_id(key, "stale_file_id")
+
+        message = await upload_bot.send_document(1, b"content")
+        assert message.document.file_id == "file_id_1"
+        assert fake_do_post.requests[0][1]["document"] == "stale_file_id"
+        assert isinstance(fake_do_post.requests[1][1]["document"], InputFile)
+        assert upload_bot.upload_cache.get_file_id(key) == "file_id_1"
+
+    async def test_other_bad_request(self, upload_bot, fake_do_post):
+        fake_do_post.error = "Chat not found"
+        key = UploadCache.build_key("document", InputFile(b"content"))
+        upload_bot.upload_cache.set_file_id(key, "stale_file_id")
+
+        with pytest.raises(BadRequest, match="Chat not found"):
+            await upload_bot.send_document(1, b"content")
+        assert len(fake_do_post.requests) == 1
+        assert upload_bot.upload_cache.get_file_id(key) == "stale_file_id"
+
+    async def test_persistence(self, bot_info, fake_do_post):
+        key = UploadCache.build_key("document", InputFile(b"content"))
+        persistence = DictPersistence(upload_cache_json=json.dumps({key: "file_id_0"}))
+        app = (
+            ApplicationBuilder()
+            .bot(make_bot(bot_info, upload_cache=True))
+            .persistence(persistence)
+            .build()
+        )
+        async with app:
+            assert app.bot.upload_cache.get_file_id(key) == "file_id_0"
+            await app.bot.send_photo(1, b"content")
+            await app.update_persistence()
+
+        assert persistence.upload_cache == {
+            key: "file_id_0",
+            UploadCache.build_key("photo", InputFile(b"content")): "file_id_1",
+        }
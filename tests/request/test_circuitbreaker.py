@@ -0,0 +1,261 @@
+#!/usr/bin/env python
+#
+# A library that provides a Python interface to the Telegram Bot API
+# Copyright (C) 2015-2025
+# Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser Public License for more details.
+#
+# You should have received a copy of the GNU Lesser Public License
+# along with this program.  If not, see [http://www.gnu.org/licenses/].
+import asyncio
+import logging
+
+import pytest
+
+from telegram.error import CircuitBreakerOpen
+from telegram.request import CircuitBreaker, _circuitbreaker
+from tests.auxil.slots import mro_slots
+
+
+class FakeTime:
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake_time = FakeTime()
+    monkeypatch.setattr(_circuitbreaker, "time", fake_time)
+    return fake_time
+
+
+def fail(breaker, times=1):
+    for _ in range(times):
+        breaker.before_call()
+        breaker.record_failure()
+
+
+def succeed(breaker, times=1):
+    for _ in range(times):
+        breaker.before_call()
+        breaker.record_success()
+
+
+class TestCircuitBreakerWithoutRequest:
+    def test_slot_behaviour(self):
+        inst = CircuitBreaker()
+        for attr in inst.__slots__:
+            assert getattr(inst, attr, "err") != "err", f"got extra slot '{attr}'"
+        assert len(mro_slots(inst)) == len(set(mro_slots(inst))), "duplicate slot"
+
+    def test_init(self):
+        breaker = CircuitBreaker()
+        assert breaker.failure_threshold == 5
+        assert breaker.error_rate_threshold == 0.5
+        assert breaker.minimum_calls == 20
+        assert breaker.window == 60
+        assert breaker.recovery_timeout == 30
+        assert breaker.half_open_max_calls == 1
+        assert breaker.name == "default"
+        assert breaker.state == CircuitBreaker.CLOSED
+        assert breaker.rejected_calls == 0
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"failure_threshold": 0},
+            {"minimum_calls": 0},
+            {"half_open_max_calls": 0},
+            {"error_rate_threshold": 0},
+            {"error_rate_threshold": 1.5},
+            {"window": 0},
+            {"recovery_timeout": -1},
+        ],
+        ids=str,
+    )
+    def test_init_invalid(self, kwargs):
+        with pytest.raises(ValueError, match="must"):
+            CircuitBreaker(**kwargs)
+
+    def test_repr(self):
+        assert repr(CircuitBreaker(name="test")) == "CircuitBreaker[name=test, state=closed]"
+
+    def test_consecutive_failures(self, clock):
+        breaker = CircuitBreaker(failure_threshold=3, error_rate_threshold=None)
+        fail(breaker, 2)
+        succeed(breaker)
+        fail(breaker, 2)
+        assert breaker.state == CircuitBreaker.CLOSED
+
+        fail(breaker)
+        assert breaker.state == CircuitBreaker.OPEN
+        with pytest.raises(CircuitBreakerOpen, match="'default' is open. Retry in 30.0 seconds"):
+            breaker.before_call()
+        clock.now += 10
+        with pytest.raises(CircuitBreakerOpen, match="Retry in 20.0 seconds"):
+            breaker.before_call()
+        assert breaker.rejected_calls == 2
+
+    def test_error_rate(self, clock):
+        breaker = CircuitBreaker(
+            failure_threshold=100, error_rate_threshold=0.5, minimum_calls=10, window=10
+        )
+        # Fewer than minimum_calls requests never open the breaker
+        for _ in range(4):
+            fail(breaker)
+            succeed(breaker)
+        fail(breaker)
+        assert breaker.state == CircuitBreaker.CLOSED
+
+        # 5 of 10 requests failed
+        succeed(breaker)
+        fail(breaker)
+        assert breaker.state == CircuitBreaker.OPEN
+
+    def test_error_rate_window(self, clock):
+        breaker = CircuitBreaker(
+            failure_threshold=100, error_rate_threshold=0.5, minimum_calls=4, window=10
+        )
+        fail(breaker, 2)
+        succeed(breaker)
+        # The failures are older than the window now
+        clock.now += 10
+        succeed(breaker, 2)
+        fail(breaker)
+        assert breaker.state == CircuitBreaker.CLOSED
+        fail(breaker)
+        assert breaker.state == CircuitBreaker.OPEN
+
+    def test_half_open(self, clock):
+        breaker = CircuitBreaker(failure_threshold=2, recovery_timeout=5, half_open_max_calls=2)
+        fail(breaker, 2)
+        clock.now += 4.9
+        assert breaker.state == CircuitBreaker.OPEN
+        clock.now += 0.1
+        assert breaker.state == CircuitBreaker.HALF_OPEN
+
+        breaker.before_call()
+        breaker.before_call()
+        with pytest.raises(CircuitBreakerOpen, match="half-open"):
+            breaker.before_call()
+
+        # A cancelled probe frees its slot
+        breaker.release()
+        breaker.before_call()
+
+        breaker.record_success()
+        assert breaker.state == CircuitBreaker.CLOSED
+        # The other probe finishing late is counted like any other request
+        breaker.record_failure()
+        assert breaker.state == CircuitBreaker.CLOSED
+
+    def test_half_open_probe_fails(self, clock):
+        breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=5)
+        fail(breaker)
+        clock.now += 5
+        fail(breaker)
+        assert breaker.state == CircuitBreaker.OPEN
+        clock.now += 4
+        assert breaker.state == CircuitBreaker.OPEN
+        clock.now += 1
+        assert breaker.state == CircuitBreaker.HALF_OPEN
+
+    def test_requests_started_before_opening(self, clock):
+        breaker = CircuitBreaker(failure_threshold=1)
+        breaker.before_call()
+        breaker.before_call()
+        breaker.record_failure()
+        breaker.record_success()
+        assert breaker.state == CircuitBreaker.OPEN
+
+    def test_on_state_change(self, clock, caplog):
+        changes = []
+        breaker = CircuitBreaker(
+            failure_threshold=1,
+            recovery_timeout=1,
+            name="test",
+            on_state_change=lambda *args: changes.append(args),
+        )
+        with caplog.at_level(logging.INFO):
+            fail(breaker)
+            clock.now += 1
+            succeed(breaker)
+
+        assert changes == [
+            (breaker, CircuitBreaker.CLOSED, CircuitBreaker.OPEN),
+            (breaker, CircuitBreaker.OPEN, CircuitBreaker.HALF_OPEN),
+            (breaker, CircuitBreaker.HALF_OPEN, CircuitBreaker.CLOSED),
+        ]
+        assert [record.levelno for record in caplog.records] == [
+            logging.WARNING,
+            logging.INFO,
+            logging.INFO,
+        ]
+        assert all(record.name == "telegram.request.CircuitBreaker" for record in caplog.records)
+        assert "'test' opened: 1 consecutive failures" in caplog.records[0].getMessage()
+
+    def test_on_state_change_error(self, clock, caplog):
+        def callback(*args):
+            raise RuntimeError("Test")
+
+        breaker = CircuitBreaker(failure_threshold=1, on_state_change=callback)
+        with caplog.at_level(logging.ERROR):
+            fail(breaker)
+        assert breaker.state == CircuitBreaker.OPEN
+        assert caplog.records[-1].getMessage().startswith("Error in the state change callback")
+
+    def test_guard(self, clock):
+        breaker = CircuitBreaker(failure_threshold=2, recovery_timeout=1)
+
+        with breaker.guard():
+            pass
+        with pytest.raises(ValueError, match="Test"), breaker.guard():
+            raise ValueError("Test")
+        # Not counted as failure
+        with pytest.raises(KeyError), breaker.guard(is_failure=lambda e: False):
+            raise KeyError("Test")
+        with pytest.raises(ValueError, match="Test"), breaker.guard():
+            raise ValueError("Test")
+        assert breaker.state == CircuitBreaker.CLOSED
+
+        with pytest.raises(ValueError, match="Test"), breaker.guard():
+            raise ValueError("Test")
+        assert breaker.state == CircuitBreaker.OPEN
+
+        with pytest.raises(CircuitBreakerOpen), breaker.guard():
+            pytest.fail("The block must not run while the breaker is open")
+
+    async def test_guard_cancelled(self, clock):
+        breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=1)
+        fail(breaker)
+        clock.now += 1
+
+        async def probe():
+            with breaker.guard():
+                await asyncio.sleep(10)
+
+        task = asyncio.create_task(probe())
+        await asyncio.sleep(0)
+        with pytest.raises(CircuitBreakerOpen, match="half-open"), breaker.guard():
+            pass
+
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        # The cancelled probe is neither a success nor a failure
+        assert breaker.state == CircuitBreaker.HALF_OPEN
+        with breaker.guard():
+            pass
+        assert breaker.state == CircuitBreaker.CLOSED
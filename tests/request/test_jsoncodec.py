@@ -0,0 +1,218 @@
+#!/usr/bin/env python
+#
+# A library that provides a Python interface to the Telegram Bot API
+# Copyright (C) 2015-2025
+# Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser Public License for more details.
+#
+# You should have received a copy of the GNU Lesser Public License
+# along with this program.  If not, see [http://www.gnu.org/licenses/].
+import json
+
+import pytest
+
+from telegram import Bot, Message, TelegramObject, User
+from telegram.error import TelegramError
+from telegram.request import BaseRequest, HTTPXRequest, JSONCodec, RequestData, _jsoncodec
+from telegram.request._requestparameter import RequestParameter
+from tests.auxil.slots import mro_slots
+
+BACKENDS = ["json"]
+if _jsoncodec.ORJSON_AVAILABLE:
+    BACKENDS.append("orjson")
+if _jsoncodec.MSGSPEC_AVAILABLE:
+    BACKENDS.append("msgspec")
+
+
+@pytest.fixture(params=BACKENDS)
+def codec(request):
+    return JSONCodec(request.param)
+
+
+class RecordingRequest(BaseRequest):
+    __slots__ = ("_json_codec", "request_data")
+
+    def __init__(self, json_codec):
+        self._json_codec = json_codec
+        self.request_data = None
+
+    @property
+    def json_codec(self):
+        return self._json_codec
+
+    @property
+    def read_timeout(self):
+        return None
+
+    async def initialize(self):
+        pass
+
+    async def shutdown(self):
+        pass
+
+    async def do_request(self, url, method, request_data=None, *args, **kwargs):
+        self.request_data = request_data
+        return 200, b'{"ok": true, "result": []}'
+
+
+class TestJSONCodecWithoutRequest:
+    def test_slot_behaviour(self):
+        inst = JSONCodec()
+        for attr in inst.__slots__:
+            assert getattr(inst, attr, "err") != "err", f"got extra slot '{attr}'"
+        assert len(mro_slots(inst)) == len(set(mro_slots(inst))), "duplicate slot"
+
+    def test_default_is_stdlib(self):
+        assert _jsoncodec.DEFAULT_JSON_CODEC.backend == "json"
+        assert JSONCodec().backend == "json"
+        assert HTTPXRequest().json_codec is _jsoncodec.DEFAULT_JSON_CODEC
+        assert RequestData().json_codec is _jsoncodec.DEFAULT_JSON_CODEC
+
+    def test_repr(self):
+        assert repr(JSONCodec()) == "JSONCodec(backend='json')"
+
+    def test_unknown_backend(self):
+        with pytest.raises(ValueError, match="Unknown JSON backend 'ujson'"):
+            JSONCodec("ujson")
+
+    @pytest.mark.parametrize("backend", ["orjson", "msgspec"])
+    def test_backend_not_installed(self, monkeypatch, backend):
+        monkeypatch.setattr(_jsoncodec, f"{backend.upper()}_AVAILABLE", False)
+        with pytest.raises(RuntimeError, match=f"JSON backend '{backend}'"):
+            JSONCodec(backend)
+
+    @pytest.mark.parametrize(
+        ("orjson", "msgspec", "expected"),
+        [
+            (True, True, "orjson"),
+            (False, True, "msgspec"),
+            (False, False, "json"),
+        ],
+    )
+    def test_auto(self, monkeypatch, orjson, msgspec, expected):
+        if (expected == "orjson" and not _jsoncodec.ORJSON_AVAILABLE) or (
+            expected == "msgspec" and not _jsoncodec.MSGSPEC_AVAILABLE
+        ):
+            pytest.skip(f"{expected} is not installed")
+        monkeypatch.setattr(_jsoncodec, "ORJSON_AVAILABLE", orjson)
+        monkeypatch.setattr(_jsoncodec, "MSGSPEC_AVAILABLE", msgspec)
+        assert JSONCodec("auto").backend == expected
+
+    def test_stdlib_output_unchanged(self):
+        codec = JSONCodec()
+        data = {"text": "测试", "list": [1, 2.5, None, True]}
+        assert codec.dumps(data) == json.dumps(data)
+        assert (
+            codec.dumps_bytes(data)
+            == json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode()
+        )
+
+    def test_round_trip(self, codec):
+        data = {"text": "测试 ✓", "nested": {"list": [1, 2.5, None, True, False]}}
+        assert codec.loads(codec.dumps(data)) == data
+        assert codec.loads(codec.dumps_bytes(data)) == data
+        assert codec.loads(codec.dumps(data).encode()) == data
+        assert codec.dumps_bytes(data).decode() == (
+            '{"text":"测试 ✓","nested":{"list":[1,2.5,null,true,false]}}'
+        )
+
+    def test_fallback_for_unsupported_values(self, codec):
+        big = 2**70
+        assert codec.loads(codec.dumps({"value": big})) == {"value": big}
+        assert codec.loads(codec.dumps_bytes({"value": big})) == {"value": big}
+
+    @pytest.mark.parametrize("data", ["{invalid", b"{invalid", b'{"text": "\xff"}'])
+    def test_loads_invalid(self, codec, data):
+        with pytest.raises(ValueError):  # noqa: PT011
+            codec.loads(data)
+
+    def test_call_sites_use_codec(self):
+        calls = []
+
+        class RecordingCodec(JSONCodec):
+            __slots__ = ()
+
+            def dumps(self, obj):
+                calls.append("dumps")
+                return super().dumps(obj)
+
+            def dumps_bytes(self, obj):
+                calls.append("dumps_bytes")
+                return json.dumps(obj).encode()
+
+            def loads(self, data):
+                calls.append("loads")
+                return super().loads(data)
+
+        request = HTTPXRequest(json_codec=RecordingCodec())
+        request_data = RequestData([RequestParameter("list", [1, 2], None)])
+        request_data.json_codec = request.json_codec
+        assert request_data.json_parameters == {"list": "[1, 2]"}
+        assert request_data.json_payload == b'{"list": [1, 2]}'
+        assert request._parse_json_payload(b'{"ok": true}') == {"ok": True}
+        user = User(1, "first", False)
+        user.set_bot(Bot("TOKEN", request=request))
+        assert user.to_json() == json.dumps(user.to_dict())
+        assert calls == ["dumps", "dumps_bytes", "loads", "dumps"]
+
+        # Other bots and objects without a bot keep using the default codec
+        calls.clear()
+        User(1, "first", False).to_json()
+        HTTPXRequest()._parse_json_payload(b'{"ok": true}')
+        assert calls == []
+
+    async def test_post_sets_codec_of_request_data(self, codec):
+        request = RecordingRequest(codec)
+        request_data = RequestData([RequestParameter("list", [1, 2], None)])
+        assert await request.post("url", request_data=request_data) == []
+        assert request.request_data is request_data
+        assert request_data.json_codec is codec
+
+    def test_telegram_object_to_json(self, codec):
+        message = Message.de_json(
+            {
+                "message_id": 1,
+                "date": 1700000000,
+                "chat": {"id": -100, "type": "group", "title": "测试"},
+                "text": "hello",
+            },
+            None,
+        )
+        assert json.loads(message.to_json()) == message.to_dict()
+        assert isinstance(message, TelegramObject)
+
+    def test_parse_json_payload_invalid(self, codec):
+        with pytest.raises(TelegramError, match="Invalid server response"):
+            HTTPXRequest(json_codec=codec)._parse_json_payload(b"{invalid")
+
+    def test_parse_json_payload_invalid_utf8(self, codec):
+        request = HTTPXRequest(json_codec=codec)
+        assert request._parse_json_payload(b'{"result": "test_string\x80"}') == {
+            "result": "test_string�"
+        }
+
+    def test_parse_json_payload_is_static(self):
+        assert BaseRequest.parse_json_payload(b'{"ok": true}') == {"ok": True}
+        with pytest.raises(TelegramError, match="Invalid server response"):
+            BaseRequest.parse_json_payload(b"{invalid")
+
+    async def test_overridden_parse_json_payload_is_used(self, codec):
+        class CustomRequest(RecordingRequest):
+            __slots__ = ()
+
+            @staticmethod
+            def parse_json_payload(payload):
+                return {"ok": True, "result": "custom"}
+
+        request = CustomRequest(codec)
+        assert request._parse_json_payload(b"{invalid") == {"ok": True, "result": "custom"}
+        assert await request.post("url") == "custom"
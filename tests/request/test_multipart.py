@@ -0,0 +1,112 @@
+#!/usr/bin/env python
+#
+# A library that provides a Python interface to the Telegram Bot API
+# Copyright (C) 2015-2025
+# Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser Public License for more details.
+#
+# You should have received a copy of the GNU Lesser Public License
+# along with this program.  If not, see [http://www.gnu.org/licenses/].
+from email.parser import BytesParser
+from io import BytesIO
+
+import pytest
+
+from telegram.request._multipart import MultipartStream
+from tests.auxil.files import data_file
+from tests.auxil.slots import mro_slots
+
+
+async def read(stream: MultipartStream) -> list[bytes]:
+    return [chunk async for chunk in stream]
+
+
+def parse(stream: MultipartStream, body: bytes) -> dict[str, tuple]:
+    message = BytesParser().parsebytes(
+        f"Content-Type: {stream.content_type}\r\n\r\n".encode() + body
+    )
+    return {
+        part.get_param("name", header="content-disposition"): (
+            part.get_filename(),
+            part.get_payload(decode=True),
+            part.get_content_type(),
+        )
+        for part in message.get_payload()
+    }
+
+
+class TestMultipartStreamWithoutRequest:
+    def test_slot_behaviour(self):
+        inst = MultipartStream({}, {})
+        for attr in inst.__slots__:
+            assert getattr(inst, attr, "err") != "err", f"got extra slot '{attr}'"
+        assert len(mro_slots(inst)) == len(set(mro_slots(inst))), "duplicate slot"
+
+    @pytest.mark.parametrize(
+        "content",
+        [
+            data_file("telegram.jpg").read_bytes(),
+            data_file("telegram.jpg"),
+            data_file("telegram.jpg").open("rb"),
+            BytesIO(data_file("telegram.jpg").read_bytes()),
+            memoryview(data_file("telegram.jpg").read_bytes()),
+        ],
+        ids=["bytes", "path", "file", "bytesio", "memoryview"],
+    )
+    async def test_encoding(self, content):
+        stream = MultipartStream(
+            {"chat_id": "123", "caption": 'ä "quoted"'},
+            {"photo": ("telegram.jpg", content, "image/jpeg")},
+            chunk_size=1000,
+        )
+        chunks = await read(stream)
+        body = b"".join(chunks)
+
+        assert stream.content_length == len(body)
+        if not isinstance(content, bytes):
+            # parameters, file header, file chunks, separator, trailer
+            assert max(len(chunk) for chunk in chunks[3:-2]) == 1000
+        if isinstance(content, memoryview):
+            # the chunks are slices of the view and not copies
+            assert all(chunk.obj is content.obj for chunk in chunks[3:-2])
+        assert parse(stream, body) == {
+            "chat_id": (None, b"123", "text/plain"),
+            "caption": (None, 'ä "quoted"'.encode(), "text/plain"),
+            "photo": ("telegram.jpg", data_file("telegram.jpg").read_bytes(), "image/jpeg"),
+        }
+        # the body can be produced again, e.g. when the request is retried
+        assert b"".join(await read(stream)) == body
+
+    async def test_async_iterable(self):
+        async def content():
+            yield b"first"
+            yield b"second"
+
+        stream = MultipartStream(
+            {"chat_id": "123"},
+            {
+                "document": ("file.txt", content(), "text/plain"),
+                "thumbnail": ("thumb.jpg", b"thumb", "image/jpeg"),
+            },
+        )
+        assert stream.content_length is None
+        assert parse(stream, b"".join(await read(stream))) == {
+            "chat_id": (None, b"123", "text/plain"),
+            "document": ("file.txt", b"firstsecond", "text/plain"),
+            "thumbnail": ("thumb.jpg", b"thumb", "image/jpeg"),
+        }
+
+    def test_escaping(self):
+        stream = MultipartStream({}, {'na"me': ('file"\r\n.txt', b"", "text/plain")})
+        assert stream._files[0][0].endswith(
+            b'name="na%22me"; filename="file%22%0D%0A.txt"\r\nContent-Type: text/plain\r\n\r\n'
+        )
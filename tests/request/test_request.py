@@ -39,6 +39,7 @@ from telegram._utils.strings import TextEncoding
 from telegram.error import (
     BadRequest,
     ChatMigrated,
+    CircuitBreakerOpen,
     Conflict,
     Forbidden,
     InvalidToken,
@@ -47,12 +48,12 @@ from telegram.error import (
     TelegramError,
     TimedOut,
 )
-from telegram.request import RequestData
+from telegram.request import CircuitBreaker, RequestData
 from telegram.request._httpxrequest import HTTPXRequest
 from telegram.request._requestparameter import RequestParameter
 from tests.auxil.envvars import TEST_WITH_OPT_DEPS
 from tests.auxil.files import data_file
-from tests.auxil.networking import NonchalantHttpxRequest
+from tests.auxil.networking import NonchalantHttpxRequest, OfflineRequest
 from tests.auxil.slots import mro_slots
 
 # We only need mixed_rqs fixture, but it uses the others, so pytest needs us to import them as well
@@ -395,6 +396,147 @@ class TestRequestWithoutRequest:
 
         assert await httpx_request.retrieve(None, None) == server_response
 
+    @pytest.mark.parametrize("chunk_size", [None, 1, 7, 100])
+    async def test_retrieve_stream(self, monkeypatch, chunk_size):
+        server_response = b'{"result": "test_string\x80"}'
+
+        # OfflineRequest does not override do_stream_request, so the default implementation is used
+        request = OfflineRequest()
+        monkeypatch.setattr(request, "do_request", mocker_factory(response=server_response))
+
+        chunks = [chunk async for chunk in request.retrieve_stream("url", chunk_size=chunk_size)]
+        assert b"".join(chunks) == server_response
+        assert all(len(chunk) <= (chunk_size or len(server_response)) for chunk in chunks)
+
+    @pytest.mark.parametrize("chunk_size", [None, 1, 7, 100])
+    @pytest.mark.parametrize("offset", [1, 7, 10])
+    async def test_retrieve_stream_offset_ignored(self, monkeypatch, chunk_size, offset):
+        server_response = b'{"result": "test_string\x80"}'
+
+        # The default implementation of do_stream_request does not send the Range header
+        request = OfflineRequest()
+        monkeypatch.setattr(request, "do_request", mocker_factory(response=server_response))
+
+        chunks = [
+            chunk
+            async for chunk in request.retrieve_stream("url", chunk_size=chunk_size, offset=offset)
+        ]
+        assert b"".join(chunks) == server_response[offset:]
+        assert all(chunks)
+
+    async def test_retrieve_stream_error_response(self, monkeypatch):
+        server_response = json.dumps({"description": "Wrong file id"}).encode(TextEncoding.UTF_8)
+
+        request = OfflineRequest()
+        monkeypatch.setattr(
+            request,
+            "do_request",
+            mocker_factory(response=server_response, return_code=HTTPStatus.BAD_REQUEST),
+        )
+
+        with pytest.raises(BadRequest, match="Wrong file id"):
+            async for _ in request.retrieve_stream("url"):
+                pass
+
+    async def test_retrieve_stream_unknown_exception(self, monkeypatch):
+        exception = ValueError("Some error")
+
+        async def do_request(*args, **kwargs):
+            raise exception
+
+        request = OfflineRequest()
+        monkeypatch.setattr(request, "do_request", do_request)
+
+        with pytest.raises(NetworkError, match="Unknown error in HTTP implementation") as exc_info:
+            async for _ in request.retrieve_stream("url"):
+                pass
+
+        assert exc_info.value.__cause__ is exception
+
+    def test_circuit_breaker_default(self):
+        assert OfflineRequest().circuit_breaker is None
+
+    @pytest.mark.parametrize(
+        ("code", "counts_as_failure"),
+        [
+            (HTTPStatus.BAD_GATEWAY, True),
+            (HTTPStatus.INTERNAL_SERVER_ERROR, True),
+            (HTTPStatus.BAD_REQUEST, False),
+            (HTTPStatus.FORBIDDEN, False),
+            (HTTPStatus.TOO_MANY_REQUESTS, False),
+        ],
+    )
+    async def test_circuit_breaker(self, monkeypatch, code, counts_as_failure):
+        response = {"ok": False, "description": "Test"}
+        if code == HTTPStatus.TOO_MANY_REQUESTS:
+            response["parameters"] = {"retry_after": 1}
+        server_response = json.dumps(response).encode(TextEncoding.UTF_8)
+        calls = 0
+
+        async def do_request(*args, **kwargs):
+            nonlocal calls
+            calls += 1
+            return code, server_response
+
+        breaker = CircuitBreaker(failure_threshold=2, recovery_timeout=60)
+        async with HTTPXRequest(circuit_breaker=breaker) as request:
+            assert request.circuit_breaker is breaker
+            monkeypatch.setattr(request, "do_request", do_request)
+
+            for _ in range(2):
+                with pytest.raises(TelegramError) as exc_info:
+                    await request.post("url")
+                assert not isinstance(exc_info.value, CircuitBreakerOpen)
+
+            if counts_as_failure:
+                assert breaker.state == CircuitBreaker.OPEN
+                with pytest.raises(CircuitBreakerOpen, match="is open"):
+                    await request.post("url")
+                with pytest.raises(CircuitBreakerOpen, match="is open"):
+                    async for _ in request.retrieve_stream("url"):
+                        pass
+                assert calls == 2
+                assert breaker.rejected_calls == 2
+            else:
+                assert breaker.state == CircuitBreaker.CLOSED
+                with pytest.raises(TelegramError):
+                    await request.post("url")
+                assert calls == 3
+
+    async def test_circuit_breaker_network_error(self, monkeypatch):
+        exception = ValueError("Some error")
+
+        async def do_request(*args, **kwargs):
+            raise exception
+
+        class BreakerRequest(OfflineRequest):
+            circuit_breaker = CircuitBreaker(failure_threshold=1)
+
+        # OfflineRequest does not override do_stream_request, so the default implementation is used
+        request = BreakerRequest()
+        monkeypatch.setattr(request, "do_request", do_request)
+        with pytest.raises(NetworkError, match="Unknown error in HTTP implementation"):
+            async for _ in request.retrieve_stream("url"):
+                pass
+        assert request.circuit_breaker.state == CircuitBreaker.OPEN
+
+    async def test_circuit_breaker_recovery(self, monkeypatch):
+        code = HTTPStatus.BAD_GATEWAY
+
+        async def do_request(*args, **kwargs):
+            return code, b'{"ok": true, "result": true}'
+
+        breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=0)
+        async with HTTPXRequest(circuit_breaker=breaker) as request:
+            monkeypatch.setattr(request, "do_request", do_request)
+            with pytest.raises(NetworkError):
+                await request.post("url")
+            assert breaker.state == CircuitBreaker.HALF_OPEN
+
+            code = HTTPStatus.OK
+            assert await request.post("url") is True
+            assert breaker.state == CircuitBreaker.CLOSED
+
     async def test_timeout_propagation_to_do_request(self, monkeypatch, httpx_request):
         async def make_assertion(*args, **kwargs):
             self.test_flag = (
@@ -610,6 +752,141 @@ class TestHTTPXRequestWithoutRequest:
         )
         assert code == HTTPStatus.OK
 
+    async def test_do_request_json_body(self, monkeypatch):
+        rqs = RequestData(
+            [
+                RequestParameter.from_input("chat_id", 1),
+                RequestParameter.from_input("reply_markup", {"inline_keyboard": [[]]}),
+            ]
+        )
+
+        async def make_assertion(self, method, url, headers, timeout, content):
+            assert headers["Content-Type"] == "application/json"
+            assert content == rqs.json_payload
+            assert json.loads(content) == {"chat_id": 1, "reply_markup": {"inline_keyboard": [[]]}}
+            return httpx.Response(HTTPStatus.OK)
+
+        monkeypatch.setattr(httpx.AsyncClient, "request", make_assertion)
+        async with HTTPXRequest(json_body=True) as httpx_request:
+            assert httpx_request.json_body
+            code, _ = await httpx_request.do_request(method="POST", url="url", request_data=rqs)
+        assert code == HTTPStatus.OK
+
+    async def test_do_request_json_body_with_files(
+        self,
+        monkeypatch,
+        mixed_rqs,  # noqa: F811
+    ):
+        async def make_assertion(self, method, url, headers, timeout, files, data):
+            assert "Content-Type" not in headers
+            assert files == mixed_rqs.multipart_data
+            assert data == mixed_rqs.json_parameters
+            return httpx.Response(HTTPStatus.OK)
+
+        monkeypatch.setattr(httpx.AsyncClient, "request", make_assertion)
+        async with HTTPXRequest(json_body=True) as httpx_request:
+            code, _ = await httpx_request.do_request(
+                method="POST", url="url", request_data=mixed_rqs
+            )
+        assert code == HTTPStatus.OK
+
+    @pytest.mark.parametrize(
+        "stream_type", ["path", "memory_map", "file_handle", "async_iterable"]
+    )
+    async def test_do_request_streamed_upload(self, stream_type):
+        content = data_file("telegram.jpg").read_bytes()
+        if stream_type == "path":
+            input_file = InputFile(data_file("telegram.jpg"))
+        elif stream_type == "memory_map":
+            input_file = InputFile(data_file("telegram.jpg"), memory_map=True)
+        elif stream_type == "file_handle":
+            input_file = InputFile(data_file("telegram.jpg").open("rb"), read_file_handle=False)
+        else:
+
+            async def chunks():
+                for start in range(0, len(content), 5000):
+                    yield content[start : start + 5000]
+
+            input_file = InputFile(chunks(), filename="telegram.jpg")
+
+        received = {}
+
+        def handler(request):
+            # MockTransport reads the complete body before calling the handler
+            received["body"] = request.content
+            received["headers"] = request.headers
+            return httpx.Response(HTTPStatus.OK)
+
+        request_data = RequestData(
+            [
+                RequestParameter.from_input("chat_id", 123),
+                RequestParameter.from_input("document", input_file),
+            ]
+        )
+        async with HTTPXRequest(upload_chunk_size=1000) as httpx_request:
+            httpx_request._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            code, _ = await httpx_request.do_request(
+                method="POST", url="https://example.com/sendDocument", request_data=request_data
+            )
+        assert code == HTTPStatus.OK
+
+        body = received["body"]
+        headers = received["headers"]
+        assert headers["Content-Type"].startswith("multipart/form-data; boundary=")
+        if stream_type == "async_iterable":
+            assert headers["Transfer-Encoding"] == "chunked"
+        else:
+            assert int(headers["Content-Length"]) == len(body)
+        assert content in body
+        assert b'name="chat_id"\r\n\r\n123\r\n' in body
+        assert b'name="document"; filename="telegram.jpg"\r\nContent-Type: image/jpeg' in body
+
+    def test_upload_chunk_size_validation(self):
+        with pytest.raises(ValueError, match="positive integer"):
+            HTTPXRequest(upload_chunk_size=0)
+        assert HTTPXRequest().upload_chunk_size == 65536
+
+    async def test_stats(self, monkeypatch):
+        event = asyncio.Event()
+
+        async def make_assertion(self, method, url, headers, timeout, files, data):
+            if url == "pool_timeout":
+                raise httpx.PoolTimeout("pool timeout")
+            await event.wait()
+            return httpx.Response(HTTPStatus.OK)
+
+        monkeypatch.setattr(httpx.AsyncClient, "request", make_assertion)
+        async with HTTPXRequest(connection_pool_size=4) as httpx_request:
+            assert httpx_request.stats == {
+                "connection_pool_size": 4,
+                "in_flight": 0,
+                "max_in_flight": 0,
+                "utilisation": 0.0,
+                "requests": 0,
+                "pool_timeouts": 0,
+            }
+            tasks = [
+                asyncio.create_task(httpx_request.do_request(method="POST", url="url"))
+                for _ in range(2)
+            ]
+            await asyncio.sleep(0)
+            assert httpx_request.stats["in_flight"] == 2
+            assert httpx_request.stats["utilisation"] == 0.5
+
+            event.set()
+            await asyncio.gather(*tasks)
+            with pytest.raises(TimedOut, match="Pool timeout"):
+                await httpx_request.do_request(method="POST", url="pool_timeout")
+
+            assert httpx_request.stats == {
+                "connection_pool_size": 4,
+                "in_flight": 0,
+                "max_in_flight": 2,
+                "utilisation": 0.0,
+                "requests": 3,
+                "pool_timeouts": 1,
+            }
+
     async def test_do_request_return_value(self, monkeypatch, httpx_request):
         async def make_assertion(self, method, url, headers, timeout, files, data):
             return httpx.Response(123, content=b"content")
@@ -645,6 +922,86 @@ class TestHTTPXRequestWithoutRequest:
 
         assert exc_info.value.__cause__ is raised_exception
 
+    async def test_do_stream_request(self):
+        received = []
+        release = asyncio.Event()
+
+        async def content():
+            yield b"first"
+            await release.wait()
+            yield b"second"
+
+        def handler(request):
+            received.append(request)
+            return httpx.Response(HTTPStatus.OK, content=content())
+
+        async with HTTPXRequest() as httpx_request:
+            httpx_request._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            async with httpx_request.do_stream_request(
+                "https://example.com/file", "GET", chunk_size=3, read_timeout=1
+            ) as (
+                code,
+                chunks,
+            ):
+                assert code == HTTPStatus.OK
+                assert httpx_request.stats["in_flight"] == 1
+                # the first chunks are available before the response is complete
+                assert await chunks.__anext__() == b"fir"
+                release.set()
+                assert [chunk async for chunk in chunks] == [b"sts", b"eco", b"nd"]
+
+            assert httpx_request.stats["in_flight"] == 0
+            assert httpx_request.stats["requests"] == 1
+            assert received[0].headers["User-Agent"] == HTTPXRequest.USER_AGENT
+            assert received[0].extensions["timeout"]["read"] == 1
+
+    async def test_retrieve_stream_offset(self):
+        received = []
+
+        def handler(request):
+            received.append(request)
+            return httpx.Response(HTTPStatus.PARTIAL_CONTENT, content=b"second")
+
+        async with HTTPXRequest() as httpx_request:
+            httpx_request._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            chunks = [
+                chunk
+                async for chunk in httpx_request.retrieve_stream(
+                    "https://example.com/file", offset=5
+                )
+            ]
+
+        assert chunks == [b"second"]
+        assert received[0].headers["Range"] == "bytes=5-"
+        assert received[0].headers["User-Agent"] == HTTPXRequest.USER_AGENT
+
+    @pytest.mark.parametrize(
+        ("raised_exception", "expected_class", "expected_message"),
+        [
+            (httpx.ReadTimeout("timeout"), TimedOut, "Timed out"),
+            (httpx.ReadError("read_error"), NetworkError, "httpx.ReadError: read_error"),
+        ],
+    )
+    async def test_do_stream_request_exceptions(
+        self, raised_exception, expected_class, expected_message
+    ):
+        async def content():
+            yield b"first"
+            raise raised_exception
+
+        def handler(request):
+            return httpx.Response(HTTPStatus.OK, content=content())
+
+        async with HTTPXRequest() as httpx_request:
+            httpx_request._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            chunks = httpx_request.retrieve_stream("https://example.com/file")
+            assert await chunks.__anext__() == b"first"
+            with pytest.raises(expected_class, match=expected_message) as exc_info:
+                await chunks.__anext__()
+
+            assert exc_info.value.__cause__ is raised_exception
+            assert httpx_request.stats["in_flight"] == 0
+
     async def test_do_request_pool_timeout(self, monkeypatch):
         pool_timeout = httpx.PoolTimeout("pool timeout")
 
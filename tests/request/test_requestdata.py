@@ -175,12 +175,15 @@ class TestRequestDataWithoutRequest:
         assert file_rqs.json_parameters == file_jsons
         assert mixed_rqs.json_parameters == mixed_jsons
 
-    def test_json_payload(
-        self, simple_rqs, file_rqs, mixed_rqs, simple_jsons, file_jsons, mixed_jsons
-    ):
-        assert simple_rqs.json_payload == json.dumps(simple_jsons).encode()
-        assert file_rqs.json_payload == json.dumps(file_jsons).encode()
-        assert mixed_rqs.json_payload == json.dumps(mixed_jsons).encode()
+    def test_json_payload(self, simple_rqs, file_rqs, mixed_rqs):
+        # nested values must be encoded exactly once
+        assert json.loads(simple_rqs.json_payload) == simple_rqs.parameters
+        assert json.loads(file_rqs.json_payload) == file_rqs.parameters
+        assert json.loads(mixed_rqs.json_payload) == mixed_rqs.parameters
+
+    def test_json_payload_non_ascii(self):
+        rqs = RequestData([RequestParameter.from_input("text", "测试 ✓")])
+        assert rqs.json_payload == '{"text":"测试 ✓"}'.encode()
 
     def test_multipart_data(
         self,
@@ -45,6 +45,7 @@ from telegram import (
     ChatInviteLink,
     ChatPermissions,
     Dice,
+    File,
     InlineKeyboardButton,
     InlineKeyboardMarkup,
     InlineQueryResultArticle,
@@ -371,6 +372,71 @@ class TestBotWithoutRequest:
         assert self.received["init"] == 2
         assert self.received["shutdown"] == 2
 
+    async def test_requests_per_traffic_class(self, offline_bot):
+        requests = {
+            name: OfflineRequest() for name in ("get_updates", "default", "upload", "download")
+        }
+        calls = []
+
+        def record(name):
+            async def post(*args, **kwargs):
+                calls.append(name)
+                return True
+
+            async def retrieve_stream(*args, **kwargs):
+                calls.append(name)
+                yield b"content"
+
+            requests[name].post = post
+            requests[name].retrieve_stream = retrieve_stream
+
+        for name in requests:
+            record(name)
+
+        bot = PytestBot(
+            offline_bot.token,
+            get_updates_request=requests["get_updates"],
+            request=requests["default"],
+            upload_request=requests["upload"],
+            download_request=requests["download"],
+        )
+        assert bot.request is requests["default"]
+        assert bot.upload_request is requests["upload"]
+        assert bot.download_request is requests["download"]
+
+        await bot._post("getUpdates")
+        await bot._post("sendMessage", {"chat_id": 1, "text": "text"})
+        await bot._post("sendDocument", {"chat_id": 1, "document": InputFile(b"content")})
+        # file ids are sent via the default request
+        await bot._post("sendDocument", {"chat_id": 1, "document": "file_id"})
+        file = File("file_id", "file_unique_id", file_path="file_path")
+        file.set_bot(bot)
+        assert await file.download_as_bytearray() == bytearray(b"content")
+
+        assert calls == ["get_updates", "default", "upload", "default", "download"]
+
+    async def test_traffic_classes_share_request(self, offline_bot, monkeypatch):
+        request = OfflineRequest()
+        bot = PytestBot(offline_bot.token, request=request)
+        assert bot.upload_request is request
+        assert bot.download_request is request
+
+        calls = defaultdict(int)
+
+        async def initialize(*args, **kwargs):
+            calls["initialize"] += 1
+
+        async def shutdown(*args, **kwargs):
+            calls["shutdown"] += 1
+
+        monkeypatch.setattr(request, "initialize", initialize)
+        monkeypatch.setattr(request, "shutdown", shutdown)
+        monkeypatch.setattr(bot, "get_me", initialize)
+        await bot.initialize()
+        await bot.shutdown()
+        # once for initialize and once for get_me, shared requests are initialized only once
+        assert calls == {"initialize": 2, "shutdown": 1}
+
     async def test_context_manager(self, monkeypatch, offline_bot):
         async def initialize():
             self.test_flag = ["initialize"]
@@ -589,7 +655,8 @@ class TestBotWithoutRequest:
         # Some methods of ext.ExtBot
         global_extra_args = {"rate_limit_args"}
         extra_args_per_method = defaultdict(
-            set, {"__init__": {"arbitrary_callback_data", "defaults", "rate_limiter"}}
+            set,
+            {"__init__": {"arbitrary_callback_data", "defaults", "rate_limiter", "upload_cache"}},
         )
         different_hints_per_method = defaultdict(set, {"__setattr__": {"ext_bot"}})
 
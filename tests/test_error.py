@@ -25,6 +25,7 @@ import pytest
 from telegram.error import (
     BadRequest,
     ChatMigrated,
+    CircuitBreakerOpen,
     Conflict,
     EndPointNotFound,
     Forbidden,
@@ -89,6 +90,12 @@ class TestErrors:
         with pytest.raises(TimedOut, match="^Timed out$"):
             raise TimedOut
 
+    def test_circuit_breaker_open(self):
+        with pytest.raises(CircuitBreakerOpen, match="^Circuit breaker is open$"):
+            raise CircuitBreakerOpen
+        with pytest.raises(NetworkError, match="custom message"):
+            raise CircuitBreakerOpen("custom message")
+
     def test_chat_migrated(self):
         with pytest.raises(ChatMigrated, match="New chat id: 1234") as e:
             raise ChatMigrated(1234)
@@ -130,6 +137,7 @@ class TestErrors:
             (NetworkError("test message"), ["message"]),
             (BadRequest("test message"), ["message"]),
             (TimedOut(), ["message"]),
+            (CircuitBreakerOpen("test message"), ["message"]),
             (ChatMigrated(1234), ["message", "new_chat_id"]),
             (RetryAfter(12), ["message", "retry_after"]),
             (RetryAfter(dtm.timedelta(seconds=12)), ["message", "retry_after"]),
@@ -157,6 +165,7 @@ class TestErrors:
             (NetworkError("test message")),
             (BadRequest("test message")),
             (TimedOut()),
+            (CircuitBreakerOpen()),
             (ChatMigrated(1234)),
             (RetryAfter(dtm.timedelta(seconds=12))),
             (Conflict("test message")),
@@ -197,7 +206,7 @@ class TestErrors:
                     InvalidCallbackData,
                     EndPointNotFound,
                 },
-                NetworkError: {BadRequest, TimedOut},
+                NetworkError: {BadRequest, CircuitBreakerOpen, TimedOut},
             }
         )
 
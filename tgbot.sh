@@ -1,5 +1,8 @@
 #!/bin/bash
 
+# 在仓库根目录下运行，requirements.txt 中的 "-e ." 会安装仓库内的 python-telegram-bot
+cd "$(dirname "$0")" || exit 1
+
 # 检查并激活虚拟环境
 if [ ! -d "venv" ]; then
     python3 -m venv venv